@@ -106,6 +106,11 @@ def main():
     ctx = init_context(settings, schema)
 
     try:
+        try:
+            ctx.gw.ensure_schema()
+        except Exception as exc:
+            log.warning("Schema setup failed, continuing without it: %s", exc)
+
         for md_file in Path(ctx.settings.doc_root).rglob("*.md"):
             process_file(md_file, ctx)
 
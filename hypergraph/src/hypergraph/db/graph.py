@@ -2,6 +2,10 @@
 
 from neo4j import GraphDatabase
 
+from hypergraph.db.schema import BUMP_GENERATION
+from hypergraph.db.schema import PROJECT_GRAPH
+from hypergraph.db.schema import SCHEMA_STATEMENTS
+
 
 class GraphWriter:
     """Handles writing triples to Neo4j and computing Node2Vec embeddings."""
@@ -10,6 +14,12 @@ class GraphWriter:
         """Initialize Neo4j connection."""
         self._drv = GraphDatabase.driver(uri, auth=(user, password))
 
+    def ensure_schema(self) -> None:
+        """Create the indexes and constraints ingestion relies on (idempotent)."""
+        with self._drv.session() as ses:
+            for statement in SCHEMA_STATEMENTS:
+                ses.run(statement)
+
     @staticmethod
     def _merge(tx, s: str, r: str, o: str):
         """Merge a subject-relation-object triple into the graph."""
@@ -21,14 +31,26 @@ class GraphWriter:
             o=o,
         )
 
+    @staticmethod
+    def _bump_generation(tx) -> int:
+        """Advance the graph generation so readers drop their caches."""
+        return tx.run(BUMP_GENERATION).single()["generation"]
+
     def write(self, triples: list[dict]):
-        """Write a list of subject-relation-object triples to Neo4j."""
+        """Write a list of subject-relation-object triples to Neo4j.
+
+        Advances the graph generation once if any triple was written.
+        """
+        written = 0
         with self._drv.session() as ses:
             for t in triples:
                 if {"subject", "relation", "object"}.issubset(t):
                     ses.execute_write(
                         self._merge, t["subject"], t["relation"], t["object"]
                     )
+                    written += 1
+            if written:
+                ses.execute_write(self._bump_generation)
 
     def run_node2vec(self, dim: int, walks: int, walk_length: int) -> None:
         """Project the graph into GDS and compute Node2Vec embeddings."""
@@ -36,7 +58,7 @@ class GraphWriter:
 
         with self._drv.session() as ses:
             # 1️⃣  Project nodes and relationships
-            ses.run(f"CALL gds.graph.project('{gname}', '*', '*')")
+            ses.run(PROJECT_GRAPH, name=gname)
 
             # 2️⃣  Write Node2Vec embeddings to a node property
             ses.run(
@@ -54,6 +76,9 @@ class GraphWriter:
             # 3️⃣  Drop the temporary in-memory graph
             ses.run(f"CALL gds.graph.drop('{gname}')")
 
+            # 4️⃣  Let readers know the embeddings changed
+            ses.execute_write(self._bump_generation)
+
     def close(self):
         """Close the Neo4j database connection."""
         self._drv.close()
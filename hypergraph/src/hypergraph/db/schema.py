@@ -0,0 +1,47 @@
+"""Idempotent Neo4j schema statements applied before ingestion."""
+
+# Name and labels of the full-text index; must match the MCP server's schema
+FULLTEXT_INDEX = "node_text"
+FULLTEXT_LABELS = (
+    "Entity",
+    "Skill",
+    "Person",
+    "Job",
+    "Role",
+    "Project",
+    "Certification",
+    "Organization",
+    "Company",
+    "Education",
+    "Tool",
+    "Technology",
+    "Topic",
+)
+
+# Advances the graph generation the MCP server polls to notice ingestion writes;
+# must match the server's statement
+BUMP_GENERATION = (
+    "MERGE (m:GraphMeta {key: 'graph'}) "
+    "SET m.generation = coalesce(m.generation, 0) + 1, m.updated_at = datetime() "
+    "RETURN m.generation AS generation"
+)
+
+# Projects every label but GraphMeta into GDS, so the generation node gets no
+# embedding and never shows up in similarity search
+PROJECT_GRAPH = (
+    "CALL db.labels() YIELD label WHERE label <> 'GraphMeta' "
+    "WITH collect(label) AS labels "
+    "CALL gds.graph.project($name, labels, '*') YIELD graphName "
+    "RETURN graphName"
+)
+
+SCHEMA_STATEMENTS = (
+    # MERGE (a:Entity {name:$s}) becomes an index seek instead of a label scan
+    "CREATE CONSTRAINT entity_name_unique IF NOT EXISTS "
+    "FOR (e:Entity) REQUIRE e.name IS UNIQUE",
+    "CREATE INDEX entity_id IF NOT EXISTS FOR (e:Entity) ON (e.id)",
+    "CREATE CONSTRAINT graph_meta_key_unique IF NOT EXISTS "
+    "FOR (m:GraphMeta) REQUIRE m.key IS UNIQUE",
+    f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} IF NOT EXISTS "
+    f"FOR (n:{'|'.join(FULLTEXT_LABELS)}) ON EACH [n.name, n.description]",
+)
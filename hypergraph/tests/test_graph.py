@@ -37,6 +37,19 @@ def test_graph_writer_init(mock_driver):
     assert writer._drv == mock_driver.return_value
 
 
+def test_ensure_schema(graph_writer):
+    """Test the Entity.name constraint and full-text index are created idempotently."""
+    mock_session = MagicMock()
+    graph_writer._drv.session.return_value.__enter__.return_value = mock_session
+
+    graph_writer.ensure_schema()
+
+    statements = [c[0][0] for c in mock_session.run.call_args_list]
+    assert all("IF NOT EXISTS" in s for s in statements)
+    assert any("REQUIRE e.name IS UNIQUE" in s for s in statements)
+    assert any("CREATE FULLTEXT INDEX node_text" in s for s in statements)
+
+
 def test_merge_triple(graph_writer):
     """Test merging a triple into the graph."""
     mock_tx = MagicMock()
@@ -59,7 +72,9 @@ def test_write_triples(graph_writer):
     ]
     graph_writer.write(triples)
 
-    assert mock_session.execute_write.call_count == 2
+    # One transaction per triple, then one advancing the graph generation
+    assert mock_session.execute_write.call_count == 3
+    assert mock_session.execute_write.call_args[0][0] == graph_writer._bump_generation
 
 
 def test_write_invalid_triple(graph_writer):
@@ -76,6 +91,16 @@ def test_write_invalid_triple(graph_writer):
     assert mock_session.execute_write.call_count == 0
 
 
+def test_bump_generation(graph_writer):
+    """Test the stored graph generation is advanced in the GraphMeta node."""
+    mock_tx = MagicMock()
+    mock_tx.run.return_value.single.return_value = {"generation": 7}
+    assert graph_writer._bump_generation(mock_tx) == 7
+    query = mock_tx.run.call_args[0][0]
+    assert "MERGE (m:GraphMeta {key: 'graph'})" in query
+    assert "coalesce(m.generation, 0) + 1" in query
+
+
 def test_run_node2vec(graph_writer):
     """Test running Node2Vec embedding computation."""
     mock_session = MagicMock()
@@ -89,6 +114,8 @@ def test_run_node2vec(graph_writer):
     # Check graph projection
     project_call = mock_session.run.call_args_list[0][0][0]
     assert "CALL gds.graph.project" in project_call
+    assert "label <> 'GraphMeta'" in project_call
+    assert mock_session.run.call_args_list[0][1] == {"name": "skill_graph_tmp"}
 
     # Check Node2Vec computation
     node2vec_call = mock_session.run.call_args_list[1][0][0]
@@ -105,6 +105,7 @@ def test_main_flow(
             main()
 
             # Verify calls
+            mock_graph_writer.ensure_schema.assert_called_once()
             mock_registry.get.assert_called_once_with("test")
             mock_embeddings.embed_documents.assert_called_once()
             assert mock_extractor.extract.call_count >= 1  # At least one call for chunk(s)
@@ -1,7 +1,9 @@
 """JSON-RPC implementation for the MCP API."""
 
+import asyncio
 import logging
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -13,6 +15,9 @@ from neo4j import AsyncSession
 
 from ..api.mcp.handlers import handle_search
 from ..api.mcp.handlers import handle_tool_dispatch
+from ..db.deps import SessionFactory
+from ..db.deps import run_in_session
+from ..tools.admission import Overloaded
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +28,9 @@ ERROR_INVALID_REQUEST = {"code": -32600, "message": "Invalid request"}
 ERROR_METHOD_NOT_FOUND = {"code": -32601, "message": "Method not found"}
 ERROR_INVALID_PARAMS = {"code": -32602, "message": "Invalid params"}
 ERROR_INTERNAL = {"code": -32603, "message": "Internal error"}
+# Implementation-defined server error
+ERROR_DEADLINE_EXCEEDED = {"code": -32001, "message": "Request deadline exceeded"}
+ERROR_OVERLOADED = {"code": -32002, "message": "Server overloaded"}
 
 # Error messages
 ERROR_MESSAGES = {
@@ -33,6 +41,10 @@ ERROR_MESSAGES = {
     "internal_error": "Internal error",
 }
 
+# Default bounds for batch requests
+BATCH_CONCURRENCY = 8
+MAX_BATCH_SIZE = 100
+
 T = TypeVar("T")
 
 
@@ -148,10 +160,26 @@ def create_error(code: int, message: str, data: Any = None) -> dict[str, Any]:
     return error
 
 
+def overloaded_error(error: Overloaded) -> dict[str, Any]:
+    """Create the JSON-RPC error object for an overloaded tool.
+
+    Args:
+        error: Admission control rejection
+
+    Returns:
+        Error object whose data carries the retry-after hint in seconds
+    """
+    return create_error(
+        ERROR_OVERLOADED["code"], str(error.detail), {"retry_after": error.retry_after}
+    )
+
+
 async def handle_error(request_id: Any, error: Exception) -> dict[str, Any]:
     """Handle different types of errors and return appropriate JSON-RPC error response."""
     if isinstance(error, ValueError):
         return create_jsonrpc_error(ERROR_INVALID_PARAMS, request_id)
+    if isinstance(error, Overloaded):
+        return create_jsonrpc_error(overloaded_error(error), request_id)
     if isinstance(error, HTTPException):
         if error.status_code == 422:
             return create_jsonrpc_error(ERROR_INVALID_PARAMS, request_id)
@@ -207,6 +235,108 @@ async def handle_request(request: JSONRPCRequest, session: AsyncSession) -> dict
         )
 
 
+def _batch_request(item: Any) -> JSONRPCRequest:
+    """Build a request from one element of a batch.
+
+    Raises:
+        ValueError: If the element is not a valid request object
+    """
+    if not isinstance(item, dict):
+        raise ValueError("Request must be a JSON object")
+    try:
+        return JSONRPCRequest(**item)
+    except HTTPException as e:
+        raise ValueError(str(e.detail)) from e
+    except TypeError as e:
+        raise ValueError("Invalid request fields") from e
+
+
+async def handle_batch(
+    items: list[Any],
+    call: Callable[[JSONRPCRequest, SessionFactory], Awaitable[dict[str, Any]]],
+    session_factory: SessionFactory,
+    max_concurrency: int = BATCH_CONCURRENCY,
+    max_size: int = MAX_BATCH_SIZE,
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Handle a JSON-RPC batch, running its calls concurrently.
+
+    At most ``max_concurrency`` calls run at a time. Each call opens its
+    own session from ``session_factory`` once it needs one, so that calls
+    do not share a transaction and calls waiting for admission hold no
+    pool slot. Responses keep the order of the requests; notifications
+    (requests without an ``id``) are executed but get no response.
+
+    Args:
+        items: Elements of the batch array
+        call: Handles one request, opening sessions from the factory, and
+            returns its response
+        session_factory: Opens a new session per call
+        max_concurrency: Maximum number of calls running at once
+        max_size: Maximum number of requests in the batch
+
+    Returns:
+        Responses in request order, or a single error response if the
+        batch itself is invalid
+    """
+    if not items:
+        return create_jsonrpc_error(ERROR_INVALID_REQUEST, None)
+    if len(items) > max_size:
+        return create_jsonrpc_error(
+            {
+                "code": ERROR_INVALID_REQUEST["code"],
+                "message": f"Batch exceeds {max_size} requests",
+            },
+            None,
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: Any) -> dict[str, Any] | None:
+        try:
+            request = _batch_request(item)
+        except ValueError as e:
+            # Invalid requests are answered even without an id
+            return create_jsonrpc_error(
+                {"code": ERROR_INVALID_REQUEST["code"], "message": str(e)}, None
+            )
+        async with semaphore:
+            try:
+                response = await call(request, session_factory)
+            except Exception as e:
+                logger.error("Error handling batch request %s: %s", request.id, e)
+                response = await handle_error(request.id, e)
+        # A valid request without an id is a notification and gets no response
+        return response if "id" in item else None
+
+    responses = await asyncio.gather(*(run(item) for item in items))
+    return [response for response in responses if response is not None]
+
+
+async def handle_batch_request(
+    items: list[Any],
+    session_factory: SessionFactory,
+    max_concurrency: int = BATCH_CONCURRENCY,
+    max_size: int = MAX_BATCH_SIZE,
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Handle a JSON-RPC batch with ``handle_request``.
+
+    Args:
+        items: Elements of the batch array
+        session_factory: Opens a new session per call
+        max_concurrency: Maximum number of calls running at once
+        max_size: Maximum number of requests in the batch
+
+    Returns:
+        Responses in request order, or a single error response if the
+        batch itself is invalid
+    """
+
+    async def call(request: JSONRPCRequest, sessions: SessionFactory) -> dict[str, Any]:
+        return await run_in_session(sessions, lambda session: handle_request(request, session))
+
+    return await handle_batch(items, call, session_factory, max_concurrency, max_size)
+
+
 class JSONRPCHandler:
     """JSON-RPC request handler."""
 
@@ -248,6 +378,8 @@ class JSONRPCHandler:
             else:
                 result = await handler(request.params)
             return JSONRPCResponse.success(result, request.id)
+        except Overloaded as e:
+            return JSONRPCResponse.create_error(request_id=request.id, **overloaded_error(e))
         except ValueError as e:
             return JSONRPCResponse.create_error(
                 ERROR_INVALID_PARAMS["code"],
@@ -262,6 +394,34 @@ class JSONRPCHandler:
                 request.id,
             )
 
+    async def handle_batch(
+        self,
+        items: list[Any],
+        session_factory: SessionFactory,
+        max_concurrency: int = BATCH_CONCURRENCY,
+        max_size: int = MAX_BATCH_SIZE,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Handle a JSON-RPC batch with the registered methods.
+
+        Args:
+            items: Elements of the batch array
+            session_factory: Opens a new session per call
+            max_concurrency: Maximum number of calls running at once
+            max_size: Maximum number of requests in the batch
+
+        Returns:
+            Responses in request order, or a single error response if the
+            batch itself is invalid
+        """
+
+        async def call(request: JSONRPCRequest, sessions: SessionFactory) -> dict[str, Any]:
+            response = await run_in_session(
+                sessions, lambda session: self.handle_request(request, session)
+            )
+            return response.__dict__
+
+        return await handle_batch(items, call, session_factory, max_concurrency, max_size)
+
     @staticmethod
     def create_error(code: int, message: str, data: Any = None) -> dict:
         """Create an error response.
@@ -1,25 +1,39 @@
 """MCP API handlers."""
 
 import inspect
+import itertools
 import logging
 
 from typing import Annotated
 from typing import Any
 from typing import TypeVar
-from typing import cast
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from neo4j import AsyncSession
 
+from ...db.deps import SessionFactory
 from ...db.deps import get_db_session
+from ...db.queries import is_read_only
+from ...db.queries import read_records
+from ...db.queries import write_records
+from ...graph.experience import experience_store
+from ...graph.generation import graph_generation
+from ...graph.pagerank import EVIDENCE_TOP_K
+from ...graph.pagerank import rank_evidence
+from ...graph.paths import bounded_paths
+from ...graph.person_skills import person_skills
+from ...graph.search_index import search_nodes
+from ...graph.snapshot import GraphSnapshot
+from ...graph.snapshot import snapshot_store
 from ...models.embedding import get_embedding_model
 from ...models.mcp import InitializeRequest
 from ...models.mcp import InitializeResponse
 from ...models.mcp import QueryRequest
 from ...models.mcp import QueryResponse
 from ...tools.dispatcher import dispatch_tool
+from ...utils.deadline import run_with_deadline
 from ..mcp.models import EntityResponse
 from ..mcp.models import ExplainMatchRequest
 from ..mcp.models import ExplainMatchResponse
@@ -55,15 +69,6 @@ async def _maybe_await(obj: Any) -> Any:
     return obj
 
 
-async def _fetch_all(result: Any) -> list[Any]:
-    """Fetch all records from a result, handling both coroutine and non-coroutine cases."""
-    fetch_all = getattr(result, "fetch_all", None)
-    if fetch_all:
-        records = await _maybe_await(fetch_all())
-        return cast(list[Any], records)
-    return []
-
-
 async def _single(result: Any) -> Any:
     """Get a single record from a result, handling both coroutine and non-coroutine cases."""
     single = getattr(result, "single", None)
@@ -97,23 +102,41 @@ async def query(
     request: QueryRequest,
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> dict[str, Any]:
-    """Execute a Cypher query."""
+    """Execute a Cypher query.
+
+    Read-only queries run in a read transaction, which a routing driver can
+    send to a follower; anything else runs in a write transaction. Both
+    time out at the request deadline.
+    """
     try:
-        result = await session.run(request.query, request.parameters or {})
-        records = await _fetch_all(result)
-        summary = await _maybe_await(result.consume())
-        return {
-            "results": [dict(record) for record in records],
-            "metadata": {
-                "nodes_created": summary.counters.nodes_created,
-                "relationships_created": summary.counters.relationships_created,
-            },
-        }
+        return await run_with_deadline(lambda: _run_query(request, session))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Query error: %s", e)
         raise HTTPException(status_code=500, detail="Query execution failed") from e
 
 
+async def _run_query(request: QueryRequest, session: AsyncSession) -> dict[str, Any]:
+    """Run a /query request in a read or write transaction."""
+    if is_read_only(request.query):
+        records = await read_records(session, request.query, request.parameters)
+        nodes_created = relationships_created = 0
+    else:
+        records, summary = await write_records(session, request.query, request.parameters)
+        if summary.counters.contains_updates:
+            await graph_generation.record_write(session)
+        nodes_created = summary.counters.nodes_created
+        relationships_created = summary.counters.relationships_created
+    return {
+        "results": [dict(record) for record in records],
+        "metadata": {
+            "nodes_created": nodes_created,
+            "relationships_created": relationships_created,
+        },
+    }
+
+
 async def match_role(request: dict, session: AsyncSession) -> dict:
     """Match a role against available skills."""
     try:
@@ -147,28 +170,43 @@ async def match_role(request: dict, session: AsyncSession) -> dict:
     except (ValueError, TypeError) as e:
         raise HTTPException(status_code=422, detail=f"MatchRoleRequest: Invalid parameters: {str(e)}") from e
 
-    # Query the database to find matching profiles
-    result = await session.run(
-        """
-        MATCH (p:Person)
-        WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
-        RETURN p
-        """,
-        required_skills=required_skills,
-    )
-    records = await result.all()
+    index = await person_skills.ensure_fresh(session)
+    if index is not None:
+        # Skills and gaps of the best-covering person, from the bitset index
+        person_id, matched, skill_gaps = index.best_match(required_skills)
+        experience = await experience_store.ensure_fresh(session)
+        matching_skills: list[dict[str, Any]] = []
+        for skill in matched:
+            entry: dict[str, Any] = {"name": skill}
+            years = experience.years(skill, person_id) if experience else None
+            if years is not None:
+                entry["years"] = round(years, 1)
+                if skill in years_experience:
+                    entry["meets_experience"] = years >= years_experience[skill]
+            matching_skills.append(entry)
+    else:
+        # Query the database to find matching profiles
+        records = await read_records(
+            session,
+            """
+            MATCH (p:Person)
+            WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
+            RETURN p
+            """,
+            {"required_skills": required_skills},
+        )
 
-    matching_skills = []
-    skill_gaps = []
-    for skill in required_skills:
-        found = False
-        for record in records:
-            if skill in record["p"].get("skills", []):
-                matching_skills.append({"name": skill})
-                found = True
-                break
-        if not found:
-            skill_gaps.append(skill)
+        matching_skills = []
+        skill_gaps = []
+        for skill in required_skills:
+            found = False
+            for record in records:
+                if skill in record["p"].get("skills", []):
+                    matching_skills.append({"name": skill})
+                    found = True
+                    break
+            if not found:
+                skill_gaps.append(skill)
 
     match_score = (
         len(matching_skills) / len(required_skills) if required_skills else 0.0
@@ -197,17 +235,12 @@ async def explain_match(request: dict, session: AsyncSession) -> dict:
             detail="ExplainMatchRequest: Invalid parameters: skill_id must be a number",
         ) from exc
 
-    # Get skill data with evidence
-    result = await session.run(
-        """
-        MATCH (s:Skill {id: $skill_id})
-        OPTIONAL MATCH (s)-[:USED_IN]->(p:Project)
-        OPTIONAL MATCH (s)-[:CERTIFIED_IN]->(c:Certification)
-        RETURN s, collect(p) as projects, collect(c) as certifications
-        """,
-        skill_id=skill_id,
-    )
-    record = await result.single()
+    # Get skill data with evidence, from the snapshot when it is built
+    snapshot = await snapshot_store.ensure_fresh(session)
+    if snapshot is not None:
+        record = _snapshot_skill_evidence(snapshot, skill_id)
+    else:
+        record = await _query_skill_evidence(session, skill_id)
     if not record:
         raise HTTPException(status_code=404, detail=f"Skill {skill_id} not found")
 
@@ -215,16 +248,25 @@ async def explain_match(request: dict, session: AsyncSession) -> dict:
     projects = record["projects"]
     certifications = record["certifications"]
 
-    # Build evidence list
-    evidence = []
-    for project in projects:
-        evidence.append(
-            {"type": "project", "description": f"Used in project: {project['name']}"}
+    # Build evidence list, keeping the entries most relevant to the role
+    project_ids = record.get("project_ids") or [None] * len(projects)
+    certification_ids = record.get("certification_ids") or [None] * len(certifications)
+    candidates = []
+    for node_id, project in zip(project_ids, projects):
+        candidates.append(
+            (node_id, {"type": "project", "description": f"Used in project: {project['name']}"})
         )
-    for cert in certifications:
-        evidence.append(
-            {"type": "certification", "description": f"Certified in: {cert['name']}"}
+    for node_id, cert in zip(certification_ids, certifications):
+        candidates.append(
+            (node_id, {"type": "certification", "description": f"Certified in: {cert['name']}"})
         )
+    evidence = await rank_evidence(
+        session,
+        record.get("node_id"),
+        request['role_requirement'],
+        candidates,
+        request.get("top_k", EVIDENCE_TOP_K),
+    )
 
     # Generate explanation
     explanation = (
@@ -238,6 +280,41 @@ async def explain_match(request: dict, session: AsyncSession) -> dict:
     }
 
 
+def _snapshot_skill_evidence(snapshot: GraphSnapshot, skill_id: int) -> dict | None:
+    """Collect a skill with its projects and certifications from the snapshot."""
+    position = snapshot.find_by_id("Skill", skill_id)
+    if position is None:
+        return None
+    projects = snapshot.related(position, "USED_IN", "Project")
+    certifications = snapshot.related(position, "CERTIFIED_IN", "Certification")
+    return {
+        "s": snapshot.nodes[position],
+        "projects": [snapshot.nodes[p] for p in projects],
+        "certifications": [snapshot.nodes[c] for c in certifications],
+        "node_id": snapshot.nodes[position].id,
+        "project_ids": [snapshot.nodes[p].id for p in projects],
+        "certification_ids": [snapshot.nodes[c].id for c in certifications],
+    }
+
+
+async def _query_skill_evidence(session: AsyncSession, skill_id: int) -> Any:
+    """Query a skill with its projects and certifications."""
+    records = await read_records(
+        session,
+        """
+        MATCH (s:Skill {id: $skill_id})
+        OPTIONAL MATCH (s)-[:USED_IN]->(p:Project)
+        OPTIONAL MATCH (s)-[:CERTIFIED_IN]->(c:Certification)
+        WITH s, collect(DISTINCT p) as projects, collect(DISTINCT c) as certifications
+        RETURN s, projects, certifications, id(s) as node_id,
+               [p IN projects | id(p)] as project_ids,
+               [c IN certifications | id(c)] as certification_ids
+        """,
+        {"skill_id": skill_id},
+    )
+    return records[0] if records else None
+
+
 async def graph_search(request: dict, session: AsyncSession = None) -> dict:
     """Execute a graph search query.
 
@@ -258,22 +335,26 @@ async def graph_search(request: dict, session: AsyncSession = None) -> dict:
     if not isinstance(top_k, int) or top_k <= 0:
         raise HTTPException(status_code=422, detail="top_k must be a positive integer")
 
-    # Query the database to find nodes matching the query
-    result = await session.run(
-        """
-        MATCH (n)
-        WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
-        RETURN n
-        LIMIT $top_k
-        """,
-        search_query=search_query, top_k=top_k
-    )
-    records = await result.all()
+    # Resolve candidates through the search index, falling back to a scan
+    ranked = await search_nodes(session, search_query, top_k)
+    if ranked is not None:
+        nodes = [node for node, _ in ranked]
+    else:
+        records = await read_records(
+            session,
+            """
+            MATCH (n)
+            WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
+            RETURN n
+            LIMIT $top_k
+            """,
+            {"search_query": search_query, "top_k": top_k},
+        )
+        nodes = [record["n"] for record in records]
 
     # Format results
     results = []
-    for record in records:
-        node = record["n"]
+    for node in nodes:
         results.append(
             {
                 "node": {
@@ -300,20 +381,24 @@ async def handle_search(session: Any, query: str, limit: int) -> dict:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
 
     try:
-        # Perform a simple text search
-        result = await session.run(
-            """
-            MATCH (n)
-            WHERE n.name CONTAINS $query OR n.description CONTAINS $query
-            RETURN n
-            LIMIT $limit
-            """,
-            query=query, limit=limit
-        )
-        records = await result.all()
+        # Perform a text search, through the index when it is available
+        ranked = await search_nodes(session, query, limit)
+        if ranked is not None:
+            nodes = [node for node, _ in ranked]
+        else:
+            records = await read_records(
+                session,
+                """
+                MATCH (n)
+                WHERE n.name CONTAINS $query OR n.description CONTAINS $query
+                RETURN n
+                LIMIT $limit
+                """,
+                {"query": query, "limit": limit},
+            )
+            nodes = [record["node"] if "node" in record else record["n"] for record in records]
         results = []
-        for record in records:
-            node = record["node"] if "node" in record else record["n"]
+        for node in nodes:
             results.append({
                 "node": {
                     "id": node.get("id"),
@@ -333,23 +418,32 @@ async def handle_search(session: Any, query: str, limit: int) -> dict:
         raise HTTPException(status_code=500, detail="Database error") from e
 
 
+async def _find_entity(session: AsyncSession, entity_id: str) -> Any:
+    """Return the node whose ``id`` or name is the entity ID, or None.
+
+    Answered from the graph snapshot when it is built.
+    """
+    snapshot = await snapshot_store.ensure_fresh(session)
+    if snapshot is not None:
+        position = snapshot.entity(entity_id)
+        return snapshot.nodes[position] if position is not None else None
+    records = await read_records(
+        session,
+        "MATCH (n) WHERE n.id = $entity_id OR n.name = $entity_id RETURN n LIMIT 1",
+        {"entity_id": entity_id},
+    )
+    return records[0]["n"] if records else None
+
+
 async def handle_get_entity(
     session: AsyncSession, entity_id: str
 ) -> dict[str, Any]:
     """Handle get entity request."""
     try:
-        # Query the database for the entity
-        result = await session.run(
-            "MATCH (n) WHERE n.id = $entity_id OR n.name = $entity_id RETURN n LIMIT 1",
-            entity_id=entity_id
-        )
-        record = await result.single()
-
-        if not record:
+        node = await _find_entity(session, entity_id)
+        if node is None:
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        node = record["n"]
-        
         # Handle both Neo4j node objects and dictionaries (from mocks)
         if hasattr(node, 'labels'):
             # Real Neo4j node
@@ -414,10 +508,15 @@ async def get_resource(resource_type: str) -> dict:
     return schemas[resource_type]
 
 
-async def handle_tool_dispatch(session: Any, tool_name: str, parameters: dict) -> dict:
+async def handle_tool_dispatch(
+    session: Any,
+    tool_name: str,
+    parameters: dict,
+    session_factory: SessionFactory | None = None,
+) -> dict:
     """Handle tool dispatch."""
     try:
-        data = await dispatch_tool(tool_name, parameters, session)
+        data = await dispatch_tool(tool_name, parameters, session, session_factory)
         return {
             "result": "success",
             "data": data
@@ -434,13 +533,8 @@ async def handle_entity_request(
 ) -> EntityResponse:
     """Handle entity request."""
     try:
-        result = await session.run(
-            "MATCH (n) WHERE n.id = $entity_id OR n.name = $entity_id RETURN n LIMIT 1",
-            entity_id=entity_id
-        )
-        record = await result.single()
-
-        if not record:
+        node = await _find_entity(session, entity_id)
+        if node is None:
             return EntityResponse(
                 id=entity_id,
                 name="",
@@ -450,7 +544,6 @@ async def handle_entity_request(
                 relationships=[],
             )
 
-        node = record["n"]
         return EntityResponse(
             id=node.get("id", node.get("name")),
             name=node.get("name", ""),
@@ -476,21 +569,25 @@ async def handle_search_request(
 ) -> SearchResponse:
     """Handle search request."""
     try:
-        result = await session.run(
-            """
-            MATCH (n)
-            WHERE toLower(n.name) CONTAINS toLower($query)
-            OR toLower(n.description) CONTAINS toLower($query)
-            RETURN n
-            LIMIT $limit
-            """,
-            query=request.query, limit=request.limit
-        )
-        records = await result.fetch_all()
+        ranked = await search_nodes(session, request.query, request.limit)
+        if ranked is not None:
+            nodes = [node for node, _ in ranked]
+        else:
+            records = await read_records(
+                session,
+                """
+                MATCH (n)
+                WHERE toLower(n.name) CONTAINS toLower($query)
+                OR toLower(n.description) CONTAINS toLower($query)
+                RETURN n
+                LIMIT $limit
+                """,
+                {"query": request.query, "limit": request.limit},
+            )
+            nodes = [record["n"] for record in records]
 
         entities = []
-        for record in records:
-            node = record["n"]
+        for node in nodes:
             entities.append({
                 "id": node.get("id", node.get("name")),
                 "name": node.get("name"),
@@ -551,12 +648,52 @@ async def handle_explain_request(
         )
 
 
+def _path_endpoint(node: Any) -> dict:
+    """Summarize a path endpoint for graph search results."""
+    return {
+        "id": node.get("id", node.get("name")),
+        "name": node.get("name"),
+        "type": list(node.labels)[0] if node.labels else "Unknown",
+    }
+
+
+def _snapshot_graph_search(snapshot: GraphSnapshot, query: str, limit: int) -> list[dict]:
+    """Answer a graph search from the in-memory snapshot.
+
+    Paths of one to three hops are enumerated lazily from nodes whose name
+    contains the query, so expansion stops once the limit is reached.
+    """
+    needle = query.lower()
+    starts = (position for position, name in enumerate(snapshot.names) if needle in name)
+    paths = []
+    for path in itertools.islice(bounded_paths(snapshot, starts, 1, 3), max(limit, 0)):
+        paths.append(
+            {
+                "start": _path_endpoint(snapshot.nodes[path.nodes[0]]),
+                "end": _path_endpoint(snapshot.nodes[path.nodes[-1]]),
+                "relationships": [
+                    {"type": rel.type, "properties": dict(rel)}
+                    for rel in (snapshot.relationships[i] for i in path.relationships)
+                ],
+            }
+        )
+    return paths
+
+
 async def handle_graph_search_request(
     request: GraphSearchRequest, session: AsyncSession
 ) -> dict:
     """Handle graph search request."""
     try:
-        result = await session.run(
+        snapshot = await snapshot_store.ensure_fresh(session)
+        if snapshot is not None:
+            paths = _snapshot_graph_search(snapshot, request.query, request.top_k)
+            return {"paths": paths, "count": len(paths)}
+
+        # The variable-length expansion can be slow on large graphs; the read
+        # transaction times out at the request deadline
+        records = await read_records(
+            session,
             """
             MATCH (start)-[r*1..3]-(end)
             WHERE toLower(start.name) CONTAINS toLower($query)
@@ -564,9 +701,8 @@ async def handle_graph_search_request(
             RETURN start, end, r
             LIMIT $limit
             """,
-            query=request.query, limit=request.top_k
+            {"query": request.query, "limit": request.top_k},
         )
-        records = await result.fetch_all()
 
         paths = []
         for record in records:
@@ -575,16 +711,8 @@ async def handle_graph_search_request(
             relationships = record["r"]
 
             path = {
-                "start": {
-                    "id": start_node.get("id", start_node.get("name")),
-                    "name": start_node.get("name"),
-                    "type": list(start_node.labels)[0] if start_node.labels else "Unknown"
-                },
-                "end": {
-                    "id": end_node.get("id", end_node.get("name")),
-                    "name": end_node.get("name"),
-                    "type": list(end_node.labels)[0] if end_node.labels else "Unknown"
-                },
+                "start": _path_endpoint(start_node),
+                "end": _path_endpoint(end_node),
                 "relationships": [
                     {
                         "type": rel.type,
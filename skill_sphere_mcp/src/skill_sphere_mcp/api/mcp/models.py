@@ -107,6 +107,7 @@ class ExplainMatchRequest(BaseModel):
 
     skill_id: str
     role_requirement: str
+    top_k: int = Field(default=5, ge=1)
 
 
 class ExplainMatchResponse(BaseModel):
@@ -2,6 +2,8 @@
 
 import logging
 
+from collections.abc import Awaitable
+from collections.abc import Callable
 from typing import Annotated
 from typing import Any
 
@@ -13,8 +15,18 @@ from neo4j import AsyncSession
 from prometheus_client import CONTENT_TYPE_LATEST
 from prometheus_client import generate_latest
 
+from ...db.deps import SessionFactory
 from ...db.deps import get_db_session
+from ...db.deps import get_session_factory
+from ...db.deps import run_in_session
+from ...db.queries import read_records
 from ...models.skill import Skill
+from ...tools.admission import admission_control
+from ...tools.dispatcher import TOOL_EXPLAIN_MATCH
+from ...tools.dispatcher import TOOL_GRAPH_SEARCH
+from ...tools.dispatcher import TOOL_MATCH_ROLE
+from ...utils.deadline import deadline_scope
+from ...utils.deadline import run_with_deadline
 from ..jsonrpc import ERROR_INVALID_PARAMS
 from ..jsonrpc import JSONRPCRequest
 from ..jsonrpc import JSONRPCResponse
@@ -24,6 +36,7 @@ from ..mcp.handlers import handle_get_entity
 from ..mcp.handlers import handle_search
 from ..mcp.handlers import handle_tool_dispatch
 from ..mcp.handlers import match_role
+from ..mcp.rpc import handle_rpc_batch
 from ..mcp.rpc import handle_rpc_request
 from ..mcp.utils import create_skill_in_db
 from ..mcp.utils import get_resource
@@ -91,44 +104,69 @@ async def get_resource_schema(resource: str) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+async def _run_tool(
+    tool_name: str,
+    handler: Callable[[dict[str, Any], AsyncSession], Awaitable[dict[str, Any]]],
+    request: dict[str, Any],
+    session_factory: SessionFactory,
+) -> dict[str, Any]:
+    """Run a tool handler within its deadline and admission limit.
+
+    The session is opened only once the call is admitted, so calls waiting
+    in the admission queue hold no pool slot.
+    """
+    with deadline_scope(tool_name):
+        return await run_with_deadline(
+            lambda: admission_control.run(
+                tool_name,
+                lambda: run_in_session(session_factory, lambda session: handler(request, session)),
+            )
+        )
+
+
 @router.post("/match_role")
 async def match_role_endpoint(
-    request: dict[str, Any], session: Annotated[AsyncSession, Depends(get_db_session)]
+    request: dict[str, Any],
+    session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
 ) -> dict[str, Any]:
     """Match role endpoint."""
-    return await match_role(request, session)
+    return await _run_tool(TOOL_MATCH_ROLE, match_role, request, session_factory)
 
 
 @router.post("/explain_match")
 async def explain_match_endpoint(
-    request: dict[str, Any], session: Annotated[AsyncSession, Depends(get_db_session)]
+    request: dict[str, Any],
+    session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
 ) -> dict[str, Any]:
     """Explain match endpoint."""
-    return await explain_match(request, session)
+    return await _run_tool(TOOL_EXPLAIN_MATCH, explain_match, request, session_factory)
 
 
 @router.post("/graph_search")
 async def graph_search_endpoint(
-    request: dict[str, Any], session: Annotated[AsyncSession, Depends(get_db_session)]
+    request: dict[str, Any],
+    session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
 ) -> dict[str, Any]:
     """Graph search endpoint."""
-    return await graph_search(request, session)
+    return await _run_tool(TOOL_GRAPH_SEARCH, graph_search, request, session_factory)
 
 
 @router.post("/mcp/rpc/tools/dispatch")
 async def tool_dispatch_endpoint(
     params: dict[str, Any],
-    session: Annotated[AsyncSession, Depends(get_db_session)]
+    session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
 ) -> dict[str, Any]:
     """Dispatch tool execution."""
     tool_name = params.get("tool_name")
     if not tool_name:
         raise HTTPException(status_code=422, detail="Tool name is required")
     try:
-        result = await handle_tool_dispatch(session, tool_name, params.get("parameters", {}))
+        result = await handle_tool_dispatch(
+            None, tool_name, params.get("parameters", {}), session_factory
+        )
         return result
     except HTTPException as e:
-        if e.status_code in (400, 404, 422):
+        if e.status_code in (400, 404, 422, 429, 504):
             raise
         raise HTTPException(status_code=500, detail="Internal server error") from e
     except Exception as e:
@@ -136,15 +174,28 @@ async def tool_dispatch_endpoint(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
-@router.post("/mcp/rpc")
+@router.post("/mcp/rpc", response_model=None)
 async def rpc_endpoint(
-    request: dict[str, Any],
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> dict[str, Any]:
-    """Handle JSON-RPC requests."""
+    request: dict[str, Any] | list[Any],
+    session_factory: Annotated[SessionFactory, Depends(get_session_factory)],
+) -> dict[str, Any] | list[dict[str, Any]] | Response:
+    """Handle JSON-RPC requests and batches of them.
+
+    A batch (JSON array) runs its calls concurrently, each with its own
+    session. A batch of only notifications gets an empty response.
+
+    Sessions are opened from the factory rather than as a request
+    dependency, and only by calls that have been admitted, so no request
+    holds a pool slot while it waits.
+    """
+    if isinstance(request, list):
+        responses = await handle_rpc_batch(request, session_factory)
+        if not responses:
+            return Response(status_code=204)
+        return responses
     try:
         rpc_request = JSONRPCRequest(**request)
-        response = await handle_rpc_request(rpc_request, session)
+        response = await handle_rpc_request(rpc_request, session_factory)
         return response.__dict__
     except ValueError as e:
         return JSONRPCResponse.create_error(
@@ -207,8 +258,7 @@ def _validate_generate_cv_params(
 async def get_skills(session: AsyncSession = Depends(get_db_session)) -> list[Skill]:
     """Get all skills from the database."""
     try:
-        result = await session.run("MATCH (s:Skill) RETURN s")
-        records = await result.fetch_all()  # type: ignore[attr-defined]
+        records = await read_records(session, "MATCH (s:Skill) RETURN s")
         return [Skill(**record["s"]) for record in records]
     except Exception as e:
         logger.error("Failed to fetch skills: %s", e)
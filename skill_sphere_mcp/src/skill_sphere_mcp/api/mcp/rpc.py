@@ -1,13 +1,36 @@
 """RPC handlers for the MCP API."""
 
+from dataclasses import replace
 from typing import Any
 
 from neo4j import AsyncSession
 
+from ...config.settings import get_settings
+from ...db.deps import SessionFactory
+from ...db.deps import run_in_session
+from ...tools.admission import admission_control
+from ...tools.cache import tool_cache
+from ...tools.dispatcher import TOOL_BATCH_SEARCH
+from ...tools.dispatcher import TOOL_EXPLAIN_MATCH
+from ...tools.dispatcher import TOOL_GRAPH_SEARCH
+from ...tools.dispatcher import TOOL_HYBRID_SEARCH
+from ...tools.dispatcher import TOOL_MATCH_ROLE
+from ...tools.dispatcher import TOOL_RECOMMEND_GAPS
+from ...tools.handlers import batch_search
+from ...tools.handlers import hybrid_search
+from ...tools.handlers import recommend_gaps
+from ...tools.single_flight import single_flight
+from ...utils.deadline import TIMEOUT_PARAM
+from ...utils.deadline import DeadlineExceeded
+from ...utils.deadline import deadline_scope
+from ...utils.deadline import parse_timeout
+from ...utils.deadline import run_with_deadline
+from ..jsonrpc import ERROR_DEADLINE_EXCEEDED
 from ..jsonrpc import ERROR_INVALID_PARAMS
 from ..jsonrpc import JSONRPCHandler
 from ..jsonrpc import JSONRPCRequest
 from ..jsonrpc import JSONRPCResponse
+from ..jsonrpc import handle_batch
 from .handlers import explain_match
 from .handlers import graph_search
 from .handlers import match_role
@@ -17,10 +40,20 @@ from .utils import get_resource
 
 rpc_handler = JSONRPCHandler()
 
+# Dispatcher names of the tools callable through mcp.tool
+RPC_TOOLS = {
+    "match_role": TOOL_MATCH_ROLE,
+    "explain_match": TOOL_EXPLAIN_MATCH,
+    "graph_search": TOOL_GRAPH_SEARCH,
+    "hybrid_search": TOOL_HYBRID_SEARCH,
+    "batch_search": TOOL_BATCH_SEARCH,
+    "recommend_gaps": TOOL_RECOMMEND_GAPS,
+}
+
 
 @rpc_handler.register("mcp.initialize")
 async def rpc_initialize(
-    _params: dict[str, Any], _session: AsyncSession | None = None
+    _params: dict[str, Any], _session_factory: SessionFactory | None = None
 ) -> dict[str, Any]:
     """Handle initialize RPC method."""
     return get_initialize_response_dict()
@@ -28,7 +61,7 @@ async def rpc_initialize(
 
 @rpc_handler.register("mcp.resources.list")
 async def rpc_list_resources(
-    _params: dict[str, Any], _session: AsyncSession | None = None
+    _params: dict[str, Any], _session_factory: SessionFactory | None = None
 ) -> list[str]:
     """Handle resources/list RPC method."""
     return ["nodes", "relationships", "search"]
@@ -36,53 +69,120 @@ async def rpc_list_resources(
 
 @rpc_handler.register("mcp.resources.get")
 async def rpc_get_resource(
-    params: dict[str, Any], _session: AsyncSession | None = None
+    params: dict[str, Any], _session_factory: SessionFactory | None = None
 ) -> dict[str, Any]:
     """Handle resources/get RPC method."""
     resource = params.get("resource")
     if not resource:
         raise ValueError("Missing resource parameter")
-    return await get_resource(resource)
+    return await tool_cache.get_or_call(
+        "mcp.resources.get", {"resource": resource}, lambda: get_resource(resource)
+    )
 
 
 @rpc_handler.register("mcp.search")
-async def rpc_search(params: dict[str, Any], session: AsyncSession) -> dict[str, Any]:
+async def rpc_search(params: dict[str, Any], session_factory: SessionFactory) -> dict[str, Any]:
     """Handle search requests."""
     if not params.get("query"):
         raise ValueError("Query is required")
-    return await graph_search(params, session)
+    return await admission_control.run(
+        TOOL_GRAPH_SEARCH,
+        lambda: run_in_session(session_factory, lambda session: graph_search(params, session)),
+    )
 
 
 @rpc_handler.register("mcp.tool")
-async def rpc_tool(params: dict[str, Any], session: AsyncSession) -> dict[str, Any]:
-    """Handle tool dispatch requests."""
+async def rpc_tool(params: dict[str, Any], session_factory: SessionFactory) -> dict[str, Any]:
+    """Handle tool dispatch requests.
+
+    Identical calls in flight at the same time share one execution, which
+    is admitted only within the tool's concurrency limit and opens its
+    session once admitted.
+    """
     tool_name = params.get("name")
     if not tool_name:
         raise ValueError("Tool name is required")
-
+    if tool_name not in RPC_TOOLS:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    parameters = params.get("parameters", {})
+    return await single_flight.do(
+        f"mcp.tool.{tool_name}",
+        parameters,
+        lambda: admission_control.run(
+            RPC_TOOLS[tool_name],
+            lambda: run_in_session(
+                session_factory, lambda session: _call_tool(tool_name, parameters, session)
+            ),
+        ),
+    )
+
+
+async def _call_tool(
+    tool_name: str, parameters: dict[str, Any], session: AsyncSession
+) -> dict[str, Any]:
+    """Run a tool by its RPC name."""
     if tool_name == "match_role":
-        return await match_role(params.get("parameters", {}), session)
+        return await match_role(parameters, session)
     if tool_name == "explain_match":
-        return await explain_match(params.get("parameters", {}), session)
+        return await explain_match(parameters, session)
     if tool_name == "graph_search":
-        return await graph_search(params.get("parameters", {}), session)
+        return await graph_search(parameters, session)
+    if tool_name == "hybrid_search":
+        return await hybrid_search(parameters, session)
+    if tool_name == "batch_search":
+        return await batch_search(parameters, session)
+    if tool_name == "recommend_gaps":
+        return await recommend_gaps(parameters, session)
     raise ValueError(f"Unknown tool: {tool_name}")
 
 
 @rpc_handler.register("mcp.skill.match_role")
 async def rpc_match_role_handler(
-    params: dict[str, Any], session: AsyncSession
+    params: dict[str, Any], session_factory: SessionFactory
 ) -> dict[str, Any]:
     """Handle skill matching requests."""
-    return await match_role(params, session)
+    return await admission_control.run(
+        TOOL_MATCH_ROLE,
+        lambda: run_in_session(session_factory, lambda session: match_role(params, session)),
+    )
+
+
+def _deadline_tool(request: JSONRPCRequest) -> str | None:
+    """Return the tool whose default timeout applies to a request."""
+    if request.method == "mcp.tool":
+        return RPC_TOOLS.get((request.params or {}).get("name"))
+    if request.method == "mcp.search":
+        return TOOL_GRAPH_SEARCH
+    if request.method == "mcp.skill.match_role":
+        return TOOL_MATCH_ROLE
+    return None
 
 
 async def handle_rpc_request(
-    request: JSONRPCRequest, session: AsyncSession | None = None
+    request: JSONRPCRequest, session_factory: SessionFactory | None = None
 ) -> JSONRPCResponse:
-    """Handle JSON-RPC requests."""
+    """Handle JSON-RPC requests.
+
+    A ``timeout`` param sets the deadline of the call in seconds, otherwise
+    the called tool's default applies. Calls still running at the deadline
+    are cancelled. Tool calls open their session from ``session_factory``
+    only once admitted, so calls waiting for a slot hold no pool slot.
+    """
     try:
-        return await rpc_handler.handle_request(request, session)
+        if request.params and TIMEOUT_PARAM in request.params:
+            params = dict(request.params)
+            requested = parse_timeout(params.pop(TIMEOUT_PARAM))
+            request = replace(request, params=params)
+        else:
+            requested = None
+        with deadline_scope(_deadline_tool(request), requested):
+            return await run_with_deadline(
+                lambda: rpc_handler.handle_request(request, session_factory)
+            )
+    except DeadlineExceeded:
+        return JSONRPCResponse.create_error(
+            ERROR_DEADLINE_EXCEEDED["code"], ERROR_DEADLINE_EXCEEDED["message"], request.id
+        )
     except ValueError as e:
         return JSONRPCResponse.create_error(
             ERROR_INVALID_PARAMS["code"],
@@ -91,3 +191,21 @@ async def handle_rpc_request(
         )
     except (TypeError, KeyError, RuntimeError) as e:
         return JSONRPCResponse.handle_error(e, request.id)
+
+
+async def handle_rpc_batch(
+    items: list[Any], session_factory: SessionFactory
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Handle a JSON-RPC batch, bounded by the configured concurrency and size."""
+    settings = get_settings()
+
+    async def call(request: JSONRPCRequest, sessions: SessionFactory) -> dict[str, Any]:
+        return (await handle_rpc_request(request, sessions)).__dict__
+
+    return await handle_batch(
+        items,
+        call,
+        session_factory,
+        max_concurrency=settings.rpc_batch_concurrency,
+        max_size=settings.rpc_batch_max_size,
+    )
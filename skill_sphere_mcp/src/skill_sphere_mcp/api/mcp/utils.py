@@ -8,6 +8,8 @@ from fastapi import HTTPException
 from neo4j import AsyncSession
 
 from ...config.settings import get_settings
+from ...db.queries import write_records
+from ...graph.generation import graph_generation
 from ...models.graph import GraphNode
 from ...models.graph import GraphRelationship
 from ...models.skill import Skill
@@ -153,14 +155,15 @@ async def create_skill_in_db(skill: Skill, session: AsyncSession) -> Skill:
         HTTPException: If skill creation fails
     """
     try:
-        result = await session.run(
+        records, _ = await write_records(
+            session,
             "CREATE (s:Skill $skill) RETURN s",
-            skill=skill.model_dump(exclude_none=True),
+            {"skill": skill.model_dump(exclude_none=True)},
         )
-        record = await result.single()
-        if not record:
+        if not records:
             raise HTTPException(status_code=500, detail="Failed to create skill")
-        return Skill(**record["s"])
+        await graph_generation.record_write(session)
+        return Skill(**records[0]["s"])
     except HTTPException:
         raise
     except Exception as e:
@@ -7,6 +7,7 @@ from typing import Annotated
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.responses import Response
 from neo4j import AsyncSession
 from prometheus_client import CONTENT_TYPE_LATEST
@@ -14,8 +15,10 @@ from prometheus_client import Counter
 from prometheus_client import generate_latest
 
 from ..db.deps import get_db_session
+from ..db.queries import read_records
 from ..db.utils import get_entity_by_id
 from ..models.skill import Skill
+from ..utils.readiness import readiness
 from .mcp.utils import create_skill_in_db
 
 
@@ -32,14 +35,19 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@router.get("/ready")
+async def readiness_check() -> JSONResponse:
+    """Readiness endpoint; 503 until the startup warm-up has finished."""
+    return JSONResponse(readiness.report(), status_code=200 if readiness.ready else 503)
+
+
 @router.get("/skills", response_model=list[Skill])
 async def get_skills(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> list[Skill]:
     """Get all skills from the database."""
     try:
-        result = await session.run("MATCH (s:Skill) RETURN s")
-        records = await result.fetch_all()  # type: ignore[attr-defined]
+        records = await read_records(session, "MATCH (s:Skill) RETURN s")
         return [Skill(**record["s"]) for record in records]
     except Exception as exc:
         logger.error("Failed to fetch skills: %s", exc)
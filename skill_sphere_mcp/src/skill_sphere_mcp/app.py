@@ -1,5 +1,7 @@
 """MCP Server - FastAPI application setup and configuration."""
 
+import asyncio
+import contextlib
 import logging
 import os
 
@@ -22,7 +24,12 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from .api.mcp_routes import router as mcp_router
 from .api.routes import router as metrics_router
 from .config.settings import get_settings
+from .db.connection import neo4j_conn
+from .graph.generation import graph_generation
+from .graph.snapshot import snapshot_store
 from .routes import router as api_router
+from .utils.deadline import DeadlineMiddleware
+from .warmup import warm_up
 
 
 # Configure logging
@@ -71,10 +78,48 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Startup
     logger.info("Starting MCP server")
+
+    # Warm up connections, indexes and caches; /ready answers 200 once done
+    background: list[asyncio.Task] = []
+
+    async def start_up() -> None:
+        if not await warm_up():
+            logger.warning("Neo4j unavailable, serving without in-memory indexes")
+            return
+
+        # Watch for writes made by other processes
+        if settings.graph_generation_poll_interval > 0:
+            background.append(
+                asyncio.create_task(
+                    graph_generation.poll(
+                        neo4j_conn.session, settings.graph_generation_poll_interval
+                    )
+                )
+            )
+
+        # Rebuild the snapshot periodically to pick up writes from other processes
+        if snapshot_store.is_ready and settings.snapshot_refresh_interval > 0:
+            background.append(
+                asyncio.create_task(
+                    snapshot_store.refresh_periodically(
+                        neo4j_conn.session, settings.snapshot_refresh_interval
+                    )
+                )
+            )
+
+    if settings.warmup_in_background:
+        background.append(asyncio.create_task(start_up()))
+    else:
+        await start_up()
+
     yield
 
     # Shutdown
     logger.info("Shutting down MCP server")
+    for task in background:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
     # Cleanup
     if settings.enable_telemetry:
@@ -122,6 +167,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Start each request's deadline from the X-Request-Timeout header
+    mcp_server_app.add_middleware(DeadlineMiddleware)
+
     # Get the static directory path
     static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 
@@ -4,6 +4,7 @@ import logging
 import os
 
 from functools import lru_cache
+from typing import Any
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -36,10 +37,11 @@ class ClientInfo(BaseModel):
     mcp_instructions: str = Field(
         default="""You are connected to Bernd Prager's (bernd@prager.ws) skills-graph. \
 This MCP server provides access to a Neo4j-powered Hypergraph-of-Thought containing enriched career records and professional experiences. \
-Use `graph.search` or traverse `skills.node` to gather evidence, \
+Use `graph.search` (or `graph.hybrid_search` to rank by keywords and meaning together) or traverse `skills.node` to gather evidence, \
+and `graph.batch_search` to look up evidence for several skills in one call, \
 then call `skill.match_role` or `cv.generate` as appropriate. \
 Prefer nodes labelled 'JOB' or 'CERTIFICATION' for hard evidence. \
-If a requirement is missing, suggest relevant up-skilling. \
+If a requirement is missing, call `skill.recommend_gaps` and suggest relevant up-skilling. \
 All context and content provided through this MCP server is specifically for Bernd Prager.""",
     )
 
@@ -58,9 +60,20 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
 
     # Neo4j
+    # A neo4j:// URI routes managed read transactions to followers and read replicas
     neo4j_uri: str = Field(default="bolt://localhost:7687")
     neo4j_user: str = Field(default="neo4j")
     neo4j_password: str = Field(default="password")
+    neo4j_max_connection_pool_size: int = Field(default=100, ge=1)
+    neo4j_connection_acquisition_timeout: float = Field(default=60.0, gt=0)
+    neo4j_fetch_size: int = Field(default=1000, ge=1)
+    # Idle time in seconds after which a pooled connection is checked before reuse
+    neo4j_liveness_check_timeout: float | None = Field(default=None, ge=0)
+    # Database to open sessions on; None uses the user's home database
+    neo4j_database: str | None = Field(default=None)
+    neo4j_read_timeout: float = Field(default=30.0, gt=0)
+    neo4j_write_timeout: float = Field(default=60.0, gt=0)
+    neo4j_max_transaction_retry_time: float = Field(default=30.0, ge=0)
 
     # OpenTelemetry
     otel_exporter_otlp_endpoint: str = Field(default="http://localhost:4317")
@@ -79,6 +92,71 @@ class Settings(BaseSettings):
     enable_telemetry: bool = Field(default=True)
     enable_caching: bool = Field(default=True)
 
+    # Tool result cache
+    tool_cache_max_entries: int = Field(default=1024, ge=1)
+    tool_cache_ttl_seconds: float = Field(default=300.0, gt=0)
+
+    # Seconds between reads of the stored graph generation, which tell this
+    # server about writes made elsewhere; 0 to disable
+    graph_generation_poll_interval: float = Field(default=5.0, ge=0)
+
+    # Graph snapshot: seconds between periodic rebuilds, 0 to only rebuild
+    # after writes made through this server
+    snapshot_refresh_interval: float = Field(default=300.0, ge=0)
+
+    # Startup warm-up: steps run in order before the readiness endpoint
+    # reports ready, in the background unless disabled so liveness checks
+    # are answered meanwhile. The default CV is rendered into the tool cache
+    # from the given cv.generate parameters; empty to skip it.
+    warmup_steps: list[str] = Field(
+        default_factory=lambda: ["connectivity", "pool", "indexes", "embeddings", "cv"]
+    )
+    warmup_in_background: bool = Field(default=True)
+    warmup_pool_connections: int = Field(default=4, ge=0)
+    warmup_cv_parameters: dict[str, Any] = Field(default_factory=dict)
+
+    # Skill neighbor table
+    skill_neighbors_k: int = Field(default=20, ge=1)
+    skill_neighbors_path: str | None = Field(default=None)
+    skill_neighbors_write_back: bool = Field(default=False)
+
+    # JSON-RPC batches
+    rpc_batch_concurrency: int = Field(default=8, ge=1)
+    rpc_batch_max_size: int = Field(default=100, ge=1)
+
+    # Request deadlines in seconds; clients may ask for up to the maximum
+    request_timeout: float = Field(default=30.0, gt=0)
+    max_request_timeout: float = Field(default=120.0, gt=0)
+    tool_timeouts: dict[str, float] = Field(
+        default_factory=lambda: {
+            "graph.search": 10.0,
+            "graph.hybrid_search": 10.0,
+            "graph.batch_search": 30.0,
+            "skill.match_role": 15.0,
+            "skill.explain_match": 15.0,
+            "skill.recommend_gaps": 20.0,
+            "cv.generate": 60.0,
+        }
+    )
+
+    # Admission control: per-tool concurrency limits adjusted by AIMD from
+    # observed latency, with a bounded queue in front of each tool
+    enable_admission_control: bool = Field(default=True)
+    admission_initial_limit: int = Field(default=16, ge=1)
+    admission_min_limit: int = Field(default=1, ge=1)
+    admission_max_limit: int = Field(default=64, ge=1)
+    admission_max_queue: int = Field(default=32, ge=0)
+    admission_target_latency: float = Field(default=1.0, gt=0)
+    admission_target_latencies: dict[str, float] = Field(
+        default_factory=lambda: {
+            "graph.batch_search": 3.0,
+            "skill.match_role": 2.0,
+            "skill.explain_match": 2.0,
+            "skill.recommend_gaps": 2.0,
+            "cv.generate": 5.0,
+        }
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="SKILL_SPHERE_MCP_",
         populate_by_name=True,
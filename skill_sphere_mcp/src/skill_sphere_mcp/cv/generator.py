@@ -7,6 +7,9 @@ from neo4j import AsyncSession
 from pydantic import BaseModel
 from pydantic import Field
 
+from ..db.queries import read_records
+from ..graph.snapshot import GraphSnapshot
+from ..graph.snapshot import snapshot_store
 from ..utils.validation import validate_parameters
 
 
@@ -204,6 +207,56 @@ def _generate_html_cv(record: dict[str, Any]) -> str:
     return content
 
 
+def _snapshot_profile(snapshot: GraphSnapshot, keywords: list[str]) -> dict[str, Any] | None:
+    """Collect the first person whose name contains a keyword from the snapshot."""
+    for position in snapshot.with_label("Person"):
+        name = snapshot.nodes[position].get("name")
+        if not isinstance(name, str) or not any(keyword in name for keyword in keywords):
+            continue
+        return {
+            "p": dict(snapshot.nodes[position]),
+            "skills": [
+                dict(snapshot.nodes[s]) for s in snapshot.related(position, "HAS_SKILL", "Skill")
+            ],
+            "companies": [
+                dict(snapshot.nodes[c])
+                for c in snapshot.related(position, "WORKED_AT", "Company")
+            ],
+            "education": [
+                dict(snapshot.nodes[e])
+                for e in snapshot.related(position, "EDUCATED_AT", "Education")
+            ],
+        }
+    return None
+
+
+async def _query_profile(session: AsyncSession, keywords: list[str]) -> dict[str, Any] | None:
+    """Query the first person whose name contains a keyword."""
+    query = """
+    MATCH (p:Person)
+    WHERE ANY(keyword IN $keywords WHERE p.name CONTAINS keyword)
+    OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
+    OPTIONAL MATCH (p)-[:WORKED_AT]->(c:Company)
+    OPTIONAL MATCH (p)-[:EDUCATED_AT]->(e:Education)
+    RETURN p,
+           collect(DISTINCT s) as skills,
+           collect(DISTINCT c) as companies,
+           collect(DISTINCT e) as education
+    """
+    records = await read_records(session, query, {"keywords": keywords})
+    if not records:
+        return None
+    record = records[0]
+
+    # Convert Neo4j Record to dictionary
+    return {
+        "p": dict(record["p"]),
+        "skills": [dict(s) for s in record["skills"]],
+        "companies": [dict(c) for c in record["companies"]],
+        "education": [dict(e) for e in record["education"]],
+    }
+
+
 async def generate_cv(
     parameters: dict[str, Any], session: AsyncSession
 ) -> dict[str, Any]:
@@ -225,32 +278,16 @@ async def generate_cv(
         # Always raise 422 for validation errors
         raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}") from e
 
-    # Query to find a profile matching the target keywords
-    query = """
-    MATCH (p:Person)
-    WHERE ANY(keyword IN $keywords WHERE p.name CONTAINS keyword)
-    OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
-    OPTIONAL MATCH (p)-[:WORKED_AT]->(c:Company)
-    OPTIONAL MATCH (p)-[:EDUCATED_AT]->(e:Education)
-    RETURN p,
-           collect(DISTINCT s) as skills,
-           collect(DISTINCT c) as companies,
-           collect(DISTINCT e) as education
-    """
     try:
-        result = await session.run(query, keywords=request.target_keywords)
-        record = await result.single()
-        if not record:
+        # Find a profile matching the target keywords, in the snapshot when it is built
+        snapshot = await snapshot_store.ensure_fresh(session)
+        if snapshot is not None:
+            record_dict = _snapshot_profile(snapshot, request.target_keywords)
+        else:
+            record_dict = await _query_profile(session, request.target_keywords)
+        if not record_dict:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        # Convert Neo4j Record to dictionary
-        record_dict = {
-            "p": dict(record["p"]),
-            "skills": [dict(s) for s in record["skills"]],
-            "companies": [dict(c) for c in record["companies"]],
-            "education": [dict(e) for e in record["education"]],
-        }
-
         # Generate CV content based on the format
         if request.format == "markdown":
             content = _generate_markdown_cv(record_dict)
@@ -1,7 +1,11 @@
 """Neo4j database connection management."""
 
+import asyncio
 import logging
+import time
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from typing import Optional
 
@@ -11,18 +15,29 @@ from neo4j import AsyncGraphDatabase
 from neo4j import AsyncSession
 from neo4j.exceptions import AuthError
 from neo4j.exceptions import ServiceUnavailable
+from prometheus_client import Gauge
+from prometheus_client import Histogram
 
 from skill_sphere_mcp.config.settings import get_settings
 
 
 logger = logging.getLogger(__name__)
 
+sessions_in_use = Gauge("neo4j_sessions_in_use", "Neo4j sessions holding a pool slot")
+session_acquisition_seconds = Histogram(
+    "neo4j_session_acquisition_seconds", "Time spent waiting for a free Neo4j pool slot"
+)
+
 
 class Neo4jConnection:
     """Neo4j connection manager."""
 
     _instance: Optional["Neo4jConnection"] = None
     _driver: Optional[AsyncDriver] = None
+    # Bounds open sessions by the pool size, see session()
+    _slots: Optional[asyncio.Semaphore] = None
+    _acquisition_timeout: float | None = None
+    _database: str | None = None
 
     def __new__(cls) -> "Neo4jConnection":
         """Ensure singleton instance."""
@@ -42,7 +57,15 @@ class Neo4jConnection:
             self._driver = AsyncGraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_user, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                fetch_size=settings.neo4j_fetch_size,
+                liveness_check_timeout=settings.neo4j_liveness_check_timeout,
+                max_transaction_retry_time=settings.neo4j_max_transaction_retry_time,
             )
+            self._slots = asyncio.Semaphore(settings.neo4j_max_connection_pool_size)
+            self._acquisition_timeout = settings.neo4j_connection_acquisition_timeout
+            self._database = settings.neo4j_database
             logger.info("Neo4j driver initialized successfully")
         except ServiceUnavailable as e:
             logger.error("Failed to connect to Neo4j: %s", e)
@@ -78,19 +101,59 @@ class Neo4jConnection:
             logger.error("Connection verification failed: %s", e)
             raise HTTPException(status_code=500, detail="Database connection failed") from e
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get a Neo4j database session.
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Open a Neo4j session that is closed when the block exits.
+
+        A session uses at most one pooled connection at a time, so open
+        sessions are limited to the pool size. Waiting for a free slot
+        times out like a connection acquisition would, instead of letting
+        requests pile up inside the driver.
 
         Yields:
             Neo4j database session
+
+        Raises:
+            HTTPException: 503 if no slot frees up within the acquisition timeout
         """
         if self._driver is None:
             self._initialize_driver()
-        session = self._driver.session()
+        if self._slots is None:
+            settings = get_settings()
+            self._slots = asyncio.Semaphore(settings.neo4j_max_connection_pool_size)
+            self._acquisition_timeout = settings.neo4j_connection_acquisition_timeout
+
+        started = time.perf_counter()
         try:
-            yield session
+            await asyncio.wait_for(self._slots.acquire(), self._acquisition_timeout)
+        except asyncio.TimeoutError as e:
+            logger.error("No Neo4j pool slot free after %ss", self._acquisition_timeout)
+            raise HTTPException(
+                status_code=503, detail="Database connection pool exhausted"
+            ) from e
+        finally:
+            session_acquisition_seconds.observe(time.perf_counter() - started)
+
+        slots = self._slots
+        sessions_in_use.inc()
+        try:
+            session = self._driver.session(database=self._database)
+            try:
+                yield session
+            finally:
+                await session.close()
         finally:
-            await session.close()
+            sessions_in_use.dec()
+            slots.release()
+
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get a Neo4j database session.
+
+        Yields:
+            Neo4j database session
+        """
+        async with self.session() as session:
+            yield session
 
     async def close(self) -> None:
         """Close Neo4j connection."""
@@ -1,16 +1,66 @@
 """Database dependencies."""
 
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import aclosing
+from typing import TypeVar
+
 from neo4j import AsyncSession
 
 from .connection import neo4j_conn
 
 
-async def get_db_session() -> AsyncSession:
-    """Get a Neo4j database session.
+T = TypeVar("T")
 
-    Returns:
+# Opens a new session per call, closing it when the generator is closed
+SessionFactory = Callable[[], AsyncIterator[AsyncSession]]
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a Neo4j database session scoped to the request.
+
+    The session is closed, and its pool slot released, once the response
+    has been sent, also if the endpoint raised.
+
+    Yields:
         Neo4j database session
     """
-    async for session in neo4j_conn.get_session():
-        return session
+    async with neo4j_conn.session() as session:
+        yield session
+
+
+def get_session_factory() -> Callable[[], AsyncGenerator[AsyncSession, None]]:
+    """Get a factory that opens a new Neo4j session per call.
+
+    For requests that run several queries concurrently, such as JSON-RPC
+    batches, where each query needs a session of its own, and for calls
+    that may wait for admission first and should not hold a pool slot
+    while they do.
+
+    Returns:
+        Session generator function; closing a generator closes its session
+    """
+    return neo4j_conn.get_session
+
+
+async def run_in_session(
+    session_factory: SessionFactory, call: Callable[[AsyncSession], Awaitable[T]]
+) -> T:
+    """Run a call with a session opened from the factory.
+
+    Args:
+        session_factory: Opens the session
+        call: Does the work with the session
+
+    Returns:
+        The result of the call
+
+    Raises:
+        RuntimeError: If the factory yields no session
+    """
+    async with aclosing(session_factory()) as sessions:
+        async for session in sessions:
+            return await call(session)
     raise RuntimeError("Failed to get database session")
@@ -0,0 +1,111 @@
+"""Managed read and write transactions."""
+
+import logging
+import re
+
+from typing import Any
+
+from neo4j import AsyncManagedTransaction
+from neo4j import AsyncSession
+from neo4j import ResultSummary
+from neo4j import unit_of_work
+
+from ..config.settings import get_settings
+from ..utils.deadline import transaction_timeout
+
+
+logger = logging.getLogger(__name__)
+
+# Clauses that make a Cypher statement need a write transaction. Procedure
+# calls are included because the server cannot tell whether they write.
+WRITE_CLAUSE = re.compile(
+    r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|LOAD\s+CSV|CALL)\b", re.IGNORECASE
+)
+
+
+def is_read_only(query: str) -> bool:
+    """Return True if a Cypher statement can run in a read transaction.
+
+    Errs on the side of writing: any statement with a writing clause
+    keyword, even inside a string literal, counts as a write.
+
+    Args:
+        query: Cypher statement
+
+    Returns:
+        True if the statement has no writing clauses
+    """
+    return WRITE_CLAUSE.search(query) is None
+
+
+async def read_records(
+    session: AsyncSession,
+    query: str,
+    parameters: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> list[Any]:
+    """Run a query in a managed read transaction.
+
+    The driver retries the transaction on transient failures and, with a
+    ``neo4j://`` URI, routes it to a follower or read replica.
+
+    Args:
+        session: Neo4j session
+        query: Cypher query
+        parameters: Query parameters
+        timeout: Transaction timeout in seconds, defaults to the read timeout
+            in the settings; either way it ends by the request deadline
+
+    Returns:
+        All records of the result
+
+    Raises:
+        DeadlineExceeded: If the request deadline has already passed
+    """
+    if timeout is None:
+        timeout = get_settings().neo4j_read_timeout
+    timeout = transaction_timeout(timeout)
+
+    @unit_of_work(timeout=timeout)
+    async def work(tx: AsyncManagedTransaction) -> list[Any]:
+        result = await tx.run(query, parameters or {})
+        return [record async for record in result]
+
+    return await session.execute_read(work)
+
+
+async def write_records(
+    session: AsyncSession,
+    query: str,
+    parameters: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> tuple[list[Any], ResultSummary]:
+    """Run a query in a managed write transaction.
+
+    The driver rolls the transaction back and retries it on transient
+    failures, always against the cluster leader.
+
+    Args:
+        session: Neo4j session
+        query: Cypher query
+        parameters: Query parameters
+        timeout: Transaction timeout in seconds, defaults to the write timeout
+            in the settings; either way it ends by the request deadline
+
+    Returns:
+        Tuple of all records of the result and its summary
+
+    Raises:
+        DeadlineExceeded: If the request deadline has already passed
+    """
+    if timeout is None:
+        timeout = get_settings().neo4j_write_timeout
+    timeout = transaction_timeout(timeout)
+
+    @unit_of_work(timeout=timeout)
+    async def work(tx: AsyncManagedTransaction) -> tuple[list[Any], ResultSummary]:
+        result = await tx.run(query, parameters or {})
+        records = [record async for record in result]
+        return records, await result.consume()
+
+    return await session.execute_write(work)
@@ -0,0 +1,167 @@
+"""Idempotent Neo4j schema migrations (indexes and constraints)."""
+
+import logging
+
+from dataclasses import dataclass
+
+from neo4j import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+# Name of the full-text index over node name and description
+FULLTEXT_INDEX = "node_text"
+
+# Labels covered by the full-text index; Neo4j requires an explicit list
+FULLTEXT_LABELS = (
+    "Entity",
+    "Skill",
+    "Person",
+    "Job",
+    "Role",
+    "Project",
+    "Certification",
+    "Organization",
+    "Company",
+    "Education",
+    "Tool",
+    "Technology",
+    "Topic",
+)
+
+# Key of the GraphMeta node holding the stored graph generation
+GRAPH_META_KEY = "graph"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A versioned set of idempotent schema statements."""
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="Range indexes for hot lookup properties",
+        statements=(
+            "CREATE INDEX skill_id IF NOT EXISTS FOR (s:Skill) ON (s.id)",
+            "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+            "CREATE INDEX entity_id IF NOT EXISTS FOR (e:Entity) ON (e.id)",
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Full-text index on node name and description",
+        statements=(
+            f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} IF NOT EXISTS "
+            f"FOR (n:{'|'.join(FULLTEXT_LABELS)}) ON EACH [n.name, n.description]",
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Uniqueness constraints for merge keys",
+        statements=(
+            "CREATE CONSTRAINT entity_name_unique IF NOT EXISTS "
+            "FOR (e:Entity) REQUIRE e.name IS UNIQUE",
+            "CREATE CONSTRAINT skill_name_unique IF NOT EXISTS "
+            "FOR (s:Skill) REQUIRE s.name IS UNIQUE",
+        ),
+    ),
+    Migration(
+        version=4,
+        description="Single graph metadata node per key",
+        statements=(
+            "CREATE CONSTRAINT graph_meta_key_unique IF NOT EXISTS "
+            "FOR (m:GraphMeta) REQUIRE m.key IS UNIQUE",
+        ),
+    ),
+)
+
+
+class SchemaMigrator:
+    """Applies schema migrations and tracks which optional indexes are usable."""
+
+    def __init__(self, migrations: tuple[Migration, ...] = MIGRATIONS):
+        """Initialize the migrator.
+
+        Args:
+            migrations: Migrations to apply, in version order
+        """
+        self.migrations = migrations
+        self.fulltext_available = False
+
+    async def _applied_versions(self, session: AsyncSession) -> set[int]:
+        """Return the versions already recorded in the database."""
+        result = await session.run("MATCH (m:SchemaMigration) RETURN m.version AS version")
+        return {record["version"] async for record in result}
+
+    async def _apply(self, session: AsyncSession, migration: Migration) -> None:
+        """Run a migration's statements and record it."""
+        for statement in migration.statements:
+            await session.run(statement)
+        await session.run(
+            """
+            MERGE (m:SchemaMigration {version: $version})
+            ON CREATE SET m.description = $description, m.applied_at = datetime()
+            """,
+            version=migration.version,
+            description=migration.description,
+        )
+
+    async def migrate(self, session: AsyncSession) -> list[int]:
+        """Apply all pending migrations.
+
+        Statements use ``IF NOT EXISTS`` so re-running is harmless. A failing
+        migration (e.g. a uniqueness constraint over duplicate data) is logged
+        and retried on the next run; it does not block the others.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            Versions applied by this run
+        """
+        applied = await self._applied_versions(session)
+        newly_applied = []
+        for migration in self.migrations:
+            if migration.version in applied:
+                continue
+            try:
+                await self._apply(session, migration)
+            except Exception as e:
+                logger.error(
+                    "Schema migration %d (%s) failed: %s",
+                    migration.version,
+                    migration.description,
+                    e,
+                )
+                continue
+            logger.info("Applied schema migration %d: %s", migration.version, migration.description)
+            newly_applied.append(migration.version)
+
+        self.fulltext_available = await self.fulltext_index_online(session)
+        return newly_applied
+
+    @staticmethod
+    async def fulltext_index_online(session: AsyncSession) -> bool:
+        """Check whether the full-text index exists and is online.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            True if the index can serve queries
+        """
+        result = await session.run(
+            "SHOW INDEXES YIELD name, state WHERE name = $name RETURN state",
+            name=FULLTEXT_INDEX,
+        )
+        record = await result.single()
+        return bool(record) and record["state"] == "ONLINE"
+
+
+# Global migrator instance
+schema_migrator = SchemaMigrator()
@@ -5,6 +5,9 @@ from typing import Any
 from fastapi import HTTPException
 from neo4j import AsyncSession
 
+from ..graph.snapshot import snapshot_store
+from .queries import read_records
+
 
 async def get_entity_by_id(session: AsyncSession, entity_id: str) -> dict[str, Any]:
     """Get an entity by ID from the database.
@@ -39,15 +42,31 @@ async def get_entity_by_id(session: AsyncSession, entity_id: str) -> dict[str, A
     """
 
     try:
-        result = await session.run(query, {"id": entity_id})
-        record = await result.single()
+        snapshot = await snapshot_store.ensure_fresh(session)
+        if snapshot is not None:
+            position = snapshot.entity(entity_id, by_name=False)
+            if position is None:
+                raise HTTPException(status_code=404, detail="Entity not found")
+            node = snapshot.nodes[position]
+            labels = list(node.labels)
+            relationships = [
+                {
+                    "type": snapshot.relationships[rel].type,
+                    "target": snapshot.nodes[target],
+                    "target_labels": list(snapshot.nodes[target].labels),
+                }
+                for rel, target in snapshot.outgoing(position)
+            ]
+        else:
+            records = await read_records(session, query, {"id": entity_id})
 
-        if not record:
-            raise HTTPException(status_code=404, detail="Entity not found")
+            if not records:
+                raise HTTPException(status_code=404, detail="Entity not found")
 
-        node = record["n"]
-        labels = record["labels"]
-        relationships = record["relationships"]
+            record = records[0]
+            node = record["n"]
+            labels = record["labels"]
+            relationships = record["relationships"]
 
         # Convert Neo4j node to dictionary
         entity_data = dict(node)
@@ -77,3 +96,27 @@ async def get_entity_by_id(session: AsyncSession, entity_id: str) -> dict[str, A
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}") from e
+
+
+async def fetch_nodes_by_ids(session: AsyncSession, node_ids: list[int]) -> dict[int, Any]:
+    """Hydrate several nodes by internal id in a single query.
+
+    Args:
+        session: Neo4j database session
+        node_ids: Internal Neo4j node ids
+
+    Returns:
+        Dictionary mapping node id to node
+    """
+    if not node_ids:
+        return {}
+    records = await read_records(
+        session,
+        """
+        UNWIND $ids AS node_id
+        MATCH (n) WHERE id(n) = node_id
+        RETURN node_id, n
+        """,
+        {"ids": list(node_ids)},
+    )
+    return {record["node_id"]: record["n"] for record in records}
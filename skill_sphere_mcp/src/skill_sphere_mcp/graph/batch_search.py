@@ -0,0 +1,77 @@
+"""Multi-query search served with one encode, one product and one hydration."""
+
+import asyncio
+import logging
+
+from typing import Any
+
+from neo4j import AsyncSession
+
+from ..db.utils import fetch_nodes_by_ids
+from ..models.embedding import get_embedding_model
+from .search_index import lexical_candidates
+from .vector_index import vector_index
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on queries per batch
+MAX_BATCH_QUERIES = 100
+
+
+async def rank_batch(
+    session: AsyncSession,
+    queries: list[str],
+    top_k: int = 5,
+    labels: list[str] | None = None,
+) -> list[list[tuple[Any, float]]]:
+    """Rank node ids for several queries at once.
+
+    Queries are encoded in one batch and scored against the vector index with
+    a single matrix-matrix product. Without an embedding model each query is
+    answered lexically instead, and the label filter does not apply.
+
+    Args:
+        session: Neo4j session
+        queries: Search texts
+        top_k: Maximum number of results per query
+        labels: Only consider nodes carrying any of these labels
+
+    Returns:
+        Per query, a list of (node_id, score) tuples, best first
+    """
+    if not queries:
+        return []
+    model = get_embedding_model()
+    if model is None:
+        return [await lexical_candidates(session, query, top_k) for query in queries]
+
+    await vector_index.ensure_fresh(session)
+    query_embeddings = await asyncio.to_thread(model.encode, queries)
+    return vector_index.search_batch(query_embeddings, top_k, labels)
+
+
+async def batch_search(
+    session: AsyncSession,
+    queries: list[str],
+    top_k: int = 5,
+    labels: list[str] | None = None,
+) -> list[list[tuple[Any, float]]]:
+    """Search nodes for several queries and hydrate all hits in one query.
+
+    Args:
+        session: Neo4j session
+        queries: Search texts
+        top_k: Maximum number of results per query
+        labels: Only consider nodes carrying any of these labels
+
+    Returns:
+        Per query, a list of (node, score) tuples, best first
+    """
+    ranked = await rank_batch(session, queries, top_k, labels)
+    node_ids = list(dict.fromkeys(node_id for hits in ranked for node_id, _ in hits))
+    nodes = await fetch_nodes_by_ids(session, node_ids)
+    return [
+        [(nodes[node_id], score) for node_id, score in hits if node_id in nodes]
+        for hits in ranked
+    ]
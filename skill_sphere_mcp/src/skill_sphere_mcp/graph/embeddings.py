@@ -8,9 +8,11 @@ from typing import Any
 import numpy as np
 
 from neo4j import AsyncSession
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import]
 
+from ..db.queries import read_records
+from .generation import graph_generation
 from .node2vec.model import Node2Vec
+from .vector_index import VectorIndex
 
 
 logger = logging.getLogger(__name__)
@@ -28,13 +30,18 @@ class Node2VecEmbeddings:
         self.dimension = dimension
         self._embeddings: dict[str, np.ndarray] = {}
         self._node_ids: dict[str, int] = {}
+        self._labels: dict[str, list[str]] = {}
+        self._index: VectorIndex | None = None
+        # Incremented whenever the embeddings are replaced
+        self.version = 0
         self.model: Any | None = None  # type: ignore[python-version, unused-ignore, syntax]
 
     async def load_embeddings(self, session: AsyncSession) -> None:
         """Load embeddings from graph."""
         # Get all nodes from graph
-        result = await session.run("MATCH (n) RETURN n")
-        nodes = [record async for record in result]
+        nodes = await read_records(
+            session, "MATCH (n) WHERE NOT n:GraphMeta RETURN id(n) AS node_id, labels(n) AS labels"
+        )
 
         # If no nodes found, return early
         if not nodes:
@@ -55,11 +62,31 @@ class Node2VecEmbeddings:
             if (embedding := node2vec.get_embedding(str(node["node_id"]))) is not None
         }
         self._node_ids = {str(node["node_id"]): int(node["node_id"]) for node in nodes}
+        self._labels = {str(node["node_id"]): list(node.get("labels") or []) for node in nodes}
+        self._index = None
+        self.version += 1
 
         logger.info("Computed Node2Vec embeddings for %d nodes", len(nodes))
 
+    def _get_index(self) -> VectorIndex:
+        """Return the embedding matrix, rebuilding it after the embeddings changed."""
+        if self._index is None:
+            node_ids = list(self._embeddings)
+            self._index = VectorIndex()
+            self._index.set_vectors(
+                node_ids,
+                [self._embeddings[node_id] for node_id in node_ids],
+                graph_generation.current,
+                [self._labels.get(node_id, []) for node_id in node_ids],
+            )
+        return self._index
+
     async def search(
-        self, session: AsyncSession, query_embedding: np.ndarray, top_k: int = 10
+        self,
+        session: AsyncSession,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        labels: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar nodes using cosine similarity.
 
@@ -67,6 +94,8 @@ class Node2VecEmbeddings:
             session: Neo4j session
             query_embedding: Query vector
             top_k: Number of results to return
+            labels: Only consider nodes carrying any of these labels
+                (case-insensitive); the filter is applied before ranking
 
         Returns:
             List of similar nodes with scores
@@ -74,52 +103,53 @@ class Node2VecEmbeddings:
         if not self._embeddings:
             await self.load_embeddings(session)
 
-        # Compute similarities
-        similarities = {}
-        for node_id, embedding in self._embeddings.items():
-            similarity = cosine_similarity(
-                query_embedding.reshape(1, -1), embedding.reshape(1, -1)
-            )[0][0]
-            similarities[node_id] = similarity
-
-        # Get top-k results
-        top_results = sorted(similarities.items(), key=lambda x: x[1], reverse=True)[
-            :top_k
-        ]
+        top_results = self._get_index().search(query_embedding, top_k, labels)
+        if not top_results:
+            return []
 
         # Fetch node details
-        results = []
-        for node_id, score in top_results:
-            query = """
-            MATCH (n) WHERE id(n) = $node_id
-            RETURN n, labels(n) as labels, properties(n) as props
+        records = await read_records(
+            session,
             """
-            result = await session.run(query, node_id=int(node_id))
-            record = await result.single()
-            if record:
-                results.append(
-                    {
-                        "node_id": node_id,
-                        "score": float(score),
-                        "labels": record["labels"],
-                        "properties": record["props"],
-                    }
-                )
-
-        return results
+            MATCH (n) WHERE id(n) IN $node_ids
+            RETURN id(n) AS node_id, labels(n) as labels, properties(n) as props
+            """,
+            {"node_ids": [int(node_id) for node_id, _ in top_results]},
+        )
+        details = {str(record["node_id"]): record for record in records}
+
+        return [
+            {
+                "node_id": node_id,
+                "score": float(score),
+                "labels": details[node_id]["labels"],
+                "properties": details[node_id]["props"],
+            }
+            for node_id, score in top_results
+            if node_id in details
+        ]
 
     # type: ignore[python-version, unused-ignore, syntax, union-attr]
     def get_embedding(self, node_id: str) -> np.ndarray | None:
         """Get embedding for a specific node."""
         return self._embeddings.get(node_id)
 
-    def set_all_embeddings(self, new_embeddings: dict[str, np.ndarray]) -> None:
+    def set_all_embeddings(
+        self,
+        new_embeddings: dict[str, np.ndarray],
+        labels: dict[str, list[str]] | None = None,
+    ) -> None:
         """Set all node embeddings.
 
         Args:
             new_embeddings: Dictionary mapping node IDs to their embeddings
+            labels: Optional dictionary mapping node IDs to their labels
         """
         self._embeddings = new_embeddings.copy()
+        if labels is not None:
+            self._labels = dict(labels)
+        self._index = None
+        self.version += 1
 
     def get_all_embeddings(self) -> dict[str, np.ndarray]:
         """Get all node embeddings.
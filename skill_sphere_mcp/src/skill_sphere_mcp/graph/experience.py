@@ -0,0 +1,195 @@
+"""Years of experience per person and skill, derived from job time ranges."""
+
+import asyncio
+import logging
+
+from datetime import date
+from typing import Any
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from .generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+DAYS_PER_YEAR = 365.25
+
+# End values meaning the job is still ongoing
+_OPEN_ENDS = {"", "present", "current", "now", "today", "ongoing"}
+
+
+def parse_date(value: Any, end: bool = False) -> date | None:
+    """Convert a date property to a date.
+
+    Accepts dates, Neo4j temporal values and ISO strings with year, month
+    or day precision. Partial dates round to the start of the period, or
+    to its end when ``end`` is set.
+
+    Args:
+        value: Property value
+        end: Whether the value is the end of a range; a missing or open end
+            ("present", "current", ...) then means today
+
+    Returns:
+        The date, or None if the value cannot be parsed
+    """
+    if value is None or (isinstance(value, str) and value.strip().lower() in _OPEN_ENDS):
+        return date.today() if end else None
+    if hasattr(value, "year") and hasattr(value, "month") and hasattr(value, "day"):
+        return date(value.year, value.month, value.day)
+    parts = str(value).strip()[:10].split("-")
+    try:
+        year = int(parts[0])
+        month = int(parts[1]) if len(parts) > 1 else (12 if end else 1)
+        if len(parts) > 2:
+            return date(year, month, int(parts[2]))
+        if not end:
+            return date(year, month, 1)
+        following = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return date.fromordinal(following.toordinal() - 1)
+    except ValueError:
+        return None
+
+
+def merged_years(intervals: list[tuple[date, date]]) -> float:
+    """Total length in years of the union of date intervals.
+
+    Overlapping and adjacent intervals are merged first, so concurrent jobs
+    using the same skill are not counted twice.
+
+    Args:
+        intervals: (start, end) dates; intervals ending before they start
+            are ignored
+
+    Returns:
+        Years covered by at least one interval
+    """
+    days = 0
+    merged: tuple[int, int] | None = None
+    for start, end in sorted((s, e) for s, e in intervals if e >= s):
+        first, last = start.toordinal(), end.toordinal()
+        if merged is not None and first <= merged[1] + 1:
+            merged = (merged[0], max(merged[1], last))
+            continue
+        if merged is not None:
+            days += merged[1] - merged[0] + 1
+        merged = (first, last)
+    if merged is not None:
+        days += merged[1] - merged[0] + 1
+    return days / DAYS_PER_YEAR
+
+
+class ExperienceTable:
+    """Precomputed years of experience keyed by (person id, skill name)."""
+
+    def __init__(self, years: dict[tuple[Any, str], float], generation: int):
+        """Wrap precomputed years.
+
+        Args:
+            years: Years per (person id, skill name)
+            generation: Graph generation the data belongs to
+        """
+        self._years = years
+        self.generation = generation
+        self.person_ids = sorted({person_id for person_id, _ in years}, key=str)
+
+    def __len__(self) -> int:
+        """Return the number of (person, skill) entries."""
+        return len(self._years)
+
+    def years(self, skill_name: str, person_id: Any = None) -> float | None:
+        """Return a person's years of experience with a skill.
+
+        Args:
+            skill_name: Skill name
+            person_id: Person node id; may be omitted if the table holds a
+                single person
+
+        Returns:
+            Years of experience, or None if unknown
+        """
+        if person_id is None:
+            if len(self.person_ids) != 1:
+                return None
+            person_id = self.person_ids[0]
+        return self._years.get((person_id, skill_name))
+
+
+class ExperienceStore:
+    """Holds the current experience table and rebuilds it after graph changes."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.table: ExperienceTable | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once a table has been built."""
+        return self.table is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the graph changed since the table was built."""
+        return self.table is None or self.table.generation != graph_generation.current
+
+    async def build(self, session: AsyncSession) -> ExperienceTable:
+        """Derive years per person and skill from the jobs that used the skill.
+
+        Follows ``(Person)-[:HAS_EXPERIENCE]->(Job)-[:USED_SKILL|RELATED_TO]->(Skill)``
+        and takes each job's dates from its ``DURING`` time range, falling
+        back to ``start_date``/``end_date`` on the job itself.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The new table
+        """
+        generation = graph_generation.current
+        records = await read_records(
+            session,
+            """
+            MATCH (p:Person)-[:HAS_EXPERIENCE]->(j:Job)-[:USED_SKILL|RELATED_TO]->(s:Skill)
+            OPTIONAL MATCH (j)-[:DURING]->(t:TimeRange)
+            RETURN DISTINCT id(p) AS person_id, s.name AS skill, id(j) AS job_id,
+                   coalesce(t.start, t.start_date, j.start_date) AS start_date,
+                   coalesce(t.end, t.end_date, j.end_date) AS end_date
+            """
+        )
+        intervals: dict[tuple[Any, str], list[tuple[date, date]]] = {}
+        for record in records:
+            start = parse_date(record["start_date"])
+            end = parse_date(record["end_date"], end=True)
+            if start is None or end is None:
+                continue
+            intervals.setdefault((record["person_id"], record["skill"]), []).append((start, end))
+
+        self.table = ExperienceTable(
+            {key: merged_years(ranges) for key, ranges in intervals.items()}, generation
+        )
+        logger.info("Built experience table with %d person-skill entries", len(self.table))
+        return self.table
+
+    async def ensure_fresh(self, session: AsyncSession) -> ExperienceTable | None:
+        """Rebuild the table if the graph changed since it was built.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The current table, or None if none has been built
+        """
+        if not self.is_ready:
+            return None
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.build(session)
+        return self.table
+
+
+# Global experience store instance
+experience_store = ExperienceStore()
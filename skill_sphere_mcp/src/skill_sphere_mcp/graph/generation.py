@@ -0,0 +1,141 @@
+"""Graph generation tracking for cache invalidation."""
+
+import asyncio
+import logging
+
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from ..db.queries import write_records
+from ..db.schema import GRAPH_META_KEY
+
+
+logger = logging.getLogger(__name__)
+
+# Advances the generation stored in the graph; ingestion runs the same statement
+BUMP_STORED_GENERATION = """
+MERGE (m:GraphMeta {key: $key})
+SET m.generation = coalesce(m.generation, 0) + 1, m.updated_at = datetime()
+RETURN m.generation AS generation
+"""
+
+READ_STORED_GENERATION = "MATCH (m:GraphMeta {key: $key}) RETURN m.generation AS generation"
+
+# Opens a session that is closed when the block exits
+SessionOpener = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class GraphGeneration:
+    """Monotonic counter identifying the current version of the graph.
+
+    Every write that goes through this process bumps the counter, so derived
+    in-memory structures can compare the generation they were built for with
+    the current one and rebuild when they are stale.
+
+    Writers also advance the ``generation`` property of the ``GraphMeta``
+    node. Polling it turns writes made by other processes, such as
+    hypergraph ingestion, into local bumps. Subscribers are called with the
+    new generation after every bump.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the generation counter."""
+        self._value = 0
+        self._stored: int | None = None
+        self._subscribers: list[Callable[[int], None]] = []
+
+    @property
+    def current(self) -> int:
+        """Return the current graph generation."""
+        return self._value
+
+    def bump(self) -> int:
+        """Advance the generation after a graph write.
+
+        Returns:
+            The new generation
+        """
+        self._value += 1
+        logger.debug("Graph generation advanced to %d", self._value)
+        for callback in list(self._subscribers):
+            try:
+                callback(self._value)
+            except Exception as e:
+                logger.warning("Graph generation subscriber failed: %s", e)
+        return self._value
+
+    def subscribe(self, callback: Callable[[int], None]) -> Callable[[], None]:
+        """Call a function with the new generation after every bump.
+
+        Args:
+            callback: Called with the new generation; must not block
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    async def record_write(self, session: AsyncSession) -> int:
+        """Advance the stored generation after a write, then the local one.
+
+        The local generation advances even if the stored one cannot be
+        updated, so this process never serves data older than its own write.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The new local generation
+        """
+        try:
+            records, _ = await write_records(
+                session, BUMP_STORED_GENERATION, {"key": GRAPH_META_KEY}
+            )
+            self._stored = records[0]["generation"]
+        except Exception as e:
+            logger.warning("Stored graph generation not advanced: %s", e)
+        return self.bump()
+
+    async def poll_once(self, session: AsyncSession) -> bool:
+        """Read the stored generation, bumping the local one if it moved.
+
+        The first read only records the stored generation as a baseline.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            True if another process changed the graph since the last read
+        """
+        records = await read_records(session, READ_STORED_GENERATION, {"key": GRAPH_META_KEY})
+        stored = records[0]["generation"] if records else 0
+        if self._stored is None or stored == self._stored:
+            self._stored = stored
+            return False
+        self._stored = stored
+        logger.info("Graph changed outside this process (stored generation %d)", stored)
+        self.bump()
+        return True
+
+    async def poll(self, open_session: SessionOpener, interval: float) -> None:
+        """Poll the stored generation every interval until cancelled.
+
+        Args:
+            open_session: Opens a Neo4j session for each read
+            interval: Seconds between reads
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with open_session() as session:
+                    await self.poll_once(session)
+            except Exception as e:
+                logger.warning("Graph generation poll failed: %s", e)
+
+
+# Global generation instance
+graph_generation = GraphGeneration()
@@ -0,0 +1,194 @@
+"""Hybrid lexical and vector search with score fusion."""
+
+import asyncio
+import logging
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+
+from ..db.utils import fetch_nodes_by_ids
+from ..models.embedding import get_embedding_model
+from .search_index import lexical_candidates
+from .vector_index import vector_index
+
+
+logger = logging.getLogger(__name__)
+
+FUSION_RRF = "rrf"
+FUSION_WEIGHTED = "weighted"
+FUSION_METHODS = (FUSION_RRF, FUSION_WEIGHTED)
+
+# Rank offset for reciprocal-rank fusion
+RRF_K = 60
+
+# Candidates fetched from each source per requested result
+CANDIDATE_MULTIPLIER = 3
+
+
+@dataclass
+class HybridHit:
+    """A fused search result."""
+
+    node_id: int
+    score: float
+    lexical_score: float | None = None
+    vector_score: float | None = None
+    node: Any = None
+
+
+def fuse_rrf(
+    lexical: list[tuple[int, float]],
+    vector: list[tuple[int, float]],
+    lexical_weight: float,
+    vector_weight: float,
+    k: int = RRF_K,
+) -> dict[int, float]:
+    """Fuse two ranked lists with weighted reciprocal-rank fusion.
+
+    Args:
+        lexical: Lexical (node_id, score) tuples, best first
+        vector: Vector (node_id, score) tuples, best first
+        lexical_weight: Weight of the lexical ranking
+        vector_weight: Weight of the vector ranking
+        k: Rank offset dampening the head of each list
+
+    Returns:
+        Fused score per node id
+    """
+    fused: dict[int, float] = {}
+    for ranked, weight in ((lexical, lexical_weight), (vector, vector_weight)):
+        for rank, (node_id, _) in enumerate(ranked, start=1):
+            fused[node_id] = fused.get(node_id, 0.0) + weight / (k + rank)
+    return fused
+
+
+def _min_max(ranked: list[tuple[int, float]]) -> dict[int, float]:
+    """Scale scores to [0, 1]; a list of equal scores maps to 1.0."""
+    if not ranked:
+        return {}
+    scores = np.array([score for _, score in ranked], dtype=np.float64)
+    low, high = scores.min(), scores.max()
+    scaled = (scores - low) / (high - low) if high > low else np.ones_like(scores)
+    return {node_id: float(s) for (node_id, _), s in zip(ranked, scaled)}
+
+
+def fuse_weighted(
+    lexical: list[tuple[int, float]],
+    vector: list[tuple[int, float]],
+    lexical_weight: float,
+    vector_weight: float,
+) -> dict[int, float]:
+    """Fuse two ranked lists with a weighted sum of min-max scaled scores.
+
+    Args:
+        lexical: Lexical (node_id, score) tuples, best first
+        vector: Vector (node_id, score) tuples, best first
+        lexical_weight: Weight of the lexical scores
+        vector_weight: Weight of the vector scores
+
+    Returns:
+        Fused score per node id
+    """
+    fused: dict[int, float] = {}
+    for ranked, weight in ((lexical, lexical_weight), (vector, vector_weight)):
+        for node_id, score in _min_max(ranked).items():
+            fused[node_id] = fused.get(node_id, 0.0) + weight * score
+    return fused
+
+
+async def _encode(query: str) -> np.ndarray | None:
+    """Encode the query off the event loop, or return None without a model."""
+    model = get_embedding_model()
+    if model is None:
+        return None
+    return await asyncio.to_thread(model.encode, query)
+
+
+async def _no_candidates() -> list[tuple[int, float]]:
+    """Placeholder for a disabled lexical source."""
+    return []
+
+
+async def _no_embedding() -> None:
+    """Placeholder for a disabled vector source."""
+    return None
+
+
+async def hybrid_search(
+    session: AsyncSession,
+    query: str,
+    top_k: int = 10,
+    lexical_weight: float = 0.5,
+    vector_weight: float = 0.5,
+    fusion: str = FUSION_RRF,
+) -> list[HybridHit]:
+    """Search nodes lexically and by embedding, and fuse the rankings.
+
+    The lexical lookup runs while the query is encoded in a worker thread.
+    The fused top-k is hydrated with a single query. A source with weight 0
+    is skipped.
+
+    Args:
+        session: Neo4j session
+        query: Search text
+        top_k: Maximum number of results
+        lexical_weight: Weight of the lexical ranking
+        vector_weight: Weight of the vector ranking
+        fusion: Fusion method, "rrf" or "weighted"
+
+    Returns:
+        Fused hits, best first
+
+    Raises:
+        ValueError: If the fusion method or weights are invalid
+    """
+    if fusion not in FUSION_METHODS:
+        raise ValueError(f"Unknown fusion method: {fusion}")
+    if lexical_weight < 0 or vector_weight < 0 or lexical_weight + vector_weight == 0:
+        raise ValueError("Weights must be non-negative and not both zero")
+    if top_k <= 0:
+        return []
+
+    pool = top_k * CANDIDATE_MULTIPLIER
+    if vector_weight > 0:
+        # Sessions are not concurrency-safe; load the matrix before fanning out
+        await vector_index.ensure_fresh(session)
+
+    lexical, query_embedding = await asyncio.gather(
+        lexical_candidates(session, query, pool) if lexical_weight > 0 else _no_candidates(),
+        _encode(query) if vector_weight > 0 else _no_embedding(),
+    )
+
+    vector: list[tuple[int, float]] = []
+    if query_embedding is not None:
+        try:
+            vector = vector_index.search(query_embedding, pool)
+        except ValueError as e:
+            logger.warning("Vector search skipped: %s", e)
+
+    if fusion == FUSION_RRF:
+        fused = fuse_rrf(lexical, vector, lexical_weight, vector_weight)
+    else:
+        fused = fuse_weighted(lexical, vector, lexical_weight, vector_weight)
+    ranked = sorted(fused.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+    if not ranked:
+        return []
+
+    lexical_scores = dict(lexical)
+    vector_scores = dict(vector)
+    nodes = await fetch_nodes_by_ids(session, [node_id for node_id, _ in ranked])
+    return [
+        HybridHit(
+            node_id=node_id,
+            score=score,
+            lexical_score=lexical_scores.get(node_id),
+            vector_score=vector_scores.get(node_id),
+            node=nodes[node_id],
+        )
+        for node_id, score in ranked
+        if node_id in nodes
+    ]
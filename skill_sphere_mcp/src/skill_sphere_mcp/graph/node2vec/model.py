@@ -1,5 +1,6 @@
 """Main Node2Vec implementation."""
 
+import asyncio
 import logging
 
 from collections import defaultdict
@@ -8,6 +9,7 @@ import numpy as np
 
 from neo4j import AsyncSession
 
+from ...db.queries import read_records
 from .config import Node2VecConfig
 from .config import PreprocessConfig
 from .config import TransitionConfig
@@ -162,12 +164,12 @@ class Node2Vec:
         """
         query = """
         MATCH (n)
+        WHERE NOT n:GraphMeta
         OPTIONAL MATCH (n)-[r]->(m)
         RETURN id(n) as node_id, collect(id(m)) as neighbors
         """
-        result = await session.run(query)
         graph = {}
-        async for record in result:
+        for record in await read_records(session, query):
             node_id = str(record["node_id"])
             neighbors = [str(n) for n in record["neighbors"] if n is not None]
             graph[node_id] = neighbors
@@ -272,8 +274,17 @@ class Node2Vec:
         Args:
             session: Neo4j session
         """
-        # Get graph structure
-        self._state.graph = await self.get_graph(session)
+        graph = await self.get_graph(session)
+        # Walks and training are CPU-bound, so keep them off the event loop
+        await asyncio.to_thread(self.fit_graph, graph)
+
+    def fit_graph(self, graph: dict[str, list[str]]) -> None:
+        """Fit Node2Vec model to a graph fetched with ``get_graph``.
+
+        Args:
+            graph: Dictionary mapping node IDs to their neighbors
+        """
+        self._state.graph = graph
 
         # Preprocess transition probabilities
         self.preprocess_transition_probs(self._state.graph)
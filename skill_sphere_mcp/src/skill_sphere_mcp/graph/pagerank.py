@@ -0,0 +1,228 @@
+"""Personalized PageRank relevance over a graph snapshot."""
+
+import logging
+import re
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+from scipy import sparse  # type: ignore[import-untyped]
+
+from .snapshot import GraphSnapshot
+from .snapshot import snapshot_store
+
+
+logger = logging.getLogger(__name__)
+
+# Probability of following a relationship rather than restarting at a seed
+DAMPING = 0.85
+
+# L1 change between iterations at which the power iteration stops
+TOLERANCE = 1e-6
+
+MAX_ITERATIONS = 100
+
+# Upper bound on cached score vectors per snapshot
+SCORE_CACHE_SIZE = 1024
+
+# Evidence entries returned per explanation by default
+EVIDENCE_TOP_K = 5
+
+# Longest skill name, in words, recognized in a role requirement
+MAX_NAME_WORDS = 3
+
+_WORD = re.compile(r"[\w+#.]+")
+
+
+def personalized_pagerank(
+    transition: sparse.csr_matrix,
+    dangling: np.ndarray,
+    restart: np.ndarray,
+    damping: float = DAMPING,
+    tolerance: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> np.ndarray:
+    """Run the power iteration for several restart distributions at once.
+
+    Each column of ``restart`` is solved independently, but all columns
+    share one sparse product per iteration. Random walkers at nodes without
+    relationships jump back to their own restart distribution.
+
+    Args:
+        transition: Column-stochastic (n, n) transition matrix
+        dangling: Boolean mask of the n nodes without relationships
+        restart: (n, m) restart distributions, each column summing to 1
+        damping: Probability of following a relationship
+        tolerance: Largest L1 change per column at which to stop
+        max_iterations: Iteration cap
+
+    Returns:
+        (n, m) stationary scores, each column summing to 1
+    """
+    scores = restart.copy()
+    for _ in range(max_iterations):
+        stranded = scores[dangling].sum(axis=0)
+        updated = damping * (transition @ scores) + (damping * stranded + 1 - damping) * restart
+        change = np.abs(updated - scores).sum(axis=0)
+        scores = updated
+        if change.max(initial=0.0) < tolerance:
+            break
+    return scores
+
+
+class PageRankIndex:
+    """Sparse random-walk matrix of a snapshot with cached relevance scores.
+
+    Relationships are walked in both directions, like the undirected
+    traversals of the snapshot. Scores are cached per seed set; the cache
+    lives as long as the index, which is rebuilt with the snapshot.
+    """
+
+    def __init__(self, snapshot: GraphSnapshot):
+        """Build the transition matrix and the skill name lookup.
+
+        Args:
+            snapshot: Graph snapshot
+        """
+        self.generation = snapshot.generation
+        size = len(snapshot)
+        endpoints = snapshot.endpoints
+        rows = np.concatenate([endpoints[:, 1], endpoints[:, 0]])
+        cols = np.concatenate([endpoints[:, 0], endpoints[:, 1]])
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(size, size)
+        )
+        degree = np.asarray(adjacency.sum(axis=0)).ravel()
+        self.dangling = degree == 0
+        inverse = np.divide(1.0, degree, out=np.zeros(size), where=~self.dangling)
+        self.transition = (adjacency @ sparse.diags(inverse)).tocsr()
+        self.skill_positions: dict[str, list[int]] = {}
+        for position, node in enumerate(snapshot.nodes):
+            if "Skill" in node.labels and node.get("name"):
+                self.skill_positions.setdefault(str(node["name"]).lower(), []).append(position)
+        self._scores: OrderedDict[tuple[int, ...], np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.dangling)
+
+    def mentioned_skills(self, text: str) -> list[int]:
+        """Return the positions of skills named in free text.
+
+        Names are matched case-insensitively on whole words, so "Go" is found
+        in "Go developer" but not in "good".
+        """
+        words = _WORD.findall(text.lower())
+        found: dict[int, None] = {}
+        for length in range(1, MAX_NAME_WORDS + 1):
+            for start in range(len(words) - length + 1):
+                name = " ".join(words[start : start + length])
+                for position in self.skill_positions.get(name, []):
+                    found[position] = None
+        return list(found)
+
+    def scores(self, seeds: Iterable[int]) -> np.ndarray:
+        """Return the personalized PageRank of every node for one seed set."""
+        return self.scores_many([seeds])[0]
+
+    def scores_many(self, seed_sets: list[Iterable[int]]) -> list[np.ndarray]:
+        """Return personalized PageRank vectors for several seed sets.
+
+        Restarts are uniform over each set's seeds. Sets not in the cache
+        are solved together in one power iteration.
+
+        Args:
+            seed_sets: Node positions to restart from, per query
+
+        Returns:
+            Score vector per seed set; an empty set scores every node 0
+        """
+        keys = [tuple(sorted(set(seeds))) for seeds in seed_sets]
+        missing = [key for key in dict.fromkeys(keys) if key and key not in self._scores]
+        if missing:
+            restart = np.zeros((len(self), len(missing)))
+            for column, key in enumerate(missing):
+                restart[list(key), column] = 1.0 / len(key)
+            solved = personalized_pagerank(self.transition, self.dangling, restart)
+            for column, key in enumerate(missing):
+                self._scores[key] = solved[:, column]
+            while len(self._scores) > SCORE_CACHE_SIZE:
+                self._scores.popitem(last=False)
+
+        vectors = []
+        for key in keys:
+            if not key:
+                vectors.append(np.zeros(len(self)))
+                continue
+            self._scores.move_to_end(key)
+            vectors.append(self._scores[key])
+        return vectors
+
+
+class PageRankStore:
+    """Keeps the PageRank index in step with the current graph snapshot."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.index: PageRankIndex | None = None
+
+    def index_for(self, snapshot: GraphSnapshot) -> PageRankIndex:
+        """Return the index of a snapshot, rebuilding it for a new generation.
+
+        Args:
+            snapshot: Current graph snapshot
+
+        Returns:
+            Index whose cached scores belong to the snapshot's generation
+        """
+        if self.index is None or self.index.generation != snapshot.generation:
+            self.index = PageRankIndex(snapshot)
+            logger.info("Built PageRank index over %d nodes", len(self.index))
+        return self.index
+
+
+# Global PageRank store instance
+pagerank_store = PageRankStore()
+
+
+async def rank_evidence(
+    session: AsyncSession,
+    skill_node_id: Any,
+    role_requirement: str,
+    evidence: list[tuple[Any, dict[str, Any]]],
+    top_k: int = EVIDENCE_TOP_K,
+) -> list[dict[str, Any]]:
+    """Keep the evidence most relevant to a skill and a role requirement.
+
+    Evidence nodes are ranked by personalized PageRank restarting at the
+    skill and at the skills named in the requirement, and each kept entry
+    gets its ``relevance`` score. Without a graph snapshot, or if the skill
+    is not in it, the first ``top_k`` entries are kept in their given order.
+
+    Args:
+        session: Neo4j session
+        skill_node_id: Node id of the skill being explained
+        role_requirement: Free-text role requirement
+        evidence: (node id, evidence entry) pairs
+        top_k: Number of entries to keep
+
+    Returns:
+        Evidence entries, most relevant first
+    """
+    snapshot = await snapshot_store.ensure_fresh(session) if evidence else None
+    skill = snapshot.positions.get(skill_node_id) if snapshot is not None else None
+    if snapshot is None or skill is None:
+        return [entry for _, entry in evidence[:top_k]]
+
+    index = pagerank_store.index_for(snapshot)
+    scores = index.scores([skill, *index.mentioned_skills(role_requirement)])
+    ranked = []
+    for node_id, entry in evidence:
+        position = snapshot.positions.get(node_id)
+        ranked.append((float(scores[position]) if position is not None else 0.0, entry))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+    return [{**entry, "relevance": round(score, 6)} for score, entry in ranked[:top_k]]
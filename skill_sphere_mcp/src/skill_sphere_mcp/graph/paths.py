@@ -0,0 +1,257 @@
+"""Bounded-hop path search over a graph snapshot."""
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from .snapshot import GraphSnapshot
+
+
+@dataclass
+class Path:
+    """A path as node positions and the relationship indexes between them."""
+
+    nodes: list[int]
+    relationships: list[int]
+
+
+def shortest_path(
+    snapshot: GraphSnapshot, source: int, target: int, max_hops: int = 3
+) -> Path | None:
+    """Find a shortest undirected path with bidirectional BFS.
+
+    The frontier with fewer nodes is expanded first, so hub nodes on one side
+    do not dominate the search.
+
+    Args:
+        snapshot: Graph snapshot
+        source: Start node position
+        target: End node position
+        max_hops: Maximum number of relationships in the path
+
+    Returns:
+        The path, or None if the nodes are not connected within max_hops
+    """
+    if source == target:
+        return Path(nodes=[source], relationships=[])
+
+    # node -> (previous node, relationship) towards the respective endpoint
+    forward: dict[int, tuple[int, int] | None] = {source: None}
+    backward: dict[int, tuple[int, int] | None] = {target: None}
+    forward_frontier = [source]
+    backward_frontier = [target]
+    hops = 0
+
+    while forward_frontier and backward_frontier and hops < max_hops:
+        expand_forward = len(forward_frontier) <= len(backward_frontier)
+        frontier = forward_frontier if expand_forward else backward_frontier
+        visited = forward if expand_forward else backward
+        other = backward if expand_forward else forward
+
+        next_frontier = []
+        meeting = None
+        for node in frontier:
+            neighbors, rels = snapshot.adjacent(node)
+            for neighbor, rel in zip(neighbors.tolist(), rels.tolist()):
+                if neighbor in visited:
+                    continue
+                visited[neighbor] = (node, rel)
+                if neighbor in other:
+                    meeting = neighbor
+                    break
+                next_frontier.append(neighbor)
+            if meeting is not None:
+                break
+        hops += 1
+
+        if meeting is not None:
+            return _join(forward, backward, meeting)
+        if expand_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return None
+
+
+def best_shortest_path(
+    snapshot: GraphSnapshot,
+    source: int,
+    target: int,
+    weights: np.ndarray,
+    max_hops: int = 3,
+) -> Path | None:
+    """Find the shortest undirected path with the most weight on its nodes.
+
+    Among all paths of minimal length, the one whose inner nodes have the
+    largest total weight wins, instead of whichever the BFS meets first.
+
+    Args:
+        snapshot: Graph snapshot
+        source: Start node position
+        target: End node position
+        weights: Weight per node position, e.g. relevance scores
+        max_hops: Maximum number of relationships in the path
+
+    Returns:
+        The path, or None if the nodes are not connected within max_hops
+    """
+    if source == target:
+        return Path(nodes=[source], relationships=[])
+    to_target = _distances(snapshot, target, max_hops)
+    hops = to_target.get(source)
+    if hops is None:
+        return None
+
+    # Best (total weight, parent, relationship) per node of the current layer,
+    # keeping only nodes that still lie on a shortest path
+    layer: dict[int, tuple[float, int | None, int | None]] = {source: (0.0, None, None)}
+    parents: list[dict[int, tuple[float, int | None, int | None]]] = [layer]
+    for remaining in range(hops - 1, -1, -1):
+        following: dict[int, tuple[float, int | None, int | None]] = {}
+        for node, (total, _, _) in layer.items():
+            neighbors, rels = snapshot.adjacent(node)
+            for neighbor, rel in zip(neighbors.tolist(), rels.tolist()):
+                if to_target.get(neighbor) != remaining:
+                    continue
+                score = total + float(weights[neighbor])
+                if neighbor not in following or score > following[neighbor][0]:
+                    following[neighbor] = (score, node, rel)
+        layer = following
+        parents.append(layer)
+
+    nodes = [target]
+    relationships: list[int] = []
+    for depth in range(hops, 0, -1):
+        _, previous, rel = parents[depth][nodes[0]]
+        nodes.insert(0, previous)  # type: ignore[arg-type]
+        relationships.insert(0, rel)  # type: ignore[arg-type]
+    return Path(nodes=nodes, relationships=relationships)
+
+
+def _distances(snapshot: GraphSnapshot, start: int, max_hops: int) -> dict[int, int]:
+    """Return the hop distance from a node to every node within max_hops."""
+    distances = {start: 0}
+    frontier = [start]
+    for hops in range(1, max_hops + 1):
+        next_frontier = []
+        for node in frontier:
+            for neighbor in snapshot.adjacent(node)[0].tolist():
+                if neighbor not in distances:
+                    distances[neighbor] = hops
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+def nearest_target(
+    snapshot: GraphSnapshot, source: int, targets: set[int], max_hops: int = 3
+) -> Path | None:
+    """Find a shortest undirected path from a node to the closest of several targets.
+
+    Args:
+        snapshot: Graph snapshot
+        source: Start node position
+        targets: Candidate end node positions
+        max_hops: Maximum number of relationships in the path
+
+    Returns:
+        The path, ending at the first target reached, or None if no target
+        is within max_hops
+    """
+    if source in targets:
+        return Path(nodes=[source], relationships=[])
+    parents: dict[int, tuple[int, int] | None] = {source: None}
+    frontier = [source]
+    for _ in range(max_hops):
+        next_frontier = []
+        for node in frontier:
+            neighbors, rels = snapshot.adjacent(node)
+            for neighbor, rel in zip(neighbors.tolist(), rels.tolist()):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = (node, rel)
+                if neighbor in targets:
+                    return _join(parents, {neighbor: None}, neighbor)
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+    return None
+
+
+def _join(
+    forward: dict[int, tuple[int, int] | None],
+    backward: dict[int, tuple[int, int] | None],
+    meeting: int,
+) -> Path:
+    """Assemble a path from the two BFS parent maps and their meeting node."""
+    nodes = [meeting]
+    relationships: list[int] = []
+    step = forward[meeting]
+    while step is not None:
+        previous, rel = step
+        nodes.insert(0, previous)
+        relationships.insert(0, rel)
+        step = forward[previous]
+    step = backward[meeting]
+    while step is not None:
+        following, rel = step
+        nodes.append(following)
+        relationships.append(rel)
+        step = backward[following]
+    return Path(nodes=nodes, relationships=relationships)
+
+
+def bounded_paths(
+    snapshot: GraphSnapshot,
+    starts: Iterable[int],
+    min_hops: int = 1,
+    max_hops: int = 3,
+) -> Iterator[Path]:
+    """Enumerate undirected paths of bounded length from the start nodes.
+
+    Like Cypher variable-length patterns, a relationship is used at most
+    once per path. Paths are produced lazily, so callers can stop after the
+    number they need without expanding the rest of a hub's neighborhood.
+
+    Args:
+        snapshot: Graph snapshot
+        starts: Start node positions
+        min_hops: Minimum number of relationships per path
+        max_hops: Maximum number of relationships per path
+
+    Yields:
+        Paths in depth-first order
+    """
+    for start in starts:
+        # Stack of (node, path so far, iterator over the node's adjacency)
+        nodes = [start]
+        rels: list[int] = []
+        stack = [_adjacency(snapshot, start)]
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                if rels:
+                    rels.pop()
+                    nodes.pop()
+                continue
+            neighbor, rel = step
+            if rel in rels:
+                continue
+            nodes.append(neighbor)
+            rels.append(rel)
+            if len(rels) >= min_hops:
+                yield Path(nodes=list(nodes), relationships=list(rels))
+            if len(rels) < max_hops:
+                stack.append(_adjacency(snapshot, neighbor))
+            else:
+                rels.pop()
+                nodes.pop()
+
+
+def _adjacency(snapshot: GraphSnapshot, node: int) -> Iterator[tuple[int, int]]:
+    """Iterate over (neighbor, relationship) pairs of a node."""
+    neighbors, rels = snapshot.adjacent(node)
+    return zip(neighbors.tolist(), rels.tolist())
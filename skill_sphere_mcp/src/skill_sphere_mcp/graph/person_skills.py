@@ -0,0 +1,210 @@
+"""Bitset index of the skills each person has."""
+
+import asyncio
+import logging
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from .generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+# Number of set bits per byte value
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+class PersonSkillIndex:
+    """Packed Person x Skill membership bits over interned skill names.
+
+    Row ``i`` has bit ``j`` set if person ``i`` has a ``HAS_SKILL``
+    relationship to the skill interned as ``j``. Coverage of a skill set is
+    a bitwise AND against a packed query mask, so all persons are scored in
+    one vectorized pass.
+    """
+
+    def __init__(
+        self,
+        person_ids: list[Any],
+        person_names: list[str | None],
+        skills: list[Iterable[str]],
+        generation: int,
+    ):
+        """Intern the skill names and pack the membership bits.
+
+        Args:
+            person_ids: Person node ids
+            person_names: Person names per node id
+            skills: Skill names per person
+            generation: Graph generation the data belongs to
+        """
+        self.person_ids = list(person_ids)
+        self.person_names = list(person_names)
+        self.generation = generation
+        self.skill_bits: dict[str, int] = {}
+        members: list[list[int]] = []
+        for held in skills:
+            members.append(
+                [self.skill_bits.setdefault(name, len(self.skill_bits)) for name in held]
+            )
+        dense = np.zeros((len(members), max(len(self.skill_bits), 1)), dtype=bool)
+        for row, bits in enumerate(members):
+            dense[row, bits] = True
+        self.bits = np.packbits(dense, axis=1)
+        self.skill_names = list(self.skill_bits)
+
+    def __len__(self) -> int:
+        """Return the number of persons."""
+        return len(self.person_ids)
+
+    def mask(self, skill_names: Iterable[str]) -> np.ndarray:
+        """Pack the known skills among the names into a query mask."""
+        dense = np.zeros(self.bits.shape[1] * 8, dtype=bool)
+        for name in skill_names:
+            bit = self.skill_bits.get(name)
+            if bit is not None:
+                dense[bit] = True
+        return np.packbits(dense)
+
+    def coverage(self, skill_names: list[str]) -> np.ndarray:
+        """Return the fraction of the skills each person has.
+
+        Args:
+            skill_names: Required skill names; duplicates count once
+
+        Returns:
+            Coverage in [0, 1] per person
+        """
+        names = list(dict.fromkeys(skill_names))
+        if not names or len(self) == 0:
+            return np.zeros(len(self))
+        counts = _POPCOUNT[self.bits & self.mask(names)].sum(axis=1, dtype=np.int64)
+        return counts / len(names)
+
+    def covering(self, skill_names: list[str]) -> list[Any]:
+        """Return the ids of the persons that have all of the skills."""
+        names = list(dict.fromkeys(skill_names))
+        if any(name not in self.skill_bits for name in names):
+            return []
+        query = self.mask(names)
+        rows = np.flatnonzero(((self.bits & query) == query).all(axis=1))
+        return [self.person_ids[row] for row in rows]
+
+    def skills_of(self, person_id: Any) -> list[str]:
+        """Return the names of the skills a person has."""
+        row = self.person_ids.index(person_id)
+        held = np.flatnonzero(np.unpackbits(self.bits[row])[: len(self.skill_names)])
+        return [self.skill_names[bit] for bit in held]
+
+    def gaps(self, skill_names: list[str], person_id: Any) -> list[str]:
+        """Return the skills, in input order, that a person does not have."""
+        return self._row_gaps(self.person_ids.index(person_id), skill_names)
+
+    def _row_gaps(self, row: int, skill_names: list[str]) -> list[str]:
+        """Return the skills, in input order, missing from an index row."""
+        held = np.unpackbits(self.bits[row])
+        return [
+            name
+            for name in skill_names
+            if (bit := self.skill_bits.get(name)) is None or not held[bit]
+        ]
+
+    def best_match(self, skill_names: list[str]) -> tuple[Any | None, list[str], list[str]]:
+        """Find the person covering most of the skills.
+
+        Ties go to the person loaded first.
+
+        Args:
+            skill_names: Required skill names
+
+        Returns:
+            Tuple of the person id (None if nobody has any of the skills),
+            the skills that person has and the gaps, both in input order
+        """
+        coverage = self.coverage(skill_names)
+        if coverage.size == 0 or coverage.max() == 0:
+            return None, [], list(skill_names)
+        row = int(np.argmax(coverage))
+        gaps = self._row_gaps(row, skill_names)
+        missing = set(gaps)
+        return self.person_ids[row], [name for name in skill_names if name not in missing], gaps
+
+
+class PersonSkillStore:
+    """Holds the current person-skill index and rebuilds it after graph changes."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.index: PersonSkillIndex | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once an index has been built."""
+        return self.index is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the graph changed since the index was built."""
+        return self.index is None or self.index.generation != graph_generation.current
+
+    async def build(self, session: AsyncSession) -> PersonSkillIndex:
+        """Load every person with the names of their skills.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The new index
+        """
+        generation = graph_generation.current
+        records = await read_records(
+            session,
+            """
+            MATCH (p:Person)
+            OPTIONAL MATCH (p)-[:HAS_SKILL]->(s:Skill)
+            RETURN id(p) AS person_id, p.name AS name, collect(DISTINCT s.name) AS skills
+            """
+        )
+        person_ids = []
+        names = []
+        skills = []
+        for record in records:
+            person_ids.append(record["person_id"])
+            names.append(record["name"])
+            skills.append([name for name in record["skills"] if name is not None])
+        self.index = PersonSkillIndex(person_ids, names, skills, generation)
+        logger.info(
+            "Built person-skill index over %d persons and %d skills",
+            len(self.index),
+            len(self.index.skill_bits),
+        )
+        return self.index
+
+    async def ensure_fresh(self, session: AsyncSession) -> PersonSkillIndex | None:
+        """Rebuild the index if the graph changed since it was built.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The current index, or None if none has been built and callers
+            should query Neo4j instead
+        """
+        if not self.is_ready:
+            return None
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.build(session)
+        return self.index
+
+
+# Global person-skill index instance
+person_skills = PersonSkillStore()
@@ -0,0 +1,361 @@
+"""In-memory inverted index for lexical node search."""
+
+import asyncio
+import logging
+import math
+import re
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from ..db.schema import FULLTEXT_INDEX
+from ..db.schema import schema_migrator
+from ..db.utils import fetch_nodes_by_ids
+from .generation import graph_generation
+from .snapshot import snapshot_store
+
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Size of the character n-grams used to resolve substring matches
+NGRAM_SIZE = 3
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _ngrams(term: str) -> set[str]:
+    """Return the character n-grams of a term."""
+    return {term[i : i + NGRAM_SIZE] for i in range(len(term) - NGRAM_SIZE + 1)}
+
+
+@dataclass
+class IndexedNode:
+    """Lowercased searchable text of a single node."""
+
+    node_id: int
+    name: str
+    description: str
+    length: int
+
+
+class SearchIndex:
+    """Token and trigram inverted index over node name and description.
+
+    Query tokens are resolved to vocabulary terms through a trigram index, so
+    substring queries are answered from the index instead of scanning every
+    node. Candidates are ranked with BM25.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._docs: dict[int, IndexedNode] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._term_grams: dict[str, set[str]] = {}
+        self._terms: list[str] = []
+        self._avg_length = 0.0
+        self._generation: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the index has been built."""
+        return self._generation is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the graph changed since the index was built."""
+        return self._generation != graph_generation.current
+
+    def __len__(self) -> int:
+        """Return the number of indexed nodes."""
+        return len(self._docs)
+
+    def clear(self) -> None:
+        """Drop all indexed data."""
+        self._docs = {}
+        self._postings = {}
+        self._term_grams = {}
+        self._terms = []
+        self._avg_length = 0.0
+        self._generation = None
+
+    def add(self, node_id: int, name: Any, description: Any) -> None:
+        """Index a single node.
+
+        Args:
+            node_id: Internal Neo4j node id
+            name: Node name property
+            description: Node description property
+        """
+        name_text = str(name).lower() if name is not None else ""
+        desc_text = str(description).lower() if description is not None else ""
+        tokens = tokenize(name_text) + tokenize(desc_text)
+        self._docs[node_id] = IndexedNode(
+            node_id=node_id, name=name_text, description=desc_text, length=len(tokens)
+        )
+        for term, freq in Counter(tokens).items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                for gram in _ngrams(term):
+                    self._term_grams.setdefault(gram, set()).add(term)
+            postings[node_id] = freq
+
+    def finalize(self, generation: int) -> None:
+        """Compute corpus statistics and mark the index as built.
+
+        Args:
+            generation: Graph generation the indexed data belongs to
+        """
+        self._terms = list(self._postings)
+        total = sum(doc.length for doc in self._docs.values())
+        self._avg_length = total / len(self._docs) if self._docs else 0.0
+        self._generation = generation
+
+    async def build(self, session: AsyncSession) -> None:
+        """Build the index from all nodes that have a name or description.
+
+        Args:
+            session: Neo4j session
+        """
+        generation = graph_generation.current
+        records = await read_records(
+            session,
+            """
+            MATCH (n)
+            WHERE n.name IS NOT NULL OR n.description IS NOT NULL
+            RETURN id(n) AS node_id, n.name AS name, n.description AS description
+            """,
+        )
+        self.clear()
+        for record in records:
+            self.add(record["node_id"], record["name"], record["description"])
+        self.finalize(generation)
+        logger.info("Built search index over %d nodes", len(self._docs))
+
+    async def ensure_fresh(self, session: AsyncSession) -> bool:
+        """Rebuild the index if the graph changed since it was built.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            True if the index is ready to serve queries
+        """
+        if not self.is_ready:
+            return False
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.build(session)
+        return True
+
+    def _expand(self, token: str) -> list[str]:
+        """Return vocabulary terms that contain the given query token."""
+        if len(token) < NGRAM_SIZE:
+            return [term for term in self._terms if token in term]
+        grams = sorted(_ngrams(token), key=lambda g: len(self._term_grams.get(g, ())))
+        candidates = set(self._term_grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._term_grams.get(gram, set())
+        return [term for term in candidates if token in term]
+
+    def _bm25(self, term: str, node_id: int) -> float:
+        """Score a single term for a single node."""
+        postings = self._postings[term]
+        freq = postings[node_id]
+        idf = math.log(1 + (len(self._docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+        norm = 1 - BM25_B + BM25_B * self._docs[node_id].length / (self._avg_length or 1.0)
+        return idf * freq * (BM25_K1 + 1) / (freq + BM25_K1 * norm)
+
+    def search(self, query: str, top_k: int = 10) -> list[tuple[int, float]]:
+        """Find nodes whose name or description contains the query.
+
+        Matching is case-insensitive. Results are ordered by BM25 score, with
+        partial-token matches weighted by how much of the term they cover.
+
+        Args:
+            query: Substring to search for
+            top_k: Maximum number of results
+
+        Returns:
+            List of (node_id, score) tuples, best first
+        """
+        phrase = query.strip().lower()
+        tokens = tokenize(phrase)
+        if not tokens or top_k <= 0:
+            return []
+
+        scores: dict[int, float] | None = None
+        for token in dict.fromkeys(tokens):
+            token_scores: dict[int, float] = {}
+            for term in self._expand(token):
+                coverage = len(token) / len(term)
+                for node_id in self._postings[term]:
+                    if scores is not None and node_id not in scores:
+                        continue
+                    score = coverage * self._bm25(term, node_id)
+                    if score > token_scores.get(node_id, 0.0):
+                        token_scores[node_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {nid: scores[nid] + s for nid, s in token_scores.items()}
+            if not scores:
+                return []
+
+        ranked = [
+            (node_id, score)
+            for node_id, score in (scores or {}).items()
+            if phrase in self._docs[node_id].name or phrase in self._docs[node_id].description
+        ]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:top_k]
+
+
+def fulltext_query(query: str) -> str | None:
+    """Build a Lucene query matching nodes that contain every query token.
+
+    Tokens only contain word characters, so no Lucene escaping is needed.
+
+    Args:
+        query: Substring to search for
+
+    Returns:
+        Lucene query string, or None if the query has no searchable tokens
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " AND ".join(f"*{token}*" for token in dict.fromkeys(tokens))
+
+
+async def fulltext_search(
+    session: AsyncSession, query: str, limit: int
+) -> list[tuple[Any, float]]:
+    """Search nodes through the Neo4j full-text index.
+
+    Args:
+        session: Neo4j session
+        query: Substring to search for
+        limit: Maximum number of results
+
+    Returns:
+        Ranked list of (node, score) tuples
+    """
+    lucene_query = fulltext_query(query)
+    if lucene_query is None or limit <= 0:
+        return []
+    records = await read_records(
+        session,
+        """
+        CALL db.index.fulltext.queryNodes($index, $query, {limit: $limit})
+        YIELD node, score
+        RETURN node, score
+        """,
+        {"index": FULLTEXT_INDEX, "query": lucene_query, "limit": limit},
+    )
+    return [(record["node"], record["score"]) for record in records]
+
+
+async def search_nodes(
+    session: AsyncSession, query: str, limit: int
+) -> list[tuple[Any, float]] | None:
+    """Resolve a substring query through an index and hydrate the hits.
+
+    The in-memory index is preferred; the Neo4j full-text index is used when
+    the in-memory one is not built. Hits of the in-memory index are hydrated
+    from the graph snapshot when it is built.
+
+    Args:
+        session: Neo4j session
+        query: Substring to search for
+        limit: Maximum number of results
+
+    Returns:
+        Ranked list of (node, score) tuples, or None if no index is available
+        and callers should fall back to a Cypher scan
+    """
+    if not await search_index.ensure_fresh(session):
+        if not schema_migrator.fulltext_available:
+            return None
+        try:
+            return await fulltext_search(session, query, limit)
+        except Exception as e:
+            logger.warning("Full-text search failed, falling back to scan: %s", e)
+            return None
+    ranked = search_index.search(query, limit)
+    if not ranked:
+        return []
+    snapshot = await snapshot_store.ensure_fresh(session)
+    if snapshot is not None:
+        nodes = {node_id: snapshot.node(node_id) for node_id, _ in ranked}
+        nodes = {node_id: node for node_id, node in nodes.items() if node is not None}
+    else:
+        nodes = await fetch_nodes_by_ids(session, [node_id for node_id, _ in ranked])
+    return [(nodes[node_id], score) for node_id, score in ranked if node_id in nodes]
+
+
+async def lexical_candidates(
+    session: AsyncSession, query: str, limit: int
+) -> list[tuple[int, float]]:
+    """Return ranked node ids for a substring query without hydrating them.
+
+    Uses the in-memory index, then the full-text index, then a Cypher scan.
+    Scan hits have no relevance signal and all score 1.0.
+
+    Args:
+        session: Neo4j session
+        query: Substring to search for
+        limit: Maximum number of results
+
+    Returns:
+        List of (node_id, score) tuples, best first
+    """
+    if await search_index.ensure_fresh(session):
+        return search_index.search(query, limit)
+    if schema_migrator.fulltext_available and (lucene_query := fulltext_query(query)):
+        try:
+            records = await read_records(
+                session,
+                """
+                CALL db.index.fulltext.queryNodes($index, $query, {limit: $limit})
+                YIELD node, score
+                RETURN id(node) AS node_id, score
+                """,
+                {"index": FULLTEXT_INDEX, "query": lucene_query, "limit": limit},
+            )
+            return [(record["node_id"], record["score"]) for record in records]
+        except Exception as e:
+            logger.warning("Full-text search failed, falling back to scan: %s", e)
+    records = await read_records(
+        session,
+        """
+        MATCH (n)
+        WHERE toLower(n.name) CONTAINS toLower($query)
+        OR toLower(n.description) CONTAINS toLower($query)
+        RETURN id(n) AS node_id
+        LIMIT $limit
+        """,
+        {"query": query, "limit": limit},
+    )
+    return [(record["node_id"], 1.0) for record in records]
+
+
+# Global search index instance
+search_index = SearchIndex()
@@ -2,20 +2,54 @@
 
 import logging
 
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 
 from neo4j import AsyncSession
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
+from scipy.optimize import linear_sum_assignment  # type: ignore[import-untyped]
 
+from ..db.queries import read_records
 from .embeddings import embeddings
+from .experience import experience_store
+from .generation import graph_generation
 from .node2vec.model import Node2Vec
+from .pagerank import pagerank_store
+from .paths import best_shortest_path
+from .paths import nearest_target
+from .skill_neighbors import skill_neighbors
+from .snapshot import GraphSnapshot
+from .snapshot import snapshot_store
 
 
 logger = logging.getLogger(__name__)
 
+# Ways of pairing requirements with candidate skills
+ASSIGN_BEST = "best"
+ASSIGN_GREEDY = "greedy"
+ASSIGN_HUNGARIAN = "hungarian"
+ASSIGNMENT_METHODS = (ASSIGN_BEST, ASSIGN_GREEDY, ASSIGN_HUNGARIAN)
+
+# Maximum length of an evidence path between two skills
+EVIDENCE_MAX_HOPS = 3
+
+# Upper bound on cached evidence pairs per graph generation
+EVIDENCE_CACHE_SIZE = 10_000
+
+# Groupings of a batch ranking
+RANK_BY_ROLE = "role"
+RANK_BY_CANDIDATE = "candidate"
+RANK_GROUPINGS = (RANK_BY_ROLE, RANK_BY_CANDIDATE)
+
+# Candidates scored per block in a batch ranking, bounding the score matrix
+RANK_CANDIDATE_BLOCK = 256
+
+# Upper bounds on the size of a batch ranking request
+MAX_RANK_ROLES = 500
+MAX_RANK_CANDIDATES = 5000
+
 
 @dataclass
 class SkillMatch:
@@ -37,6 +71,81 @@ class MatchResult:
     supporting_nodes: list[dict[str, Any]]
 
 
+@dataclass
+class GapRecommendation:
+    """Up-skilling suggestion for a missing skill."""
+
+    skill_name: str
+    # Held skills closest to the gap in embedding space, best first
+    nearest_skills: list[dict[str, Any]]
+    # Held skill the shortest graph path to the gap starts from, if any
+    bridge_from: str | None
+    # Nodes and relationships along that path
+    bridge: list[dict[str, Any]]
+
+
+@dataclass
+class RankedMatch:
+    """A scored role and candidate pair of a batch ranking."""
+
+    role_index: int
+    candidate_index: int
+    overall_score: float
+    matching_skills: list[SkillMatch]
+    skill_gaps: list[str]
+
+
+@dataclass
+class Ranking:
+    """Best matches of one role, or of one candidate, in a batch ranking."""
+
+    index: int
+    matches: list[RankedMatch]
+
+
+def assign_skills(scores: np.ndarray, method: str = ASSIGN_BEST) -> dict[int, int]:
+    """Pair requirement rows with candidate columns of a score matrix.
+
+    Args:
+        scores: Required x candidate scores, ``-inf`` for non-matches
+        method: "best" takes the argmax of each row independently; "greedy"
+            repeatedly takes the highest remaining pair; "hungarian" maximizes
+            the total score. The last two use each candidate at most once.
+
+    Returns:
+        Dictionary mapping requirement row to candidate column
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method: {method}")
+    if scores.size == 0:
+        return {}
+    valid = np.isfinite(scores)
+
+    if method == ASSIGN_BEST:
+        best = np.argmax(scores, axis=1)
+        rows = np.flatnonzero(valid[np.arange(scores.shape[0]), best])
+        return {int(row): int(best[row]) for row in rows}
+
+    if method == ASSIGN_GREEDY:
+        assigned: dict[int, int] = {}
+        used: set[int] = set()
+        rows, cols = np.nonzero(valid)
+        for i in np.argsort(-scores[rows, cols], kind="stable"):
+            row, col = int(rows[i]), int(cols[i])
+            if row not in assigned and col not in used:
+                assigned[row] = col
+                used.add(col)
+        return assigned
+
+    # Non-matches get a cost no real pairing can offset, then are dropped
+    penalty = -(np.abs(scores[valid]).sum() + 1.0) if valid.any() else -1.0
+    rows, cols = linear_sum_assignment(np.where(valid, scores, penalty), maximize=True)
+    return {int(r): int(c) for r, c in zip(rows, cols) if valid[r, c]}
+
+
 # pylint: disable=R0903  # Too few public methods (1/2) - this is a simple utility class
 class SkillMatchingService:
     """Service for matching skills against role requirements."""
@@ -49,19 +158,73 @@ class SkillMatchingService:
         """
         self.similarity_threshold = similarity_threshold
         self._node2vec = Node2Vec()
+        # Skill name -> node id (None if no such skill) for the cached generation
+        self._skill_ids: dict[str, int | None] = {}
+        # (required, candidate) skill pair -> evidence for the cached generation
+        self._evidence: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        self._cache_generation = graph_generation.current
+
+    def _sync_cache_generation(self) -> None:
+        """Drop cached lookups if the graph changed since they were made."""
+        if self._cache_generation != graph_generation.current:
+            self._skill_ids = {}
+            self._evidence = {}
+            self._cache_generation = graph_generation.current
+
+    async def _resolve_skill_ids(
+        self, session: AsyncSession, names: list[str]
+    ) -> dict[str, int | None]:
+        """Resolve skill names to node ids, querying only uncached names.
+
+        All uncached names are resolved in a single query. The cache is
+        dropped when the graph generation changes.
+
+        Args:
+            session: Neo4j session
+            names: Skill names
+
+        Returns:
+            Dictionary mapping each name to its node id, or None if not found
+        """
+        self._sync_cache_generation()
+        generation = self._cache_generation
+        resolved = {name: self._skill_ids[name] for name in names if name in self._skill_ids}
+        missing = [name for name in dict.fromkeys(names) if name not in resolved]
+        if missing:
+            query = """
+            UNWIND $names AS name
+            MATCH (s:Skill {name: name})
+            RETURN name, id(s) as node_id
+            """
+            records = await read_records(session, query, {"names": missing})
+            found = {record["name"]: record["node_id"] for record in records}
+            resolved.update((name, found.get(name)) for name in missing)
+            # The cache is reset when the graph changes while the query runs
+            if graph_generation.current == generation:
+                self._skill_ids.update((name, resolved[name]) for name in missing)
+
+        return {name: resolved[name] for name in names}
 
     async def match_role(
         self,
         session: AsyncSession,
         required_skills: list[dict[str, Any]],
         candidate_skills: list[dict[str, Any]],
+        assignment: str = ASSIGN_BEST,
+        person_id: Any = None,
     ) -> MatchResult:
         """Match candidate skills against role requirements.
 
         Args:
             session: Neo4j session
             required_skills: List of required skills with experience requirements
-            candidate_skills: List of candidate's skills with experience
+            candidate_skills: List of candidate's skills with experience; skills
+                without ``years`` take them from the experience table
+            assignment: "best" picks the best candidate per requirement, so one
+                candidate skill may cover several requirements; "greedy" and
+                "hungarian" use each candidate skill at most once
+            person_id: Person whose derived experience fills in missing years;
+                may be omitted if the graph holds a single person
 
         Returns:
             MatchResult containing match scores, gaps, and evidence
@@ -77,6 +240,8 @@ class SkillMatchingService:
         # Load embeddings if not already loaded
         if not embeddings.model:
             await embeddings.load_embeddings(session)
+        await self._refresh_neighbors(session)
+        candidate_skills = await self._with_experience(session, candidate_skills, person_id)
 
         # Initialize result components
         matching_skills: list[SkillMatch] = []
@@ -87,15 +252,48 @@ class SkillMatchingService:
         skill_scores: list[float] = []
         experience_scores: list[float] = []
 
+        # Resolve every required and candidate skill name in one query
+        skill_ids = await self._resolve_skill_ids(
+            session,
+            [skill["name"] for skill in required_skills]
+            + [skill["name"] for skill in candidate_skills],
+        )
+
+        # Score every requirement against every candidate at once
+        scores = self.score_matrix(
+            self._similarity_matrix(
+                [skill["name"] for skill in required_skills],
+                [skill["name"] for skill in candidate_skills],
+                skill_ids,
+            ),
+            [skill.get("years", 0) for skill in required_skills],
+            [skill.get("years", 0) for skill in candidate_skills],
+        )
+        assigned = assign_skills(scores, assignment)
+
+        # Fetch evidence for the chosen pairs only, in one query
+        evidence = await self._gather_evidence_batch(
+            session,
+            [
+                (required_skills[row]["name"], candidate_skills[col]["name"])
+                for row, col in assigned.items()
+            ],
+        )
+
         # Match each required skill
-        for req_skill in required_skills:
+        for row, req_skill in enumerate(required_skills):
             req_name = req_skill["name"]
             req_years = req_skill.get("years", 0)
 
-            # Find best matching candidate skill
-            best_match = await self._find_best_match(
-                session, req_name, candidate_skills, req_years
-            )
+            best_match = None
+            if row in assigned:
+                candidate = candidate_skills[assigned[row]]
+                best_match = SkillMatch(
+                    skill_name=candidate["name"],
+                    match_score=float(scores[row, assigned[row]]),
+                    evidence=evidence[(req_name, candidate["name"])],
+                    experience_years=candidate.get("years", 0),
+                )
 
             if best_match:
                 matching_skills.append(best_match)
@@ -123,12 +321,435 @@ class SkillMatchingService:
             supporting_nodes=supporting_nodes,
         )
 
+    async def rank_batch(
+        self,
+        session: AsyncSession,
+        roles: list[list[dict[str, Any]]],
+        candidates: list[list[dict[str, Any]]],
+        top_k: int = 10,
+        evidence_top: int = 3,
+        by: str = RANK_BY_ROLE,
+    ) -> AsyncGenerator[Ranking, None]:
+        """Rank many candidates against many roles.
+
+        All skill names are resolved with one query and scored with one
+        similarity product; the per-pair scores equal those of
+        :meth:`match_role` with the "best" assignment. Rankings are yielded
+        one group at a time, and evidence is gathered only for the
+        ``evidence_top`` best pairs of each group.
+
+        Args:
+            session: Neo4j session
+            roles: Required skills with experience requirements, per role
+            candidates: Skills with experience, per candidate
+            top_k: Maximum number of matches per group
+            evidence_top: Matches per group that carry evidence
+            by: "role" ranks the candidates of each role; "candidate" ranks
+                the roles of each candidate
+
+        Yields:
+            One ranking per role or per candidate, in input order
+
+        Raises:
+            ValueError: If the grouping is unknown
+        """
+        if by not in RANK_GROUPINGS:
+            raise ValueError(f"Unknown ranking grouping: {by}")
+        if not roles or not candidates:
+            return
+        if not embeddings.model:
+            await embeddings.load_embeddings(session)
+        await self._refresh_neighbors(session)
+
+        required = [skill for role in roles for skill in role]
+        offered = [skill for candidate in candidates for skill in candidate]
+        skill_ids = await self._resolve_skill_ids(
+            session, [skill["name"] for skill in required + offered]
+        )
+        overall, best_scores, best_cols = self._batch_scores(roles, candidates, skill_ids)
+
+        role_starts = np.cumsum([0] + [len(role) for role in roles])
+        groups = len(roles) if by == RANK_BY_ROLE else len(candidates)
+        for group in range(groups):
+            row = overall[group] if by == RANK_BY_ROLE else overall[:, group]
+            top = np.argsort(-row, kind="stable")[:top_k]
+            pairs = [
+                (group, int(other)) if by == RANK_BY_ROLE else (int(other), group)
+                for other in top
+            ]
+            matches = []
+            # Requirement row of every matched skill, for evidence lookups
+            matched_rows: list[list[tuple[int, SkillMatch]]] = []
+            for role, candidate in pairs:
+                matched: list[tuple[int, SkillMatch]] = []
+                gaps: list[str] = []
+                for req_row in range(role_starts[role], role_starts[role + 1]):
+                    if not np.isfinite(best_scores[req_row, candidate]):
+                        gaps.append(required[req_row]["name"])
+                        continue
+                    skill = offered[best_cols[req_row, candidate]]
+                    matched.append(
+                        (
+                            req_row,
+                            SkillMatch(
+                                skill_name=skill["name"],
+                                match_score=float(best_scores[req_row, candidate]),
+                                evidence=[],
+                                experience_years=skill.get("years", 0),
+                            ),
+                        )
+                    )
+                matched_rows.append(matched)
+                matches.append(
+                    RankedMatch(
+                        role_index=role,
+                        candidate_index=candidate,
+                        overall_score=float(overall[role, candidate]),
+                        matching_skills=[match for _, match in matched],
+                        skill_gaps=gaps,
+                    )
+                )
+
+            with_evidence = [pair for matched in matched_rows[:evidence_top] for pair in matched]
+            evidence = await self._gather_evidence_batch(
+                session,
+                [(required[row]["name"], match.skill_name) for row, match in with_evidence],
+            )
+            for row, match in with_evidence:
+                match.evidence = evidence[(required[row]["name"], match.skill_name)]
+            yield Ranking(index=group, matches=matches)
+
+    def _batch_scores(
+        self,
+        roles: list[list[dict[str, Any]]],
+        candidates: list[list[dict[str, Any]]],
+        skill_ids: dict[str, int | None],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Score every role against every candidate.
+
+        Similarities are computed once between the distinct required and
+        offered skill names. Candidates are then scored in blocks, so the
+        adjusted score matrix never exceeds ``RANK_CANDIDATE_BLOCK``
+        candidates' worth of columns.
+
+        Returns:
+            Tuple of the role x candidate overall scores, and the best score
+            (``-inf`` if none) and its offered-skill column for every
+            requirement row x candidate
+        """
+        required = [skill for role in roles for skill in role]
+        offered = [skill for candidate in candidates for skill in candidate]
+        required_names = list(dict.fromkeys(skill["name"] for skill in required))
+        offered_names = list(dict.fromkeys(skill["name"] for skill in offered))
+        similarities = self._similarity_matrix(required_names, offered_names, skill_ids)
+        required_index = {name: i for i, name in enumerate(required_names)}
+        offered_index = {name: i for i, name in enumerate(offered_names)}
+        rows = np.array([required_index[skill["name"]] for skill in required], dtype=np.intp)
+        cols = np.array([offered_index[skill["name"]] for skill in offered], dtype=np.intp)
+        required_years = np.array([skill.get("years", 0) for skill in required], dtype=float)
+        offered_years = np.array([skill.get("years", 0) for skill in offered], dtype=float)
+        col_starts = np.cumsum([0] + [len(candidate) for candidate in candidates])
+
+        best_scores = np.full((len(required), len(candidates)), -np.inf)
+        best_cols = np.zeros((len(required), len(candidates)), dtype=np.intp)
+        requirement_rows = np.arange(len(required))
+        for block in range(0, len(candidates), RANK_CANDIDATE_BLOCK):
+            first = col_starts[block]
+            last = col_starts[min(block + RANK_CANDIDATE_BLOCK, len(candidates))]
+            scores = self.score_matrix(
+                similarities[np.ix_(rows, cols[first:last])],
+                required_years,
+                offered_years[first:last],
+            )
+            for candidate in range(block, min(block + RANK_CANDIDATE_BLOCK, len(candidates))):
+                start, end = col_starts[candidate] - first, col_starts[candidate + 1] - first
+                if start == end or not len(required):
+                    continue
+                best = np.argmax(scores[:, start:end], axis=1)
+                best_scores[:, candidate] = scores[requirement_rows, start + best]
+                best_cols[:, candidate] = first + start + best
+
+        matched = np.isfinite(best_scores)
+        req = required_years[:, None]
+        years = offered_years[best_cols] if offered else np.zeros(best_cols.shape)
+        ratio = np.minimum(years / np.where(req > 0, req, 1.0), 1.0)
+        experience = np.where(matched, np.where(req > 0, ratio, 1.0), 0.0)
+        combined = 0.6 * np.where(matched, best_scores, 0.0) + 0.4 * experience
+
+        # Average the requirement rows of each role with one matrix product
+        membership = np.zeros((len(roles), len(required)))
+        role_starts = np.cumsum([0] + [len(role) for role in roles])
+        for role in range(len(roles)):
+            start, end = role_starts[role], role_starts[role + 1]
+            if end > start:
+                membership[role, start:end] = 1.0 / (end - start)
+        return membership @ combined, best_scores, best_cols
+
+    async def recommend_for_gaps(
+        self,
+        session: AsyncSession,
+        gaps: list[str],
+        held_skills: list[str],
+        top_k: int = 3,
+    ) -> list[GapRecommendation]:
+        """Suggest how each missing skill relates to skills already held.
+
+        Every gap is compared with every held skill in one similarity
+        product. The learning bridge is the shortest graph path from any
+        held skill to the gap, taken from the graph snapshot when one is
+        built and from one batched shortestPath query otherwise.
+
+        Args:
+            session: Neo4j session
+            gaps: Missing skill names
+            held_skills: Names of the skills the person has
+            top_k: Nearest held skills per gap
+
+        Returns:
+            One recommendation per gap, in input order
+        """
+        gaps = list(dict.fromkeys(gaps))
+        held_skills = [name for name in dict.fromkeys(held_skills) if name not in gaps]
+        if not gaps:
+            return []
+        if not embeddings.model:
+            await embeddings.load_embeddings(session)
+        await self._refresh_neighbors(session)
+        skill_ids = await self._resolve_skill_ids(session, gaps + held_skills)
+
+        similarities = self._similarity_matrix(gaps, held_skills, skill_ids, prune=False)
+        nearest = []
+        for row in similarities:
+            ranked = np.argsort(-np.nan_to_num(row, nan=-np.inf), kind="stable")
+            order = [col for col in ranked if not np.isnan(row[col])][:top_k]
+            nearest.append(
+                [{"name": held_skills[col], "similarity": float(row[col])} for col in order]
+            )
+
+        bridges = await self._learning_bridges(session, gaps, held_skills)
+        return [
+            GapRecommendation(
+                skill_name=gap,
+                nearest_skills=nearest[row],
+                bridge_from=bridges[gap][0] if gap in bridges else None,
+                bridge=bridges[gap][1] if gap in bridges else [],
+            )
+            for row, gap in enumerate(gaps)
+        ]
+
+    async def _learning_bridges(
+        self, session: AsyncSession, gaps: list[str], held_skills: list[str]
+    ) -> dict[str, tuple[str, list[dict[str, Any]]]]:
+        """Find the shortest path from any held skill to each gap.
+
+        Returns:
+            Dictionary mapping each reachable gap to the held skill the path
+            starts from and the path's evidence entries
+        """
+        if not held_skills:
+            return {}
+        snapshot = await snapshot_store.ensure_fresh(session)
+        if snapshot is not None:
+            held = {
+                position: name
+                for name in held_skills
+                if (position := snapshot.find("Skill", name)) is not None
+            }
+            bridges = {}
+            for gap in gaps:
+                source = snapshot.find("Skill", gap)
+                if source is None:
+                    continue
+                path = nearest_target(snapshot, source, set(held), EVIDENCE_MAX_HOPS)
+                if path is None:
+                    continue
+                # Walk from the held skill towards the gap
+                bridges[gap] = (
+                    held[path.nodes[-1]],
+                    self._path_evidence(
+                        [snapshot.nodes[node] for node in reversed(path.nodes)],
+                        [snapshot.relationships[rel] for rel in reversed(path.relationships)],
+                    ),
+                )
+            return bridges
+
+        query = """
+        UNWIND $gaps AS gap
+        MATCH (g:Skill {name: gap})
+        MATCH (h:Skill) WHERE h.name IN $held AND h <> g
+        MATCH path = shortestPath((h)-[*..3]-(g))
+        WITH gap, h.name AS held, path ORDER BY length(path)
+        WITH gap, collect({held: held, path: path})[0] AS best
+        RETURN gap, best.held AS held, nodes(best.path) AS nodes,
+               relationships(best.path) AS relationships
+        """
+        records = await read_records(session, query, {"gaps": gaps, "held": held_skills})
+        return {
+            record["gap"]: (
+                record["held"],
+                self._path_evidence(record["nodes"], record["relationships"]),
+            )
+            for record in records
+        }
+
+    async def similarity_matrix(
+        self,
+        session: AsyncSession,
+        required_skills: list[dict[str, Any]],
+        candidate_skills: list[dict[str, Any]],
+    ) -> np.ndarray:
+        """Return the adjusted required x candidate score matrix.
+
+        Entries below the similarity threshold, or for skills without an
+        embedding, are ``-inf``. Pass the matrix to :func:`assign_skills` for
+        a global assignment.
+
+        Args:
+            session: Neo4j session
+            required_skills: List of required skills with experience requirements
+            candidate_skills: List of candidate's skills with experience
+
+        Returns:
+            Score matrix of shape (len(required_skills), len(candidate_skills))
+        """
+        if not embeddings.model:
+            await embeddings.load_embeddings(session)
+        await self._refresh_neighbors(session)
+        candidate_skills = await self._with_experience(session, candidate_skills)
+        required_names = [skill["name"] for skill in required_skills]
+        candidate_names = [skill["name"] for skill in candidate_skills]
+        skill_ids = await self._resolve_skill_ids(session, required_names + candidate_names)
+        return self.score_matrix(
+            self._similarity_matrix(required_names, candidate_names, skill_ids),
+            [skill.get("years", 0) for skill in required_skills],
+            [skill.get("years", 0) for skill in candidate_skills],
+        )
+
+    @staticmethod
+    async def _with_experience(
+        session: AsyncSession, skills: list[dict[str, Any]], person_id: Any = None
+    ) -> list[dict[str, Any]]:
+        """Fill in missing ``years`` from the precomputed experience table.
+
+        Skills that already carry years, or that the table does not know,
+        are returned unchanged.
+        """
+        if all("years" in skill for skill in skills):
+            return skills
+        table = await experience_store.ensure_fresh(session)
+        if table is None:
+            return skills
+        filled = []
+        for skill in skills:
+            years = None if "years" in skill else table.years(skill["name"], person_id)
+            filled.append(skill if years is None else {**skill, "years": years})
+        return filled
+
+    @staticmethod
+    async def _refresh_neighbors(session: AsyncSession) -> None:
+        """Rebuild the skill neighbor table if the embeddings changed.
+
+        Matching falls back to scoring every pair if the table cannot be built.
+        """
+        if not skill_neighbors.is_stale:
+            return
+        try:
+            await skill_neighbors.ensure_fresh(session)
+        except Exception as e:
+            logger.warning("Skill neighbor table unavailable: %s", e)
+
+    def _embedding_matrix(
+        self, names: list[str], skill_ids: dict[str, int | None]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Stack unit-normalized embeddings for the given skill names.
+
+        Returns:
+            Tuple of the embedding matrix and a mask of names that have one
+        """
+        vectors = [self._embedding_for(skill_ids.get(name)) for name in names]
+        valid = np.array([vector is not None for vector in vectors], dtype=bool)
+        if not valid.any():
+            return np.zeros((len(names), 0)), valid
+        dimension = next(v for v in vectors if v is not None).size
+        matrix = np.zeros((len(names), dimension))
+        for row, vector in enumerate(vectors):
+            if vector is not None:
+                matrix[row] = np.ravel(vector)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms), valid
+
+    def _similarity_matrix(
+        self,
+        required_names: list[str],
+        candidate_names: list[str],
+        skill_ids: dict[str, int | None],
+        prune: bool = True,
+    ) -> np.ndarray:
+        """Cosine similarities between required and candidate skills.
+
+        When the skill neighbor table is built it serves as a first pass:
+        pairs it rules out are not scored, and candidates no requirement can
+        match are not stacked at all. Pairs where either skill has no
+        embedding, or that the table rules out, are NaN. With ``prune``
+        unset every pair is scored, including those below the threshold.
+        """
+        similarities = np.full((len(required_names), len(candidate_names)), np.nan)
+        possible = np.ones(similarities.shape, dtype=bool)
+        table = skill_neighbors.table if prune and not skill_neighbors.is_stale else None
+        if table is not None:
+            possible = table.candidate_mask(
+                [skill_ids.get(name) for name in required_names],
+                [skill_ids.get(name) for name in candidate_names],
+                self.similarity_threshold,
+            )
+        columns = np.flatnonzero(possible.any(axis=0))
+        if columns.size == 0:
+            return similarities
+
+        required, required_valid = self._embedding_matrix(required_names, skill_ids)
+        candidates, candidate_valid = self._embedding_matrix(
+            [candidate_names[col] for col in columns], skill_ids
+        )
+        if required.shape[1] == 0 or candidates.shape[1] == 0:
+            return similarities
+        scored = required @ candidates.T
+        scored[~required_valid, :] = np.nan
+        scored[:, ~candidate_valid] = np.nan
+        similarities[:, columns] = scored
+        similarities[~possible] = np.nan
+        return similarities
+
+    def score_matrix(
+        self,
+        similarities: np.ndarray,
+        required_years: list[float],
+        candidate_years: list[float],
+    ) -> np.ndarray:
+        """Apply the threshold and experience adjustment to a similarity matrix.
+
+        Args:
+            similarities: Required x candidate cosine similarities
+            required_years: Required years of experience per requirement
+            candidate_years: Years of experience per candidate skill
+
+        Returns:
+            Adjusted scores, ``-inf`` where the pair is not a match
+        """
+        req = np.asarray(required_years, dtype=float)[:, None]
+        cand = np.asarray(candidate_years, dtype=float)[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.minimum(np.where(req > 0, cand / req, 0.0), 1.0)
+        adjusted = np.where(req > 0, similarities * 0.7 + ratio * 0.3, similarities)
+        matched = np.nan_to_num(similarities, nan=-np.inf) >= self.similarity_threshold
+        return np.where(matched & (adjusted > 0), adjusted, -np.inf)
+
     async def _find_best_match(
         self,
         session: AsyncSession,
         req_skill: str,
         candidate_skills: list[dict[str, Any]],
         req_years: float | None = None,
+        skill_ids: dict[str, int | None] | None = None,
     ) -> SkillMatch | None:
         """Find the best matching skill from candidate's skills.
 
@@ -137,55 +758,41 @@ class SkillMatchingService:
             req_skill: Required skill name
             candidate_skills: List of candidate's skills
             req_years: Optional required years of experience
+            skill_ids: Pre-resolved skill name to node id mapping; resolved
+                here if omitted
 
         Returns:
             Best matching skill with evidence, or None if no match found
         """
-        best_score = 0.0
-        best_match: SkillMatch | None = None
-
-        # Get required skill embedding
-        req_embedding = await self._get_skill_embedding(session, req_skill)
-        if req_embedding is None:
+        if not candidate_skills:
+            return None
+        candidate_names = [c["name"] for c in candidate_skills]
+        if skill_ids is None:
+            skill_ids = await self._resolve_skill_ids(session, [req_skill] + candidate_names)
+
+        scores = self.score_matrix(
+            self._similarity_matrix([req_skill], candidate_names, skill_ids),
+            [req_years or 0],
+            [c.get("years", 0) for c in candidate_skills],
+        )[0]
+        best = int(np.argmax(scores))
+        if not np.isfinite(scores[best]):
             return None
 
-        # Compare with each candidate skill
-        for candidate in candidate_skills:
-            candidate_embedding = await self._get_skill_embedding(
-                session, candidate["name"]
-            )
-            if candidate_embedding is None:
-                continue
-
-            # Calculate semantic similarity
-            similarity = cosine_similarity(
-                req_embedding.reshape(1, -1), candidate_embedding.reshape(1, -1)
-            )[0][0]
-
-            if similarity >= self.similarity_threshold:
-                # Gather evidence for the match
-                evidence = await self._gather_evidence(
-                    session, req_skill, candidate["name"]
-                )
-
-                # Adjust score based on experience if required
-                candidate_years = candidate.get("years", 0)
-                if req_years is not None and req_years > 0:
-                    experience_ratio = min(candidate_years / req_years, 1.0)
-                    similarity = similarity * 0.7 + experience_ratio * 0.3
-
-                match = SkillMatch(
-                    skill_name=candidate["name"],
-                    match_score=similarity,
-                    evidence=evidence,
-                    experience_years=candidate_years,
-                )
-
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = match
+        candidate = candidate_skills[best]
+        return SkillMatch(
+            skill_name=candidate["name"],
+            match_score=float(scores[best]),
+            evidence=await self._gather_evidence(session, req_skill, candidate["name"]),
+            experience_years=candidate.get("years", 0),
+        )
 
-        return best_match
+    @staticmethod
+    def _embedding_for(node_id: int | None) -> np.ndarray | None:
+        """Return the embedding of a resolved skill node, if any."""
+        if node_id is None:
+            return None
+        return embeddings.get_embedding(str(node_id))
 
     async def _get_skill_embedding(
         self, session: AsyncSession, skill_name: str
@@ -199,19 +806,8 @@ class SkillMatchingService:
         Returns:
             Skill embedding vector or None if not found
         """
-        # Query to find skill node
-        query = """
-        MATCH (s:Skill {name: $name})
-        RETURN id(s) as node_id
-        """
-        result = await session.run(query, name=skill_name)
-        record = await result.single()
-
-        if not record:
-            return None
-
-        node_id = str(record["node_id"])
-        return embeddings.get_embedding(node_id)
+        skill_ids = await self._resolve_skill_ids(session, [skill_name])
+        return self._embedding_for(skill_ids[skill_name])
 
     async def _gather_evidence(
         self, session: AsyncSession, req_skill: str, candidate_skill: str
@@ -226,23 +822,104 @@ class SkillMatchingService:
         Returns:
             List of evidence nodes and relationships
         """
-        query = """
-        MATCH (s1:Skill {name: $req_skill})
-        MATCH (s2:Skill {name: $candidate_skill})
-        MATCH path = shortestPath((s1)-[*..3]-(s2))
-        RETURN path
-        """
-        result = await session.run(
-            query, req_skill=req_skill, candidate_skill=candidate_skill
-        )
-        record = await result.single()
+        pair = (req_skill, candidate_skill)
+        return (await self._gather_evidence_batch(session, [pair]))[pair]
 
-        if not record:
-            return []
+    async def _gather_evidence_batch(
+        self, session: AsyncSession, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Gather evidence for several skill pairs with at most one query.
+
+        Paths come from the in-memory graph snapshot when one is built, and
+        from a single shortestPath query otherwise. They are cached per pair
+        until the graph generation changes. A pair of identical skills is
+        evidenced by the skill node itself.
+
+        Args:
+            session: Neo4j session
+            pairs: (required skill, candidate skill) name pairs
 
-        # Extract nodes and relationships from the path
+        Returns:
+            Dictionary mapping each pair to its evidence nodes and relationships
+        """
+        self._sync_cache_generation()
+        generation = self._cache_generation
+        evidence = {pair: self._evidence[pair] for pair in pairs if pair in self._evidence}
+        missing = [pair for pair in dict.fromkeys(pairs) if pair not in evidence]
+        snapshot = await snapshot_store.ensure_fresh(session) if missing else None
+        if snapshot is not None:
+            found = self._snapshot_evidence(snapshot, missing)
+        elif missing:
+            query = """
+            UNWIND $pairs AS pair
+            MATCH (s1:Skill {name: pair.req_skill})
+            MATCH (s2:Skill {name: pair.candidate_skill})
+            WHERE s1 <> s2
+            MATCH path = shortestPath((s1)-[*..3]-(s2))
+            RETURN pair.req_skill AS req_skill, pair.candidate_skill AS candidate_skill,
+                   nodes(path) AS nodes, relationships(path) AS relationships
+            UNION ALL
+            UNWIND $pairs AS pair
+            MATCH (s:Skill {name: pair.req_skill})
+            WHERE pair.req_skill = pair.candidate_skill
+            RETURN pair.req_skill AS req_skill, pair.candidate_skill AS candidate_skill,
+                   [s] AS nodes, [] AS relationships
+            """
+            records = await read_records(
+                session,
+                query,
+                {"pairs": [{"req_skill": req, "candidate_skill": cand} for req, cand in missing]},
+            )
+            found = {
+                (record["req_skill"], record["candidate_skill"]): self._path_evidence(
+                    record["nodes"], record["relationships"]
+                )
+                for record in records
+            }
+        if missing:
+            evidence.update((pair, found.get(pair, [])) for pair in missing)
+            # The cache is reset when the graph changes while the query runs
+            if graph_generation.current == generation:
+                if len(self._evidence) + len(missing) > EVIDENCE_CACHE_SIZE:
+                    self._evidence = {}
+                self._evidence.update((pair, evidence[pair]) for pair in missing)
+
+        return {pair: list(evidence[pair]) for pair in pairs}
+
+    def _snapshot_evidence(
+        self, snapshot: GraphSnapshot, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Find the evidence paths between skill pairs in the graph snapshot.
+
+        Of all shortest paths between two skills, the one through the nodes
+        most relevant to both, by personalized PageRank seeded on the pair,
+        is chosen.
+        """
+        located = {}
+        for pair in pairs:
+            source = snapshot.find("Skill", pair[0])
+            target = snapshot.find("Skill", pair[1])
+            if source is not None and target is not None:
+                located[pair] = (source, target)
+        index = pagerank_store.index_for(snapshot)
+        relevance = index.scores_many(list(located.values()))
+        found = {}
+        for (pair, (source, target)), weights in zip(located.items(), relevance):
+            path = best_shortest_path(
+                snapshot, source, target, weights, max_hops=EVIDENCE_MAX_HOPS
+            )
+            if path is not None:
+                found[pair] = self._path_evidence(
+                    [snapshot.nodes[node] for node in path.nodes],
+                    [snapshot.relationships[rel] for rel in path.relationships],
+                )
+        return found
+
+    @staticmethod
+    def _path_evidence(nodes: list[Any], relationships: list[Any]) -> list[dict[str, Any]]:
+        """Convert the nodes and relationships of a path into evidence entries."""
         evidence = []
-        for node in record["path"].nodes:
+        for node in nodes:
             evidence.append(
                 {
                     "type": "node",
@@ -250,7 +927,7 @@ class SkillMatchingService:
                     "properties": dict(node),
                 }
             )
-        for rel in record["path"].relationships:
+        for rel in relationships:
             evidence.append(
                 {
                     "type": "relationship",
@@ -258,7 +935,6 @@ class SkillMatchingService:
                     "properties": dict(rel),
                 }
             )
-
         return evidence
 
 
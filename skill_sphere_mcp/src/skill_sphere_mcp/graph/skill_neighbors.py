@@ -0,0 +1,332 @@
+"""Precomputed top-k similar skills per Skill node."""
+
+import asyncio
+import hashlib
+import logging
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+
+from ..config.settings import get_settings
+from ..db.queries import read_records
+from ..db.queries import write_records
+from .embeddings import embeddings
+from .generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+# Neighbors kept per skill
+DEFAULT_NEIGHBORS = 20
+
+# Rows scored per block when computing the table
+BLOCK_ROWS = 1024
+
+# Rows sent per SIMILAR_TO write-back query
+WRITE_BATCH_SIZE = 1000
+
+# Slack between float32 table scores and exact float64 similarities
+SCORE_TOLERANCE = 1e-4
+
+
+class SkillNeighborTable:
+    """Top-k most similar skills of every skill as two dense arrays.
+
+    Row ``i`` of ``neighbors`` holds the table rows of the skills most similar
+    to skill ``i``, best first, padded with -1; ``scores`` holds the matching
+    cosine similarities, padded with -inf.
+    """
+
+    def __init__(
+        self,
+        node_ids: np.ndarray,
+        neighbors: np.ndarray,
+        scores: np.ndarray,
+        fingerprint: str,
+    ):
+        """Wrap precomputed neighbor arrays.
+
+        Args:
+            node_ids: Skill node id per row
+            neighbors: Neighbor rows, shape (len(node_ids), k)
+            scores: Neighbor similarities, shape (len(node_ids), k)
+            fingerprint: Digest of the embeddings the table was computed from
+        """
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.neighbors = np.asarray(neighbors, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.float32)
+        self.fingerprint = fingerprint
+        self._rows = {int(node_id): row for row, node_id in enumerate(self.node_ids)}
+
+    def __len__(self) -> int:
+        """Return the number of skills in the table."""
+        return len(self.node_ids)
+
+    @property
+    def k(self) -> int:
+        """Return the number of neighbors kept per skill."""
+        return int(self.neighbors.shape[1])
+
+    @classmethod
+    def compute(
+        cls,
+        node_ids: list[int],
+        vectors: list[np.ndarray],
+        k: int = DEFAULT_NEIGHBORS,
+    ) -> "SkillNeighborTable":
+        """Compute the table from skill embeddings.
+
+        Similarities are computed block by block, so memory stays bounded by
+        ``BLOCK_ROWS`` rows of the full similarity matrix.
+
+        Args:
+            node_ids: Skill node ids
+            vectors: Embedding per skill node id
+            k: Neighbors kept per skill
+
+        Returns:
+            The neighbor table
+        """
+        count = len(node_ids)
+        k = max(0, min(k, count - 1))
+        fingerprint = embedding_fingerprint(node_ids, vectors)
+        neighbors = np.full((count, k), -1, dtype=np.int32)
+        scores = np.full((count, k), -np.inf, dtype=np.float32)
+        if k == 0:
+            return cls(np.asarray(node_ids), neighbors, scores, fingerprint)
+
+        matrix = np.vstack([np.asarray(v, dtype=np.float32).ravel() for v in vectors])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.ascontiguousarray(matrix / np.where(norms == 0, 1.0, norms))
+
+        for start in range(0, count, BLOCK_ROWS):
+            block = matrix[start : start + BLOCK_ROWS] @ matrix.T
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = -np.inf
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            neighbors[start : start + len(rows)] = np.take_along_axis(top, order, axis=1)
+            scores[start : start + len(rows)] = np.take_along_axis(top_scores, order, axis=1)
+
+        return cls(np.asarray(node_ids), neighbors, scores, fingerprint)
+
+    def similar(self, node_id: int, top_k: int | None = None) -> list[tuple[int, float]]:
+        """Return the most similar skills of a skill.
+
+        Args:
+            node_id: Skill node id
+            top_k: Maximum number of neighbors, all kept neighbors if omitted
+
+        Returns:
+            List of (skill node id, cosine similarity) tuples, best first
+        """
+        row = self._rows.get(int(node_id))
+        if row is None:
+            return []
+        limit = self.k if top_k is None else min(top_k, self.k)
+        return [
+            (int(self.node_ids[neighbor]), float(score))
+            for neighbor, score in zip(self.neighbors[row, :limit], self.scores[row, :limit])
+            if neighbor >= 0
+        ]
+
+    def candidate_mask(
+        self,
+        required_ids: list[int | None],
+        candidate_ids: list[int | None],
+        threshold: float,
+    ) -> np.ndarray:
+        """Mark required x candidate pairs that may reach the threshold.
+
+        A requirement whose k-th neighbor scores below the threshold has
+        every skill above the threshold in its neighbor list, so only those
+        candidates (and the skill itself) can match. Requirements whose list
+        may be cut short, or that are not in the table, keep all candidates.
+
+        Args:
+            required_ids: Required skill node ids
+            candidate_ids: Candidate skill node ids
+            threshold: Minimum cosine similarity of a match
+
+        Returns:
+            Boolean matrix of shape (len(required_ids), len(candidate_ids))
+        """
+        mask = np.ones((len(required_ids), len(candidate_ids)), dtype=bool)
+        if self.k == 0:
+            return mask
+        candidate_rows = np.array(
+            [-1 if c is None else self._rows.get(int(c), -1) for c in candidate_ids],
+            dtype=np.int64,
+        )
+        for i, node_id in enumerate(required_ids):
+            row = None if node_id is None else self._rows.get(int(node_id))
+            if row is None or self.scores[row, -1] >= threshold - SCORE_TOLERANCE:
+                continue
+            listed = self.neighbors[row][self.scores[row] >= threshold - SCORE_TOLERANCE]
+            mask[i] = np.isin(candidate_rows, listed) | (candidate_rows == row)
+        return mask
+
+    def save(self, path: str | Path) -> None:
+        """Write the table to a compressed ``.npz`` file."""
+        np.savez_compressed(
+            path,
+            node_ids=self.node_ids,
+            neighbors=self.neighbors,
+            scores=self.scores,
+            fingerprint=np.array(self.fingerprint),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SkillNeighborTable":
+        """Read a table written by :meth:`save`."""
+        with np.load(path) as data:
+            return cls(
+                data["node_ids"],
+                data["neighbors"],
+                data["scores"],
+                str(data["fingerprint"]),
+            )
+
+
+def embedding_fingerprint(node_ids: list[int], vectors: list[np.ndarray]) -> str:
+    """Return a digest identifying a set of skill embeddings."""
+    digest = hashlib.sha1()
+    digest.update(np.asarray(node_ids, dtype=np.int64).tobytes())
+    for vector in vectors:
+        digest.update(np.asarray(vector, dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+class SkillNeighborStore:
+    """Keeps the neighbor table in step with the loaded embeddings."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.table: SkillNeighborTable | None = None
+        self._embeddings_version: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the embeddings changed since the table was built."""
+        return self._embeddings_version != embeddings.version
+
+    async def ensure_fresh(self, session: AsyncSession) -> SkillNeighborTable | None:
+        """Rebuild the table after the embeddings were trained or loaded.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The current table, or None if no skill has an embedding
+        """
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.build(session)
+        return self.table
+
+    async def build(self, session: AsyncSession) -> SkillNeighborTable | None:
+        """Compute the table for all Skill nodes with an embedding.
+
+        A table persisted at ``skill_neighbors_path`` is reused if it was
+        computed from the same embeddings; otherwise the table is computed
+        and saved there. With ``skill_neighbors_write_back`` enabled the
+        neighbors are also stored as ``SIMILAR_TO`` relationships.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The new table, or None if no skill has an embedding
+        """
+        version = embeddings.version
+        records = await read_records(session, "MATCH (s:Skill) RETURN id(s) AS node_id")
+        node_ids = []
+        vectors = []
+        for record in records:
+            vector = embeddings.get_embedding(str(record["node_id"]))
+            if vector is not None:
+                node_ids.append(int(record["node_id"]))
+                vectors.append(vector)
+
+        self._embeddings_version = version
+        if not node_ids:
+            self.table = None
+            return None
+
+        settings = get_settings()
+        table = self._load_persisted(settings.skill_neighbors_path, node_ids, vectors)
+        if table is None or table.k != min(settings.skill_neighbors_k, len(node_ids) - 1):
+            table = await asyncio.to_thread(
+                SkillNeighborTable.compute, node_ids, vectors, settings.skill_neighbors_k
+            )
+            if settings.skill_neighbors_path:
+                try:
+                    table.save(settings.skill_neighbors_path)
+                except OSError as e:
+                    logger.warning("Could not save skill neighbor table: %s", e)
+            if settings.skill_neighbors_write_back:
+                await write_similar_to(session, table)
+        self.table = table
+        logger.info("Built skill neighbor table for %d skills (k=%d)", len(table), table.k)
+        return table
+
+    @staticmethod
+    def _load_persisted(
+        path: str | None, node_ids: list[int], vectors: list[np.ndarray]
+    ) -> SkillNeighborTable | None:
+        """Load the persisted table if it matches the current embeddings."""
+        if not path or not Path(path).exists():
+            return None
+        try:
+            table = SkillNeighborTable.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable skill neighbor table %s: %s", path, e)
+            return None
+        if table.fingerprint != embedding_fingerprint(node_ids, vectors):
+            return None
+        return table
+
+
+async def write_similar_to(session: AsyncSession, table: SkillNeighborTable) -> None:
+    """Replace all ``SIMILAR_TO`` relationships with the table's neighbors.
+
+    The graph generation is advanced afterwards, so the snapshot, cached
+    evidence paths and other servers pick up the new relationships.
+
+    Args:
+        session: Neo4j session
+        table: Neighbor table to write
+    """
+    await write_records(session, "MATCH (:Skill)-[r:SIMILAR_TO]->(:Skill) DELETE r")
+    rows: list[dict[str, Any]] = [
+        {
+            "source": int(table.node_ids[row]),
+            "target": int(table.node_ids[neighbor]),
+            "score": float(score),
+        }
+        for row in range(len(table))
+        for neighbor, score in zip(table.neighbors[row], table.scores[row])
+        if neighbor >= 0
+    ]
+    query = """
+    UNWIND $rows AS row
+    MATCH (a:Skill) WHERE id(a) = row.source
+    MATCH (b:Skill) WHERE id(b) = row.target
+    MERGE (a)-[r:SIMILAR_TO]->(b)
+    SET r.score = row.score
+    """
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        await write_records(session, query, {"rows": rows[start : start + WRITE_BATCH_SIZE]})
+    logger.info("Wrote %d SIMILAR_TO relationships", len(rows))
+    await graph_generation.record_write(session)
+
+
+# Global skill neighbor store instance
+skill_neighbors = SkillNeighborStore()
@@ -0,0 +1,354 @@
+"""Compact in-memory adjacency snapshot of the graph."""
+
+import asyncio
+import logging
+
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from .generation import SessionOpener
+from .generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+# Node properties that identify an entity, indexed for lookups
+KEY_PROPERTIES = ("id", "name")
+
+
+class SnapshotNode(dict):
+    """Node properties with the labels and id of the Neo4j node.
+
+    Behaves like a Neo4j ``Node`` for code that reads ``labels``, ``get()``
+    or ``dict(node)``.
+    """
+
+    def __init__(self, node_id: int, labels: list[str], properties: dict[str, Any]):
+        super().__init__(properties)
+        self.id = node_id
+        self.labels = frozenset(labels)
+
+
+class SnapshotRelationship(dict):
+    """Relationship properties with the type of the Neo4j relationship."""
+
+    def __init__(self, rel_id: int, rel_type: str, properties: dict[str, Any]):
+        super().__init__(properties)
+        self.id = rel_id
+        self.type = rel_type
+
+
+class GraphSnapshot:
+    """Immutable CSR adjacency over all nodes and relationships.
+
+    Nodes are addressed by position. Each relationship appears in the
+    adjacency of both endpoints, so traversals are undirected like the
+    ``-[*]-`` Cypher patterns they replace; ``outgoing`` and ``related``
+    follow the stored direction for typed ``-[:TYPE]->`` patterns. Nodes
+    are also indexed by label and by their ``id`` and ``name`` properties,
+    keeping the first node in load order for each value like a ``LIMIT 1``
+    scan would.
+    """
+
+    def __init__(
+        self,
+        nodes: list[SnapshotNode],
+        relationships: list[SnapshotRelationship],
+        endpoints: np.ndarray,
+        generation: int,
+    ):
+        """Build the adjacency arrays.
+
+        Args:
+            nodes: Nodes by position
+            relationships: Relationships by index
+            endpoints: Array of shape (len(relationships), 2) with the
+                source and target position of each relationship
+            generation: Graph generation the data belongs to
+        """
+        self.nodes = nodes
+        self.relationships = relationships
+        self.generation = generation
+        self.positions = {node.id: position for position, node in enumerate(nodes)}
+        self.names = [str(node.get("name", "")).lower() for node in nodes]
+        self._by_label: dict[str, list[int]] = {}
+        self._by_key: dict[tuple[str, Any], int] = {}
+        self._by_label_key: dict[tuple[str, str, Any], int] = {}
+        for position, node in enumerate(nodes):
+            for label in node.labels:
+                self._by_label.setdefault(label, []).append(position)
+            for key in KEY_PROPERTIES:
+                value = node.get(key)
+                if not isinstance(value, (str, int, float)):
+                    continue
+                self._by_key.setdefault((key, value), position)
+                for label in node.labels:
+                    self._by_label_key.setdefault((label, key, value), position)
+
+        endpoints = np.asarray(endpoints, dtype=np.int64).reshape(-1, 2)
+        rel_index = np.arange(len(endpoints), dtype=np.int64)
+        sources = np.concatenate([endpoints[:, 0], endpoints[:, 1]])
+        targets = np.concatenate([endpoints[:, 1], endpoints[:, 0]])
+        rels = np.concatenate([rel_index, rel_index])
+        order = np.argsort(sources, kind="stable")
+        self.neighbors = targets[order].astype(np.int32)
+        self.edge_rels = rels[order].astype(np.int32)
+        self.indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(nodes)), out=self.indptr[1:])
+        self.endpoints = endpoints
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.nodes)
+
+    def find(self, label: str, name: str) -> int | None:
+        """Return the position of the node with a label and name."""
+        return self._by_label_key.get((label, "name", name))
+
+    def find_by_id(self, label: str, value: Any) -> int | None:
+        """Return the position of the node with a label and ``id`` property."""
+        return self._by_label_key.get((label, "id", value))
+
+    def with_label(self, label: str) -> list[int]:
+        """Return the positions of all nodes with a label, in load order."""
+        return self._by_label.get(label, [])
+
+    def node(self, node_id: int) -> SnapshotNode | None:
+        """Return a node by its Neo4j id."""
+        position = self.positions.get(node_id)
+        return self.nodes[position] if position is not None else None
+
+    def entity(self, key: Any, by_name: bool = True) -> int | None:
+        """Return the position of the first node whose ``id`` or name is a key.
+
+        Args:
+            key: Property value to look up
+            by_name: False to match the ``id`` property only
+
+        Returns:
+            The node position, or None if no node matches
+        """
+        matches = [self._by_key.get(("id", key))]
+        if by_name:
+            matches.append(self._by_key.get(("name", key)))
+        found = [position for position in matches if position is not None]
+        return min(found) if found else None
+
+    def outgoing(self, position: int, rel_type: str | None = None) -> list[tuple[int, int]]:
+        """Return the relationships starting at a node.
+
+        Args:
+            position: Node position
+            rel_type: Relationship type to keep, or None for all types
+
+        Returns:
+            List of (relationship index, target position) tuples
+        """
+        neighbors, rels = self.adjacent(position)
+        edges = []
+        seen = set()
+        for target, rel in zip(neighbors.tolist(), rels.tolist()):
+            # Self-loops appear twice in the adjacency of their node
+            if rel in seen or self.endpoints[rel, 0] != position:
+                continue
+            if rel_type is not None and self.relationships[rel].type != rel_type:
+                continue
+            seen.add(rel)
+            edges.append((rel, target))
+        return edges
+
+    def related(self, position: int, rel_type: str, label: str | None = None) -> list[int]:
+        """Return the distinct targets of a node's typed outgoing relationships.
+
+        Args:
+            position: Node position
+            rel_type: Relationship type
+            label: Label the targets must have, or None for any
+
+        Returns:
+            Target positions in adjacency order
+        """
+        targets = dict.fromkeys(
+            target
+            for _, target in self.outgoing(position, rel_type)
+            if label is None or label in self.nodes[target].labels
+        )
+        return list(targets)
+
+    def adjacent(self, position: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the neighbor positions and relationship indexes of a node."""
+        start, end = self.indptr[position], self.indptr[position + 1]
+        return self.neighbors[start:end], self.edge_rels[start:end]
+
+    def same_graph(
+        self,
+        nodes: list[SnapshotNode],
+        relationships: list[SnapshotRelationship],
+        endpoints: np.ndarray,
+    ) -> bool:
+        """Return True if freshly loaded graph data equals this snapshot's."""
+        if len(nodes) != len(self.nodes) or len(relationships) != len(self.relationships):
+            return False
+        endpoints = np.asarray(endpoints, dtype=np.int64).reshape(-1, 2)
+        return (
+            np.array_equal(endpoints, self.endpoints)
+            and all(
+                new.id == old.id and new.labels == old.labels and new == old
+                for new, old in zip(nodes, self.nodes)
+            )
+            and all(
+                new.id == old.id and new.type == old.type and new == old
+                for new, old in zip(relationships, self.relationships)
+            )
+        )
+
+
+class SnapshotStore:
+    """Holds the current graph snapshot and rebuilds it after graph changes.
+
+    Reads are served from the snapshot while it is built; writes still go
+    to Neo4j and bump the graph generation, which makes the next read
+    rebuild it. A periodic refresh also picks up writes made by other
+    processes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.snapshot: GraphSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once a snapshot has been built."""
+        return self.snapshot is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the graph changed since the snapshot was built."""
+        return self.snapshot is None or self.snapshot.generation != graph_generation.current
+
+    async def build(self, session: AsyncSession) -> GraphSnapshot:
+        """Load all nodes and relationships into a new snapshot.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The new snapshot
+        """
+        generation = graph_generation.current
+        self.snapshot = GraphSnapshot(*await _load_graph(session), generation)
+        logger.info(
+            "Built graph snapshot with %d nodes and %d relationships",
+            len(self.snapshot.nodes),
+            len(self.snapshot.relationships),
+        )
+        return self.snapshot
+
+    async def refresh(self, session: AsyncSession) -> bool:
+        """Reload the graph, advancing the generation if it changed elsewhere.
+
+        A graph that differs from an up-to-date snapshot was written by
+        another process, so the generation is bumped for the in-memory
+        indexes and caches derived from it.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        async with self._lock:
+            generation = graph_generation.current
+            data = await _load_graph(session)
+            current = self.snapshot
+            if current is not None and current.generation == generation:
+                if current.same_graph(*data):
+                    return False
+                if graph_generation.current == generation:
+                    generation = graph_generation.bump()
+                    logger.info("Graph changed outside this server")
+            self.snapshot = GraphSnapshot(*data, generation)
+            return True
+
+    async def ensure_fresh(self, session: AsyncSession) -> GraphSnapshot | None:
+        """Rebuild the snapshot if the graph changed since it was built.
+
+        Args:
+            session: Neo4j session
+
+        Returns:
+            The current snapshot, or None if none has been built and callers
+            should query Neo4j instead
+        """
+        if not self.is_ready:
+            return None
+        if self.is_stale:
+            async with self._lock:
+                if self.is_stale:
+                    await self.build(session)
+        return self.snapshot
+
+    async def refresh_periodically(self, open_session: SessionOpener, interval: float) -> None:
+        """Rebuild the snapshot every interval until cancelled.
+
+        The previous snapshot keeps serving reads while the new one loads.
+        A failed refresh is logged and retried at the next interval.
+
+        Args:
+            open_session: Opens a Neo4j session for each rebuild
+            interval: Seconds between rebuilds
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with open_session() as session:
+                    await self.refresh(session)
+            except Exception as e:
+                logger.warning("Graph snapshot refresh failed: %s", e)
+
+
+async def _load_graph(
+    session: AsyncSession,
+) -> tuple[list[SnapshotNode], list[SnapshotRelationship], np.ndarray]:
+    """Read all nodes and the relationships between them."""
+    records = await read_records(
+        session,
+        # GraphMeta only holds the stored generation and is not part of the graph
+        "MATCH (n) WHERE NOT n:GraphMeta "
+        "RETURN id(n) AS node_id, labels(n) AS labels, properties(n) AS props",
+    )
+    nodes = [
+        SnapshotNode(record["node_id"], record["labels"], record["props"])
+        for record in records
+    ]
+    positions = {node.id: position for position, node in enumerate(nodes)}
+
+    records = await read_records(
+        session,
+        """
+        MATCH (a)-[r]->(b)
+        RETURN id(r) AS rel_id, id(a) AS source, id(b) AS target,
+               type(r) AS type, properties(r) AS props
+        """
+    )
+    relationships = []
+    endpoints = []
+    for record in records:
+        source = positions.get(record["source"])
+        target = positions.get(record["target"])
+        if source is None or target is None:
+            continue
+        relationships.append(
+            SnapshotRelationship(record["rel_id"], record["type"], record["props"])
+        )
+        endpoints.append((source, target))
+    return nodes, relationships, np.array(endpoints)
+
+
+# Global snapshot store instance
+snapshot_store = SnapshotStore()
@@ -0,0 +1,268 @@
+"""In-memory matrix of stored node embeddings for vector search."""
+
+import asyncio
+import logging
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from neo4j import AsyncSession
+
+from ..db.queries import read_records
+from .generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:
+    """Row-normalized, contiguous embedding matrix for cosine search.
+
+    Similarities for a query are a single matrix-vector product, and the
+    top-k rows are selected with ``argpartition`` instead of a full sort.
+    Each label maps to a sorted array of row numbers, so label-filtered
+    queries only score the matching rows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._ids: list[Any] = []
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._label_rows: dict[str, np.ndarray] = {}
+        self._generation: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the index has been built."""
+        return self._generation is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the graph changed since the index was built."""
+        return self._generation != graph_generation.current
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding dimension, or 0 if the index is empty."""
+        return int(self._matrix.shape[1])
+
+    def __len__(self) -> int:
+        """Return the number of indexed nodes."""
+        return len(self._ids)
+
+    def set_vectors(
+        self,
+        node_ids: list[Any],
+        vectors: list,
+        generation: int,
+        labels: list[list[str]] | None = None,
+    ) -> None:
+        """Replace the indexed vectors.
+
+        Rows whose dimension differs from the first row are skipped.
+
+        Args:
+            node_ids: Node ids
+            vectors: Embedding per node id
+            generation: Graph generation the vectors belong to
+            labels: Optional node labels per node id
+        """
+        ids: list[Any] = []
+        rows: list[np.ndarray] = []
+        label_rows: dict[str, list[int]] = {}
+        dimension = None
+        for position, (node_id, vector) in enumerate(zip(node_ids, vectors)):
+            row = np.asarray(vector, dtype=np.float32).ravel()
+            if dimension is None:
+                dimension = row.shape[0]
+            if row.shape[0] != dimension:
+                logger.warning(
+                    "Skipping embedding of node %s with dimension %d", node_id, row.shape[0]
+                )
+                continue
+            if labels is not None:
+                for label in labels[position] or ():
+                    label_rows.setdefault(label.casefold(), []).append(len(ids))
+            ids.append(node_id)
+            rows.append(row)
+
+        matrix = np.vstack(rows) if rows else np.empty((0, 0), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._matrix = np.ascontiguousarray(matrix / norms, dtype=np.float32)
+        self._ids = ids
+        self._label_rows = {
+            label: np.asarray(positions, dtype=np.intp) for label, positions in label_rows.items()
+        }
+        self._generation = generation
+
+    async def build(self, session: AsyncSession) -> None:
+        """Load all stored node embeddings.
+
+        Args:
+            session: Neo4j session
+        """
+        generation = graph_generation.current
+        records = await read_records(
+            session,
+            """
+            MATCH (n)
+            WHERE n.embedding IS NOT NULL AND NOT n:GraphMeta
+            RETURN id(n) AS node_id, n.embedding AS embedding, labels(n) AS labels
+            """
+        )
+        node_ids = []
+        vectors = []
+        labels = []
+        for record in records:
+            node_ids.append(record["node_id"])
+            vectors.append(record["embedding"])
+            labels.append(record["labels"])
+        self.set_vectors(node_ids, vectors, generation, labels)
+        logger.info("Built vector index over %d nodes", len(self))
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """Build the index on first use and rebuild it after graph changes.
+
+        Args:
+            session: Neo4j session
+        """
+        if self.is_ready and not self.is_stale:
+            return
+        async with self._lock:
+            if not self.is_ready or self.is_stale:
+                await self.build(session)
+
+    def rows_for_labels(self, labels: Iterable[str]) -> np.ndarray:
+        """Return the sorted rows of nodes carrying any of the labels.
+
+        Labels are matched case-insensitively.
+
+        Args:
+            labels: Labels to filter on
+
+        Returns:
+            Sorted array of row numbers
+        """
+        arrays = [
+            self._label_rows[key]
+            for key in {label.casefold() for label in labels}
+            if key in self._label_rows
+        ]
+        if not arrays:
+            return np.empty(0, dtype=np.intp)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        labels: Iterable[str] | None = None,
+    ) -> list[tuple[Any, float]]:
+        """Find the nodes most similar to a query vector.
+
+        Args:
+            query_embedding: Query vector
+            top_k: Maximum number of results
+            labels: Only consider nodes carrying any of these labels
+
+        Returns:
+            List of (node_id, cosine similarity) tuples, best first
+
+        Raises:
+            ValueError: If the query dimension does not match the index
+        """
+        if len(self) == 0 or top_k <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        if query.shape[0] != self.dimension:
+            raise ValueError(
+                f"Query dimension {query.shape[0]} does not match "
+                f"index dimension {self.dimension}"
+            )
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        query = query / norm
+
+        if labels is None:
+            rows = None
+            scores = self._matrix @ query
+        else:
+            rows = self.rows_for_labels(labels)
+            if rows.size == 0:
+                return []
+            scores = self._matrix[rows] @ query
+
+        k = min(top_k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        positions = top if rows is None else rows[top]
+        return [(self._ids[p], float(s)) for p, s in zip(positions, scores[top])]
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int = 10,
+        labels: Iterable[str] | None = None,
+    ) -> list[list[tuple[Any, float]]]:
+        """Find the nodes most similar to each of several query vectors.
+
+        All queries are scored with one matrix-matrix product.
+
+        Args:
+            query_embeddings: Query vectors, one per row
+            top_k: Maximum number of results per query
+            labels: Only consider nodes carrying any of these labels
+
+        Returns:
+            Per query, a list of (node_id, cosine similarity) tuples, best first
+
+        Raises:
+            ValueError: If the query dimension does not match the index
+        """
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        if len(self) == 0 or top_k <= 0 or queries.shape[0] == 0:
+            return [[] for _ in range(queries.shape[0])]
+        if queries.shape[1] != self.dimension:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match "
+                f"index dimension {self.dimension}"
+            )
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1.0, norms)
+
+        if labels is None:
+            rows = None
+            matrix = self._matrix
+        else:
+            rows = self.rows_for_labels(labels)
+            if rows.size == 0:
+                return [[] for _ in range(queries.shape[0])]
+            matrix = self._matrix[rows]
+
+        scores = queries @ matrix.T
+        k = min(top_k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = []
+        for query_top, query_scores, norm in zip(top, top_scores, norms[:, 0]):
+            if norm == 0:
+                results.append([])
+                continue
+            positions = query_top if rows is None else rows[query_top]
+            results.append([(self._ids[p], float(s)) for p, s in zip(positions, query_scores)])
+        return results
+
+
+# Global vector index instance
+vector_index = VectorIndex()
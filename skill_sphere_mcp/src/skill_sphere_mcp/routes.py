@@ -1,17 +1,31 @@
 """Route handlers for the MCP server."""
 
+import json
 import logging
 
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 from typing import Any
-
-import numpy as np
+from typing import Literal
 
 from fastapi import APIRouter
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
+from pydantic import Field
 
 from .db.connection import neo4j_conn
+from .db.queries import read_records
+from .graph.batch_search import MAX_BATCH_QUERIES
+from .graph.batch_search import rank_batch
+from .graph.hybrid_search import FUSION_RRF
+from .graph.hybrid_search import hybrid_search as run_hybrid_search
+from .graph.skill_matching import MAX_RANK_CANDIDATES
+from .graph.skill_matching import MAX_RANK_ROLES
+from .graph.skill_matching import RANK_BY_ROLE
+from .graph.skill_matching import skill_matching
+from .graph.snapshot import snapshot_store
+from .graph.vector_index import vector_index
 from .models.embedding import get_embedding_model
 
 
@@ -38,6 +52,7 @@ class SearchRequest(BaseModel):
 
     query: str
     k: int = 10  # top-k results
+    labels: list[str] | None = None  # only rank nodes carrying any of these labels
 
 
 class SearchResult(BaseModel):
@@ -47,6 +62,73 @@ class SearchResult(BaseModel):
     score: float
 
 
+class BatchSearchRequest(BaseModel):
+    """Batch search request with several queries sharing one limit."""
+
+    queries: list[str] = Field(min_length=1, max_length=MAX_BATCH_QUERIES)
+    k: int = Field(default=10, gt=0)
+    labels: list[str] | None = None
+
+
+class BatchSearchResult(BaseModel):
+    """Search results for a single query of a batch."""
+
+    query: str
+    results: list[SearchResult]
+
+
+class HybridSearchRequest(BaseModel):
+    """Hybrid search request with per-request fusion weights."""
+
+    query: str
+    k: int = Field(default=10, gt=0)
+    lexical_weight: float = Field(default=0.5, ge=0.0)
+    vector_weight: float = Field(default=0.5, ge=0.0)
+    fusion: Literal["rrf", "weighted"] = FUSION_RRF
+
+
+class HybridSearchResult(BaseModel):
+    """Fused search result with the per-source scores that produced it."""
+
+    entity_id: str
+    score: float
+    lexical_score: float | None = None
+    vector_score: float | None = None
+    labels: list[str]
+    properties: dict[str, Any]
+
+
+class SkillExperience(BaseModel):
+    """Skill name with years of experience."""
+
+    name: str
+    years: float = Field(default=0, ge=0)
+
+
+class MatchBatchRole(BaseModel):
+    """Role with its required skills."""
+
+    id: str | None = None
+    required_skills: list[SkillExperience]
+
+
+class MatchBatchCandidate(BaseModel):
+    """Candidate profile with its skills."""
+
+    id: str | None = None
+    skills: list[SkillExperience]
+
+
+class MatchBatchRequest(BaseModel):
+    """Batch ranking request of many roles against many candidates."""
+
+    roles: list[MatchBatchRole] = Field(min_length=1, max_length=MAX_RANK_ROLES)
+    candidates: list[MatchBatchCandidate] = Field(min_length=1, max_length=MAX_RANK_CANDIDATES)
+    k: int = Field(default=10, gt=0)  # matches per role (or per candidate)
+    evidence_k: int = Field(default=3, ge=0)  # matches per group carrying evidence
+    by: Literal["role", "candidate"] = RANK_BY_ROLE
+
+
 @router.get("/healthz", summary="Health check")
 async def health_check() -> dict[str, str]:
     """Return service health status."""
@@ -67,14 +149,28 @@ async def get_entity(entity_id: int) -> Entity:
         "    targetLabels: labels(m)"
         "}) AS rels"
     )
-    async for ses in neo4j_conn.get_session():
-        result = await ses.run(cypher, id=entity_id)
-        record = await result.single()
-        if not record:
+    async with neo4j_conn.session() as ses:
+        snapshot = await snapshot_store.ensure_fresh(ses)
+        if snapshot is not None:
+            node = snapshot.node(entity_id)
+            rels = []
+            if node is not None:
+                rels = [
+                    {
+                        "relType": snapshot.relationships[rel].type,
+                        "targetId": snapshot.nodes[target].id,
+                        "targetLabels": list(snapshot.nodes[target].labels),
+                    }
+                    for rel, target in snapshot.outgoing(snapshot.positions[entity_id])
+                ]
+        else:
+            records = await read_records(ses, cypher, {"id": entity_id})
+            record = records[0] if records else None
+            node = record["n"] if record else None
+            rels = record["rels"] if record else []
+        if node is None:
             logger.warning("Entity not found: %d", entity_id)
             raise HTTPException(status_code=404, detail="Entity not found")
-        node = record["n"]
-        rels = record["rels"]
         logger.debug("Found entity with %d relationships", len(rels))
         return Entity(
             id=str(node.id),
@@ -82,7 +178,6 @@ async def get_entity(entity_id: int) -> Entity:
             properties=dict(node),
             relationships=rels,
         )
-    raise HTTPException(status_code=500, detail="Database session error")
 
 
 @router.post(
@@ -99,34 +194,12 @@ async def search(request: SearchRequest) -> list[SearchResult]:
         # Encode query
         query_embedding = MODEL.encode(request.query)
 
-        # Get all nodes with their embeddings
-        cypher = """
-        MATCH (n)
-        WHERE n.embedding IS NOT NULL
-        RETURN id(n) as id, n.embedding as embedding
-        """
-
-        async for ses in neo4j_conn.get_session():
-            result = await ses.run(cypher)
-            records = [record async for record in result]
-            results = []
-            for record in records:
-                node_id = record["id"]
-                node_embedding = np.array(record["embedding"])
-
-                # Compute cosine similarity
-                similarity = cosine_similarity(
-                    query_embedding.reshape(1, -1), node_embedding.reshape(1, -1)
-                )[0][0]
-
-                results.append(
-                    SearchResult(entity_id=str(node_id), score=float(similarity))
-                )
-
-            # Sort by score and return top-k
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[: request.k]
-        raise HTTPException(status_code=500, detail="Database session error")
+        async with neo4j_conn.session() as ses:
+            await vector_index.ensure_fresh(ses)
+            hits = vector_index.search(query_embedding, request.k, request.labels or None)
+            return [
+                SearchResult(entity_id=str(node_id), score=score) for node_id, score in hits
+            ]
 
     except ImportError as exc:
         logger.error("Semantic search failed: %s", exc)
@@ -137,3 +210,126 @@ async def search(request: SearchRequest) -> list[SearchResult]:
     except Exception as exc:
         logger.error("Search failed: %s", exc)
         raise HTTPException(status_code=500, detail="Search operation failed") from exc
+
+
+@router.post(
+    "/batch_search",
+    response_model=list[BatchSearchResult],
+    summary="Semantic search for several queries at once",
+)
+async def batch_search(request: BatchSearchRequest) -> list[BatchSearchResult]:
+    """Search entities for several queries with one encode and one matrix product."""
+    logger.info("Batch search request: %d queries (k=%d)", len(request.queries), request.k)
+
+    try:
+        async with neo4j_conn.session() as ses:
+            ranked = await rank_batch(ses, request.queries, request.k, request.labels or None)
+            return [
+                BatchSearchResult(
+                    query=query,
+                    results=[
+                        SearchResult(entity_id=str(node_id), score=score)
+                        for node_id, score in hits
+                    ],
+                )
+                for query, hits in zip(request.queries, ranked)
+            ]
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.error("Batch search failed: %s", exc)
+        raise HTTPException(status_code=500, detail="Search operation failed") from exc
+
+
+@router.post(
+    "/hybrid_search",
+    response_model=list[HybridSearchResult],
+    summary="Hybrid lexical + semantic search",
+)
+async def hybrid_search(request: HybridSearchRequest) -> list[HybridSearchResult]:
+    """Search entities lexically and by embedding, fusing both rankings."""
+    logger.info("Hybrid search request: %s (k=%d)", request.query, request.k)
+    if request.lexical_weight + request.vector_weight == 0:
+        raise HTTPException(status_code=422, detail="At least one weight must be positive")
+
+    try:
+        async with neo4j_conn.session() as ses:
+            hits = await run_hybrid_search(
+                ses,
+                request.query,
+                top_k=request.k,
+                lexical_weight=request.lexical_weight,
+                vector_weight=request.vector_weight,
+                fusion=request.fusion,
+            )
+            return [
+                HybridSearchResult(
+                    entity_id=str(hit.node_id),
+                    score=hit.score,
+                    lexical_score=hit.lexical_score,
+                    vector_score=hit.vector_score,
+                    labels=list(hit.node.labels),
+                    properties=dict(hit.node),
+                )
+                for hit in hits
+            ]
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.error("Hybrid search failed: %s", exc)
+        raise HTTPException(status_code=500, detail="Search operation failed") from exc
+
+
+@router.post("/match_batch", summary="Rank many candidates against many roles")
+async def match_batch(request: MatchBatchRequest) -> StreamingResponse:
+    """Stream rankings as newline-delimited JSON, one line per role or candidate.
+
+    Each line carries the role (or candidate) id and its best matches. Roles
+    and candidates without an id are identified by their position.
+    """
+    logger.info(
+        "Batch match request: %d roles x %d candidates (k=%d, by=%s)",
+        len(request.roles),
+        len(request.candidates),
+        request.k,
+        request.by,
+    )
+    role_ids = [role.id or str(i) for i, role in enumerate(request.roles)]
+    candidate_ids = [c.id or str(i) for i, c in enumerate(request.candidates)]
+
+    async def lines() -> AsyncIterator[str]:
+        try:
+            async with neo4j_conn.session() as ses:
+                async for ranking in skill_matching.rank_batch(
+                    ses,
+                    [
+                        [skill.model_dump() for skill in role.required_skills]
+                        for role in request.roles
+                    ],
+                    [[skill.model_dump() for skill in c.skills] for c in request.candidates],
+                    top_k=request.k,
+                    evidence_top=request.evidence_k,
+                    by=request.by,
+                ):
+                    group_ids = role_ids if request.by == RANK_BY_ROLE else candidate_ids
+                    line = {
+                        request.by: group_ids[ranking.index],
+                        "matches": [
+                            {
+                                "role": role_ids[match.role_index],
+                                "candidate": candidate_ids[match.candidate_index],
+                                "score": match.overall_score,
+                                "matching_skills": [asdict(m) for m in match.matching_skills],
+                                "skill_gaps": match.skill_gaps,
+                            }
+                            for match in ranking.matches
+                        ],
+                    }
+                    yield json.dumps(line, default=str) + "\n"
+                return
+        except Exception as exc:
+            # Headers are already sent; report the failure in-band
+            logger.error("Batch match failed: %s", exc)
+            yield json.dumps({"error": "Match operation failed"}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
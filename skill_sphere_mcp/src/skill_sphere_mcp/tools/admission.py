@@ -0,0 +1,263 @@
+"""Adaptive admission control for tool calls."""
+
+import asyncio
+import logging
+import math
+import time
+
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TypeVar
+
+from fastapi import HTTPException
+from prometheus_client import Counter
+from prometheus_client import Gauge
+
+from ..config.settings import get_settings
+from ..utils.deadline import DeadlineExceeded
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Weight of the latest call in the latency average
+LATENCY_SMOOTHING = 0.2
+
+admission_limit = Gauge("admission_limit", "Concurrent calls allowed per tool", ["tool"])
+admission_in_flight = Gauge("admission_in_flight", "Calls running per tool", ["tool"])
+admission_queued = Gauge("admission_queued", "Calls waiting for a slot per tool", ["tool"])
+admission_rejected = Counter(
+    "admission_rejected", "Calls rejected because a tool was overloaded", ["tool"]
+)
+
+
+class Overloaded(HTTPException):
+    """Raised when a tool's concurrency limit and queue are both full."""
+
+    def __init__(self, tool_name: str, retry_after: int) -> None:
+        """Initialize with status 429 and a Retry-After header.
+
+        Args:
+            tool_name: Overloaded tool
+            retry_after: Seconds after which a retry is likely to be admitted
+        """
+        super().__init__(
+            status_code=429,
+            detail=f"Too many concurrent {tool_name} calls",
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """Concurrency limit of one tool, adjusted by AIMD.
+
+    Calls beyond the limit wait in a bounded FIFO queue; once that is full
+    they are rejected straight away. The limit grows by one per limit's
+    worth of calls that finish within the target latency, and is cut by
+    the backoff factor when a call is slower or times out, at most once
+    per target latency so one slow burst does not collapse it.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        target_latency: float,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        max_queue: int = 32,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an idle limiter.
+
+        Args:
+            tool_name: Tool whose calls are limited
+            target_latency: Seconds a call may take before the limit is cut
+            initial_limit: Starting concurrency limit
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            max_queue: Maximum number of calls waiting for a slot
+            backoff: Factor the limit is multiplied by on congestion
+            clock: Monotonic time source
+        """
+        self.tool_name = tool_name
+        self.target_latency = target_latency
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.backoff = backoff
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.latency = target_latency
+        self._clock = clock
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = -math.inf
+        admission_limit.labels(tool=tool_name).set(self.limit)
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Estimate the seconds until a new call would get a slot."""
+        waves = (self.queued + 1) / max(int(self.limit), 1)
+        return max(1, math.ceil(waves * self.latency))
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the queue if all are in use.
+
+        Raises:
+            Overloaded: If the queue is full
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._take()
+            return
+        if self.queued >= self.max_queue:
+            admission_rejected.labels(tool=self.tool_name).inc()
+            raise Overloaded(self.tool_name, self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        admission_queued.labels(tool=self.tool_name).set(self.queued)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as this call was cancelled
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+                admission_queued.labels(tool=self.tool_name).set(self.queued)
+            raise
+
+    def release(self) -> None:
+        """Give a slot back, handing it to the next waiting call if allowed."""
+        self.in_flight -= 1
+        self._wake()
+
+    def record(self, latency: float, congested: bool = False) -> None:
+        """Adjust the limit after a call finished.
+
+        Args:
+            latency: Seconds the call held its slot
+            congested: True if the call failed in a way that signals overload
+        """
+        self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+        now = self._clock()
+        if congested or latency > self.target_latency:
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = now
+                logger.info("Lowered %s concurrency limit to %d", self.tool_name, self.limit)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        admission_limit.labels(tool=self.tool_name).set(self.limit)
+        self._wake()
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call in a slot, feeding its latency back into the limit.
+
+        Args:
+            call: Starts the work
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Overloaded: If the tool is overloaded
+        """
+        await self.acquire()
+        started = self._clock()
+        congested = False
+        try:
+            return await call()
+        except (DeadlineExceeded, asyncio.TimeoutError):
+            congested = True
+            raise
+        except asyncio.CancelledError:
+            # Cancelled by a request deadline further out: the call was slow
+            congested = True
+            raise
+        finally:
+            self.release()
+            self.record(self._clock() - started, congested)
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        admission_in_flight.labels(tool=self.tool_name).set(self.in_flight)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._take()
+            waiter.set_result(None)
+        admission_in_flight.labels(tool=self.tool_name).set(self.in_flight)
+        admission_queued.labels(tool=self.tool_name).set(self.queued)
+
+
+class AdmissionControl:
+    """Admission limiters of all tools, created on first use."""
+
+    def __init__(self) -> None:
+        """Initialize without limiters."""
+        self._limiters: dict[str, AdmissionLimiter] = {}
+
+    def limiter(self, tool_name: str) -> AdmissionLimiter:
+        """Return the limiter of a tool, creating it from the settings.
+
+        Args:
+            tool_name: Tool name
+
+        Returns:
+            The tool's limiter
+        """
+        limiter = self._limiters.get(tool_name)
+        if limiter is None:
+            settings = get_settings()
+            limiter = AdmissionLimiter(
+                tool_name,
+                target_latency=settings.admission_target_latencies.get(
+                    tool_name, settings.admission_target_latency
+                ),
+                initial_limit=settings.admission_initial_limit,
+                min_limit=settings.admission_min_limit,
+                max_limit=settings.admission_max_limit,
+                max_queue=settings.admission_max_queue,
+            )
+            self._limiters[tool_name] = limiter
+        return limiter
+
+    async def run(self, tool_name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a tool call under the tool's admission limit.
+
+        Does nothing but call through when admission control is disabled in
+        the settings.
+
+        Args:
+            tool_name: Tool name
+            call: Starts the work
+
+        Returns:
+            The result of the call
+
+        Raises:
+            Overloaded: If the tool is overloaded
+        """
+        if not get_settings().enable_admission_control:
+            return await call()
+        return await self.limiter(tool_name).run(call)
+
+    def clear(self) -> None:
+        """Forget all limiters, so they are recreated from the settings."""
+        self._limiters.clear()
+
+
+# Global admission control instance
+admission_control = AdmissionControl()
@@ -0,0 +1,174 @@
+"""Result cache for idempotent tools."""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+from prometheus_client import Counter
+from prometheus_client import Gauge
+
+from ..config.settings import get_settings
+from ..graph.generation import graph_generation
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+cache_hits = Counter("tool_cache_hits", "Tool results served from the cache", ["tool"])
+cache_misses = Counter("tool_cache_misses", "Tool results computed on a cache miss", ["tool"])
+cache_entries = Gauge("tool_cache_entries", "Tool results currently cached")
+
+
+def parameters_key(tool_name: str, parameters: dict[str, Any]) -> str:
+    """Return a canonical hash of a tool call.
+
+    Parameters that differ only in key order or JSON formatting hash the
+    same.
+
+    Args:
+        tool_name: Tool name
+        parameters: Tool parameters
+
+    Returns:
+        Hex digest identifying the call
+    """
+    canonical = json.dumps(
+        {"tool": tool_name, "parameters": parameters},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolResultCache:
+    """LRU cache of tool results with a time to live.
+
+    Entries are keyed by the canonical parameter hash and the graph
+    generation, so any graph write made through this process, or seen by
+    polling the stored generation, retires all earlier results. The TTL
+    bounds how long results can miss writes that advance neither.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Seconds a result stays valid
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, int], tuple[float, Any]] = OrderedDict()
+        self._generation = graph_generation.current
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        cache_entries.set(0)
+
+    def _key(self, tool_name: str, parameters: dict[str, Any]) -> tuple[str, int]:
+        """Return the entry key, dropping results of earlier graph generations."""
+        if self._generation != graph_generation.current:
+            self.clear()
+            self._generation = graph_generation.current
+        return parameters_key(tool_name, parameters), self._generation
+
+    def get(self, tool_name: str, parameters: dict[str, Any]) -> tuple[bool, Any]:
+        """Look up a result.
+
+        Args:
+            tool_name: Tool name
+            parameters: Tool parameters
+
+        Returns:
+            Tuple of whether the result was cached and a copy of it
+        """
+        key = self._key(tool_name, parameters)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires <= self._clock():
+            del self._entries[key]
+            cache_entries.set(len(self._entries))
+            return False, None
+        self._entries.move_to_end(key)
+        return True, copy.deepcopy(value)
+
+    def put(self, tool_name: str, parameters: dict[str, Any], value: Any) -> None:
+        """Store a result, evicting the least recently used beyond capacity.
+
+        Args:
+            tool_name: Tool name
+            parameters: Tool parameters
+            value: Result to cache; a copy is stored
+        """
+        key = self._key(tool_name, parameters)
+        self._entries[key] = (self._clock() + self.ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        cache_entries.set(len(self._entries))
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        parameters: dict[str, Any],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return the cached result of a call, computing it on a miss.
+
+        Failed calls are not cached. Does nothing but call through when
+        caching is disabled in the settings.
+
+        Args:
+            tool_name: Tool name
+            parameters: Tool parameters
+            call: Computes the result
+
+        Returns:
+            The tool result
+        """
+        settings = get_settings()
+        if not settings.enable_caching:
+            return await call()
+        self.max_entries = settings.tool_cache_max_entries
+        self.ttl_seconds = settings.tool_cache_ttl_seconds
+
+        hit, value = self.get(tool_name, parameters)
+        if hit:
+            cache_hits.labels(tool=tool_name).inc()
+            return value
+        cache_misses.labels(tool=tool_name).inc()
+        generation = graph_generation.current
+        result = await call()
+        # A write during the call may have made the result stale already
+        if graph_generation.current == generation:
+            self.put(tool_name, parameters, result)
+        return result
+
+
+# Global tool result cache instance, emptied as soon as the graph changes
+tool_cache = ToolResultCache()
+graph_generation.subscribe(lambda _generation: tool_cache.clear())
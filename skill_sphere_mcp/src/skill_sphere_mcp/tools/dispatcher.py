@@ -2,15 +2,29 @@
 
 import logging
 
+from collections.abc import Awaitable
 from typing import Any
 
 from fastapi import HTTPException
 from neo4j import AsyncSession
 
 from ..cv import generate_cv
+from ..db.deps import SessionFactory
+from ..db.deps import run_in_session
+from ..graph.batch_search import MAX_BATCH_QUERIES
+from ..graph.hybrid_search import FUSION_METHODS
+from ..graph.pagerank import EVIDENCE_TOP_K
+from ..tools.admission import admission_control
+from ..tools.cache import tool_cache
+from ..tools.handlers import batch_search
 from ..tools.handlers import explain_match
 from ..tools.handlers import graph_search
+from ..tools.handlers import hybrid_search
 from ..tools.handlers import match_role
+from ..tools.handlers import recommend_gaps
+from ..tools.single_flight import single_flight
+from ..utils.deadline import deadline_scope
+from ..utils.deadline import run_with_deadline
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +34,12 @@ TOOL_MATCH_ROLE = "skill.match_role"
 TOOL_EXPLAIN_MATCH = "skill.explain_match"
 TOOL_GENERATE_CV = "cv.generate"
 TOOL_GRAPH_SEARCH = "graph.search"
+TOOL_HYBRID_SEARCH = "graph.hybrid_search"
+TOOL_BATCH_SEARCH = "graph.batch_search"
+TOOL_RECOMMEND_GAPS = "skill.recommend_gaps"
+
+# Tools whose results depend only on their parameters and the graph
+CACHEABLE_TOOLS = frozenset({TOOL_EXPLAIN_MATCH, TOOL_GENERATE_CV, TOOL_GRAPH_SEARCH})
 
 
 def _validate_match_role_params(parameters: dict[str, Any]) -> None:
@@ -36,6 +56,9 @@ def _validate_explain_match_params(parameters: dict[str, Any]) -> None:
         raise HTTPException(status_code=422, detail="Skill ID is required")
     if not parameters.get("role_requirement"):
         raise HTTPException(status_code=422, detail="Role requirement is required")
+    top_k = parameters.get("top_k", EVIDENCE_TOP_K)
+    if not isinstance(top_k, int) or top_k <= 0:
+        raise HTTPException(status_code=422, detail="top_k must be a positive integer")
 
 
 def _validate_generate_cv_params(parameters: dict[str, Any]) -> None:
@@ -55,19 +78,79 @@ def _validate_graph_search_params(parameters: dict[str, Any]) -> None:
         raise HTTPException(status_code=422, detail="top_k must be a positive integer")
 
 
-async def dispatch_tool(tool_name: str, parameters: dict[str, Any], session: AsyncSession) -> dict[str, Any]:
+def _validate_hybrid_search_params(parameters: dict[str, Any]) -> None:
+    """Validate hybrid_search parameters."""
+    _validate_graph_search_params(parameters)
+    weights = [parameters.get("lexical_weight", 0.5), parameters.get("vector_weight", 0.5)]
+    if not all(isinstance(w, int | float) and w >= 0 for w in weights):
+        raise HTTPException(status_code=422, detail="Weights must be non-negative numbers")
+    if sum(weights) == 0:
+        raise HTTPException(status_code=422, detail="At least one weight must be positive")
+    if parameters.get("fusion", FUSION_METHODS[0]) not in FUSION_METHODS:
+        raise HTTPException(
+            status_code=422, detail=f"fusion must be one of: {', '.join(FUSION_METHODS)}"
+        )
+
+
+def _validate_batch_search_params(parameters: dict[str, Any]) -> None:
+    """Validate batch_search parameters."""
+    queries = parameters.get("queries")
+    if not queries or not isinstance(queries, list):
+        raise HTTPException(status_code=422, detail="Queries must be a non-empty list")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(
+            status_code=422, detail=f"At most {MAX_BATCH_QUERIES} queries per batch"
+        )
+    if not all(isinstance(q, str) and q.strip() for q in queries):
+        raise HTTPException(status_code=422, detail="Queries must be non-empty strings")
+    top_k = parameters.get("top_k", 5)
+    if not isinstance(top_k, int) or top_k <= 0:
+        raise HTTPException(status_code=422, detail="top_k must be a positive integer")
+    labels = parameters.get("labels")
+    if labels is not None and not (
+        isinstance(labels, list) and all(isinstance(label, str) for label in labels)
+    ):
+        raise HTTPException(status_code=422, detail="labels must be a list of strings")
+
+
+def _validate_recommend_gaps_params(parameters: dict[str, Any]) -> None:
+    """Validate recommend_gaps parameters."""
+    required_skills = parameters.get("required_skills")
+    if not required_skills or not isinstance(required_skills, list):
+        raise HTTPException(status_code=422, detail="Required skills are missing")
+    person_skills = parameters.get("person_skills")
+    if person_skills is not None and not (
+        isinstance(person_skills, list) and all(isinstance(s, str) for s in person_skills)
+    ):
+        raise HTTPException(status_code=422, detail="person_skills must be a list of strings")
+    top_k = parameters.get("top_k", 3)
+    if not isinstance(top_k, int) or top_k <= 0:
+        raise HTTPException(status_code=422, detail="top_k must be a positive integer")
+
+
+async def dispatch_tool(
+    tool_name: str,
+    parameters: dict[str, Any],
+    session: AsyncSession | None = None,
+    session_factory: SessionFactory | None = None,
+) -> dict[str, Any]:
     """Dispatch tool execution to appropriate handler.
 
     Args:
         tool_name: Name of tool to dispatch
         parameters: Tool parameters
         session: Database session
+        session_factory: Opens the session once the call is admitted, in
+            place of ``session``, so that calls waiting for admission hold
+            no pool slot
 
     Returns:
         Tool execution result
 
     Raises:
-        HTTPException: If tool name is invalid or parameters are invalid
+        HTTPException: If tool name is invalid or parameters are invalid,
+            with status 429 if the tool is overloaded, or with status 504 if
+            the tool runs past the request deadline
     """
     if not tool_name or not tool_name.strip():
         raise HTTPException(status_code=422, detail="Tool name is required")
@@ -78,6 +161,9 @@ async def dispatch_tool(tool_name: str, parameters: dict[str, Any], session: Asy
         TOOL_EXPLAIN_MATCH: explain_match,
         TOOL_GENERATE_CV: generate_cv,
         TOOL_GRAPH_SEARCH: graph_search,
+        TOOL_HYBRID_SEARCH: hybrid_search,
+        TOOL_BATCH_SEARCH: batch_search,
+        TOOL_RECOMMEND_GAPS: recommend_gaps,
     }
 
     # Get handler
@@ -95,14 +181,40 @@ async def dispatch_tool(tool_name: str, parameters: dict[str, Any], session: Asy
             _validate_generate_cv_params(parameters)
         elif tool_name == TOOL_GRAPH_SEARCH:
             _validate_graph_search_params(parameters)
+        elif tool_name == TOOL_HYBRID_SEARCH:
+            _validate_hybrid_search_params(parameters)
+        elif tool_name == TOOL_BATCH_SEARCH:
+            _validate_batch_search_params(parameters)
+        elif tool_name == TOOL_RECOMMEND_GAPS:
+            _validate_recommend_gaps_params(parameters)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
-    # Execute handler
+    # Execute handler, serving idempotent tools from the result cache and
+    # letting identical concurrent calls share one execution, which is
+    # admitted only within the tool's concurrency limit
+    def run_handler() -> Awaitable[dict[str, Any]]:
+        if session_factory is not None:
+            return run_in_session(session_factory, lambda opened: handler(parameters, opened))
+        return handler(parameters, session)
+
+    def admitted_call() -> Awaitable[dict[str, Any]]:
+        return admission_control.run(tool_name, run_handler)
+
+    def call() -> Awaitable[dict[str, Any]]:
+        return single_flight.do(tool_name, parameters, admitted_call)
+
+    def cached_call() -> Awaitable[dict[str, Any]]:
+        if tool_name in CACHEABLE_TOOLS:
+            return tool_cache.get_or_call(tool_name, parameters, call)
+        return call()
+
     try:
-        return await handler(parameters, session)
+        # The handler is cancelled if it runs past the request deadline
+        with deadline_scope(tool_name):
+            return await run_with_deadline(cached_call)
     except HTTPException as e:
         if e.status_code == 422:
             raise
@@ -111,6 +223,8 @@ async def dispatch_tool(tool_name: str, parameters: dict[str, Any], session: Asy
             or "Invalid parameters" in str(e.detail)
         ):
             raise HTTPException(status_code=422, detail=str(e.detail)) from e
-        raise HTTPException(status_code=e.status_code, detail=str(e.detail)) from e
+        raise HTTPException(
+            status_code=e.status_code, detail=str(e.detail), headers=e.headers
+        ) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail="Some error") from e
@@ -1,10 +1,22 @@
 """Tool handlers for the MCP server."""
 
+from dataclasses import asdict
 from typing import Any
 
 from fastapi import HTTPException
 from neo4j import AsyncSession
 
+from ..db.queries import read_records
+from ..graph.batch_search import batch_search as run_batch_search
+from ..graph.experience import experience_store
+from ..graph.hybrid_search import FUSION_RRF
+from ..graph.hybrid_search import hybrid_search as run_hybrid_search
+from ..graph.pagerank import EVIDENCE_TOP_K
+from ..graph.pagerank import rank_evidence
+from ..graph.person_skills import person_skills
+from ..graph.search_index import search_nodes
+from ..graph.skill_matching import skill_matching
+
 
 async def explain_match(
     parameters: dict[str, Any], session: AsyncSession
@@ -32,10 +44,13 @@ async def explain_match(
     MATCH (s:Skill {id: $skill_id})
     OPTIONAL MATCH (s)-[:USED_IN]->(p:Project)
     OPTIONAL MATCH (s)-[:CERTIFIED_IN]->(c:Certification)
-    RETURN s, collect(p) as projects, collect(c) as certifications
+    WITH s, collect(DISTINCT p) as projects, collect(DISTINCT c) as certifications
+    RETURN s, projects, certifications, id(s) as node_id,
+           [p IN projects | id(p)] as project_ids,
+           [c IN certifications | id(c)] as certification_ids
     """
-    result = await session.run(query, skill_id=skill_id)
-    record = await result.single()
+    records = await read_records(session, query, {"skill_id": skill_id})
+    record = records[0] if records else None
     if not record:
         raise HTTPException(status_code=404, detail=f"Skill {skill_id} not found")
 
@@ -43,16 +58,25 @@ async def explain_match(
     projects = record["projects"]
     certifications = record["certifications"]
 
-    # Build evidence list
-    evidence = []
-    for project in projects:
-        evidence.append(
-            {"type": "project", "description": f"Used in project: {project['name']}"}
+    # Build evidence list, keeping the entries most relevant to the role
+    project_ids = record.get("project_ids") or [None] * len(projects)
+    certification_ids = record.get("certification_ids") or [None] * len(certifications)
+    candidates = []
+    for node_id, project in zip(project_ids, projects):
+        candidates.append(
+            (node_id, {"type": "project", "description": f"Used in project: {project['name']}"})
         )
-    for cert in certifications:
-        evidence.append(
-            {"type": "certification", "description": f"Certified in: {cert['name']}"}
+    for node_id, cert in zip(certification_ids, certifications):
+        candidates.append(
+            (node_id, {"type": "certification", "description": f"Certified in: {cert['name']}"})
         )
+    evidence = await rank_evidence(
+        session,
+        record.get("node_id"),
+        role_requirement,
+        candidates,
+        parameters.get("top_k", EVIDENCE_TOP_K),
+    )
 
     # Generate explanation
     explanation = (
@@ -77,20 +101,80 @@ async def graph_search(
     if top_k <= 0:
         raise HTTPException(status_code=400, detail="top_k must be greater than 0")
 
-    # Query the database to find nodes matching the query
-    cypher_query = """
-    MATCH (n)
-    WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
-    RETURN n
-    LIMIT $top_k
-    """
-    result = await session.run(cypher_query, search_query=query, top_k=top_k)
-    records = await result.all()  # type: ignore[attr-defined]
-    results = [{"node": record["n"]} for record in records]
+    # Resolve candidates through the search index, falling back to a scan
+    ranked = await search_nodes(session, query, top_k)
+    if ranked is not None:
+        results = [{"node": node} for node, _ in ranked]
+    else:
+        cypher_query = """
+        MATCH (n)
+        WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
+        RETURN n
+        LIMIT $top_k
+        """
+        records = await read_records(
+            session, cypher_query, {"search_query": query, "top_k": top_k}
+        )
+        results = [{"node": record["n"]} for record in records]
+
+    return {"results": results, "query": query, "top_k": top_k}
+
+
+async def hybrid_search(
+    parameters: dict[str, Any], session: AsyncSession
+) -> dict[str, Any]:
+    """Hybrid lexical + vector search tool handler."""
+    query = parameters.get("query")
+    top_k = parameters.get("top_k", 5)
+    if not query:
+        raise HTTPException(status_code=400, detail="Missing query parameter")
+    try:
+        hits = await run_hybrid_search(
+            session,
+            query,
+            top_k=top_k,
+            lexical_weight=parameters.get("lexical_weight", 0.5),
+            vector_weight=parameters.get("vector_weight", 0.5),
+            fusion=parameters.get("fusion", FUSION_RRF),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
+    results = [
+        {
+            "node": hit.node,
+            "score": hit.score,
+            "lexical_score": hit.lexical_score,
+            "vector_score": hit.vector_score,
+        }
+        for hit in hits
+    ]
     return {"results": results, "query": query, "top_k": top_k}
 
 
+async def batch_search(
+    parameters: dict[str, Any], session: AsyncSession
+) -> dict[str, Any]:
+    """Multi-query search tool handler (one result list per query)."""
+    queries = parameters.get("queries")
+    top_k = parameters.get("top_k", 5)
+    if not queries:
+        raise HTTPException(status_code=400, detail="Missing queries parameter")
+    if top_k <= 0:
+        raise HTTPException(status_code=400, detail="top_k must be greater than 0")
+
+    try:
+        ranked = await run_batch_search(session, queries, top_k, parameters.get("labels"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    results = [
+        {"query": query, "results": [{"node": node, "score": score} for node, score in hits]}
+        for query, hits in zip(queries, ranked)
+    ]
+    return {"results": results, "top_k": top_k}
+
+
 async def match_role(
     parameters: dict[str, Any], session: AsyncSession
 ) -> dict[str, Any]:
@@ -112,26 +196,40 @@ async def match_role(
                 detail=f"Invalid years_experience for skill '{skill}': {years} (must be int)",
             )
 
-    # Query the database to find matching profiles
-    query = """
-    MATCH (p:Person)
-    WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
-    RETURN p
-    """
-    result = await session.run(query, required_skills=required_skills)
-    records = await result.all()  # type: ignore[attr-defined]
-
-    matching_skills = []
-    skill_gaps = []
-    for skill in required_skills:
-        found = False
-        for record in records:
-            if skill in record["p"].get("skills", []):
-                matching_skills.append({"name": skill})
-                found = True
-                break
-        if not found:
-            skill_gaps.append(skill)
+    index = await person_skills.ensure_fresh(session)
+    if index is not None:
+        # Skills and gaps of the best-covering person, from the bitset index
+        person_id, matched, skill_gaps = index.best_match(required_skills)
+        experience = await experience_store.ensure_fresh(session)
+        matching_skills: list[dict[str, Any]] = []
+        for skill in matched:
+            entry: dict[str, Any] = {"name": skill}
+            years = experience.years(skill, person_id) if experience else None
+            if years is not None:
+                entry["years"] = round(years, 1)
+                if skill in years_experience:
+                    entry["meets_experience"] = years >= years_experience[skill]
+            matching_skills.append(entry)
+    else:
+        # Query the database to find matching profiles
+        query = """
+        MATCH (p:Person)
+        WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
+        RETURN p
+        """
+        records = await read_records(session, query, {"required_skills": required_skills})
+
+        matching_skills = []
+        skill_gaps = []
+        for skill in required_skills:
+            found = False
+            for record in records:
+                if skill in record["p"].get("skills", []):
+                    matching_skills.append({"name": skill})
+                    found = True
+                    break
+            if not found:
+                skill_gaps.append(skill)
 
     match_score = (
         len(matching_skills) / len(required_skills) if required_skills else 0.0
@@ -142,3 +240,33 @@ async def match_role(
         "skill_gaps": skill_gaps,
         "matching_skills": matching_skills,
     }
+
+
+async def recommend_gaps(
+    parameters: dict[str, Any], session: AsyncSession
+) -> dict[str, Any]:
+    """Gap recommendation tool handler (nearest held skills and learning bridge per gap)."""
+    required_skills = parameters.get("required_skills")
+    if not required_skills:
+        raise HTTPException(status_code=400, detail="Missing required_skills parameter")
+    top_k = parameters.get("top_k", 3)
+
+    held = parameters.get("person_skills")
+    if held is None:
+        index = await person_skills.ensure_fresh(session)
+        if index is not None:
+            person_id, _, _ = index.best_match(required_skills)
+            held = index.skills_of(person_id) if person_id is not None else []
+        else:
+            records = await read_records(
+                session, "MATCH (:Person)-[:HAS_SKILL]->(s:Skill) RETURN DISTINCT s.name AS name"
+            )
+            held = [record["name"] for record in records]
+
+    held_names = set(held)
+    gaps = [skill for skill in required_skills if skill not in held_names]
+    recommendations = await skill_matching.recommend_for_gaps(session, gaps, held, top_k)
+    return {
+        "skill_gaps": gaps,
+        "recommendations": [asdict(recommendation) for recommendation in recommendations],
+    }
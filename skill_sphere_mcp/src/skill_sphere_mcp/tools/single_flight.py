@@ -0,0 +1,93 @@
+"""Single-flight deduplication of identical concurrent tool calls."""
+
+import asyncio
+import copy
+import logging
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+from prometheus_client import Counter
+
+from ..graph.generation import graph_generation
+from .cache import parameters_key
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+coalesced_calls = Counter(
+    "single_flight_coalesced", "Tool calls that shared an identical in-flight call", ["tool"]
+)
+
+
+class SingleFlight:
+    """Lets concurrent identical calls share one execution.
+
+    The first call for a key runs; calls with the same key that arrive
+    while it is in flight wait for it and get a copy of its result, or its
+    exception. Keys include the graph generation, so a call made after a
+    write never joins a flight that started before it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._flights: dict[tuple[str, int], asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._flights)
+
+    async def do(
+        self,
+        tool_name: str,
+        parameters: dict[str, Any],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run a call, or join an identical one already in flight.
+
+        Args:
+            tool_name: Tool name
+            parameters: Tool parameters
+            call: Computes the result
+
+        Returns:
+            The tool result
+        """
+        key = (parameters_key(tool_name, parameters), graph_generation.current)
+        flight = self._flights.get(key)
+        if flight is not None:
+            coalesced_calls.labels(tool=tool_name).inc()
+            try:
+                return copy.deepcopy(await asyncio.shield(flight))
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The leading call was cancelled, not this one: run it here
+                logger.debug("In-flight %s call was cancelled, retrying", tool_name)
+                return await call()
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Mark the exception retrieved in case no other call joined
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+
+
+# Global single-flight instance
+single_flight = SingleFlight()
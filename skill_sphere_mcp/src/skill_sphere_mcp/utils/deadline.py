@@ -0,0 +1,215 @@
+"""Per-request deadlines."""
+
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from typing import TypeVar
+
+from fastapi import HTTPException
+
+from ..config.settings import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Request header and JSON-RPC param giving the client's timeout in seconds
+TIMEOUT_HEADER = "x-request-timeout"
+TIMEOUT_PARAM = "timeout"
+
+
+class DeadlineExceeded(HTTPException):
+    """Raised when a request runs past its deadline."""
+
+    def __init__(self) -> None:
+        """Initialize with status 504."""
+        super().__init__(status_code=504, detail="Request deadline exceeded")
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in time by which a request must have finished.
+
+    Attributes:
+        started: Monotonic time the request arrived
+        timeout: Seconds the request may take
+        requested: True if the client set the timeout, False for a default
+    """
+
+    started: float
+    timeout: float
+    requested: bool = False
+
+    @property
+    def expires(self) -> float:
+        """Monotonic time the deadline passes."""
+        return self.started + self.timeout
+
+    def remaining(self) -> float:
+        """Return the seconds left, negative once the deadline has passed."""
+        return self.expires - time.monotonic()
+
+
+_current: ContextVar[Deadline | None] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the current request, if any."""
+    return _current.get()
+
+
+def parse_timeout(value: Any) -> float | None:
+    """Parse a client timeout, capped at the configured maximum.
+
+    Args:
+        value: Timeout in seconds from a header or request parameter
+
+    Returns:
+        The timeout, or None if not given
+
+    Raises:
+        ValueError: If the timeout is not a positive number
+    """
+    if value is None:
+        return None
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid timeout: {value!r}") from e
+    if not timeout > 0:
+        raise ValueError("Timeout must be positive")
+    return min(timeout, get_settings().max_request_timeout)
+
+
+def tool_timeout(tool_name: str | None) -> float:
+    """Return the default timeout of a tool, or of requests in general.
+
+    Args:
+        tool_name: Tool name, or None for requests that are not tool calls
+
+    Returns:
+        Timeout in seconds
+    """
+    settings = get_settings()
+    if tool_name is None:
+        return settings.request_timeout
+    return settings.tool_timeouts.get(tool_name, settings.request_timeout)
+
+
+@contextmanager
+def deadline_scope(
+    tool_name: str | None = None, requested: float | None = None
+) -> Iterator[Deadline]:
+    """Set the deadline for the work done inside the block.
+
+    A timeout requested by the client wins over defaults. Otherwise the
+    tool's default applies, measured from when the request arrived. A
+    deadline the client requested for an enclosing scope is kept.
+
+    Args:
+        tool_name: Tool whose default timeout applies
+        requested: Timeout requested by the client, in seconds
+
+    Yields:
+        The deadline in effect
+    """
+    current = _current.get()
+    started = current.started if current is not None else time.monotonic()
+    if requested is not None:
+        deadline = Deadline(time.monotonic(), requested, requested=True)
+    elif current is not None and current.requested:
+        deadline = current
+    else:
+        deadline = Deadline(started, tool_timeout(tool_name))
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def transaction_timeout(default: float) -> float:
+    """Return a Neo4j transaction timeout that ends by the current deadline.
+
+    Args:
+        default: Timeout to use without a deadline, in seconds
+
+    Returns:
+        Timeout in seconds
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return default
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    return min(default, remaining)
+
+
+async def run_with_deadline(call: Callable[[], Awaitable[T]]) -> T:
+    """Await a call, cancelling it once the current deadline passes.
+
+    Args:
+        call: Starts the work
+
+    Returns:
+        The result of the call
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return await call()
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    try:
+        return await asyncio.wait_for(call(), remaining)
+    except asyncio.TimeoutError as e:
+        logger.warning("Request cancelled after its %.3gs deadline", deadline.timeout)
+        raise DeadlineExceeded() from e
+
+
+class DeadlineMiddleware:
+    """ASGI middleware starting each HTTP request's deadline.
+
+    Reads the client's timeout from the ``X-Request-Timeout`` header, or
+    falls back to the configured request timeout, which tool calls made
+    by the request replace with the tool's own default.
+    """
+
+    def __init__(self, app: Any) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        value = headers.get(TIMEOUT_HEADER.encode("latin-1"))
+        try:
+            requested = parse_timeout(value.decode("latin-1") if value else None)
+        except ValueError as e:
+            logger.debug("Ignoring %s header: %s", TIMEOUT_HEADER, e)
+            requested = None
+        with deadline_scope(requested=requested):
+            await self.app(scope, receive, send)
@@ -0,0 +1,95 @@
+"""Readiness of the server, reported separately from liveness."""
+
+import logging
+
+from typing import Any
+
+from prometheus_client import Gauge
+
+
+logger = logging.getLogger(__name__)
+
+STEP_PENDING = "pending"
+STEP_OK = "ok"
+STEP_FAILED = "failed"
+STEP_SKIPPED = "skipped"
+
+warmup_step_seconds = Gauge("warmup_step_seconds", "Duration of startup warm-up steps", ["step"])
+server_ready = Gauge("server_ready", "1 once the startup warm-up has finished and Neo4j answers")
+
+
+class Readiness:
+    """Progress of the startup warm-up.
+
+    The server is live as soon as it accepts requests, but only ready once
+    every warm-up step has run. A failed step leaves the server ready with
+    the affected caches cold, except for the required steps without which
+    no request can be served.
+    """
+
+    def __init__(self, required: tuple[str, ...] = ()) -> None:
+        """Initialize before any warm-up has started.
+
+        Args:
+            required: Steps whose failure keeps the server not ready
+        """
+        self.required = required
+        self._steps: dict[str, dict[str, Any]] = {}
+        self._finished = False
+
+    @property
+    def ready(self) -> bool:
+        """Return True once the warm-up finished without a required step failing."""
+        return self._finished and not any(
+            self._steps.get(step, {}).get("status") == STEP_FAILED for step in self.required
+        )
+
+    def start(self, steps: list[str]) -> None:
+        """Begin a warm-up running the given steps.
+
+        Args:
+            steps: Step names in the order they run
+        """
+        self._steps = {step: {"status": STEP_PENDING} for step in steps}
+        self._finished = False
+        server_ready.set(0)
+
+    def record(
+        self, step: str, status: str, seconds: float | None = None, error: str | None = None
+    ) -> None:
+        """Record the outcome of a step.
+
+        Args:
+            step: Step name
+            status: One of ok, failed or skipped
+            seconds: Time the step took
+            error: Why the step failed or was skipped
+        """
+        outcome: dict[str, Any] = {"status": status}
+        if seconds is not None:
+            outcome["seconds"] = round(seconds, 3)
+            warmup_step_seconds.labels(step=step).set(seconds)
+        if error is not None:
+            outcome["error"] = error
+        self._steps[step] = outcome
+
+    def finish(self) -> None:
+        """Mark the warm-up as finished."""
+        self._finished = True
+        server_ready.set(1 if self.ready else 0)
+        if self.ready:
+            logger.info("Warm-up finished, server ready")
+        else:
+            logger.warning("Warm-up finished, server not ready: %s", self._steps)
+
+    def report(self) -> dict[str, Any]:
+        """Return the readiness status and the outcome of each step."""
+        if not self._finished:
+            status = "starting"
+        else:
+            status = "ready" if self.ready else "unavailable"
+        return {"status": status, "steps": {step: dict(o) for step, o in self._steps.items()}}
+
+
+# Global readiness instance; Neo4j connectivity is required to serve requests
+readiness = Readiness(required=("connectivity",))
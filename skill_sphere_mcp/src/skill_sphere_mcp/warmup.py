@@ -0,0 +1,172 @@
+"""Startup warm-up of connections, indexes, embeddings and the default CV."""
+
+import asyncio
+import logging
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from .config.settings import get_settings
+from .db.connection import neo4j_conn
+from .db.queries import read_records
+from .db.schema import schema_migrator
+from .graph.embeddings import embeddings
+from .graph.experience import experience_store
+from .graph.generation import graph_generation
+from .graph.person_skills import person_skills
+from .graph.search_index import search_index
+from .graph.snapshot import snapshot_store
+from .graph.vector_index import vector_index
+from .models.embedding import get_embedding_model
+from .tools.dispatcher import TOOL_GENERATE_CV
+from .tools.dispatcher import dispatch_tool
+from .utils.readiness import STEP_FAILED
+from .utils.readiness import STEP_OK
+from .utils.readiness import STEP_SKIPPED
+from .utils.readiness import readiness
+
+
+logger = logging.getLogger(__name__)
+
+WARMUP_CONNECTIVITY = "connectivity"
+WARMUP_POOL = "pool"
+WARMUP_INDEXES = "indexes"
+WARMUP_EMBEDDINGS = "embeddings"
+WARMUP_CV = "cv"
+WARMUP_STEPS = (WARMUP_CONNECTIVITY, WARMUP_POOL, WARMUP_INDEXES, WARMUP_EMBEDDINGS, WARMUP_CV)
+
+POOL_PING = "RETURN 1 AS ok"
+
+
+async def _verify_connectivity() -> None:
+    """Check Neo4j answers and record the generation the caches are built from."""
+    await neo4j_conn.verify_connectivity()
+    try:
+        async with neo4j_conn.session() as session:
+            await graph_generation.poll_once(session)
+    except Exception as e:
+        logger.warning("Stored graph generation unavailable: %s", e)
+
+
+async def _prime_pool() -> None:
+    """Open pooled connections concurrently so early requests find them open."""
+    settings = get_settings()
+    connections = min(settings.warmup_pool_connections, settings.neo4j_max_connection_pool_size)
+
+    async def ping() -> None:
+        async with neo4j_conn.session() as session:
+            await read_records(session, POOL_PING)
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+    logger.info("Primed %d Neo4j connections", connections)
+
+
+async def _build_indexes() -> None:
+    """Build the in-memory indexes; each one that fails is left unbuilt.
+
+    Raises:
+        RuntimeError: Naming the indexes that could not be built
+    """
+    failed = []
+    for name, store in (
+        # Handlers fall back to Cypher scans without the search index
+        ("search index", search_index),
+        # Path queries fall back to Cypher without the graph snapshot
+        ("graph snapshot", snapshot_store),
+        # match_role falls back to Cypher matching without the bitsets
+        ("person skills", person_skills),
+        # Years of experience per person and skill, derived from job time ranges
+        ("experience table", experience_store),
+    ):
+        try:
+            async with neo4j_conn.session() as session:
+                await store.build(session)
+        except Exception as e:
+            logger.warning("%s unavailable, falling back to Cypher: %s", name.capitalize(), e)
+            failed.append(name)
+    if failed:
+        raise RuntimeError(f"Not built: {', '.join(failed)}")
+
+
+async def _load_embeddings() -> None:
+    """Load stored node embeddings, fit Node2Vec and run the text model once."""
+    model = get_embedding_model()
+    if model is not None:
+        # The first encode initializes the tokenizer and compute kernels
+        await asyncio.to_thread(model.encode, "warm-up")
+    async with neo4j_conn.session() as session:
+        await vector_index.build(session)
+    async with neo4j_conn.session() as session:
+        await embeddings.load_embeddings(session)
+
+
+async def _render_default_cv() -> None:
+    """Generate the default CV through the tool cache, so it is served from it."""
+    async with neo4j_conn.session() as session:
+        await dispatch_tool(TOOL_GENERATE_CV, dict(get_settings().warmup_cv_parameters), session)
+
+
+STEP_WORK: dict[str, Callable[[], Awaitable[None]]] = {
+    WARMUP_CONNECTIVITY: _verify_connectivity,
+    WARMUP_POOL: _prime_pool,
+    WARMUP_INDEXES: _build_indexes,
+    WARMUP_EMBEDDINGS: _load_embeddings,
+    WARMUP_CV: _render_default_cv,
+}
+
+
+async def _run_step(step: str) -> bool:
+    """Run one warm-up step and record its outcome.
+
+    Args:
+        step: Step name
+
+    Returns:
+        True if the step succeeded
+    """
+    started = time.perf_counter()
+    try:
+        await STEP_WORK[step]()
+    except Exception as e:
+        logger.warning("Warm-up step %s failed: %s", step, e)
+        readiness.record(step, STEP_FAILED, time.perf_counter() - started, str(e))
+        return False
+    readiness.record(step, STEP_OK, time.perf_counter() - started)
+    return True
+
+
+async def warm_up() -> bool:
+    """Apply schema migrations and run the configured warm-up steps in order.
+
+    Without Neo4j the remaining steps are skipped and the server serves
+    requests with cold caches, falling back to Cypher queries.
+
+    Returns:
+        False if Neo4j did not answer
+    """
+    settings = get_settings()
+    steps = [step for step in settings.warmup_steps if step in STEP_WORK]
+    for step in set(settings.warmup_steps) - set(steps):
+        logger.warning("Ignoring unknown warm-up step %s", step)
+    readiness.start(steps)
+
+    # Apply schema migrations (indexes, constraints, full-text index)
+    try:
+        async with neo4j_conn.session() as session:
+            await schema_migrator.migrate(session)
+    except Exception as e:
+        logger.warning("Schema migrations not applied: %s", e)
+
+    connected = True
+    for step in steps:
+        if not connected:
+            readiness.record(step, STEP_SKIPPED, error="Neo4j unavailable")
+        elif step == WARMUP_CV and not settings.warmup_cv_parameters:
+            readiness.record(step, STEP_SKIPPED, error="No default CV configured")
+        elif not await _run_step(step) and step == WARMUP_CONNECTIVITY:
+            # Managed read transactions keep retrying while Neo4j is
+            # unreachable, so do not build the in-memory structures
+            connected = False
+    readiness.finish()
+    return connected
@@ -2,23 +2,35 @@
 
 # pylint: disable=redefined-outer-name
 
+import asyncio
+
+from unittest.mock import AsyncMock
+
 import pytest
 import pytest_asyncio
 
+from fastapi import FastAPI
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from starlette.status import HTTP_200_OK
+from starlette.status import HTTP_204_NO_CONTENT
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
+from skill_sphere_mcp.api.jsonrpc import ERROR_INTERNAL
 from skill_sphere_mcp.api.jsonrpc import ERROR_INVALID_PARAMS
 from skill_sphere_mcp.api.jsonrpc import ERROR_INVALID_REQUEST
 from skill_sphere_mcp.api.jsonrpc import ERROR_METHOD_NOT_FOUND
+from skill_sphere_mcp.api.jsonrpc import JSONRPCHandler
 from skill_sphere_mcp.api.jsonrpc import JSONRPCRequest
 from skill_sphere_mcp.api.jsonrpc import JSONRPCResponse
 from skill_sphere_mcp.api.jsonrpc import create_jsonrpc_error
 from skill_sphere_mcp.api.jsonrpc import create_jsonrpc_response
+from skill_sphere_mcp.api.jsonrpc import handle_batch
 from skill_sphere_mcp.api.jsonrpc import validate_jsonrpc_request
 from skill_sphere_mcp.app import app
+from skill_sphere_mcp.db.deps import get_db_session
+from skill_sphere_mcp.db.deps import get_session_factory
+from skill_sphere_mcp.db.deps import run_in_session
 
 
 @pytest_asyncio.fixture
@@ -165,3 +177,148 @@ def test_rpc_endpoint_method_not_found(client: TestClient) -> None:
     assert "error" in data
     assert data["error"]["code"] == ERROR_METHOD_NOT_FOUND["code"]
     assert data["id"] == 1
+
+
+class SessionFactory:
+    """Opens mock sessions and records which were closed."""
+
+    def __init__(self) -> None:
+        self.opened: list[AsyncMock] = []
+        self.closed: list[AsyncMock] = []
+
+    async def __call__(self):
+        session = AsyncMock()
+        self.opened.append(session)
+        try:
+            yield session
+        finally:
+            self.closed.append(session)
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_runs_calls_concurrently_in_order():
+    """Test batch calls run concurrently up to the limit and keep their order."""
+    running = 0
+    peak = 0
+
+    async def run(request, session):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later requests finish first
+        await asyncio.sleep(0.01 * (5 - request.params["n"]))
+        running -= 1
+        result = {"n": request.params["n"], "session": id(session)}
+        return create_jsonrpc_response(result, request.id)
+
+    async def call(request, sessions):
+        return await run_in_session(sessions, lambda session: run(request, session))
+
+    items = [{"jsonrpc": "2.0", "method": "echo", "params": {"n": n}, "id": n} for n in range(5)]
+    items.insert(2, {"jsonrpc": "2.0", "method": "echo", "params": {"n": 9}})
+    factory = SessionFactory()
+    responses = await handle_batch(items, call, factory, max_concurrency=3)
+
+    assert [response["id"] for response in responses] == [0, 1, 2, 3, 4]
+    assert [response["result"]["n"] for response in responses] == [0, 1, 2, 3, 4]
+    assert peak == 3
+    # Every call, including the notification, had its own session, now closed
+    assert len({response["result"]["session"] for response in responses}) == 5
+    assert len(factory.opened) == 6 and len(factory.closed) == 6
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_errors():
+    """Test invalid elements and failing calls get error responses in place."""
+
+    async def call(request, _sessions):
+        if request.method == "fail":
+            raise RuntimeError("boom")
+        return create_jsonrpc_response("ok", request.id)
+
+    items = [
+        {"jsonrpc": "2.0", "method": "fail", "id": 1},
+        1,
+        {"jsonrpc": "1.0", "method": "ok", "id": 3},
+        {"jsonrpc": "2.0", "method": "ok", "id": 4},
+        # Invalid objects without an id are still answered
+        {"foo": 1},
+    ]
+    responses = await handle_batch(items, call, SessionFactory())
+    assert responses[0] == create_jsonrpc_error(ERROR_INTERNAL, 1)
+    assert responses[1]["error"]["code"] == ERROR_INVALID_REQUEST["code"]
+    assert responses[1]["id"] is None
+    assert responses[2]["error"]["code"] == ERROR_INVALID_REQUEST["code"]
+    assert responses[3] == create_jsonrpc_response("ok", 4)
+    assert responses[4]["error"]["code"] == ERROR_INVALID_REQUEST["code"]
+    assert responses[4]["id"] is None
+
+    # An empty or oversized batch is answered with a single error
+    assert await handle_batch([], call, SessionFactory()) == create_jsonrpc_error(
+        ERROR_INVALID_REQUEST, None
+    )
+    too_many = await handle_batch(items, call, SessionFactory(), max_size=3)
+    assert too_many["error"]["message"] == "Batch exceeds 3 requests"
+
+
+@pytest.mark.asyncio
+async def test_handler_batch_uses_registered_methods():
+    """Test JSONRPCHandler.handle_batch dispatches to its registered methods."""
+    handler = JSONRPCHandler()
+
+    @handler.register("double")
+    async def double(params, _session):
+        return params["value"] * 2
+
+    responses = await handler.handle_batch(
+        [
+            {"jsonrpc": "2.0", "method": "double", "params": {"value": 2}, "id": "a"},
+            {"jsonrpc": "2.0", "method": "missing", "id": "b"},
+        ],
+        SessionFactory(),
+    )
+    assert responses[0]["result"] == 4 and responses[0]["id"] == "a"
+    assert responses[1]["error"]["code"] == ERROR_METHOD_NOT_FOUND["code"]
+
+
+def test_rpc_endpoint_batch(app: FastAPI, client: TestClient) -> None:
+    """Test the RPC endpoint answers a batch array, omitting notifications."""
+    factory = SessionFactory()
+
+    async def no_request_session():
+        raise AssertionError("A batch must not hold a session of its own")
+        yield  # pylint: disable=unreachable
+
+    app.dependency_overrides[get_session_factory] = lambda: factory
+    app.dependency_overrides[get_db_session] = no_request_session
+    try:
+        response = client.post(
+            "/mcp/rpc",
+            json=[
+                {"jsonrpc": "2.0", "method": "mcp.resources.list", "id": 1},
+                {"jsonrpc": "2.0", "method": "mcp.initialize", "params": {}},
+                {"jsonrpc": "2.0", "method": "system.nonexistent", "id": 2},
+            ],
+        )
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert [item["id"] for item in data] == [1, 2]
+        assert data[0]["result"] == ["nodes", "relationships", "search"]
+        assert data[1]["error"]["code"] == ERROR_METHOD_NOT_FOUND["code"]
+        # Methods that need no database open no session
+        assert not factory.opened
+
+        notifications = client.post(
+            "/mcp/rpc", json=[{"jsonrpc": "2.0", "method": "mcp.initialize", "params": {}}]
+        )
+        assert notifications.status_code == HTTP_204_NO_CONTENT
+        assert notifications.content == b""
+
+        single = client.post(
+            "/mcp/rpc", json={"jsonrpc": "2.0", "method": "mcp.initialize", "params": {}, "id": 3}
+        )
+        assert single.json()["id"] == 3
+        assert not factory.opened
+    finally:
+        app.dependency_overrides.pop(get_session_factory, None)
+        app.dependency_overrides.pop(get_db_session, None)
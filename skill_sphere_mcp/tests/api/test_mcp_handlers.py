@@ -1,5 +1,6 @@
 """Tests for MCP handlers."""
 
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import patch
 
@@ -15,11 +16,32 @@ from skill_sphere_mcp.api.mcp.handlers import handle_search
 from skill_sphere_mcp.api.mcp.handlers import handle_tool_dispatch
 
 
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
 @pytest.fixture
 def mock_session():
-    """Create a mock Neo4j session."""
+    """Create a mock Neo4j session running managed transactions on itself."""
     session = AsyncMock(spec=AsyncSession)
     session.run = AsyncMock()
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
     return session
 
 
@@ -27,8 +49,7 @@ def mock_session():
 async def test_handle_search_success(mock_session):
     """Test successful search handling."""
     # Mock search results
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(return_value=[
+    mock_session.run.return_value = AsyncRecords([
         {
             "node": {
                 "id": "1",
@@ -38,7 +59,6 @@ async def test_handle_search_success(mock_session):
             }
         }
     ])
-    mock_session.run.return_value = mock_result
 
     result = await handle_search(
         session=mock_session,
@@ -106,16 +126,14 @@ async def test_handle_tool_dispatch_missing_name(mock_session: AsyncMock) -> Non
 @pytest.mark.asyncio
 async def test_handle_get_entity_success(mock_session):
     """Test successful entity retrieval."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value={
+    mock_session.run.return_value = AsyncRecords([{
         "n": {
             "id": "1",
             "name": "Test Entity",
             "type": "Skill",
             "description": "Test description"
         }
-    })
-    mock_session.run.return_value = mock_result
+    }])
 
     result = await handle_get_entity(session=mock_session, entity_id="1")
 
@@ -127,9 +145,7 @@ async def test_handle_get_entity_success(mock_session):
 @pytest.mark.asyncio
 async def test_handle_get_entity_not_found(mock_session):
     """Test entity retrieval for non-existent entity."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value=None)
-    mock_session.run.return_value = mock_result
+    mock_session.run.return_value = AsyncRecords([])
 
     with pytest.raises(HTTPException) as exc_info:
         await handle_get_entity(session=mock_session, entity_id="nonexistent")
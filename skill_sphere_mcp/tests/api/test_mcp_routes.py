@@ -1,6 +1,7 @@
 # pylint: disable=redefined-outer-name
 """Tests for MCP routes."""
 
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import patch
 
@@ -21,6 +22,7 @@ from skill_sphere_mcp.api.mcp.handlers import graph_search
 from skill_sphere_mcp.api.mcp.handlers import match_role
 from skill_sphere_mcp.api.mcp.models import ToolRequest
 from skill_sphere_mcp.api.mcp.routes import get_db_session
+from skill_sphere_mcp.api.mcp.routes import get_session_factory
 from skill_sphere_mcp.api.mcp.routes import list_resources
 from skill_sphere_mcp.api.mcp.rpc import rpc_match_role_handler
 from skill_sphere_mcp.api.mcp.utils import get_resource
@@ -53,14 +55,54 @@ HTTP_422_UNPROCESSABLE_ENTITY = 422
 HTTP_UNPROCESSABLE_ENTITY = 422
 
 
-@pytest_asyncio.fixture
-async def mock_session() -> AsyncMock:
-    """Create a mock Neo4j session."""
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed_session() -> AsyncMock:
+    """Create a mock Neo4j session running managed transactions on itself."""
     session = AsyncMock()
     session.run = AsyncMock()
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
     return session
 
 
+def _factory(session: AsyncMock) -> Any:
+    """Create a session factory that yields the given session."""
+
+    async def sessions() -> Any:
+        yield session
+
+    return sessions
+
+
+def _returns(session: AsyncMock, records: list[dict[str, Any]]) -> None:
+    """Make every query on the session return the given records."""
+    session.run.side_effect = lambda *_args, **_kwargs: AsyncRecords(records)
+
+
+@pytest_asyncio.fixture
+async def mock_session() -> AsyncMock:
+    """Create a mock Neo4j session."""
+    return _managed_session()
+
+
 @pytest_asyncio.fixture
 async def test_list_resources() -> None:
     """Test resource listing endpoint."""
@@ -120,7 +162,7 @@ async def test_dispatch_tool_success(mock_session: AsyncMock) -> None:
     request = ToolRequest(tool_name="skill.match_role", parameters=parameters)
     # Patch the DB result to return skills compatible with match_role
     mock_record = {"p": {"name": "John Doe", "skills": ["Python", "FastAPI"]}}
-    mock_session.run.return_value.all.return_value = [mock_record]
+    _returns(mock_session, [mock_record])
     response = await dispatch_tool(request.tool_name, request.parameters, mock_session)
     assert isinstance(response, dict)
     assert "match_score" in response
@@ -176,7 +218,7 @@ async def test_generate_cv_tool(mock_session: AsyncMock) -> None:
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
     response = await dispatch_tool(request.tool_name, request.parameters, mock_session)
     assert isinstance(response, dict)
     assert "content" in response
@@ -302,21 +344,18 @@ async def test_match_role_tool_invalid_experience(mock_session: AsyncMock) -> No
 async def test_match_role_success() -> None:
     """Test match_role returns expected result."""
     params = {"required_skills": ["Python"], "years_experience": {}}
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     # Simulate DB returning a person with matching skills
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                }
+    records = [
+        {
+            "p": {
+                "id": "1",
+                "name": "Test Person",
+                "skills": ["Python"],
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
     result = await match_role(params, mock_session)
     assert "match_score" in result
     assert result["match_score"] == pytest.approx(1.0)
@@ -325,7 +364,7 @@ async def test_match_role_success() -> None:
 @pytest.mark.asyncio
 async def test_match_role_invalid_params() -> None:
     """Test match_role with invalid parameters raises HTTPException."""
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     with pytest.raises(HTTPException) as exc_info:
         await match_role({}, mock_session)
     assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
@@ -335,25 +374,22 @@ async def test_match_role_invalid_params() -> None:
 async def test_explain_match_success() -> None:
     """Test explain_match returns expected result."""
     params = {"skill_id": "1", "role_requirement": "Python dev"}
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     # Simulate DB returning a skill node with projects and certifications
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(
-        return_value={
-            "s": {"id": "1", "name": "Python"},
-            "projects": [
-                {"id": "p1", "name": "Project A", "description": "Python project"}
-            ],
-            "certifications": [
-                {
-                    "id": "c1",
-                    "name": "Python Cert",
-                    "description": "Python certification",
-                }
-            ],
-        }
-    )
-    mock_session.run.return_value = mock_result
+    record = {
+        "s": {"id": "1", "name": "Python"},
+        "projects": [
+            {"id": "p1", "name": "Project A", "description": "Python project"}
+        ],
+        "certifications": [
+            {
+                "id": "c1",
+                "name": "Python Cert",
+                "description": "Python certification",
+            }
+        ],
+    }
+    _returns(mock_session, [record])
     result = await explain_match(params, mock_session)
     assert "explanation" in result
     assert "evidence" in result
@@ -363,7 +399,7 @@ async def test_explain_match_success() -> None:
 @pytest.mark.asyncio
 async def test_explain_match_invalid_params() -> None:
     """Test explain_match with invalid parameters raises HTTPException."""
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     with pytest.raises(HTTPException) as exc_info:
         await explain_match({}, mock_session)
     assert exc_info.value.status_code == HTTP_UNPROCESSABLE_ENTITY
@@ -373,7 +409,7 @@ async def test_explain_match_invalid_params() -> None:
 async def test_explain_match_value_error() -> None:
     """Test explain_match with invalid skill_id format raises HTTPException."""
     params = {"skill_id": "not_a_number", "role_requirement": "Python dev"}
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     mock_session.run.side_effect = ValueError()
     with pytest.raises(HTTPException) as exc_info:
         await explain_match(params, mock_session)
@@ -385,14 +421,14 @@ async def test_explain_match_value_error() -> None:
 async def test_generate_cv_success() -> None:
     """Test generate_cv returns markdown CV."""
     params = {"target_keywords": ["Python"], "format": "markdown"}
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     mock_record = {
         "p": {"name": "John"},
         "skills": [{"name": "Python"}],
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
     result = await generate_cv(params, mock_session)
     assert result["format"] == "markdown"
     assert "# John" in result["content"]
@@ -402,7 +438,7 @@ async def test_generate_cv_success() -> None:
 @pytest.mark.asyncio
 async def test_generate_cv_invalid_params() -> None:
     """Test generate_cv with invalid parameters raises HTTPException."""
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     with pytest.raises(HTTPException) as exc_info:
         await generate_cv({"target_keywords": ["Python"], "format": "invalid"}, mock_session)
     assert exc_info.value.status_code == HTTP_UNPROCESSABLE_ENTITY
@@ -413,8 +449,8 @@ async def test_generate_cv_invalid_params() -> None:
 async def test_generate_cv_profile_not_found() -> None:
     """Test generate_cv when profile not found raises HTTPException."""
     params = {"target_keywords": ["Python"], "format": "markdown"}
-    mock_session = AsyncMock()
-    mock_session.run.return_value.single.return_value = None
+    mock_session = _managed_session()
+    _returns(mock_session, [])
     with pytest.raises(HTTPException) as exc_info:
         await generate_cv(params, mock_session)
     assert exc_info.value.status_code == HTTP_NOT_FOUND
@@ -424,14 +460,14 @@ async def test_generate_cv_profile_not_found() -> None:
 async def test_generate_cv_format_not_implemented() -> None:
     """Test generate_cv with unsupported format raises HTTPException."""
     params = {"target_keywords": ["Python"], "format": "pdf"}
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     mock_record = {
         "p": {"name": "John"},
         "skills": [],
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
     with pytest.raises(HTTPException) as exc_info:
         await generate_cv(params, mock_session)
     assert exc_info.value.status_code == HTTP_NOT_IMPLEMENTED
@@ -441,22 +477,19 @@ async def test_generate_cv_format_not_implemented() -> None:
 async def test_graph_search_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test graph_search returns results."""
     params = {"query": "Python", "top_k": 1}
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "n": {
-                    "id": "1",
-                    "name": "Python",
-                    "type": "Skill",
-                    "description": "Python programming language",
-                    "labels": ["Skill"],
-                }
+    mock_session = _managed_session()
+    records = [
+        {
+            "n": {
+                "id": "1",
+                "name": "Python",
+                "type": "Skill",
+                "description": "Python programming language",
+                "labels": ["Skill"],
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
     result = await graph_search(params, mock_session)
     assert "results" in result
     assert len(result["results"]) > 0
@@ -467,22 +500,19 @@ async def test_graph_search_success(monkeypatch: pytest.MonkeyPatch) -> None:
 async def test_graph_search_importerror(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test graph_search falls back to random embedding if MODEL is None."""
     params = {"query": "Python", "top_k": 1}
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "n": {
-                    "id": "1",
-                    "name": "Python",
-                    "type": "Skill",
-                    "description": "Python programming language",
-                    "labels": ["Skill"],
-                }
+    mock_session = _managed_session()
+    records = [
+        {
+            "n": {
+                "id": "1",
+                "name": "Python",
+                "type": "Skill",
+                "description": "Python programming language",
+                "labels": ["Skill"],
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
     result = await graph_search(params, mock_session)
     assert "results" in result
     assert len(result["results"]) > 0
@@ -492,25 +522,22 @@ async def test_graph_search_importerror(monkeypatch: pytest.MonkeyPatch) -> None
 @pytest.mark.asyncio
 async def test_handle_skill_match_success() -> None:
     """Test successful skill matching."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                }
+    mock_session = _managed_session()
+    records = [
+        {
+            "p": {
+                "id": "1",
+                "name": "Test Person",
+                "skills": ["Python"],
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
     params = {
         "required_skills": ["Python"],
         "years_experience": {"Python": 5},
     }
-    result = await rpc_match_role_handler(params, mock_session)
+    result = await rpc_match_role_handler(params, _factory(mock_session))
     assert "match_score" in result
     assert result["match_score"] == pytest.approx(1.0)
 
@@ -518,7 +545,7 @@ async def test_handle_skill_match_success() -> None:
 @pytest.mark.asyncio
 async def test_handle_skill_match_below_threshold() -> None:
     """Test skill matching below threshold."""
-    mock_session = AsyncMock()
+    mock_session = _managed_session()
     with patch("skill_sphere_mcp.tools.dispatcher.dispatch_tool") as mock_dispatch:
         mock_dispatch.return_value = {
             "match_score": SKILL_MATCH_THRESHOLD - 0.1,
@@ -529,7 +556,7 @@ async def test_handle_skill_match_below_threshold() -> None:
             "required_skills": MOCK_SKILLS,
             "years_experience": MOCK_YEARS,
         }
-        result = await rpc_match_role_handler(params, mock_session)
+        result = await rpc_match_role_handler(params, _factory(mock_session))
         assert "match_score" in result
         assert result["match_score"] < SKILL_MATCH_THRESHOLD
         assert len(result["matching_skills"]) == 0
@@ -562,25 +589,22 @@ async def test_handle_skill_match_error() -> None:
 @pytest.mark.asyncio
 async def test_handle_jsonrpc_request_success() -> None:
     """Test successful JSON-RPC request handling."""
-    mock_session = AsyncMock()
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                }
+    mock_session = _managed_session()
+    records = [
+        {
+            "p": {
+                "id": "1",
+                "name": "Test Person",
+                "skills": ["Python"],
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
     params = {
         "required_skills": ["Python"],
         "years_experience": {"Python": 5},
     }
-    result = await rpc_match_role_handler(params, mock_session)
+    result = await rpc_match_role_handler(params, _factory(mock_session))
     assert "match_score" in result
     assert result["match_score"] == pytest.approx(1.0)
 
@@ -647,6 +671,7 @@ def client(mock_session):
     """Create a test client with mocked dependencies."""
     app = create_app()
     app.dependency_overrides[get_db_session] = lambda: mock_session
+    app.dependency_overrides[get_session_factory] = lambda: _factory(mock_session)
     with TestClient(app) as test_client:
         yield test_client
 
@@ -661,8 +686,7 @@ def test_health_check(client):
 def test_search_endpoint_success(client, mock_session):
     """Test successful search endpoint."""
     # Mock search results
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(return_value=[
+    _returns(mock_session, [
         {
             "node": {
                 "id": "1",
@@ -672,7 +696,6 @@ def test_search_endpoint_success(client, mock_session):
             }
         }
     ])
-    mock_session.run.return_value = mock_result
 
     response = client.post(
         "/mcp/search",
@@ -734,16 +757,14 @@ def test_tool_dispatch_endpoint_missing_name(client):
 
 def test_get_entity_endpoint_success(client, mock_session):
     """Test successful entity retrieval endpoint."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value={
+    _returns(mock_session, [{
         "n": {
             "id": "1",
             "name": "Test Entity",
             "type": "Skill",
             "description": "Test description"
         }
-    })
-    mock_session.run.return_value = mock_result
+    }])
 
     response = client.get("/mcp/entities/1")
     assert response.status_code == 200
@@ -755,9 +776,7 @@ def test_get_entity_endpoint_success(client, mock_session):
 
 def test_get_entity_endpoint_not_found(client, mock_session):
     """Test entity retrieval endpoint for non-existent entity."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value=None)
-    mock_session.run.return_value = mock_result
+    _returns(mock_session, [])
 
     response = client.get("/mcp/entities/nonexistent")
     assert response.status_code == 404
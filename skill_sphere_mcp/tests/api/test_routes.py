@@ -3,6 +3,7 @@
 # pylint: disable=redefined-outer-name
 
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
@@ -24,24 +25,6 @@ MOCK_SKILLS = [{"name": "Python"}, {"name": "FastAPI"}]
 HTTP_INTERNAL_ERROR = 500
 
 
-class AsyncRecordIterator:
-    """Async iterator for mock Neo4j records."""
-
-    def __init__(self, records: list[dict]):
-        self.records = records
-        self.index = 0
-
-    def __aiter__(self) -> "AsyncRecordIterator":
-        return self
-
-    async def __anext__(self) -> dict:
-        if self.index >= len(self.records):
-            raise StopAsyncIteration
-        record = self.records[self.index]
-        self.index += 1
-        return record
-
-
 @pytest_asyncio.fixture
 async def mock_session():
     """Create a mock Neo4j session."""
@@ -59,12 +42,10 @@ async def test_health_check() -> None:
 @pytest.mark.asyncio
 async def test_get_skills_success(mock_session: AsyncMock) -> None:
     """Test successful skills retrieval."""
-    # Mock the Neo4j result
-    mock_result = AsyncMock()
-    mock_result.fetch_all.return_value = [
+    # Mock the records of the read transaction
+    mock_session.execute_read.return_value = [
         {"s": {"name": skill["name"]}} for skill in MOCK_SKILLS
     ]
-    mock_session.run.return_value = mock_result
 
     skills = await get_skills(mock_session)
     assert isinstance(skills, list)
@@ -72,17 +53,16 @@ async def test_get_skills_success(mock_session: AsyncMock) -> None:
     assert all(hasattr(skill, "name") for skill in skills)
     assert [skill.name for skill in skills] == [skill["name"] for skill in MOCK_SKILLS]
 
-    # Verify Neo4j query was called correctly
-    mock_session.run.assert_called_once_with("MATCH (s:Skill) RETURN s")
+    # Verify the skills were read in a managed read transaction
+    mock_session.execute_read.assert_awaited_once()
+    mock_session.run.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_get_skills_empty(mock_session: AsyncMock) -> None:
     """Test skills retrieval with empty result."""
     # Mock empty result
-    mock_result = AsyncMock()
-    mock_result.__aiter__ = lambda self: AsyncRecordIterator([])
-    mock_session.run.return_value = mock_result
+    mock_session.execute_read.return_value = []
 
     skills = await get_skills(mock_session)
     assert isinstance(skills, list)
@@ -92,7 +72,7 @@ async def test_get_skills_empty(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_get_skills_error(mock_session: AsyncMock) -> None:
     """Test skills retrieval with database error."""
-    mock_session.run.side_effect = Exception("Database error")
+    mock_session.execute_read.side_effect = Exception("Database error")
 
     with pytest.raises(HTTPException) as exc_info:
         await get_skills(mock_session)
@@ -103,33 +83,31 @@ async def test_get_skills_error(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_create_skill_success(mock_session: AsyncMock) -> None:
     """Test successful skill creation."""
-    # Mock the Neo4j result
-    mock_result = AsyncMock()
-    mock_result.single.return_value = {"s": {"name": MOCK_SKILL_NAME}}
-    mock_session.run.return_value = mock_result
+    # Mock the records of the write transactions creating the skill and
+    # advancing the stored graph generation
+    mock_session.execute_write.side_effect = [
+        ([{"s": {"name": MOCK_SKILL_NAME}}], MagicMock()),
+        ([{"generation": 1}], MagicMock()),
+    ]
 
     skill = Skill(name=MOCK_SKILL_NAME)
     response = await create_skill(skill, mock_session)
     assert isinstance(response, Skill)
     assert response.name == MOCK_SKILL_NAME
 
-    # Verify Neo4j query was called correctly
-    mock_session.run.assert_called_once_with(
-        "CREATE (s:Skill $skill) RETURN s",
-        skill={"name": MOCK_SKILL_NAME},
-    )
+    # Verify the skill was created in a write transaction
+    assert mock_session.execute_write.await_count == 2
+    mock_session.run.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_create_skill_no_result(mock_session: AsyncMock) -> None:
     """Test skill creation with no result."""
     # Mock empty result
-    mock_result = AsyncMock()
-    mock_result.single.return_value = None
-    mock_session.run.return_value = mock_result
+    mock_session.execute_write.return_value = ([], MagicMock())
 
     with pytest.raises(HTTPException) as exc_info:
-        await create_skill(MOCK_SKILL_NAME, mock_session)
+        await create_skill(Skill(name=MOCK_SKILL_NAME), mock_session)
     assert exc_info.value.status_code == HTTP_INTERNAL_ERROR
     assert exc_info.value.detail == "Failed to create skill"
 
@@ -1,6 +1,8 @@
 """Tests for Neo4j connection management."""
 
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name,protected-access
+
+import asyncio
 
 from builtins import anext
 from unittest.mock import AsyncMock
@@ -15,6 +17,7 @@ from neo4j import AsyncGraphDatabase
 from neo4j import AsyncSession
 from neo4j.exceptions import AuthError
 from neo4j.exceptions import ServiceUnavailable
+from prometheus_client import REGISTRY
 
 from skill_sphere_mcp.db.connection import Neo4jConnection
 
@@ -26,6 +29,12 @@ def settings() -> MagicMock:
     settings.neo4j_uri = "bolt://localhost:7687"
     settings.neo4j_user = "neo4j"
     settings.neo4j_password = "neo4j"
+    settings.neo4j_max_connection_pool_size = 10
+    settings.neo4j_connection_acquisition_timeout = 5.0
+    settings.neo4j_fetch_size = 500
+    settings.neo4j_liveness_check_timeout = None
+    settings.neo4j_database = None
+    settings.neo4j_max_transaction_retry_time = 15.0
     return settings
 
 
@@ -85,6 +94,11 @@ async def test_connection_initialization(
         mock_driver.assert_called_once_with(
             settings.neo4j_uri,
             auth=(settings.neo4j_user, settings.neo4j_password),
+            max_connection_pool_size=10,
+            connection_acquisition_timeout=5.0,
+            fetch_size=500,
+            liveness_check_timeout=None,
+            max_transaction_retry_time=15.0,
         )
 
 
@@ -207,3 +221,30 @@ async def test_get_session_cleanup_on_error(
         assert session is session_mock
         await agen.athrow(RuntimeError("Test error"))
     session_mock.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_sessions_limited_to_pool_size(
+    conn: Neo4jConnection, driver: AsyncMock
+) -> None:
+    """Test sessions beyond the pool size wait for a slot and time out."""
+    conn._driver = driver
+    conn._slots = asyncio.Semaphore(1)
+    conn._acquisition_timeout = 0.01
+    driver.session.side_effect = lambda **_: AsyncMock(spec=AsyncSession)
+    in_use = REGISTRY.get_sample_value("neo4j_sessions_in_use")
+    waits = REGISTRY.get_sample_value("neo4j_session_acquisition_seconds_count")
+
+    async with conn.session() as first:
+        assert REGISTRY.get_sample_value("neo4j_sessions_in_use") == in_use + 1
+        with pytest.raises(HTTPException) as exc_info:
+            async with conn.session():
+                pass
+        assert exc_info.value.status_code == 503
+    first.close.assert_awaited_once()
+
+    # The slot is free again once the first session is closed
+    async with conn.session():
+        pass
+    assert REGISTRY.get_sample_value("neo4j_sessions_in_use") == in_use
+    assert REGISTRY.get_sample_value("neo4j_session_acquisition_seconds_count") == waits + 3
@@ -3,20 +3,26 @@
 # pylint: disable=redefined-outer-name
 
 from collections.abc import AsyncGenerator
+from typing import Annotated
 from typing import Any
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest_asyncio
 
 from fastapi import Depends
 from fastapi import FastAPI
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from neo4j import AsyncSession
 from starlette.status import HTTP_200_OK
+from starlette.status import HTTP_404_NOT_FOUND
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
 from skill_sphere_mcp.db.connection import neo4j_conn
+from skill_sphere_mcp.db.deps import get_db_session
 
 
 get_db_session_dep = Depends(neo4j_conn.get_session)
@@ -77,3 +83,34 @@ async def test_get_db_session_error_handling(app: FastAPI) -> None:
     client = TestClient(app, raise_server_exceptions=False)
     response = client.get("/test")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def test_get_db_session_closes_session_after_request() -> None:
+    """Test the request session is closed after the response, also on errors."""
+    sessions: list[AsyncMock] = []
+
+    def open_session(**_config: Any) -> AsyncMock:
+        sessions.append(AsyncMock(spec=AsyncSession))
+        return sessions[-1]
+
+    driver = MagicMock()
+    driver.session.side_effect = open_session
+    test_app = FastAPI()
+
+    @test_app.get("/ok")
+    async def ok(session: Annotated[AsyncSession, Depends(get_db_session)]) -> dict[str, Any]:
+        await session.run("RETURN 1")
+        return {"status": "ok"}
+
+    @test_app.get("/fail")
+    async def fail(_session: Annotated[AsyncSession, Depends(get_db_session)]) -> None:
+        raise HTTPException(status_code=404, detail="missing")
+
+    with patch.object(neo4j_conn, "_driver", driver):
+        client = TestClient(test_app)
+        assert client.get("/ok").status_code == HTTP_200_OK
+        assert client.get("/fail").status_code == HTTP_404_NOT_FOUND
+
+    assert len(sessions) == 2
+    for session in sessions:
+        session.close.assert_awaited_once()
@@ -25,6 +25,12 @@ def mock_settings() -> MagicMock:
     settings.neo4j_uri = "bolt://localhost:7687"
     settings.neo4j_user = "neo4j"
     settings.neo4j_password = "password"
+    settings.neo4j_max_connection_pool_size = 10
+    settings.neo4j_connection_acquisition_timeout = 5.0
+    settings.neo4j_fetch_size = 500
+    settings.neo4j_liveness_check_timeout = None
+    settings.neo4j_database = None
+    settings.neo4j_max_transaction_retry_time = 15.0
     return settings
 
 
@@ -90,6 +96,11 @@ async def test_connection_initialization(mock_settings: MagicMock) -> None:
         mock_driver_factory.assert_called_once_with(
             mock_settings.neo4j_uri,
             auth=(mock_settings.neo4j_user, mock_settings.neo4j_password),
+            max_connection_pool_size=10,
+            connection_acquisition_timeout=5.0,
+            fetch_size=500,
+            liveness_check_timeout=None,
+            max_transaction_retry_time=15.0,
         )
 
 
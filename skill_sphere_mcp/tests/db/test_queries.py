@@ -0,0 +1,121 @@
+"""Tests for managed read and write transactions."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from neo4j import AsyncSession
+
+from skill_sphere_mcp.api.mcp.handlers import query
+from skill_sphere_mcp.db.queries import is_read_only
+from skill_sphere_mcp.db.queries import read_records
+from skill_sphere_mcp.db.queries import write_records
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.models.mcp import QueryRequest
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records with a summary."""
+
+    def __init__(self, records: list[dict[str, Any]], summary: Any = None):
+        self._records = iter(records)
+        self._summary = summary
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+    async def consume(self) -> Any:
+        return self._summary
+
+
+def _session(records: list[dict[str, Any]], summary: Any = None) -> AsyncMock:
+    """Create a session whose managed transactions record their work functions."""
+    session = AsyncMock(spec=AsyncSession)
+    session.work = []
+    tx = AsyncMock()
+    tx.run.side_effect = lambda *args, **kwargs: AsyncRecords(records, summary)
+
+    async def execute(work: Any) -> Any:
+        session.work.append(work)
+        return await work(tx)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    session.tx = tx
+    return session
+
+
+def _summary(nodes_created: int = 0) -> MagicMock:
+    summary = MagicMock()
+    summary.counters.contains_updates = nodes_created > 0
+    summary.counters.nodes_created = nodes_created
+    summary.counters.relationships_created = 0
+    return summary
+
+
+def test_is_read_only() -> None:
+    """Test statements with writing clauses are not treated as reads."""
+    assert is_read_only("MATCH (n:Skill) WHERE n.name = $name RETURN n")
+    assert is_read_only("MATCH (n) RETURN count(n) AS offset")
+    assert not is_read_only("MATCH (n) SET n.seen = true")
+    assert not is_read_only("merge (s:Skill {name: 'Go'})")
+    assert not is_read_only("CALL db.labels()")
+
+
+@pytest.mark.asyncio
+async def test_read_records_uses_read_transaction() -> None:
+    """Test reads run in a managed read transaction with the read timeout."""
+    session = _session([{"n": 1}, {"n": 2}])
+    settings = MagicMock(neo4j_read_timeout=7.5)
+    with patch("skill_sphere_mcp.db.queries.get_settings", return_value=settings):
+        records = await read_records(session, "MATCH (n) RETURN n", {"limit": 2})
+
+    assert records == [{"n": 1}, {"n": 2}]
+    session.execute_write.assert_not_called()
+    session.run.assert_not_called()
+    session.tx.run.assert_awaited_once_with("MATCH (n) RETURN n", {"limit": 2})
+    assert session.work[0].timeout == 7.5
+
+
+@pytest.mark.asyncio
+async def test_write_records_uses_write_transaction() -> None:
+    """Test writes run in a managed write transaction and return the summary."""
+    summary = _summary(nodes_created=1)
+    session = _session([{"s": {"name": "Go"}}], summary)
+    records, result_summary = await write_records(
+        session, "CREATE (s:Skill $skill) RETURN s", {"skill": {"name": "Go"}}, timeout=2.0
+    )
+
+    assert records == [{"s": {"name": "Go"}}]
+    assert result_summary is summary
+    session.execute_read.assert_not_called()
+    assert session.work[0].timeout == 2.0
+
+
+@pytest.mark.asyncio
+async def test_query_endpoint_routes_reads_and_writes() -> None:
+    """Test /query sends reads to read transactions and counts writes."""
+    session = _session([{"name": "Python"}])
+    generation = graph_generation.current
+    response = await query(QueryRequest(query="MATCH (s:Skill) RETURN s.name AS name"), session)
+    assert response["results"] == [{"name": "Python"}]
+    assert response["metadata"] == {"nodes_created": 0, "relationships_created": 0}
+    session.execute_write.assert_not_called()
+    assert graph_generation.current == generation
+
+    session = _session([], _summary(nodes_created=1))
+    response = await query(QueryRequest(query="CREATE (:Skill {name: 'Go'})"), session)
+    assert response["metadata"]["nodes_created"] == 1
+    session.execute_read.assert_not_called()
+    assert graph_generation.current == generation + 1
+    # The stored generation is advanced for other processes too
+    assert "MERGE (m:GraphMeta" in session.tx.run.call_args.args[0]
@@ -0,0 +1,154 @@
+"""Tests for the schema migration runner."""
+
+# pylint: disable=redefined-outer-name
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from skill_sphere_mcp.db.schema import FULLTEXT_INDEX
+from skill_sphere_mcp.db.schema import MIGRATIONS
+from skill_sphere_mcp.db.schema import SchemaMigrator
+from skill_sphere_mcp.graph.search_index import SearchIndex
+from skill_sphere_mcp.graph.search_index import fulltext_query
+from skill_sphere_mcp.graph.search_index import search_nodes
+
+
+class FakeResult:
+    """Mock Neo4j result supporting async iteration and single()."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = records
+        self._iter = iter(records)
+
+    def __aiter__(self) -> "FakeResult":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._iter)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+    async def single(self) -> dict[str, Any] | None:
+        return self._records[0] if self._records else None
+
+
+def _session(applied: list[int], index_state: str | None = "ONLINE") -> AsyncMock:
+    """Create a session answering the migrator's bookkeeping queries."""
+
+    def run(query: str, **_kwargs: Any) -> FakeResult:
+        if "MATCH (m:SchemaMigration)" in query:
+            return FakeResult([{"version": v} for v in applied])
+        if "SHOW INDEXES" in query:
+            return FakeResult([{"state": index_state}] if index_state else [])
+        return FakeResult([])
+
+    session = AsyncMock()
+    session.run.side_effect = run
+    return session
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed read transactions on the session itself."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
+
+
+def _statements(session: AsyncMock) -> list[str]:
+    return [c.args[0] for c in session.run.call_args_list]
+
+
+def test_statements_are_idempotent() -> None:
+    """Test every schema statement can safely be re-run."""
+    statements = [s for m in MIGRATIONS for s in m.statements]
+    assert all("IF NOT EXISTS" in s for s in statements)
+    assert any(f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX}" in s for s in statements)
+    assert [m.version for m in MIGRATIONS] == sorted({m.version for m in MIGRATIONS})
+
+
+@pytest.mark.asyncio
+async def test_migrate_applies_pending_only() -> None:
+    """Test only unapplied migrations run and are recorded."""
+    session = _session(applied=[1])
+    migrator = SchemaMigrator()
+
+    applied = await migrator.migrate(session)
+
+    assert applied == [m.version for m in MIGRATIONS if m.version != 1]
+    statements = _statements(session)
+    assert not any(s in statements for s in MIGRATIONS[0].statements)
+    recorded = [
+        c.kwargs["version"]
+        for c in session.run.call_args_list
+        if "MERGE (m:SchemaMigration" in c.args[0]
+    ]
+    assert recorded == applied
+    assert migrator.fulltext_available
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_does_not_block_others() -> None:
+    """Test a failing migration is skipped and left unrecorded."""
+    session = _session(applied=[], index_state="POPULATING")
+    base_run = session.run.side_effect
+
+    def run(query: str, **kwargs: Any) -> FakeResult:
+        if "CREATE CONSTRAINT" in query:
+            raise RuntimeError("duplicate values")
+        return base_run(query, **kwargs)
+
+    session.run.side_effect = run
+    migrator = SchemaMigrator()
+
+    applied = await migrator.migrate(session)
+
+    assert 1 in applied and 2 in applied and 3 not in applied
+    assert not migrator.fulltext_available
+
+
+def test_fulltext_query() -> None:
+    """Test queries become wildcarded Lucene term conjunctions."""
+    assert fulltext_query("Graph DB") == "*graph* AND *db*"
+    assert fulltext_query("C++ c") == "*c*"
+    assert fulltext_query("+-") is None
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_uses_fulltext_index() -> None:
+    """Test search uses the full-text index when the in-memory index is not built."""
+    node = MagicMock()
+    session = _managed(AsyncMock())
+    session.run.return_value = FakeResult([{"node": node, "score": 2.5}])
+    migrator = SchemaMigrator()
+    migrator.fulltext_available = True
+
+    with patch("skill_sphere_mcp.graph.search_index.search_index", SearchIndex()), patch(
+        "skill_sphere_mcp.graph.search_index.schema_migrator", migrator
+    ):
+        ranked = await search_nodes(session, "graph", 5)
+
+    assert ranked == [(node, 2.5)]
+    assert "db.index.fulltext.queryNodes" in session.run.call_args.args[0]
+    assert session.run.call_args.args[1]["query"] == "*graph*"
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_fulltext_error_falls_back() -> None:
+    """Test a failing full-text query tells callers to fall back to a scan."""
+    session = _managed(AsyncMock())
+    session.run.side_effect = RuntimeError("no such index")
+    migrator = SchemaMigrator()
+    migrator.fulltext_available = True
+
+    with patch("skill_sphere_mcp.graph.search_index.search_index", SearchIndex()), patch(
+        "skill_sphere_mcp.graph.search_index.schema_migrator", migrator
+    ):
+        assert await search_nodes(session, "graph", 5) is None
@@ -1,6 +1,7 @@
 """Tests for database utility functions."""
 
 from collections import UserDict
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
@@ -12,6 +13,33 @@ from neo4j import AsyncSession
 from skill_sphere_mcp.db.utils import get_entity_by_id
 
 
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[Any]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed_session() -> AsyncMock:
+    """Create a mock Neo4j session running managed transactions on itself."""
+    session = AsyncMock(spec=AsyncSession)
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
+
+
 @pytest.mark.asyncio
 async def test_get_entity_by_id_invalid_id():
     """Test get_entity_by_id with invalid ID."""
@@ -33,10 +61,8 @@ async def test_get_entity_by_id_invalid_id():
 @pytest.mark.asyncio
 async def test_get_entity_by_id_not_found():
     """Test get_entity_by_id when entity is not found."""
-    mock_session = AsyncMock(spec=AsyncSession)
-    mock_result = AsyncMock()
-    mock_result.single.return_value = None
-    mock_session.run.return_value = mock_result
+    mock_session = _managed_session()
+    mock_session.run.return_value = AsyncRecords([])
     
     with pytest.raises(HTTPException) as exc_info:
         await get_entity_by_id(mock_session, "nonexistent")
@@ -47,7 +73,7 @@ async def test_get_entity_by_id_not_found():
 @pytest.mark.asyncio
 async def test_get_entity_by_id_success():
     """Test successful entity retrieval with relationships."""
-    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session = _managed_session()
     
     # Mock Neo4j node and relationships
     mock_node = UserDict({"name": "Test Entity", "description": "Test Description"})
@@ -65,9 +91,7 @@ async def test_get_entity_by_id_success():
         ]
     }
     
-    mock_result = AsyncMock()
-    mock_result.single.return_value = mock_record
-    mock_session.run.return_value = mock_result
+    mock_session.run.return_value = AsyncRecords([mock_record])
     
     result = await get_entity_by_id(mock_session, "test123")
     
@@ -84,7 +108,7 @@ async def test_get_entity_by_id_success():
 @pytest.mark.asyncio
 async def test_get_entity_by_id_database_error():
     """Test get_entity_by_id with database error."""
-    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session = _managed_session()
     mock_session.run.side_effect = Exception("Database connection error")
     
     with pytest.raises(HTTPException) as exc_info:
@@ -96,7 +120,7 @@ async def test_get_entity_by_id_database_error():
 @pytest.mark.asyncio
 async def test_get_entity_by_id_null_relationships():
     """Test get_entity_by_id with null relationships."""
-    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session = _managed_session()
     
     # Mock Neo4j node with null relationships
     mock_node = UserDict({"name": "Test Entity"})
@@ -113,9 +137,7 @@ async def test_get_entity_by_id_null_relationships():
         ]
     }
     
-    mock_result = AsyncMock()
-    mock_result.single.return_value = mock_record
-    mock_session.run.return_value = mock_result
+    mock_session.run.return_value = AsyncRecords([mock_record])
     
     result = await get_entity_by_id(mock_session, "test123")
     
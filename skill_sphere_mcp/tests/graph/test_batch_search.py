@@ -0,0 +1,120 @@
+"""Tests for multi-query batch search."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.batch_search import batch_search
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.search_index import SearchIndex
+from skill_sphere_mcp.graph.vector_index import VectorIndex
+from skill_sphere_mcp.tools.dispatcher import dispatch_tool
+
+
+MODULE = "skill_sphere_mcp.graph.batch_search"
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _vector_index() -> VectorIndex:
+    index = VectorIndex()
+    index.set_vectors(
+        [1, 2, 3],
+        [[1.0, 0.0], [0.7, 0.7], [0.0, 1.0]],
+        graph_generation.current,
+        [["Skill"], ["Job"], ["Skill"]],
+    )
+    return index
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.run.side_effect = lambda query, parameters: AsyncRecords(
+        [{"node_id": i, "n": {"id": i}} for i in parameters["ids"]]
+    )
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
+
+
+@pytest.mark.asyncio
+async def test_batch_search_encodes_once_and_hydrates_once() -> None:
+    """Test all queries share one encode call and one hydration query."""
+    model = MagicMock()
+    model.encode.return_value = np.array([[1.0, 0.0], [0.0, 1.0]])
+    session = _session()
+    with patch(f"{MODULE}.vector_index", _vector_index()), patch(
+        f"{MODULE}.get_embedding_model", return_value=model
+    ):
+        results = await batch_search(session, ["python", "kubernetes"], top_k=2)
+
+    model.encode.assert_called_once_with(["python", "kubernetes"])
+    session.run.assert_called_once()
+    assert "UNWIND" in session.run.call_args.args[0]
+    assert session.run.call_args.args[1]["ids"] == [1, 2, 3]
+    assert [[node["id"] for node, _ in hits] for hits in results] == [[1, 2], [3, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_label_filter() -> None:
+    """Test the label filter applies to every query of the batch."""
+    model = MagicMock()
+    model.encode.return_value = np.array([[0.7, 0.7], [0.0, 1.0]])
+    with patch(f"{MODULE}.vector_index", _vector_index()), patch(
+        f"{MODULE}.get_embedding_model", return_value=model
+    ):
+        results = await batch_search(_session(), ["a", "b"], top_k=5, labels=["skill"])
+    assert all(2 not in [node["id"] for node, _ in hits] for hits in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_search_without_model_uses_lexical_index() -> None:
+    """Test queries are answered lexically when no embedding model is loaded."""
+    index = SearchIndex()
+    index.add(1, "Python", None)
+    index.add(3, "Kubernetes", None)
+    index.finalize(graph_generation.current)
+    session = _session()
+    with patch("skill_sphere_mcp.graph.search_index.search_index", index), patch(
+        f"{MODULE}.get_embedding_model", return_value=None
+    ):
+        results = await batch_search(session, ["python", "kube", "java"], top_k=2)
+    assert [[node["id"] for node, _ in hits] for hits in results] == [[1], [3], []]
+    session.run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_search_tool() -> None:
+    """Test the dispatcher returns one result list per query."""
+    model = MagicMock()
+    model.encode.return_value = np.array([[1.0, 0.0]])
+    with patch(f"{MODULE}.vector_index", _vector_index()), patch(
+        f"{MODULE}.get_embedding_model", return_value=model
+    ):
+        result = await dispatch_tool(
+            "graph.batch_search", {"queries": ["python"], "top_k": 1}, _session()
+        )
+    assert result["results"] == [
+        {"query": "python", "results": [{"node": {"id": 1}, "score": 1.0}]}
+    ]
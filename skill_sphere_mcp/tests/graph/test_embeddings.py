@@ -34,9 +34,14 @@ EXPECTED_EMBEDDINGS_COUNT = 2
 
 @pytest_asyncio.fixture
 async def mock_session() -> AsyncMock:
-    """Create mock Neo4j session."""
+    """Create mock Neo4j session running managed transactions on itself."""
     session = AsyncMock(spec=AsyncSession)
     session.close = AsyncMock()
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
     return session
 
 
@@ -307,9 +312,7 @@ async def test_load_embeddings_with_missing_embeddings(mock_session: AsyncMock)
             if node_id == "1":
                 return rng.random(TEST_DIMENSION)
             return None
-    mock_result = AsyncMock()
-    mock_result.__aiter__.return_value = iter(sample_nodes)
-    mock_session.run.return_value = mock_result
+    mock_session.run.return_value = AsyncRecordIterator(sample_nodes)
     with patch("skill_sphere_mcp.graph.embeddings.Node2Vec", return_value=FakeNode2Vec()):
         emb = Node2VecEmbeddings(dimension=TEST_DIMENSION)
         await emb.load_embeddings(mock_session)
@@ -329,12 +332,33 @@ async def test_search_loads_embeddings_if_empty(monkeypatch: pytest.MonkeyPatch)
     emb.load_embeddings = fake_load_embeddings
     mock_session = AsyncMock()
     query_embedding = rng.random(TEST_DIMENSION)
-    mock_session.run.return_value.single.return_value = None  # No node details found
+    mock_session.execute_read.return_value = []  # No node details found
     results = await emb.search(mock_session, query_embedding, top_k=1)
     assert called["load"]
     assert results == []
 
 
+@pytest.mark.asyncio
+async def test_search_with_label_filter(mock_session: AsyncMock) -> None:
+    """Test only nodes with the requested labels are ranked and hydrated."""
+    emb = Node2VecEmbeddings(dimension=2)
+    emb.set_all_embeddings(
+        {"1": np.array([1.0, 0.0]), "2": np.array([0.9, 0.1]), "3": np.array([0.0, 1.0])},
+        labels={"1": ["Skill"], "2": ["Job"], "3": ["Certification"]},
+    )
+    mock_session.run.return_value = AsyncRecordIterator(
+        [{"node_id": 3, "labels": ["Certification"], "props": {"name": "CKA"}}]
+    )
+
+    results = await emb.search(
+        mock_session, np.array([1.0, 0.0]), top_k=1, labels=["CERTIFICATION"]
+    )
+
+    assert [r["node_id"] for r in results] == ["3"]
+    assert results[0]["properties"] == {"name": "CKA"}
+    assert mock_session.run.call_args.args[1]["node_ids"] == [3]
+
+
 def test_get_all_embeddings_direct():
     """Test get_all_embeddings returns a copy and works on fresh instance."""
     emb = Node2VecEmbeddings(dimension=TEST_DIMENSION)
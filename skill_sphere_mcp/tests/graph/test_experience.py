@@ -0,0 +1,157 @@
+"""Tests for experience years derived from job time ranges."""
+
+from datetime import date
+from typing import Any
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.experience import ExperienceStore
+from skill_sphere_mcp.graph.experience import ExperienceTable
+from skill_sphere_mcp.graph.experience import merged_years
+from skill_sphere_mcp.graph.experience import parse_date
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.person_skills import PersonSkillIndex
+from skill_sphere_mcp.graph.person_skills import PersonSkillStore
+from skill_sphere_mcp.graph.skill_matching import SkillMatchingService
+from skill_sphere_mcp.tools.handlers import match_role
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def test_parse_date_precision_and_open_ends() -> None:
+    """Test partial dates round to the period start or end."""
+    assert parse_date("2019") == date(2019, 1, 1)
+    assert parse_date("2019", end=True) == date(2019, 12, 31)
+    assert parse_date("2020-02", end=True) == date(2020, 2, 29)
+    assert parse_date("2020-02-10T08:00:00") == date(2020, 2, 10)
+    assert parse_date(date(2021, 5, 4)) == date(2021, 5, 4)
+    assert parse_date("present", end=True) == date.today()
+    assert parse_date(None) is None
+    assert parse_date("someday") is None
+
+
+def test_merged_years_does_not_double_count_overlaps() -> None:
+    """Test overlapping and adjacent intervals are merged before summing."""
+    years = merged_years(
+        [
+            (date(2020, 1, 1), date(2020, 12, 31)),
+            (date(2020, 6, 1), date(2021, 12, 31)),
+            (date(2022, 1, 1), date(2022, 12, 31)),
+            (date(2024, 1, 1), date(2024, 12, 31)),
+            (date(2025, 1, 1), date(2024, 1, 1)),
+        ]
+    )
+    assert years == pytest.approx(4.0, abs=0.01)
+    assert merged_years([]) == 0.0
+
+
+def test_table_lookup() -> None:
+    """Test lookups by person, and without one for a single-person table."""
+    table = ExperienceTable({(1, "Python"): 3.0, (1, "Go"): 1.0}, 0)
+    assert table.years("Python") == 3.0
+    assert table.years("Go", 1) == 1.0
+    assert table.years("Rust") is None
+    shared = ExperienceTable({(1, "Python"): 3.0, (2, "Python"): 5.0}, 0)
+    assert shared.years("Python") is None
+    assert shared.years("Python", 2) == 5.0
+
+
+@pytest.mark.asyncio
+async def test_store_builds_from_job_ranges() -> None:
+    """Test years per person and skill are merged across jobs."""
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda *args, **kwargs: AsyncRecords(
+        [
+            {"person_id": 1, "skill": "Python", "start_date": "2018", "end_date": "2019"},
+            {"person_id": 1, "skill": "Python", "start_date": "2019-01", "end_date": "2020"},
+            {"person_id": 1, "skill": "Go", "start_date": None, "end_date": "2020"},
+        ]
+    )
+    store = ExperienceStore()
+    assert await store.ensure_fresh(session) is None
+
+    table = await store.build(session)
+    assert table.years("Python", 1) == pytest.approx(3.0, abs=0.01)
+    assert table.years("Go", 1) is None
+    assert await store.ensure_fresh(session) is table
+
+    graph_generation.bump()
+    assert await store.ensure_fresh(session) is not table
+
+
+@pytest.mark.asyncio
+async def test_match_role_reads_derived_years() -> None:
+    """Test candidate skills without years take them from the table."""
+    store = ExperienceStore()
+    store.table = ExperienceTable({(7, "Python"): 2.0}, graph_generation.current)
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda query, parameters=None: AsyncRecords(
+        [{"name": name, "node_id": 1} for name in (parameters or {}).get("names", [])]
+    )
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings, mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.experience_store", store
+    ):
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.return_value = np.ones(4)
+        result = await SkillMatchingService().match_role(
+            session, [{"name": "Python", "years": 4}], [{"name": "Python"}]
+        )
+
+    assert result.matching_skills[0].experience_years == 2.0
+    # 60% similarity + 40% experience ratio of 2/4 years
+    assert result.overall_score == pytest.approx(0.6 * (0.7 + 0.3 * 0.5) + 0.4 * 0.5)
+
+
+@pytest.mark.asyncio
+async def test_match_role_tool_reports_derived_years() -> None:
+    """Test the match_role tool checks years_experience against derived years."""
+    persons = PersonSkillStore()
+    persons.index = PersonSkillIndex(
+        [7], ["Ada"], [["Python", "Go"]], graph_generation.current
+    )
+    experience = ExperienceStore()
+    experience.table = ExperienceTable(
+        {(7, "Python"): 2.04, (7, "Go"): 6.0}, graph_generation.current
+    )
+    with mock.patch(
+        "skill_sphere_mcp.tools.handlers.person_skills", persons
+    ), mock.patch("skill_sphere_mcp.tools.handlers.experience_store", experience):
+        result = await match_role(
+            {"required_skills": ["Python", "Go"], "years_experience": {"Python": 3}},
+            AsyncMock(),
+        )
+
+    assert result["matching_skills"] == [
+        {"name": "Python", "years": 2.0, "meets_experience": False},
+        {"name": "Go", "years": 6.0},
+    ]
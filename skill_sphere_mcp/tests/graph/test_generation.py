@@ -0,0 +1,96 @@
+"""Tests for the graph generation counter and change feed."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from skill_sphere_mcp.graph.generation import GraphGeneration
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.tools.cache import tool_cache
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+    async def consume(self) -> None:
+        return None
+
+
+class StoredGeneration:
+    """Session over a GraphMeta node that other processes may advance."""
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.session = AsyncMock()
+        self.session.run.side_effect = self.run
+        self.session.execute_read.side_effect = self.execute
+        self.session.execute_write.side_effect = self.execute
+
+    def run(self, query: str, *_args: Any, **_kwargs: Any) -> AsyncRecords:
+        if "MERGE (m:GraphMeta" in query:
+            self.value += 1
+        return AsyncRecords([{"generation": self.value}])
+
+    async def execute(self, work: Any) -> Any:
+        return await work(self.session)
+
+
+@pytest.mark.asyncio
+async def test_polling_publishes_outside_writes() -> None:
+    """Test the first poll is a baseline and later changes bump subscribers."""
+    generation = GraphGeneration()
+    stored = StoredGeneration()
+    seen: list[int] = []
+    unsubscribe = generation.subscribe(seen.append)
+
+    stored.value = 5
+    assert not await generation.poll_once(stored.session)
+    assert not await generation.poll_once(stored.session)
+    assert generation.current == 0
+
+    stored.value = 6
+    assert await generation.poll_once(stored.session)
+    assert generation.current == 1 and seen == [1]
+
+    unsubscribe()
+    stored.value = 7
+    assert await generation.poll_once(stored.session)
+    assert seen == [1]
+
+
+@pytest.mark.asyncio
+async def test_own_writes_are_not_seen_twice() -> None:
+    """Test a recorded write advances both generations once."""
+    generation = GraphGeneration()
+    stored = StoredGeneration()
+    await generation.poll_once(stored.session)
+
+    assert await generation.record_write(stored.session) == 1
+    assert stored.value == 1
+    assert not await generation.poll_once(stored.session)
+    assert generation.current == 1
+
+    # The local generation still advances when the stored one cannot
+    stored.session.execute_write.side_effect = RuntimeError("leader unavailable")
+    assert await generation.record_write(stored.session) == 2
+
+
+def test_tool_cache_is_emptied_on_change() -> None:
+    """Test the tool cache subscribes to the global generation."""
+    tool_cache.put("graph.search", {"query": "feed"}, {"results": []})
+    assert len(tool_cache) > 0
+    graph_generation.bump()
+    assert len(tool_cache) == 0
@@ -0,0 +1,124 @@
+"""Tests for hybrid lexical + vector search."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.hybrid_search import fuse_rrf
+from skill_sphere_mcp.graph.hybrid_search import fuse_weighted
+from skill_sphere_mcp.graph.hybrid_search import hybrid_search
+from skill_sphere_mcp.graph.search_index import SearchIndex
+from skill_sphere_mcp.graph.vector_index import VectorIndex
+
+
+MODULE = "skill_sphere_mcp.graph.hybrid_search"
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _search_index() -> SearchIndex:
+    index = SearchIndex()
+    index.add(1, "Python", "Programming language")
+    index.add(2, "Django", "Python web framework")
+    index.add(3, "Kubernetes", "Container orchestration")
+    index.finalize(graph_generation.current)
+    return index
+
+
+def _vector_index() -> VectorIndex:
+    index = VectorIndex()
+    index.set_vectors([1, 2, 3], [[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]], graph_generation.current)
+    return index
+
+
+def _model(vector: list[float]) -> MagicMock:
+    model = MagicMock()
+    model.encode.return_value = np.array(vector)
+    return model
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.run.side_effect = lambda query, parameters: AsyncRecords(
+        [{"node_id": i, "n": {"id": i}} for i in parameters["ids"]]
+    )
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
+
+
+def test_fuse_rrf_rewards_agreement() -> None:
+    """Test nodes ranked by both sources beat nodes ranked by one."""
+    fused = fuse_rrf([(1, 9.0), (2, 5.0)], [(2, 0.9), (3, 0.8)], 1.0, 1.0)
+    assert max(fused, key=fused.get) == 2
+    assert fused[1] == pytest.approx(1 / 61)
+
+
+def test_fuse_weighted_scales_scores() -> None:
+    """Test weighted fusion combines min-max scaled scores."""
+    fused = fuse_weighted([(1, 10.0), (2, 5.0)], [(2, 0.9), (3, 0.1)], 0.25, 0.75)
+    assert fused == pytest.approx({1: 0.25, 2: 0.75, 3: 0.0})
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_and_hydrates_once() -> None:
+    """Test both sources contribute and the union is hydrated in one query."""
+    session = _session()
+    with patch("skill_sphere_mcp.graph.search_index.search_index", _search_index()), patch(
+        f"{MODULE}.vector_index", _vector_index()
+    ), patch(f"{MODULE}.get_embedding_model", return_value=_model([0.6, 0.8])):
+        hits = await hybrid_search(session, "python", top_k=3)
+
+    assert [hit.node_id for hit in hits] == [2, 1, 3]
+    assert hits[0].lexical_score is not None and hits[0].vector_score is not None
+    assert hits[2].lexical_score is None
+    session.run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_weights_per_request() -> None:
+    """Test a zero weight disables a source."""
+    session = _session()
+    with patch("skill_sphere_mcp.graph.search_index.search_index", _search_index()), patch(
+        f"{MODULE}.vector_index", _vector_index()
+    ), patch(f"{MODULE}.get_embedding_model", return_value=_model([0.0, 1.0])) as model:
+        hits = await hybrid_search(
+            session, "python", top_k=3, lexical_weight=0.0, fusion="weighted"
+        )
+        assert [hit.node_id for hit in hits] == [3, 2, 1]
+        assert all(hit.lexical_score is None for hit in hits)
+
+        hits = await hybrid_search(session, "python", top_k=3, vector_weight=0.0)
+        assert {hit.node_id for hit in hits} == {1, 2}
+        model.return_value.encode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rejects_bad_arguments() -> None:
+    """Test invalid fusion methods and weights are rejected."""
+    with pytest.raises(ValueError):
+        await hybrid_search(AsyncMock(), "python", fusion="max")
+    with pytest.raises(ValueError):
+        await hybrid_search(AsyncMock(), "python", lexical_weight=0.0, vector_weight=0.0)
@@ -2,7 +2,11 @@
 
 # pylint: disable=redefined-outer-name
 
+import threading
+
 from collections.abc import Callable
+from typing import Any
+from unittest import mock
 from unittest.mock import AsyncMock
 
 import numpy as np
@@ -80,8 +84,14 @@ class AsyncIterator:
 
 @pytest_asyncio.fixture
 async def test_mock_session() -> AsyncMock:
-    """Create mock Neo4j session."""
-    return AsyncMock(spec=AsyncSession)
+    """Create mock Neo4j session running managed transactions on itself."""
+    session = AsyncMock(spec=AsyncSession)
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
 
 
 @pytest_asyncio.fixture
@@ -442,6 +452,33 @@ async def test_fit(
         assert np.allclose(np.linalg.norm(embeddings[node_id]), 1.0)
 
 
+@pytest.mark.asyncio
+async def test_fit_trains_off_the_event_loop(
+    test_node2vec: Node2Vec, test_mock_session: AsyncMock, test_mock_result: AsyncMock
+) -> None:
+    """Test walks and training run in a worker thread, not on the event loop."""
+    records = [
+        {"node_id": 1, "neighbors": [2, 3]},
+        {"node_id": 2, "neighbors": [1, 3, 4]},
+        {"node_id": 3, "neighbors": [1, 2, 4]},
+        {"node_id": 4, "neighbors": [2, 3]},
+    ]
+    test_mock_result.__aiter__ = make_aiter(records)
+    test_mock_session.run.return_value = test_mock_result
+    fit_graph = test_node2vec.fit_graph
+    threads = []
+
+    def record_thread(graph: dict[str, list[str]]) -> None:
+        threads.append(threading.get_ident())
+        fit_graph(graph)
+
+    with mock.patch.object(test_node2vec, "fit_graph", side_effect=record_thread):
+        await test_node2vec.fit(test_mock_session)
+
+    assert threads and threads[0] != threading.get_ident()
+    assert len(test_node2vec.get_all_embeddings()) == EXPECTED_NUM_NODES
+
+
 def test_node2vec_initialization() -> None:
     """Test Node2Vec model initialization."""
     model = Node2VecModel()
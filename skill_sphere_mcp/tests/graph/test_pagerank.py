@@ -0,0 +1,136 @@
+"""Tests for personalized PageRank relevance."""
+
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.pagerank import PageRankIndex
+from skill_sphere_mcp.graph.pagerank import PageRankStore
+from skill_sphere_mcp.graph.pagerank import rank_evidence
+from skill_sphere_mcp.graph.paths import best_shortest_path
+from skill_sphere_mcp.graph.snapshot import GraphSnapshot
+from skill_sphere_mcp.graph.snapshot import SnapshotNode
+from skill_sphere_mcp.graph.snapshot import SnapshotRelationship
+from skill_sphere_mcp.graph.snapshot import SnapshotStore
+
+
+# Python and Go are both used in the API project, only Python in the
+# scripts project; the Cloud certification hangs off Go alone.
+NODES = [
+    (10, ["Skill"], {"name": "Python"}),
+    (11, ["Skill"], {"name": "Go"}),
+    (12, ["Project"], {"name": "API"}),
+    (13, ["Project"], {"name": "Scripts"}),
+    (14, ["Certification"], {"name": "Cloud"}),
+    (15, ["Skill"], {"name": "Machine Learning"}),
+    (16, ["Project"], {"name": "Orphan"}),
+]
+EDGES = [
+    (10, 12, "USED_IN"),
+    (11, 12, "USED_IN"),
+    (10, 13, "USED_IN"),
+    (11, 14, "CERTIFIED_IN"),
+    (15, 13, "USED_IN"),
+]
+
+
+def _snapshot(generation: int = 0) -> GraphSnapshot:
+    nodes = [SnapshotNode(i, labels, props) for i, labels, props in NODES]
+    positions = {node.id: position for position, node in enumerate(nodes)}
+    relationships = [SnapshotRelationship(i, t, {}) for i, (_, _, t) in enumerate(EDGES)]
+    endpoints = np.array([(positions[a], positions[b]) for a, b, _ in EDGES])
+    return GraphSnapshot(nodes, relationships, endpoints, generation)
+
+
+def test_scores_match_linear_solve() -> None:
+    """Test the power iteration converges to the closed-form solution."""
+    index = PageRankIndex(_snapshot())
+    scores = index.scores([0])
+
+    # Dangling walkers restart at the seed, so fold them into the matrix
+    restart = np.zeros(len(index))
+    restart[0] = 1.0
+    walk = index.transition.toarray() + np.outer(restart, index.dangling)
+    expected = np.linalg.solve(np.eye(len(index)) - 0.85 * walk, 0.15 * restart)
+    assert scores == pytest.approx(expected, abs=1e-5)
+    assert scores.sum() == pytest.approx(1.0)
+    # The orphan project is never reached
+    assert scores[6] == 0.0
+
+
+def test_scores_many_batches_and_caches() -> None:
+    """Test several seed sets are solved together and then served from cache."""
+    index = PageRankIndex(_snapshot())
+    python, go, empty = index.scores_many([[0], [1, 1], []])
+    assert python[2] > 0 and go[4] > python[4]
+    assert not empty.any()
+    with mock.patch("skill_sphere_mcp.graph.pagerank.personalized_pagerank") as solve:
+        assert index.scores([1]) is go
+    solve.assert_not_called()
+
+
+def test_mentioned_skills_match_whole_words() -> None:
+    """Test skills are found in free text case-insensitively, by whole words."""
+    index = PageRankIndex(_snapshot())
+    assert index.mentioned_skills("Senior GO engineer with machine learning") == [1, 5]
+    assert index.mentioned_skills("good pythonista") == []
+
+
+def test_store_rebuilds_for_new_generation() -> None:
+    """Test the index, and its score cache, follow the snapshot generation."""
+    store = PageRankStore()
+    index = store.index_for(_snapshot(generation=1))
+    assert store.index_for(_snapshot(generation=1)) is index
+    assert store.index_for(_snapshot(generation=2)) is not index
+
+
+def test_best_shortest_path_prefers_relevant_nodes() -> None:
+    """Test ties between shortest paths go to the heavier inner nodes."""
+    # 0 - 1 - 3 and 0 - 2 - 3 are both shortest
+    nodes = [SnapshotNode(i, ["Skill"], {"name": str(i)}) for i in range(4)]
+    relationships = [SnapshotRelationship(i, "RELATED_TO", {}) for i in range(4)]
+    snapshot = GraphSnapshot(nodes, relationships, np.array([(0, 1), (1, 3), (0, 2), (2, 3)]), 0)
+
+    path = best_shortest_path(snapshot, 0, 3, np.array([0.0, 0.1, 0.5, 0.0]))
+    assert path is not None and path.nodes == [0, 2, 3] and path.relationships == [2, 3]
+    path = best_shortest_path(snapshot, 3, 0, np.array([0.0, 0.5, 0.1, 0.0]))
+    assert path is not None and path.nodes == [3, 1, 0]
+    assert best_shortest_path(snapshot, 0, 3, np.zeros(4), max_hops=1) is None
+    assert best_shortest_path(snapshot, 2, 2, np.zeros(4)).nodes == [2]
+
+
+@pytest.mark.asyncio
+async def test_rank_evidence_orders_by_relevance() -> None:
+    """Test evidence is ranked from the skill and the skills in the requirement."""
+    store = SnapshotStore()
+    store.snapshot = _snapshot(graph_generation.current)
+    evidence = [
+        (16, {"type": "project", "description": "Orphan"}),
+        (13, {"type": "project", "description": "Scripts"}),
+        (12, {"type": "project", "description": "API"}),
+        (14, {"type": "certification", "description": "Cloud"}),
+    ]
+    with mock.patch("skill_sphere_mcp.graph.pagerank.snapshot_store", store), mock.patch(
+        "skill_sphere_mcp.graph.pagerank.pagerank_store", PageRankStore()
+    ):
+        python = await rank_evidence(AsyncMock(), 10, "Backend developer", evidence, 2)
+        go = await rank_evidence(AsyncMock(), 10, "Go and cloud developer", evidence, 4)
+
+    assert [entry["description"] for entry in python] == ["Scripts", "API"]
+    assert python[0]["relevance"] > python[1]["relevance"] > 0
+    # Naming Go in the requirement pulls its project ahead of Python's own
+    assert [entry["description"] for entry in go][:2] == ["API", "Scripts"]
+    assert go[-1] == {"type": "project", "description": "Orphan", "relevance": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_rank_evidence_without_snapshot_keeps_order() -> None:
+    """Test evidence is only trimmed when there is no snapshot to rank with."""
+    evidence = [(i, {"type": "project", "description": str(i)}) for i in range(3)]
+    with mock.patch("skill_sphere_mcp.graph.pagerank.snapshot_store", SnapshotStore()):
+        kept = await rank_evidence(AsyncMock(), 1, "Python", evidence, 2)
+    assert [entry["description"] for entry in kept] == ["0", "1"]
+    assert "relevance" not in kept[0]
@@ -0,0 +1,190 @@
+"""Tests for the graph snapshot and local path engine."""
+
+# pylint: disable=protected-access
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.api.mcp.handlers import handle_graph_search_request
+from skill_sphere_mcp.api.mcp.models import GraphSearchRequest
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.paths import bounded_paths
+from skill_sphere_mcp.graph.paths import nearest_target
+from skill_sphere_mcp.graph.paths import shortest_path
+from skill_sphere_mcp.graph.skill_matching import SkillMatchingService
+from skill_sphere_mcp.graph.snapshot import GraphSnapshot
+from skill_sphere_mcp.graph.snapshot import SnapshotNode
+from skill_sphere_mcp.graph.snapshot import SnapshotRelationship
+from skill_sphere_mcp.graph.snapshot import SnapshotStore
+
+
+# Person -HAS_EXPERIENCE-> Job -USED_SKILL-> Python, Django; Django -RELATED_TO-> Python
+NODES = [
+    (100, ["Person"], {"name": "Bernd"}),
+    (101, ["Job"], {"name": "Engineer"}),
+    (102, ["Skill"], {"name": "Python", "id": "s1"}),
+    (103, ["Skill"], {"name": "Django", "id": "s2"}),
+    (104, ["Skill"], {"name": "Rust", "id": "s3"}),
+]
+RELS = [
+    (200, 100, 101, "HAS_EXPERIENCE", {}),
+    (201, 101, 102, "USED_SKILL", {"years": 5}),
+    (202, 101, 103, "USED_SKILL", {}),
+    (203, 103, 102, "RELATED_TO", {}),
+]
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def _session() -> AsyncMock:
+    def run(query: str, *args: Any, **kwargs: Any) -> AsyncRecords:
+        if "MATCH (a)-[r]->(b)" in query:
+            return AsyncRecords(
+                [
+                    {"rel_id": r, "source": a, "target": b, "type": t, "props": p}
+                    for r, a, b, t, p in RELS
+                ]
+            )
+        return AsyncRecords([{"node_id": i, "labels": l, "props": p} for i, l, p in NODES])
+
+    session = AsyncMock()
+    session.run.side_effect = run
+    return _managed(session)
+
+
+def _snapshot() -> GraphSnapshot:
+    nodes = [SnapshotNode(i, labels, props) for i, labels, props in NODES]
+    positions = {node.id: pos for pos, node in enumerate(nodes)}
+    rels = [SnapshotRelationship(r, t, p) for r, _, _, t, p in RELS]
+    endpoints = np.array([(positions[a], positions[b]) for _, a, b, _, _ in RELS])
+    return GraphSnapshot(nodes, rels, endpoints, graph_generation.current)
+
+
+def test_snapshot_adjacency_is_undirected() -> None:
+    """Test each relationship is reachable from both endpoints."""
+    snapshot = _snapshot()
+    neighbors, rels = snapshot.adjacent(snapshot.find("Skill", "Python"))
+    assert sorted(neighbors.tolist()) == [1, 3]
+    assert sorted(rels.tolist()) == [1, 3]
+    assert snapshot.adjacent(snapshot.find("Skill", "Rust"))[0].size == 0
+    assert snapshot.find("Skill", "Bernd") is None
+
+
+def test_shortest_path() -> None:
+    """Test bidirectional BFS finds the shortest path within the hop limit."""
+    snapshot = _snapshot()
+    person, python = snapshot.find("Person", "Bernd"), snapshot.find("Skill", "Python")
+    path = shortest_path(snapshot, person, python)
+    assert path is not None
+    assert path.nodes == [0, 1, 2]
+    assert [snapshot.relationships[r].type for r in path.relationships] == [
+        "HAS_EXPERIENCE",
+        "USED_SKILL",
+    ]
+    assert shortest_path(snapshot, person, python, max_hops=1) is None
+    assert shortest_path(snapshot, python, snapshot.find("Skill", "Rust")) is None
+    assert shortest_path(snapshot, python, python).nodes == [python]
+
+
+def test_nearest_target() -> None:
+    """Test BFS stops at the closest of several targets."""
+    snapshot = _snapshot()
+    person, job = snapshot.find("Person", "Bernd"), 1
+    python, django = snapshot.find("Skill", "Python"), snapshot.find("Skill", "Django")
+    path = nearest_target(snapshot, person, {python, django, job})
+    assert path is not None and path.nodes == [person, job]
+    path = nearest_target(snapshot, person, {python, django})
+    assert path is not None and len(path.relationships) == 2
+    assert nearest_target(snapshot, person, {python}, max_hops=1) is None
+    assert nearest_target(snapshot, python, {python}).nodes == [python]
+    assert nearest_target(snapshot, python, {snapshot.find("Skill", "Rust")}) is None
+
+
+def test_bounded_paths_use_each_relationship_once() -> None:
+    """Test enumeration honors hop bounds and relationship uniqueness."""
+    snapshot = _snapshot()
+    python = snapshot.find("Skill", "Python")
+    paths = list(bounded_paths(snapshot, [python], 1, 3))
+    assert all(1 <= len(p.relationships) <= 3 for p in paths)
+    assert all(len(set(p.relationships)) == len(p.relationships) for p in paths)
+    # Python-Job, Python-Django, and the triangle both ways round
+    assert sorted(p.nodes for p in paths if len(p.relationships) == 1) == [[2, 1], [2, 3]]
+    assert [2, 1, 3, 2] in [p.nodes for p in paths]
+    assert len(list(bounded_paths(snapshot, [python], 1, 1))) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_builds_and_refreshes() -> None:
+    """Test the store loads nodes and relationships and rebuilds when stale."""
+    store = SnapshotStore()
+    session = _session()
+    assert await store.ensure_fresh(session) is None
+
+    snapshot = await store.build(session)
+    assert len(snapshot) == len(NODES)
+    assert len(snapshot.relationships) == len(RELS)
+    assert await store.ensure_fresh(session) is snapshot
+
+    graph_generation.bump()
+    assert await store.ensure_fresh(session) is not snapshot
+    assert session.run.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_graph_search_from_snapshot() -> None:
+    """Test graph search is answered locally with the Cypher result shape."""
+    store = SnapshotStore()
+    store.snapshot = _snapshot()
+    session = AsyncMock()
+    with patch("skill_sphere_mcp.api.mcp.handlers.snapshot_store", store):
+        result = await handle_graph_search_request(
+            GraphSearchRequest(query="ENGINEER", top_k=2), session
+        )
+    session.run.assert_not_called()
+    assert result["count"] == 2
+    first = result["paths"][0]
+    assert first["start"] == {"id": "Engineer", "name": "Engineer", "type": "Job"}
+    assert first["relationships"][0]["type"] in {"HAS_EXPERIENCE", "USED_SKILL"}
+
+
+@pytest.mark.asyncio
+async def test_skill_evidence_from_snapshot() -> None:
+    """Test skill match evidence is built from the snapshot without queries."""
+    store = SnapshotStore()
+    store.snapshot = _snapshot()
+    session = AsyncMock()
+    with patch("skill_sphere_mcp.graph.skill_matching.snapshot_store", store):
+        evidence = await SkillMatchingService()._gather_evidence(session, "Python", "Django")
+    session.run.assert_not_called()
+    assert [e["type"] for e in evidence] == ["node", "node", "relationship"]
+    assert evidence[0]["properties"]["name"] == "Python"
+    assert evidence[2]["rel_type"] == "RELATED_TO"
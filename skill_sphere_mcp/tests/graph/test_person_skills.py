@@ -0,0 +1,116 @@
+"""Tests for the person-skill bitset index."""
+
+from typing import Any
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.person_skills import PersonSkillIndex
+from skill_sphere_mcp.graph.person_skills import PersonSkillStore
+from skill_sphere_mcp.tools.handlers import match_role
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def _index() -> PersonSkillIndex:
+    # Enough skills to span several bytes per row
+    extra = [f"Skill{i}" for i in range(12)]
+    return PersonSkillIndex(
+        [1, 2, 3],
+        ["Ada", "Bob", "Cy"],
+        [["Python", "Neo4j"] + extra, ["Python", "Go"], []],
+        graph_generation.current,
+    )
+
+
+def test_coverage_for_all_persons() -> None:
+    """Test coverage fractions, with duplicates and unknown skills."""
+    index = _index()
+    assert index.coverage(["Python", "Go"]).tolist() == [0.5, 1.0, 0.0]
+    assert index.coverage(["Python", "Python", "Skill11"]).tolist() == [1.0, 0.5, 0.0]
+    assert index.coverage(["Rust"]).tolist() == [0.0, 0.0, 0.0]
+    assert index.coverage([]).tolist() == [0.0, 0.0, 0.0]
+
+
+def test_covering_and_gaps() -> None:
+    """Test which persons cover a skill set and which skills they miss."""
+    index = _index()
+    assert index.covering(["Python"]) == [1, 2]
+    assert index.covering(["Python", "Skill7"]) == [1]
+    assert index.covering(["Python", "Rust"]) == []
+    assert index.gaps(["Go", "Python", "Rust"], 1) == ["Go", "Rust"]
+    assert np.unpackbits(index.bits[0]).sum() == 14
+
+
+def test_best_match() -> None:
+    """Test the best-covering person and the split into matches and gaps."""
+    index = _index()
+    assert index.best_match(["Go", "Python", "Rust"]) == (2, ["Go", "Python"], ["Rust"])
+    assert index.best_match(["Rust"]) == (None, [], ["Rust"])
+
+
+@pytest.mark.asyncio
+async def test_store_rebuilds_after_graph_change() -> None:
+    """Test the store only answers once built and rebuilds when stale."""
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda *args, **kwargs: AsyncRecords(
+        [
+            {"person_id": 1, "name": "Ada", "skills": ["Python", None]},
+            {"person_id": 2, "name": "Bob", "skills": []},
+        ]
+    )
+    store = PersonSkillStore()
+    assert await store.ensure_fresh(session) is None
+
+    index = await store.build(session)
+    assert await store.ensure_fresh(session) is index
+    assert index.covering(["Python"]) == [1]
+
+    graph_generation.bump()
+    rebuilt = await store.ensure_fresh(session)
+    assert rebuilt is not index
+    assert session.run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_match_role_tool_uses_index() -> None:
+    """Test the match_role tool answers from the index without querying Neo4j."""
+    store = PersonSkillStore()
+    store.index = _index()
+    session = AsyncMock()
+    with mock.patch("skill_sphere_mcp.tools.handlers.person_skills", store):
+        result = await match_role(
+            {"required_skills": ["Python", "Neo4j", "Rust"]}, session
+        )
+    session.run.assert_not_called()
+    assert result["match_score"] == pytest.approx(2 / 3)
+    assert result["matching_skills"] == [{"name": "Python"}, {"name": "Neo4j"}]
+    assert result["skill_gaps"] == ["Rust"]
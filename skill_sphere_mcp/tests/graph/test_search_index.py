@@ -0,0 +1,175 @@
+"""Tests for the in-memory search index."""
+
+# pylint: disable=redefined-outer-name, protected-access
+
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+
+from skill_sphere_mcp.api.mcp.handlers import graph_search
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.search_index import SearchIndex
+from skill_sphere_mcp.graph.search_index import search_nodes
+from skill_sphere_mcp.graph.search_index import tokenize
+
+
+NODES = [
+    (1, "Python", "Python programming language"),
+    (2, "FastAPI", "Modern Python web framework"),
+    (3, "Neo4j", "Graph database"),
+    (4, "C++", "Systems programming"),
+    (5, "Project Atlas", None),
+]
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def _build_index() -> SearchIndex:
+    index = SearchIndex()
+    for node_id, name, description in NODES:
+        index.add(node_id, name, description)
+    index.finalize(graph_generation.current)
+    return index
+
+
+def _node_records() -> list[dict[str, Any]]:
+    return [{"node_id": i, "name": n, "description": d} for i, n, d in NODES]
+
+
+def test_tokenize() -> None:
+    """Test tokenization lowercases and splits on non-word characters."""
+    assert tokenize("Neo4j, Graph-DB!") == ["neo4j", "graph", "db"]
+
+
+def test_search_exact_and_ranked() -> None:
+    """Test exact term hits rank nodes containing the term."""
+    index = _build_index()
+    results = index.search("python", top_k=10)
+    ids = [node_id for node_id, _ in results]
+    assert set(ids) == {1, 2}
+    # Python appears in both name and description of node 1
+    assert ids[0] == 1
+    assert results[0][1] > results[1][1]
+
+
+def test_search_substring_is_case_insensitive() -> None:
+    """Test partial tokens are resolved through the trigram index."""
+    index = _build_index()
+    assert [node_id for node_id, _ in index.search("ATAB")] == [3]
+    assert [node_id for node_id, _ in index.search("api")] == [2]
+
+
+def test_search_phrase_must_be_contiguous() -> None:
+    """Test multi-token queries keep substring semantics."""
+    index = _build_index()
+    assert [node_id for node_id, _ in index.search("web framework")] == [2]
+    assert index.search("framework web") == []
+
+
+def test_search_short_and_symbol_queries() -> None:
+    """Test short tokens and queries with symbols."""
+    index = _build_index()
+    assert [node_id for node_id, _ in index.search("C++")] == [4]
+    assert {node_id for node_id, _ in index.search("4j")} == {3}
+    assert index.search("++") == []
+    assert index.search("   ") == []
+
+
+def test_search_top_k() -> None:
+    """Test the result count is bounded by top_k."""
+    index = _build_index()
+    assert len(index.search("p", top_k=2)) == 2
+    assert index.search("python", top_k=0) == []
+
+
+def test_staleness_follows_generation() -> None:
+    """Test the index becomes stale when the graph generation advances."""
+    index = _build_index()
+    assert index.is_ready
+    assert not index.is_stale
+    graph_generation.bump()
+    assert index.is_stale
+
+
+@pytest.mark.asyncio
+async def test_build_and_refresh() -> None:
+    """Test building from Neo4j and rebuilding after a graph change."""
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda *args, **kwargs: AsyncRecords(_node_records())
+    index = SearchIndex()
+    assert not await index.ensure_fresh(session)
+
+    await index.build(session)
+    assert len(index) == len(NODES)
+    assert await index.ensure_fresh(session)
+    assert session.run.call_count == 1
+
+    graph_generation.bump()
+    assert await index.ensure_fresh(session)
+    assert session.run.call_count == 2
+    assert not index.is_stale
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_hydrates_in_one_query() -> None:
+    """Test hits are hydrated with a single query in ranked order."""
+    session = _managed(AsyncMock())
+    session.run.return_value = AsyncRecords(
+        [
+            {"node_id": 2, "n": {"name": "FastAPI"}},
+            {"node_id": 1, "n": {"name": "Python"}},
+        ]
+    )
+    with patch("skill_sphere_mcp.graph.search_index.search_index", _build_index()):
+        ranked = await search_nodes(session, "python", 10)
+    assert ranked is not None
+    assert [node["name"] for node, _ in ranked] == ["Python", "FastAPI"]
+    session.run.assert_called_once()
+    assert sorted(session.run.call_args.args[1]["ids"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_without_index() -> None:
+    """Test callers are told to fall back when the index is not built."""
+    with patch("skill_sphere_mcp.graph.search_index.search_index", SearchIndex()):
+        assert await search_nodes(AsyncMock(), "python", 10) is None
+
+
+@pytest.mark.asyncio
+async def test_graph_search_uses_index() -> None:
+    """Test the graph search handler serves ranked results from the index."""
+    session = _managed(AsyncMock())
+    session.run.return_value = AsyncRecords(
+        [{"node_id": 3, "n": {"id": "3", "name": "Neo4j", "description": "Graph database"}}]
+    )
+    with patch("skill_sphere_mcp.graph.search_index.search_index", _build_index()):
+        result = await graph_search({"query": "graph", "top_k": 5}, session)
+    assert [r["node"]["name"] for r in result["results"]] == ["Neo4j"]
+    assert "CONTAINS" not in session.run.call_args.args[0]
@@ -5,6 +5,7 @@
 import os
 
 from collections import UserDict
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock
 from unittest.mock import patch
@@ -25,9 +26,15 @@ os.environ.pop('SKILL_SPHERE_MCP_CLIENT_MCP_INSTRUCTIONS', None)
 from skill_sphere_mcp.config.settings import ClientInfo
 from skill_sphere_mcp.config.settings import Settings
 from skill_sphere_mcp.config.settings import get_settings
+from skill_sphere_mcp.graph.generation import graph_generation
 from skill_sphere_mcp.graph.skill_matching import MatchResult
 from skill_sphere_mcp.graph.skill_matching import SkillMatch
 from skill_sphere_mcp.graph.skill_matching import SkillMatchingService
+from skill_sphere_mcp.graph.skill_matching import assign_skills
+from skill_sphere_mcp.graph.snapshot import GraphSnapshot
+from skill_sphere_mcp.graph.snapshot import SnapshotNode
+from skill_sphere_mcp.graph.snapshot import SnapshotRelationship
+from skill_sphere_mcp.graph.snapshot import SnapshotStore
 
 
 # Set test environment
@@ -81,8 +88,72 @@ async def skill_matcher() -> SkillMatchingService:
 
 @pytest_asyncio.fixture
 async def mock_session() -> AsyncMock:
-    """Create a mock Neo4j session."""
-    return AsyncMock()
+    """Create a mock Neo4j session running managed transactions on itself."""
+    session = AsyncMock()
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def mock_run(
+    skill_ids: dict[str, int], paths: dict[tuple[str, str], Any] | None = None
+) -> Any:
+    """Build a session.run side effect resolving skill names and evidence paths."""
+
+    def run(query: str, parameters: dict[str, Any] | None = None) -> Any:
+        if "UNWIND $names" in query:
+            return AsyncRecords(
+                [
+                    {"name": name, "node_id": skill_ids[name]}
+                    for name in parameters["names"]
+                    if name in skill_ids
+                ]
+            )
+        if "UNWIND $pairs" in query:
+            records = []
+            for pair in parameters["pairs"]:
+                path = (paths or {}).get((pair["req_skill"], pair["candidate_skill"]))
+                if path:
+                    records.append(
+                        {
+                            **pair,
+                            "nodes": path.nodes,
+                            "relationships": path.relationships,
+                        }
+                    )
+            return AsyncRecords(records)
+        return AsyncRecords([])
+
+    return run
+
+
+def skill_path(name: str = "Python") -> mock.MagicMock:
+    """Build a mock evidence path through a single skill node."""
+    node = UserDict({"name": name, "type": "Programming Language"})
+    node.labels = ["Skill"]
+    path = mock.MagicMock()
+    path.nodes = [node]
+    path.relationships = []
+    return path
 
 
 @pytest.fixture
@@ -152,19 +223,11 @@ async def test_match_role_success(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        
-        # Mock a path with nodes and relationships
-        mock_node = mock.MagicMock()
-        mock_node.labels = ["Skill"]
-        mock_node.items.return_value = [("name", "Python")]
-        mock_node.get.return_value = "Python"  # Ensure the node can be accessed like a dict
-        
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-        
-        mock_session.run.return_value.single.return_value = {"path": mock_path, "node_id": 1}
-        
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1, "FastAPI": 2},
+            {("Python", "Python"): skill_path(), ("FastAPI", "FastAPI"): skill_path("FastAPI")},
+        )
+
         result = await skill_matcher.match_role(
             mock_session,
             MOCK_REQUIRED_SKILLS,
@@ -215,19 +278,10 @@ async def test_match_role_partial_match(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        # Only return a path for the matching skill
-        mock_node = UserDict({"name": "Python", "type": "Programming Language"})
-        mock_node.labels = ["Skill"]
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-        # Return node_id for Python embedding, node_id for candidate, path for evidence, None for FastAPI
-        mock_session.run.return_value.single.side_effect = [
-            {"node_id": 1},  # Python embedding
-            {"node_id": 1},  # Python candidate embedding
-            {"path": mock_path},  # Python evidence
-            None,  # FastAPI embedding (not found)
-        ]
+        # FastAPI is not in the graph, so it cannot be matched
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1}, {("Python", "Python"): skill_path()}
+        )
         partial_candidate_skills = [{"name": "Python", "years": 5}]
         result = await skill_matcher.match_role(
             mock_session,
@@ -251,19 +305,8 @@ async def test_match_role_experience_scoring(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        
-        # Mock a path with nodes and relationships
-        mock_node = mock.MagicMock()
-        mock_node.labels = ["Skill"]
-        mock_node.items.return_value = [("name", "Python")]
-        mock_node.get.return_value = "Python"  # Ensure the node can be accessed like a dict
-        
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-        
-        mock_session.run.return_value.single.return_value = {"path": mock_path, "node_id": 1}
-        
+        mock_session.run.side_effect = mock_run({"Python": 1, "FastAPI": 2})
+
         # Test with varying experience levels
         candidate_skills = [
             {"name": "Python", "years": 3},  # Less than required
@@ -279,6 +322,76 @@ async def test_match_role_experience_scoring(
         assert len(result.skill_gaps) == 0
 
 
+@pytest.mark.asyncio
+async def test_match_role_resolves_names_in_one_query(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test all skill names are resolved with one query and then cached."""
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.return_value = np.ones((1, 128))
+        mock_session.run.side_effect = mock_run({"Python": 1, "FastAPI": 2})
+
+        await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+        queries = [c.args[0] for c in mock_session.run.call_args_list]
+        assert sum("UNWIND $names" in q for q in queries) == 1
+        assert "UNWIND $names" in queries[0]
+
+        # A second match reuses the cached names
+        mock_session.run.reset_mock()
+        await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+        assert not any("UNWIND $names" in c.args[0] for c in mock_session.run.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_skill_id_cache_invalidated_on_graph_change(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test cached names, including misses, are dropped when the graph changes."""
+    mock_session.run.side_effect = mock_run({"Python": 1})
+    assert await skill_matcher._resolve_skill_ids(mock_session, ["Python", "Rust"]) == {
+        "Python": 1,
+        "Rust": None,
+    }
+    await skill_matcher._resolve_skill_ids(mock_session, ["Rust"])
+    assert mock_session.run.call_count == 1
+
+    graph_generation.bump()
+    mock_session.run.side_effect = mock_run({"Python": 1, "Rust": 7})
+    assert await skill_matcher._resolve_skill_ids(mock_session, ["Rust"]) == {"Rust": 7}
+    assert mock_session.run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_skill_ids_survive_graph_change_during_query(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test names cached before a query are returned even if it resets the cache."""
+    mock_session.run.side_effect = mock_run({"Python": 1})
+    await skill_matcher._resolve_skill_ids(mock_session, ["Python"])
+
+    resolve = mock_run({"Python": 1, "Rust": 7})
+
+    def run_during_write(query: str, parameters: dict[str, Any]) -> Any:
+        graph_generation.bump()
+        skill_matcher._sync_cache_generation()
+        return resolve(query, parameters)
+
+    mock_session.run.side_effect = run_during_write
+    assert await skill_matcher._resolve_skill_ids(mock_session, ["Python", "Rust"]) == {
+        "Python": 1,
+        "Rust": 7,
+    }
+    # Results read while the graph changed are not cached
+    assert skill_matcher._skill_ids == {}
+
+
 @pytest.mark.asyncio
 async def test_find_best_match(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
@@ -289,22 +402,9 @@ async def test_find_best_match(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        mock_node = UserDict({"name": "Python", "type": "Programming Language"})
-        mock_node.labels = ["Skill"]
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-
-        def run_side_effect(query, *args, **kwargs):
-            mock_result = mock.MagicMock()
-            if "RETURN id(s) as node_id" in query:
-                mock_result.single = AsyncMock(return_value={"node_id": 1})
-            elif "RETURN path" in query:
-                mock_result.single = AsyncMock(return_value={"path": mock_path})
-            else:
-                mock_result.single = AsyncMock(return_value=None)
-            return mock_result
-        mock_session.run.side_effect = run_side_effect
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1, "FastAPI": 2}, {("Python", "Python"): skill_path()}
+        )
 
         best_match = await skill_matcher._find_best_match(
             mock_session,
@@ -327,6 +427,7 @@ async def test_find_best_match_no_match(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = None
+        mock_session.run.side_effect = mock_run({"Python": 1, "FastAPI": 2})
         best_match = await skill_matcher._find_best_match(
             mock_session,
             "Rust",
@@ -346,22 +447,9 @@ async def test_find_best_match_below_threshold(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        mock_node = UserDict({"name": "Python", "type": "Programming Language"})
-        mock_node.labels = ["Skill"]
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-
-        def run_side_effect(query, *args, **kwargs):
-            mock_result = mock.MagicMock()
-            if "RETURN id(s) as node_id" in query:
-                mock_result.single = AsyncMock(return_value={"node_id": 1})
-            elif "RETURN path" in query:
-                mock_result.single = AsyncMock(return_value={"path": mock_path})
-            else:
-                mock_result.single = AsyncMock(return_value=None)
-            return mock_result
-        mock_session.run.side_effect = run_side_effect
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1, "FastAPI": 2}, {("Python", "Python"): skill_path()}
+        )
 
         # Create a matcher with high threshold
         high_threshold_matcher = SkillMatchingService(similarity_threshold=1.1)
@@ -384,10 +472,11 @@ async def test_get_skill_embedding(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones(128)
-        mock_session.run.return_value.single.return_value = {"node_id": 1}
+        mock_session.run.side_effect = mock_run({"Python": 1})
         embedding = await skill_matcher._get_skill_embedding(mock_session, "Python")
         assert embedding is not None
         assert isinstance(embedding, np.ndarray)
+        mock_embeddings.get_embedding.assert_called_once_with("1")
 
 
 @pytest.mark.asyncio
@@ -395,26 +484,16 @@ async def test_get_skill_embedding_not_found(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
 ) -> None:
     """Test getting skill embedding when skill is not found."""
-    mock_session.run.return_value.single.return_value = None
+    mock_session.run.side_effect = mock_run({})
     embedding = await skill_matcher._get_skill_embedding(mock_session, "UnknownSkill")
     assert embedding is None
-
-
 @pytest.mark.asyncio
 async def test_gather_evidence(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
 ) -> None:
     """Test gathering evidence for skill match."""
-    # Mock a path with nodes and relationships
-    mock_node = UserDict({"name": "Python", "type": "Programming Language"})
-    mock_node.labels = ["Skill"]
-    
-    mock_path = mock.MagicMock()
-    mock_path.nodes = [mock_node]
-    mock_path.relationships = []
-    
-    mock_session.run.return_value.single.return_value = {"path": mock_path}
-    
+    mock_session.run.side_effect = mock_run({}, {("Python", "Python"): skill_path()})
+
     evidence = await skill_matcher._gather_evidence(mock_session, "Python", "Python")
     assert isinstance(evidence, list)
     assert len(evidence) > 0
@@ -427,12 +506,82 @@ async def test_gather_evidence_no_path(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
 ) -> None:
     """Test gathering evidence when no path exists."""
-    mock_session.run.return_value.single.return_value = None
+    mock_session.run.side_effect = mock_run({})
     evidence = await skill_matcher._gather_evidence(mock_session, "Python", "Rust")
     assert isinstance(evidence, list)
     assert len(evidence) == 0
 
 
+@pytest.mark.asyncio
+async def test_gather_evidence_batch_is_cached(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test pairs are fetched in one query and cached until the graph changes."""
+    paths = {("Python", "Django"): skill_path("Django"), ("Go", "Go"): skill_path("Go")}
+    mock_session.run.side_effect = mock_run({}, paths)
+    pairs = [("Python", "Django"), ("Go", "Go"), ("Rust", "C")]
+
+    evidence = await skill_matcher._gather_evidence_batch(mock_session, pairs)
+    assert mock_session.run.call_count == 1
+    assert len(mock_session.run.call_args.args[1]["pairs"]) == 3
+    assert evidence[("Python", "Django")][0]["properties"]["name"] == "Django"
+    assert evidence[("Rust", "C")] == []
+
+    await skill_matcher._gather_evidence_batch(mock_session, pairs[:2])
+    assert mock_session.run.call_count == 1
+
+    graph_generation.bump()
+    await skill_matcher._gather_evidence_batch(mock_session, pairs[:1])
+    assert mock_session.run.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_evidence_batch_evicts_without_losing_hits(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test cached pairs are still returned when a full cache is emptied."""
+    paths = {("a", "b"): skill_path("b"), ("c", "d"): skill_path("d")}
+    mock_session.run.side_effect = mock_run({}, paths)
+    with mock.patch("skill_sphere_mcp.graph.skill_matching.EVIDENCE_CACHE_SIZE", 2):
+        await skill_matcher._gather_evidence_batch(mock_session, [("a", "b")])
+        evidence = await skill_matcher._gather_evidence_batch(
+            mock_session, [("a", "b"), ("c", "d"), ("e", "f")]
+        )
+
+    assert evidence[("a", "b")][0]["properties"]["name"] == "b"
+    assert evidence[("c", "d")][0]["properties"]["name"] == "d"
+    assert evidence[("e", "f")] == []
+    assert set(skill_matcher._evidence) == {("c", "d"), ("e", "f")}
+
+
+@pytest.mark.asyncio
+async def test_match_role_gathers_evidence_for_chosen_pairs_only(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test evidence is fetched once, after matching, for the chosen pairs."""
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.return_value = np.ones(4)
+        mock_session.run.side_effect = mock_run({"Python": 1, "FastAPI": 2, "Flask": 3})
+
+        await skill_matcher.match_role(
+            mock_session,
+            MOCK_REQUIRED_SKILLS,
+            [{"name": "Flask", "years": 1}, {"name": "Python", "years": 5}],
+        )
+
+        evidence_calls = [
+            c for c in mock_session.run.call_args_list if "UNWIND $pairs" in c.args[0]
+        ]
+        assert len(evidence_calls) == 1
+        assert evidence_calls[0].args[1]["pairs"] == [
+            {"req_skill": "Python", "candidate_skill": "Python"},
+            {"req_skill": "FastAPI", "candidate_skill": "Python"},
+        ]
+
+
 @pytest.mark.asyncio
 async def test_match_role_with_evidence(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
@@ -443,17 +592,9 @@ async def test_match_role_with_evidence(
     ) as mock_embeddings:
         mock_embeddings.model = object()
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
-        mock_node = UserDict({"name": "Python", "type": "Programming Language"})
-        mock_node.labels = ["Skill"]
-        mock_path = mock.MagicMock()
-        mock_path.nodes = [mock_node]
-        mock_path.relationships = []
-        # First call for embedding, second for evidence
-        mock_session.run.return_value.single.side_effect = [
-            {"node_id": 1},  # embedding for req_skill
-            {"node_id": 1},  # embedding for candidate
-            {"path": mock_path},  # evidence
-        ]
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1}, {("Python", "Python"): skill_path()}
+        )
         result = await skill_matcher.match_role(
             mock_session,
             [{"name": "Python", "years": 5}],
@@ -463,3 +604,243 @@ async def test_match_role_with_evidence(
         assert len(result.matching_skills) == 1
         assert len(result.matching_skills[0].evidence) > 0
         assert result.supporting_nodes
+
+
+def test_score_matrix_threshold_and_experience(skill_matcher: SkillMatchingService) -> None:
+    """Test the threshold and experience adjustment are applied element-wise."""
+    similarities = np.array([[1.0, 0.5], [0.8, np.nan]])
+    scores = skill_matcher.score_matrix(similarities, [4, 0], [2, 8])
+    assert scores[0, 0] == pytest.approx(1.0 * 0.7 + 0.5 * 0.3)
+    assert scores[0, 1] == -np.inf  # below threshold
+    assert scores[1, 0] == pytest.approx(0.8)  # no experience requirement
+    assert scores[1, 1] == -np.inf  # missing embedding
+
+
+def test_assign_skills_methods() -> None:
+    """Test per-row argmax versus one-to-one assignments."""
+    scores = np.array(
+        [
+            [0.9, 0.8],
+            [0.85, -np.inf],
+            [-np.inf, -np.inf],
+        ]
+    )
+    assert assign_skills(scores, "best") == {0: 0, 1: 0}
+    assert assign_skills(scores, "greedy") == {0: 0}
+    assert assign_skills(scores, "hungarian") == {0: 1, 1: 0}
+    assert assign_skills(np.empty((0, 0))) == {}
+    with pytest.raises(ValueError):
+        assign_skills(scores, "random")
+
+
+@pytest.mark.asyncio
+async def test_similarity_matrix_and_global_assignment(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test the exposed matrix and a one-to-one assignment in match_role."""
+    vectors = {"1": np.array([1.0, 0.0]), "2": np.array([0.8, 0.6]), "3": np.array([0.0, 1.0])}
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.side_effect = vectors.get
+        mock_session.run.side_effect = mock_run({"Python": 1, "Django": 2, "Go": 3})
+        required = [{"name": "Python"}, {"name": "Django"}]
+        candidates = [{"name": "Django", "years": 2}, {"name": "Go", "years": 1}]
+
+        matrix = await skill_matcher.similarity_matrix(mock_session, required, candidates)
+        assert matrix.shape == (2, 2)
+        assert matrix[0, 0] == pytest.approx(0.8)
+        assert matrix[1, 0] == pytest.approx(1.0)
+        assert matrix[0, 1] == -np.inf
+
+        best = await skill_matcher.match_role(mock_session, required, candidates)
+        assert [m.skill_name for m in best.matching_skills] == ["Django", "Django"]
+
+        one_to_one = await skill_matcher.match_role(
+            mock_session, required, candidates, assignment="hungarian"
+        )
+        assert [m.skill_name for m in one_to_one.matching_skills] == ["Django"]
+        assert one_to_one.skill_gaps == ["Python"]
+
+
+@pytest.mark.asyncio
+async def test_rank_batch_matches_match_role(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test batch scores equal per-pair match_role scores and are ranked."""
+    rng = np.random.default_rng(3)
+    names = [f"skill{i}" for i in range(12)]
+    base = rng.normal(size=(3, 4))
+    vectors = {str(i + 1): base[i % 3] + 0.2 * rng.normal(size=4) for i in range(12)}
+    roles = [
+        [{"name": name, "years": int(rng.integers(0, 5))} for name in rng.choice(names, 3)]
+        for _ in range(3)
+    ] + [[]]
+    candidates = [
+        [{"name": name, "years": int(rng.integers(0, 5))} for name in rng.choice(names, 4)]
+        for _ in range(5)
+    ] + [[]]
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings, mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.RANK_CANDIDATE_BLOCK", 2
+    ):
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.side_effect = vectors.get
+        mock_session.run.side_effect = mock_run({name: i + 1 for i, name in enumerate(names)})
+
+        rankings = [
+            ranking
+            async for ranking in skill_matcher.rank_batch(mock_session, roles, candidates)
+        ]
+        assert [ranking.index for ranking in rankings] == [0, 1, 2, 3]
+        name_queries = [
+            call for call in mock_session.run.call_args_list if "UNWIND $names" in call.args[0]
+        ]
+        assert len(name_queries) == 1
+
+        for ranking in rankings:
+            scores = [match.overall_score for match in ranking.matches]
+            assert scores == sorted(scores, reverse=True)
+            assert len(ranking.matches) == len(candidates)
+            for match in ranking.matches:
+                expected = await skill_matcher.match_role(
+                    mock_session, roles[match.role_index], candidates[match.candidate_index]
+                )
+                assert match.overall_score == pytest.approx(expected.overall_score)
+                assert match.skill_gaps == expected.skill_gaps
+                assert [m.skill_name for m in match.matching_skills] == [
+                    m.skill_name for m in expected.matching_skills
+                ]
+
+
+@pytest.mark.asyncio
+async def test_rank_batch_by_candidate_gathers_top_evidence_only(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test grouping by candidate, top_k, and evidence for the top pairs only."""
+    vectors = {"1": np.array([1.0, 0.0]), "2": np.array([0.0, 1.0])}
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.side_effect = vectors.get
+        mock_session.run.side_effect = mock_run(
+            {"Python": 1, "Go": 2},
+            {("Python", "Python"): skill_path(), ("Go", "Go"): skill_path("Go")},
+        )
+        roles = [[{"name": "Go"}], [{"name": "Python"}], [{"name": "Python"}, {"name": "Go"}]]
+        candidates = [[{"name": "Python", "years": 2}]]
+
+        rankings = [
+            ranking
+            async for ranking in skill_matcher.rank_batch(
+                mock_session, roles, candidates, top_k=2, evidence_top=1, by="candidate"
+            )
+        ]
+
+        assert len(rankings) == 1
+        matches = rankings[0].matches
+        assert [match.role_index for match in matches] == [1, 2]
+        assert matches[0].overall_score == pytest.approx(1.0)
+        assert matches[0].matching_skills[0].evidence
+        assert matches[1].skill_gaps == ["Go"]
+        assert matches[1].matching_skills[0].evidence == []
+
+        with pytest.raises(ValueError):
+            async for _ in skill_matcher.rank_batch(mock_session, roles, candidates, by="x"):
+                pass
+
+
+# Job -USED_SKILL-> Python, Django; Django -RELATED_TO-> Python; Rust is unconnected
+GAP_NODES = [
+    (101, ["Job"], {"name": "Engineer"}),
+    (102, ["Skill"], {"name": "Python"}),
+    (103, ["Skill"], {"name": "Django"}),
+    (104, ["Skill"], {"name": "Rust"}),
+]
+GAP_RELS = [
+    (201, 101, 102, "USED_SKILL", {}),
+    (202, 101, 103, "USED_SKILL", {}),
+    (203, 103, 102, "RELATED_TO", {}),
+]
+GAP_VECTORS = {
+    "102": np.array([1.0, 0.0]),
+    "103": np.array([0.6, 0.8]),
+    "104": np.array([0.0, 1.0]),
+}
+GAP_SKILL_IDS = {"Python": 102, "Django": 103, "Rust": 104}
+
+
+def _gap_snapshot_store() -> SnapshotStore:
+    nodes = [SnapshotNode(i, labels, props) for i, labels, props in GAP_NODES]
+    positions = {node.id: pos for pos, node in enumerate(nodes)}
+    rels = [SnapshotRelationship(r, t, p) for r, _, _, t, p in GAP_RELS]
+    endpoints = np.array([(positions[a], positions[b]) for _, a, b, _, _ in GAP_RELS])
+    store = SnapshotStore()
+    store.snapshot = GraphSnapshot(nodes, rels, endpoints, graph_generation.current)
+    return store
+
+
+async def _recommend_django_and_rust(session: AsyncMock, store: Any) -> list[Any]:
+    with mock.patch("skill_sphere_mcp.graph.skill_matching.snapshot_store", store), mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.side_effect = GAP_VECTORS.get
+        return await SkillMatchingService().recommend_for_gaps(
+            session, ["Django", "Rust"], ["Python", "Django"], top_k=2
+        )
+
+
+@pytest.mark.asyncio
+async def test_gap_recommendations_from_snapshot(mock_session: AsyncMock) -> None:
+    """Test gaps get the nearest held skills and a bridge from the snapshot."""
+    mock_session.run.side_effect = mock_run(GAP_SKILL_IDS)
+    django, rust = await _recommend_django_and_rust(mock_session, _gap_snapshot_store())
+
+    assert django.skill_name == "Django"
+    assert django.nearest_skills == [{"name": "Python", "similarity": pytest.approx(0.6)}]
+    assert django.bridge_from == "Python"
+    assert [e["properties"].get("name") for e in django.bridge if e["type"] == "node"] == [
+        "Python",
+        "Django",
+    ]
+    # Rust is unconnected, but still has a nearest held skill by embedding
+    assert rust.nearest_skills[0]["name"] == "Python"
+    assert rust.bridge_from is None and rust.bridge == []
+    assert not any("UNWIND $gaps" in c.args[0] for c in mock_session.run.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_gap_recommendations_without_snapshot(mock_session: AsyncMock) -> None:
+    """Test bridges come from one shortestPath query when no snapshot is built."""
+    resolve = mock_run(GAP_SKILL_IDS)
+    relationship = UserDict()
+    relationship.type = "RELATED_TO"
+
+    def run(query: str, parameters: dict[str, Any]) -> Any:
+        if "UNWIND $gaps" not in query:
+            return resolve(query, parameters)
+        assert parameters == {"gaps": ["Django", "Rust"], "held": ["Python"]}
+        return AsyncRecords(
+            [
+                {
+                    "gap": "Django",
+                    "held": "Python",
+                    "nodes": [skill_path("Python").nodes[0], skill_path("Django").nodes[0]],
+                    "relationships": [relationship],
+                }
+            ]
+        )
+
+    mock_session.run.side_effect = run
+    store = mock.Mock(ensure_fresh=AsyncMock(return_value=None))
+    django, rust = await _recommend_django_and_rust(mock_session, store)
+
+    assert django.bridge_from == "Python"
+    assert [e["type"] for e in django.bridge] == ["node", "node", "relationship"]
+    assert django.bridge[2]["rel_type"] == "RELATED_TO"
+    assert rust.bridge_from is None and rust.bridge == []
+    assert sum("UNWIND $gaps" in c.args[0] for c in mock_session.run.call_args_list) == 1
@@ -0,0 +1,209 @@
+"""Tests for the precomputed skill neighbor table."""
+
+# pylint: disable=protected-access
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.embeddings import embeddings
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.skill_matching import SkillMatchingService
+from skill_sphere_mcp.graph.skill_neighbors import SkillNeighborStore
+from skill_sphere_mcp.graph.skill_neighbors import SkillNeighborTable
+from skill_sphere_mcp.graph.skill_neighbors import skill_neighbors
+from skill_sphere_mcp.graph.skill_neighbors import write_similar_to
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def _vectors(count: int = 40, dimension: int = 8, seed: int = 7) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dimension))
+
+
+def _cosine(vectors: np.ndarray) -> np.ndarray:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return unit @ unit.T
+
+
+def test_compute_matches_brute_force() -> None:
+    """Test each row holds the k most similar other skills, best first."""
+    vectors = _vectors()
+    node_ids = list(range(100, 140))
+    with mock.patch("skill_sphere_mcp.graph.skill_neighbors.BLOCK_ROWS", 16):
+        table = SkillNeighborTable.compute(node_ids, list(vectors), k=5)
+
+    similarities = _cosine(vectors)
+    np.fill_diagonal(similarities, -np.inf)
+    for row in range(len(node_ids)):
+        expected = np.argsort(-similarities[row])[:5]
+        assert table.neighbors[row].tolist() == expected.tolist()
+        assert table.scores[row] == pytest.approx(similarities[row, expected], abs=1e-5)
+
+    similar = table.similar(100, top_k=2)
+    assert [node_id for node_id, _ in similar] == [node_ids[i] for i in table.neighbors[0, :2]]
+    assert table.similar(999) == []
+
+
+def test_compute_caps_k_by_skill_count() -> None:
+    """Test small tables keep at most every other skill."""
+    table = SkillNeighborTable.compute([1, 2], [np.array([1.0, 0.0]), np.array([0.0, 1.0])])
+    assert table.k == 1
+    assert table.similar(1) == [(2, pytest.approx(0.0))]
+    assert SkillNeighborTable.compute([1], [np.array([1.0])]).k == 0
+
+
+def test_candidate_mask_never_drops_a_match() -> None:
+    """Test the first pass keeps every pair at or above the threshold."""
+    vectors = _vectors(count=60, dimension=4)
+    node_ids = list(range(60))
+    table = SkillNeighborTable.compute(node_ids, list(vectors), k=10)
+    similarities = _cosine(vectors)
+
+    threshold = 0.9
+    mask = table.candidate_mask(node_ids, node_ids + [None], threshold)
+    assert mask.shape == (60, 61)
+    assert mask[:, :60][similarities >= threshold].all()
+    # Short neighbor lists rule out most pairs
+    assert mask[:, :60].sum() < 0.5 * mask[:, :60].size
+
+    # Rows whose list may be cut short, and unknown skills, keep everything
+    assert table.candidate_mask(node_ids, node_ids, -1.0).all()
+    assert table.candidate_mask([None, 999], node_ids, threshold).all()
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """Test the table survives an .npz round trip."""
+    table = SkillNeighborTable.compute([1, 2, 3], list(_vectors(count=3)), k=2)
+    path = tmp_path / "neighbors.npz"
+    table.save(path)
+    loaded = SkillNeighborTable.load(path)
+    assert loaded.node_ids.tolist() == [1, 2, 3]
+    assert np.array_equal(loaded.neighbors, table.neighbors)
+    assert np.array_equal(loaded.scores, table.scores)
+    assert loaded.fingerprint == table.fingerprint
+
+
+@pytest.mark.asyncio
+async def test_store_rebuilds_after_embeddings_change(tmp_path: Path) -> None:
+    """Test the store follows the embeddings and reuses a persisted table."""
+    vectors = _vectors(count=3)
+    embeddings.set_all_embeddings({str(i + 1): vectors[i] for i in range(3)})
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda *args, **kwargs: AsyncRecords(
+        [{"node_id": 1}, {"node_id": 2}, {"node_id": 3}, {"node_id": 4}]
+    )
+    path = tmp_path / "neighbors.npz"
+    store = SkillNeighborStore()
+    settings = mock.Mock(
+        skill_neighbors_k=2, skill_neighbors_path=str(path), skill_neighbors_write_back=False
+    )
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_neighbors.get_settings", return_value=settings
+    ):
+        table = await store.ensure_fresh(session)
+        assert table is not None and table.node_ids.tolist() == [1, 2, 3]
+        assert path.exists()
+        assert await store.ensure_fresh(session) is table
+        assert session.run.await_count == 1
+
+        # Same embeddings, new version: the persisted table is reused
+        embeddings.set_all_embeddings(embeddings.get_all_embeddings())
+        with mock.patch.object(SkillNeighborTable, "compute") as compute:
+            reloaded = await store.ensure_fresh(session)
+        compute.assert_not_called()
+        assert reloaded is not None and reloaded.fingerprint == table.fingerprint
+
+        # Changed embeddings: the table is recomputed
+        embeddings.set_all_embeddings({"1": vectors[0], "2": vectors[1]})
+        assert (await store.ensure_fresh(session)).node_ids.tolist() == [1, 2]
+    embeddings.set_all_embeddings({})
+
+
+@pytest.mark.asyncio
+async def test_write_similar_to() -> None:
+    """Test neighbors are written back as SIMILAR_TO relationships in batches."""
+    table = SkillNeighborTable.compute([1, 2, 3], list(_vectors(count=3)), k=2)
+    session = _managed(AsyncMock())
+    generation = graph_generation.current
+    with mock.patch("skill_sphere_mcp.graph.skill_neighbors.WRITE_BATCH_SIZE", 4):
+        await write_similar_to(session, table)
+
+    calls = session.run.await_args_list
+    assert "DELETE r" in calls[0].args[0]
+    assert all("MERGE (a)-[r:SIMILAR_TO]->(b)" in call.args[0] for call in calls[1:-1])
+    rows = [row for call in calls[1:-1] for row in call.args[1]["rows"]]
+    assert len(calls) == 4 and len(rows) == 6
+    # The new relationships advance the stored and the local graph generation
+    assert "MERGE (m:GraphMeta" in calls[-1].args[0]
+    assert graph_generation.current == generation + 1
+    assert {(row["source"], row["target"]) for row in rows if row["source"] == 1} == {
+        (1, 2),
+        (1, 3),
+    }
+
+
+@pytest.mark.asyncio
+async def test_matching_uses_table_as_first_pass() -> None:
+    """Test the table prunes candidates without changing the scores."""
+    vectors = {"1": np.array([1.0, 0.0]), "2": np.array([0.8, 0.6]), "3": np.array([0.0, 1.0])}
+    ids = {"Python": 1, "Django": 2, "Go": 3}
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda query, parameters=None: AsyncRecords(
+        [{"name": name, "node_id": ids[name]} for name in (parameters or {}).get("names", [])]
+    )
+    required = [{"name": "Go"}]
+    candidates = [{"name": "Python"}, {"name": "Django"}, {"name": "Go"}]
+    table = SkillNeighborTable.compute([1, 2, 3], list(vectors.values()), k=2)
+
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings, mock.patch.object(
+        SkillMatchingService, "_refresh_neighbors", AsyncMock()
+    ):
+        mock_embeddings.model = object()
+        mock_embeddings.get_embedding.side_effect = vectors.get
+        matcher = SkillMatchingService()
+        exact = await matcher.similarity_matrix(session, required, candidates)
+
+        with mock.patch.object(skill_neighbors, "table", table), mock.patch.object(
+            skill_neighbors, "_embeddings_version", embeddings.version
+        ), mock.patch.object(
+            matcher, "_embedding_matrix", wraps=matcher._embedding_matrix
+        ) as stacked:
+            filtered = await matcher.similarity_matrix(session, required, candidates)
+            # Go's neighbors all fall below the threshold, so only Go is stacked
+            assert stacked.call_args_list[1].args[0] == ["Go"]
+
+    assert np.array_equal(exact, filtered)
+    assert filtered[0, :2].tolist() == [-np.inf, -np.inf]
+    assert filtered[0, 2] == pytest.approx(1.0)
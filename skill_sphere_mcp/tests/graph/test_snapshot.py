@@ -0,0 +1,185 @@
+"""Tests for reads served from the graph snapshot."""
+
+from typing import Any
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.api.mcp.handlers import explain_match
+from skill_sphere_mcp.api.mcp.handlers import handle_get_entity
+from skill_sphere_mcp.cv.generator import generate_cv
+from skill_sphere_mcp.db.utils import get_entity_by_id
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.search_index import SearchIndex
+from skill_sphere_mcp.graph.search_index import search_nodes
+from skill_sphere_mcp.graph.snapshot import GraphSnapshot
+from skill_sphere_mcp.graph.snapshot import SnapshotNode
+from skill_sphere_mcp.graph.snapshot import SnapshotRelationship
+from skill_sphere_mcp.graph.snapshot import SnapshotStore
+
+
+NODES = [
+    (100, ["Person"], {"name": "Bernd Prager", "email": "bernd@example.com"}),
+    (101, ["Skill"], {"name": "Python", "id": 1}),
+    (102, ["Skill"], {"name": "Rust", "id": 2}),
+    (103, ["Project"], {"name": "SkillSphere"}),
+    (104, ["Certification"], {"name": "CKA"}),
+    (105, ["Company"], {"name": "Acme", "id": "Python"}),
+    (106, ["Education"], {"name": "TU Berlin", "institution": "TU Berlin"}),
+]
+RELS = [
+    (200, 100, 101, "HAS_SKILL", {}),
+    (201, 100, 102, "HAS_SKILL", {}),
+    (202, 100, 105, "WORKED_AT", {"title": "Engineer"}),
+    (203, 100, 106, "EDUCATED_AT", {}),
+    (204, 101, 103, "USED_IN", {}),
+    (205, 101, 104, "CERTIFIED_IN", {}),
+    (206, 103, 101, "USES", {}),
+    (207, 101, 101, "RELATED_TO", {}),
+]
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _graph() -> tuple[list, list, np.ndarray]:
+    snapshot_nodes = [SnapshotNode(i, labels, props) for i, labels, props in NODES]
+    positions = {node.id: pos for pos, node in enumerate(snapshot_nodes)}
+    rels = [SnapshotRelationship(r, t, p) for r, _, _, t, p in RELS]
+    endpoints = np.array([(positions[a], positions[b]) for _, a, b, _, _ in RELS])
+    return snapshot_nodes, rels, endpoints
+
+
+def _store() -> SnapshotStore:
+    store = SnapshotStore()
+    store.snapshot = GraphSnapshot(*_graph(), graph_generation.current)
+    return store
+
+
+def _session(nodes: list[tuple]) -> AsyncMock:
+    """Session that serves a graph to managed read transactions."""
+
+    def run(query: str, *args: Any, **kwargs: Any) -> AsyncRecords:
+        if "MATCH (a)-[r]->(b)" in query:
+            return AsyncRecords(
+                [
+                    {"rel_id": r, "source": a, "target": b, "type": t, "props": p}
+                    for r, a, b, t, p in RELS
+                ]
+            )
+        return AsyncRecords(
+            [{"node_id": i, "labels": l, "props": p} for i, l, p in nodes]
+        )
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session = AsyncMock()
+    session.run.side_effect = run
+    session.execute_read.side_effect = execute
+    return session
+
+
+def test_lookups_and_typed_traversal() -> None:
+    """Test key and label lookups and direction-aware typed relationships."""
+    snapshot = _store().snapshot
+    assert snapshot.entity("Python") == 1
+    # A node's id property wins over a later node's name, like a scan would
+    assert snapshot.entity(1) == 1
+    assert snapshot.entity("Python", by_name=False) == 5
+    assert snapshot.entity("Go") is None
+    assert snapshot.find_by_id("Skill", 2) == 2
+    assert snapshot.find_by_id("Company", 2) is None
+    assert snapshot.with_label("Skill") == [1, 2]
+    assert snapshot.node(106)["name"] == "TU Berlin"
+    assert snapshot.node(999) is None
+
+    python = snapshot.find("Skill", "Python")
+    assert [snapshot.relationships[r].type for r, _ in snapshot.outgoing(python)] == [
+        "USED_IN",
+        "CERTIFIED_IN",
+        "RELATED_TO",
+    ]
+    assert snapshot.related(python, "USED_IN") == [3]
+    assert snapshot.related(python, "USED_IN", "Certification") == []
+    assert snapshot.related(0, "HAS_SKILL", "Skill") == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_without_neo4j() -> None:
+    """Test entity, explain, CV and search reads never query Neo4j."""
+    store = _store()
+    session = AsyncMock()
+    index = SearchIndex()
+    for node_id, _, props in NODES:
+        index.add(node_id, props.get("name"), None)
+    index.finalize(graph_generation.current)
+
+    with mock.patch("skill_sphere_mcp.api.mcp.handlers.snapshot_store", store), mock.patch(
+        "skill_sphere_mcp.db.utils.snapshot_store", store
+    ), mock.patch("skill_sphere_mcp.cv.generator.snapshot_store", store), mock.patch(
+        "skill_sphere_mcp.graph.search_index.snapshot_store", store
+    ), mock.patch(
+        "skill_sphere_mcp.graph.search_index.search_index", index
+    ), mock.patch(
+        "skill_sphere_mcp.api.mcp.handlers.rank_evidence",
+        AsyncMock(side_effect=lambda _s, _n, _r, candidates, _k: [e for _, e in candidates]),
+    ):
+        entity = await handle_get_entity(session, "Rust")
+        assert entity == {
+            "id": 2,
+            "name": "Rust",
+            "type": "Skill",
+            "properties": {"name": "Rust", "id": 2},
+        }
+
+        company = await get_entity_by_id(session, "Python")
+        assert company["type"] == "Company" and company["relationships"] == []
+
+        explained = await explain_match({"skill_id": "1", "role_requirement": "ML"}, session)
+        assert "based on 1 projects and 1 certifications" in explained["explanation"]
+        assert [e["type"] for e in explained["evidence"]] == ["project", "certification"]
+
+        cv = await generate_cv({"target_keywords": ["Bernd"], "format": "markdown"}, session)
+        assert cv["content"].startswith("# Bernd Prager")
+        assert all(name in cv["content"] for name in ("Python", "Acme", "TU Berlin"))
+
+        ranked = await search_nodes(session, "rus", 5)
+        assert [node["name"] for node, _ in ranked] == ["Rust"]
+
+    session.run.assert_not_called()
+    session.execute_read.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_bumps_generation_only_on_change() -> None:
+    """Test a periodic refresh detects writes made by other processes."""
+    store = SnapshotStore()
+    session = _session(NODES)
+    await store.build(session)
+    generation = graph_generation.current
+
+    assert not await store.refresh(session)
+    assert graph_generation.current == generation
+
+    changed = NODES[:-1] + [(106, ["Education"], {"name": "MIT", "institution": "MIT"})]
+    assert await store.refresh(_session(changed))
+    assert graph_generation.current == generation + 1
+    assert store.snapshot.generation == graph_generation.current
+    assert not store.is_stale
+    assert store.snapshot.node(106)["name"] == "MIT"
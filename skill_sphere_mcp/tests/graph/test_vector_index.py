@@ -0,0 +1,114 @@
+"""Tests for the in-memory vector index."""
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.graph.vector_index import VectorIndex
+
+
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _managed(session: AsyncMock) -> AsyncMock:
+    """Run managed transaction functions against the session's own ``run``."""
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    session.execute_write.side_effect = execute
+    return session
+
+
+def _index() -> VectorIndex:
+    index = VectorIndex()
+    index.set_vectors(
+        [10, 20, 30],
+        [[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]],
+        graph_generation.current,
+        [["Job"], ["Certification"], ["Skill", "Job"]],
+    )
+    return index
+
+
+def test_search_ranks_by_cosine() -> None:
+    """Test results are ordered by cosine similarity and bounded by top_k."""
+    index = _index()
+    results = index.search(np.array([2.0, 0.1]), top_k=2)
+    assert [node_id for node_id, _ in results] == [10, 30]
+    assert results[0][1] == pytest.approx(0.99875, abs=1e-4)
+    assert index.search(np.array([0.0, 0.0])) == []
+
+
+def test_search_filters_labels_before_top_k() -> None:
+    """Test label filters are case-insensitive and applied before ranking."""
+    index = _index()
+    query = np.array([1.0, 0.0])
+    assert [node_id for node_id, _ in index.search(query, 1, labels=["CERTIFICATION"])] == [20]
+    assert [node_id for node_id, _ in index.search(query, 5, labels=["job"])] == [10, 30]
+    assert [
+        node_id for node_id, _ in index.search(query, 5, labels=["Certification", "Skill"])
+    ] == [30, 20]
+    assert index.search(query, 5, labels=["Person"]) == []
+    assert index.rows_for_labels(["JOB", "skill"]).tolist() == [0, 2]
+
+
+def test_search_batch_matches_single_queries() -> None:
+    """Test batched scoring returns the same rankings as one query at a time."""
+    index = _index()
+    queries = np.array([[2.0, 0.1], [0.0, 1.0], [0.0, 0.0]])
+    batch = index.search_batch(queries, top_k=2)
+    assert batch[0] == index.search(queries[0], 2)
+    assert batch[1] == index.search(queries[1], 2)
+    assert batch[2] == []
+    filtered = index.search_batch(queries[:2], top_k=5, labels=["Job"])
+    assert [[node_id for node_id, _ in hits] for hits in filtered] == [[10, 30], [30, 10]]
+
+
+def test_search_rejects_dimension_mismatch() -> None:
+    """Test a query of the wrong dimension is rejected."""
+    with pytest.raises(ValueError):
+        _index().search(np.array([1.0, 0.0, 0.0]))
+
+
+def test_set_vectors_skips_mismatched_rows() -> None:
+    """Test rows with a different dimension are left out."""
+    index = VectorIndex()
+    index.set_vectors([1, 2], [[1.0, 0.0], [1.0, 0.0, 0.0]], graph_generation.current)
+    assert len(index) == 1
+    assert index.dimension == 2
+
+
+@pytest.mark.asyncio
+async def test_ensure_fresh_builds_lazily_and_rebuilds() -> None:
+    """Test the matrix is loaded on first use and after graph changes only."""
+    session = _managed(AsyncMock())
+    session.run.side_effect = lambda *args, **kwargs: AsyncRecords(
+        [{"node_id": 1, "embedding": [0.5, 0.5], "labels": ["Skill"]}]
+    )
+    index = VectorIndex()
+    await index.ensure_fresh(session)
+    await index.ensure_fresh(session)
+    assert session.run.call_count == 1
+    assert len(index) == 1
+
+    graph_generation.bump()
+    await index.ensure_fresh(session)
+    assert session.run.call_count == 2
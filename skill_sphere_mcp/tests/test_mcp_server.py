@@ -1,6 +1,7 @@
 """Tests for the MCP server."""
 
 from http import HTTPStatus
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -14,18 +15,40 @@ from skill_sphere_mcp.api.jsonrpc import ERROR_INVALID_PARAMS
 from skill_sphere_mcp.api.jsonrpc import ERROR_METHOD_NOT_FOUND
 from skill_sphere_mcp.api.jsonrpc import JSONRPCRequest
 from skill_sphere_mcp.api.mcp.routes import get_db_session
+from skill_sphere_mcp.api.mcp.routes import get_session_factory
 from skill_sphere_mcp.app import create_app
 
 from .constants import HTTP_OK
 from .constants import HTTP_UNPROCESSABLE_ENTITY
 
 
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
 @pytest.fixture
 def mock_db_session():
-    """Create a mock database session."""
+    """Create a mock database session running managed transactions on itself."""
     session = AsyncMock()
     session.run = AsyncMock()
 
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+
     def run_side_effect(*args, **kwargs):
         query = args[0] if args else ""
         params = args[1] if len(args) > 1 else kwargs
@@ -36,17 +59,11 @@ def mock_db_session():
         if "MATCH (n) WHERE n.id = $entity_id OR n.name = $entity_id RETURN n LIMIT 1" in norm_query:
             # Simulate not found for 'nonexistent'
             if params and (params.get("entity_id") == "nonexistent"):
-                mock_result = AsyncMock()
-                mock_result.single = AsyncMock(return_value=None)
-                return mock_result
+                return AsyncRecords([])
             # Otherwise, return a dummy entity
-            mock_result = AsyncMock()
-            mock_result.single = AsyncMock(
-                return_value={
-                    "n": {"id": "someid", "name": "Some Entity", "type": "Skill"}
-                }
-            )
-            return mock_result
+            return AsyncRecords([{
+                "n": {"id": "someid", "name": "Some Entity", "type": "Skill"}
+            }])
 
         # For get_entity_by_id (MATCH (n) WHERE n.id = $entity_id ...)
         elif (
@@ -55,104 +72,86 @@ def mock_db_session():
         ):
             # Simulate not found for 'nonexistent'
             if params and (params.get("entity_id") == "nonexistent"):
-                mock_result = AsyncMock()
-                mock_result.single = AsyncMock(return_value=None)
-                return mock_result
+                return AsyncRecords([])
             # Otherwise, return a dummy entity with relationships
-            mock_result = AsyncMock()
-            mock_result.single = AsyncMock(
-                return_value={
-                    "n": {"id": "someid", "name": "Some Entity", "type": "Skill"},
-                    "relationships": [
-                        {
-                            "type": "RELATES_TO",
-                            "target": "otherid"
-                        }
-                    ]
-                }
-            )
-            return mock_result
+            return AsyncRecords([{
+                "n": {"id": "someid", "name": "Some Entity", "type": "Skill"},
+                "relationships": [
+                    {
+                        "type": "RELATES_TO",
+                        "target": "otherid"
+                    }
+                ]
+            }])
 
         # For match_role (MATCH (p:Person))
         elif "MATCH (p:Person)" in norm_query:
-            mock_result = AsyncMock()
-            mock_result.all = AsyncMock(
-                return_value=[
-                    {
-                        "p": {
-                            "id": "1",
-                            "name": "Test Person",
-                            "skills": ["Python", "FastAPI"],
-                            "experience": {"Python": 5, "FastAPI": 3},
-                        }
+            return AsyncRecords([
+                {
+                    "p": {
+                        "id": "1",
+                        "name": "Test Person",
+                        "skills": ["Python", "FastAPI"],
+                        "experience": {"Python": 5, "FastAPI": 3},
                     }
-                ]
+                }
+            ]
             )
-            return mock_result
 
         # For explain_match (MATCH (s:Skill))
         elif "MATCH (s:Skill" in norm_query:
-            mock_result = AsyncMock()
-            mock_result.single = AsyncMock(
-                return_value={
-                    "s": {"id": "1", "name": "Python"},
-                    "projects": [
-                        {
-                            "id": "p1",
-                            "name": "Project A",
-                            "description": "Python project",
-                        }
-                    ],
-                    "certifications": [
-                        {
-                            "id": "c1",
-                            "name": "Python Cert",
-                            "description": "Python certification",
-                        }
-                    ],
-                }
-            )
-            return mock_result
+            return AsyncRecords([{
+                "s": {"id": "1", "name": "Python"},
+                "projects": [
+                    {
+                        "id": "p1",
+                        "name": "Project A",
+                        "description": "Python project",
+                    }
+                ],
+                "certifications": [
+                    {
+                        "id": "c1",
+                        "name": "Python Cert",
+                        "description": "Python certification",
+                    }
+                ],
+            }])
 
         # For graph_search (MATCH (n))
         elif "MATCH (n)" in norm_query:
-            mock_result = AsyncMock()
-            mock_result.all = AsyncMock(
-                return_value=[
-                    {
-                        "n": {
-                            "id": "1",
+            return AsyncRecords([
+                {
+                    "n": {
+                        "id": "1",
+                        "name": "Python",
+                        "type": "Skill",
+                        "description": "Python programming language",
+                        "labels": ["Skill"],
+                        "properties": {
                             "name": "Python",
-                            "type": "Skill",
                             "description": "Python programming language",
-                            "labels": ["Skill"],
-                            "properties": {
-                                "name": "Python",
-                                "description": "Python programming language",
-                            },
-                        }
-                    },
-                    {
-                        "n": {
-                            "id": "2",
+                        },
+                    }
+                },
+                {
+                    "n": {
+                        "id": "2",
+                        "name": "FastAPI",
+                        "type": "Skill",
+                        "description": "FastAPI web framework",
+                        "labels": ["Skill"],
+                        "properties": {
                             "name": "FastAPI",
-                            "type": "Skill",
                             "description": "FastAPI web framework",
-                            "labels": ["Skill"],
-                            "properties": {
-                                "name": "FastAPI",
-                                "description": "FastAPI web framework",
-                            },
-                        }
-                    },
-                ]
+                        },
+                    }
+                },
+            ]
             )
-            return mock_result
 
         # Default case
-        mock_result = AsyncMock()
-        mock_result.all = AsyncMock(return_value=[])
-        return mock_result
+        return AsyncRecords([])
 
     session.run.side_effect = run_side_effect
     return session
@@ -162,7 +161,12 @@ def mock_db_session():
 def client(mock_db_session):
     """Create a test client with mocked dependencies."""
     app = create_app()
+
+    async def sessions():
+        yield mock_db_session
+
     app.dependency_overrides[get_db_session] = lambda: mock_db_session
+    app.dependency_overrides[get_session_factory] = lambda: sessions
     with TestClient(app) as test_client:
         yield test_client
 
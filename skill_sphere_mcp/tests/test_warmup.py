@@ -0,0 +1,121 @@
+"""Tests for the startup warm-up and the readiness endpoint."""
+
+# pylint: disable=redefined-outer-name
+
+import asyncio
+import json
+
+from collections.abc import AsyncIterator
+from collections.abc import Generator
+from contextlib import asynccontextmanager
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fastapi import HTTPException
+
+from skill_sphere_mcp.api.routes import readiness_check
+from skill_sphere_mcp.utils.readiness import readiness
+from skill_sphere_mcp.warmup import warm_up
+
+
+CV_PARAMETERS = {"profile_id": "bernd", "target_keywords": ["Python"], "format": "markdown"}
+
+
+class Connection:
+    """Neo4j connection counting how many sessions are open at once."""
+
+    def __init__(self) -> None:
+        self.verify_connectivity = AsyncMock(return_value=True)
+        self.open = 0
+        self.most_open = 0
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncMock]:
+        self.open += 1
+        self.most_open = max(self.most_open, self.open)
+        try:
+            yield AsyncMock()
+        finally:
+            self.open -= 1
+
+
+async def _ping(*_args: object) -> list[dict[str, int]]:
+    # Yield to the event loop, so concurrent pings hold their sessions together
+    await asyncio.sleep(0)
+    return [{"ok": 1}]
+
+
+@pytest.fixture
+def warmup_env() -> Generator[dict[str, mock.Mock], None, None]:
+    """Patch everything the warm-up touches."""
+    settings = mock.Mock(
+        warmup_steps=["connectivity", "pool", "indexes", "embeddings", "cv", "typo"],
+        warmup_pool_connections=3,
+        neo4j_max_connection_pool_size=100,
+        warmup_cv_parameters=CV_PARAMETERS,
+    )
+    connection = Connection()
+    patches = {
+        "neo4j_conn": connection,
+        "get_settings": mock.Mock(return_value=settings),
+        "schema_migrator": mock.Mock(migrate=AsyncMock()),
+        "graph_generation": mock.Mock(poll_once=AsyncMock()),
+        "read_records": AsyncMock(side_effect=_ping),
+        "search_index": mock.Mock(build=AsyncMock()),
+        "snapshot_store": mock.Mock(build=AsyncMock()),
+        "person_skills": mock.Mock(build=AsyncMock(side_effect=RuntimeError("no skills"))),
+        "experience_store": mock.Mock(build=AsyncMock()),
+        "vector_index": mock.Mock(build=AsyncMock()),
+        "embeddings": mock.Mock(load_embeddings=AsyncMock()),
+        "get_embedding_model": mock.Mock(return_value=None),
+        "dispatch_tool": AsyncMock(return_value={"content": "# Bernd"}),
+    }
+    with mock.patch.multiple("skill_sphere_mcp.warmup", **patches):
+        yield patches
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_each_step(warmup_env: dict[str, mock.Mock]) -> None:
+    """Test a warm-up runs every step and is ready despite a cold index."""
+    readiness.start([])
+    response = await readiness_check()
+    assert response.status_code == 503
+    assert json.loads(response.body)["status"] == "starting"
+
+    assert await warm_up()
+    assert warmup_env["neo4j_conn"].most_open == 3
+    warmup_env["vector_index"].build.assert_awaited_once()
+    warmup_env["embeddings"].load_embeddings.assert_awaited_once()
+    warmup_env["dispatch_tool"].assert_awaited_once_with(
+        "cv.generate", CV_PARAMETERS, mock.ANY
+    )
+
+    response = await readiness_check()
+    report = json.loads(response.body)
+    assert response.status_code == 200 and report["status"] == "ready"
+    assert list(report["steps"]) == ["connectivity", "pool", "indexes", "embeddings", "cv"]
+    assert report["steps"]["indexes"]["status"] == "failed"
+    assert "person skills" in report["steps"]["indexes"]["error"]
+    assert all(
+        step["status"] == "ok" for name, step in report["steps"].items() if name != "indexes"
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_without_neo4j(warmup_env: dict[str, mock.Mock]) -> None:
+    """Test the server stays not ready and skips the rest when Neo4j is down."""
+    warmup_env["neo4j_conn"].verify_connectivity.side_effect = HTTPException(
+        status_code=503, detail="Database service unavailable"
+    )
+
+    assert not await warm_up()
+    warmup_env["search_index"].build.assert_not_awaited()
+    warmup_env["dispatch_tool"].assert_not_awaited()
+
+    response = await readiness_check()
+    report = json.loads(response.body)
+    assert response.status_code == 503 and report["status"] == "unavailable"
+    assert report["steps"]["connectivity"]["status"] == "failed"
+    assert report["steps"]["cv"] == {"status": "skipped", "error": "Neo4j unavailable"}
@@ -0,0 +1,245 @@
+"""Tests for adaptive admission control of tool calls."""
+
+# pylint: disable=redefined-outer-name
+
+import asyncio
+
+from collections.abc import Generator
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fastapi import HTTPException
+from neo4j import AsyncSession
+from prometheus_client import REGISTRY
+
+from skill_sphere_mcp.api.jsonrpc import ERROR_OVERLOADED
+from skill_sphere_mcp.api.jsonrpc import JSONRPCRequest
+from skill_sphere_mcp.api.mcp.rpc import handle_rpc_request
+from skill_sphere_mcp.db.connection import neo4j_conn
+from skill_sphere_mcp.db.deps import get_session_factory
+from skill_sphere_mcp.tools.admission import AdmissionLimiter
+from skill_sphere_mcp.tools.admission import Overloaded
+from skill_sphere_mcp.tools.admission import admission_control
+from skill_sphere_mcp.tools.dispatcher import dispatch_tool
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HeldCall:
+    """Runs until released, counting how many calls run at once."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.running = 0
+
+    async def run(self, *_args: object) -> dict:
+        self.running += 1
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return {"done": True}
+
+    async def started(self) -> None:
+        while not self.running:
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+def single_slot() -> Generator[mock.Mock, None, None]:
+    """Allow one call per tool at a time and no queue."""
+    settings = mock.Mock(
+        enable_admission_control=True,
+        admission_initial_limit=1,
+        admission_min_limit=1,
+        admission_max_limit=1,
+        admission_max_queue=0,
+        admission_target_latency=1.0,
+        admission_target_latencies={},
+    )
+    admission_control.clear()
+    with mock.patch("skill_sphere_mcp.tools.admission.get_settings", return_value=settings):
+        yield settings
+    admission_control.clear()
+
+
+async def sessions():
+    """Yield a mock session, standing in for a session factory."""
+    yield AsyncMock()
+
+
+def _rejected(tool: str) -> float:
+    return REGISTRY.get_sample_value("admission_rejected_total", {"tool": tool}) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_calls_queue_then_get_rejected() -> None:
+    """Test calls over the limit wait in the queue and beyond it are rejected."""
+    limiter = AdmissionLimiter("test.queue", target_latency=1.0, initial_limit=1, max_queue=1)
+    call = HeldCall()
+    before = _rejected("test.queue")
+
+    first = asyncio.create_task(limiter.run(call.run))
+    second = asyncio.create_task(limiter.run(call.run))
+    await asyncio.sleep(0)
+    assert call.running == 1 and limiter.queued == 1
+
+    with pytest.raises(Overloaded) as exc_info:
+        await limiter.run(call.run)
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+    assert _rejected("test.queue") == before + 1
+
+    call.release.set()
+    assert await asyncio.gather(first, second) == [{"done": True}] * 2
+    assert limiter.in_flight == 0 and limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    """Test a call cancelled while queued frees its place without a slot."""
+    limiter = AdmissionLimiter("test.cancel", target_latency=1.0, initial_limit=1, max_queue=1)
+    call = HeldCall()
+    running = asyncio.create_task(limiter.run(call.run))
+    waiting = asyncio.create_task(limiter.run(call.run))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert limiter.queued == 0 and limiter.in_flight == 1
+
+    call.release.set()
+    await running
+    assert limiter.in_flight == 0
+
+
+def test_limit_follows_latency() -> None:
+    """Test the limit grows additively when fast and halves when slow."""
+    clock = Clock()
+    limiter = AdmissionLimiter(
+        "test.aimd", target_latency=1.0, initial_limit=4, max_limit=5, clock=clock
+    )
+    for _ in range(4):
+        limiter.record(0.1)
+    assert limiter.limit == pytest.approx(4.92, abs=0.01)
+
+    limiter.record(2.0)
+    assert limiter.limit == pytest.approx(2.46, abs=0.01)
+    # A burst of slow calls only cuts the limit once per target latency
+    limiter.record(2.0, congested=True)
+    assert limiter.limit == pytest.approx(2.46, abs=0.01)
+    clock.now = 1.5
+    limiter.record(0.5, congested=True)
+    assert limiter.limit == pytest.approx(1.23, abs=0.01)
+    clock.now = 3.0
+    limiter.record(5.0)
+    assert limiter.limit == 1.0
+
+    for _ in range(100):
+        limiter.record(0.1)
+    assert limiter.limit == 5.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("single_slot")
+async def test_dispatcher_rejects_with_retry_after() -> None:
+    """Test an overloaded tool answers 429 while other tools are admitted."""
+    call = HeldCall()
+    handler = AsyncMock(side_effect=call.run)
+    with mock.patch("skill_sphere_mcp.tools.dispatcher.generate_cv", handler):
+        running = asyncio.create_task(
+            dispatch_tool("cv.generate", {"profile_id": "1", "format": "markdown"}, AsyncMock())
+        )
+        await call.started()
+        with pytest.raises(HTTPException) as exc_info:
+            await dispatch_tool("cv.generate", {"profile_id": "2", "format": "pdf"}, AsyncMock())
+        assert exc_info.value.status_code == 429
+        assert "Retry-After" in exc_info.value.headers
+
+        search = AsyncMock(return_value={"results": []})
+        with mock.patch("skill_sphere_mcp.tools.dispatcher.graph_search", search):
+            await dispatch_tool("graph.search", {"query": "admitted"}, AsyncMock())
+        search.assert_awaited_once()
+
+        call.release.set()
+        assert await running == {"done": True}
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_hold_no_pool_slot(single_slot: mock.Mock) -> None:
+    """Test calls waiting for admission open their session only once admitted."""
+    single_slot.admission_max_queue = 2
+    call = HeldCall()
+    handler = AsyncMock(side_effect=call.run)
+    in_use = REGISTRY.get_sample_value("neo4j_sessions_in_use")
+    driver = mock.Mock()
+    driver.session.side_effect = lambda **_: AsyncMock(spec=AsyncSession)
+    with (
+        mock.patch.object(neo4j_conn, "_driver", driver),
+        mock.patch.object(neo4j_conn, "_slots", asyncio.Semaphore(1)),
+        mock.patch.object(neo4j_conn, "_acquisition_timeout", 0.01),
+        mock.patch("skill_sphere_mcp.tools.dispatcher.recommend_gaps", handler),
+    ):
+        calls = [
+            asyncio.create_task(
+                dispatch_tool(
+                    "skill.recommend_gaps",
+                    {"required_skills": [skill]},
+                    session_factory=get_session_factory(),
+                )
+            )
+            for skill in ("Go", "Rust", "Zig")
+        ]
+        await call.started()
+        limiter = admission_control.limiter("skill.recommend_gaps")
+        while limiter.queued < 2:
+            await asyncio.sleep(0)
+
+        # Only the admitted call holds a session; the queued ones wait without
+        assert REGISTRY.get_sample_value("neo4j_sessions_in_use") == in_use + 1
+
+        call.release.set()
+        assert await asyncio.gather(*calls) == [{"done": True}] * 3
+    assert REGISTRY.get_sample_value("neo4j_sessions_in_use") == in_use
+    assert driver.session.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("single_slot")
+async def test_rpc_overloaded_error() -> None:
+    """Test an overloaded JSON-RPC tool call gets an error with a retry hint."""
+    call = HeldCall()
+    with mock.patch("skill_sphere_mcp.api.mcp.rpc.match_role", AsyncMock(side_effect=call.run)):
+        running = asyncio.create_task(
+            handle_rpc_request(
+                JSONRPCRequest(
+                    method="mcp.tool",
+                    params={"name": "match_role", "parameters": {"required_skills": ["Go"]}},
+                    id=1,
+                ),
+                sessions,
+            )
+        )
+        await call.started()
+        response = await handle_rpc_request(
+            JSONRPCRequest(
+                method="mcp.skill.match_role", params={"required_skills": ["Rust"]}, id=2
+            ),
+            sessions,
+        )
+        call.release.set()
+        assert (await running).result == {"done": True}
+
+    assert response.error["code"] == ERROR_OVERLOADED["code"]
+    assert response.error["data"]["retry_after"] >= 1
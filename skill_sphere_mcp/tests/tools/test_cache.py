@@ -0,0 +1,142 @@
+"""Tests for the tool result cache."""
+
+# pylint: disable=redefined-outer-name
+
+from collections.abc import Generator
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.tools.cache import ToolResultCache
+from skill_sphere_mcp.tools.cache import parameters_key
+from skill_sphere_mcp.tools.cache import tool_cache
+from skill_sphere_mcp.tools.dispatcher import dispatch_tool
+
+
+class Clock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def caching() -> Generator[mock.Mock, None, None]:
+    """Enable caching, which the test settings turn off."""
+    settings = mock.Mock(
+        enable_caching=True, tool_cache_max_entries=2, tool_cache_ttl_seconds=60.0
+    )
+    with mock.patch("skill_sphere_mcp.tools.cache.get_settings", return_value=settings):
+        yield settings
+
+
+def _samples(name: str, tool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"tool": tool}) or 0.0
+
+
+def test_parameters_key_is_canonical() -> None:
+    """Test key order does not matter but tool and values do."""
+    key = parameters_key("graph.search", {"query": "Python", "top_k": 5})
+    assert parameters_key("graph.search", {"top_k": 5, "query": "Python"}) == key
+    assert parameters_key("graph.search", {"query": "Python", "top_k": 6}) != key
+    assert parameters_key("cv.generate", {"query": "Python", "top_k": 5}) != key
+
+
+def test_ttl_lru_and_generation() -> None:
+    """Test entries expire, are evicted least recently used first, and follow writes."""
+    clock = Clock()
+    cache = ToolResultCache(max_entries=2, ttl_seconds=10.0, clock=clock)
+    cache.put("t", {"n": 1}, {"value": 1})
+    cache.put("t", {"n": 2}, {"value": 2})
+    assert cache.get("t", {"n": 1}) == (True, {"value": 1})
+    cache.put("t", {"n": 3}, {"value": 3})
+    assert cache.get("t", {"n": 2}) == (False, None)
+    assert len(cache) == 2
+
+    clock.now = 10.0
+    assert cache.get("t", {"n": 1}) == (False, None)
+
+    cache.put("t", {"n": 4}, {"value": 4})
+    graph_generation.bump()
+    assert cache.get("t", {"n": 4}) == (False, None)
+    assert len(cache) == 0
+
+
+def test_cached_results_are_copies() -> None:
+    """Test callers cannot change a cached result by mutating theirs."""
+    cache = ToolResultCache()
+    result = {"results": [1]}
+    cache.put("t", {}, result)
+    result["results"].append(2)
+    _, cached = cache.get("t", {})
+    cached["results"].append(3)
+    assert cache.get("t", {}) == (True, {"results": [1]})
+
+
+@pytest.mark.asyncio
+async def test_get_or_call_counts_hits_and_misses(caching: mock.Mock) -> None:
+    """Test results are computed once, failures are not cached, and metrics move."""
+    cache = ToolResultCache()
+    call = AsyncMock(return_value={"ok": True})
+    hits = _samples("tool_cache_hits_total", "test.tool")
+    misses = _samples("tool_cache_misses_total", "test.tool")
+
+    assert await cache.get_or_call("test.tool", {"a": 1}, call) == {"ok": True}
+    assert await cache.get_or_call("test.tool", {"a": 1}, call) == {"ok": True}
+    assert call.await_count == 1
+    assert _samples("tool_cache_hits_total", "test.tool") == hits + 1
+    assert _samples("tool_cache_misses_total", "test.tool") == misses + 1
+
+    failing = AsyncMock(side_effect=RuntimeError("down"))
+    with pytest.raises(RuntimeError):
+        await cache.get_or_call("test.tool", {"a": 2}, failing)
+    assert cache.get("test.tool", {"a": 2}) == (False, None)
+
+    caching.enable_caching = False
+    await cache.get_or_call("test.tool", {"a": 1}, call)
+    assert call.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_call_skips_results_raced_by_a_write(caching: mock.Mock) -> None:
+    """Test a result is not cached if the graph changed while computing it."""
+    cache = ToolResultCache()
+
+    async def call() -> dict:
+        graph_generation.bump()
+        return {"stale": True}
+
+    await cache.get_or_call("test.tool", {}, call)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_caches_idempotent_tools(caching: mock.Mock) -> None:
+    """Test graph.search is served from the cache while match_role is not."""
+    tool_cache.clear()
+    search = AsyncMock(return_value={"results": []})
+    match = AsyncMock(return_value={"match_score": 1.0})
+    with mock.patch(
+        "skill_sphere_mcp.tools.dispatcher.graph_search", search
+    ), mock.patch("skill_sphere_mcp.tools.dispatcher.match_role", match):
+        session = AsyncMock()
+        for _ in range(2):
+            await dispatch_tool("graph.search", {"query": "Python", "top_k": 3}, session)
+            await dispatch_tool(
+                "skill.match_role",
+                {"required_skills": ["Python"], "years_experience": {"Python": 3}},
+                session,
+            )
+        graph_generation.bump()
+        await dispatch_tool("graph.search", {"top_k": 3, "query": "Python"}, session)
+
+    assert search.await_count == 2
+    assert match.await_count == 2
+    tool_cache.clear()
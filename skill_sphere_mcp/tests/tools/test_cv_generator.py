@@ -1,5 +1,6 @@
 """Tests for CV generation functionality."""
 
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import patch
 
@@ -12,10 +13,37 @@ from neo4j import AsyncSession
 from skill_sphere_mcp.cv.generator import generate_cv
 
 
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _returns(session: AsyncMock, records: list[dict[str, Any]]) -> None:
+    """Make every query on the session return the given records."""
+    session.run.side_effect = lambda *_args, **_kwargs: AsyncRecords(records)
+
+
 @pytest_asyncio.fixture
 async def mock_session() -> AsyncMock:
-    """Create a mock Neo4j session."""
-    return AsyncMock(spec=AsyncSession)
+    """Create a mock Neo4j session running managed transactions on itself."""
+    session = AsyncMock(spec=AsyncSession)
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
 
 
 @pytest.mark.asyncio
@@ -53,7 +81,7 @@ async def test_generate_cv_success(mock_session: AsyncMock) -> None:
             }
         ],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
 
     result = await generate_cv(
         {
@@ -88,7 +116,7 @@ async def test_generate_cv_html_format(mock_session: AsyncMock) -> None:
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
 
     result = await generate_cv(
         {
@@ -115,7 +143,7 @@ async def test_generate_cv_pdf_format(mock_session: AsyncMock) -> None:
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
 
     with pytest.raises(HTTPException) as exc_info:
         await generate_cv(
@@ -167,7 +195,7 @@ async def test_generate_cv_empty_profile(mock_session: AsyncMock) -> None:
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
 
     result = await generate_cv(
         {
@@ -206,7 +234,7 @@ async def test_generate_cv_database_error(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_generate_cv_no_profile_found(mock_session: AsyncMock) -> None:
     """Test CV generation when no profile is found."""
-    mock_session.run.return_value.single.return_value = None
+    _returns(mock_session, [])
 
     with pytest.raises(HTTPException) as exc_info:
         await generate_cv(
@@ -13,10 +13,13 @@ from starlette.status import HTTP_404_NOT_FOUND
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
+from skill_sphere_mcp.tools.dispatcher import _validate_batch_search_params
 from skill_sphere_mcp.tools.dispatcher import _validate_explain_match_params
 from skill_sphere_mcp.tools.dispatcher import _validate_generate_cv_params
 from skill_sphere_mcp.tools.dispatcher import _validate_graph_search_params
+from skill_sphere_mcp.tools.dispatcher import _validate_hybrid_search_params
 from skill_sphere_mcp.tools.dispatcher import _validate_match_role_params
+from skill_sphere_mcp.tools.dispatcher import _validate_recommend_gaps_params
 from skill_sphere_mcp.tools.dispatcher import dispatch_tool
 
 
@@ -124,6 +127,69 @@ def test_validate_graph_search_params() -> None:
     assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
 
+def test_validate_hybrid_search_params() -> None:
+    """Test validation of hybrid search parameters."""
+    # Valid parameters
+    _validate_hybrid_search_params(
+        {
+            "query": "Python developer",
+            "lexical_weight": 0.3,
+            "vector_weight": 0.7,
+            "fusion": "weighted",
+        }
+    )
+
+    # Invalid parameters
+    for params in (
+        {},
+        {"query": "Python", "lexical_weight": -1},
+        {"query": "Python", "lexical_weight": 0, "vector_weight": 0},
+        {"query": "Python", "fusion": "max"},
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_hybrid_search_params(params)
+        assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_validate_recommend_gaps_params() -> None:
+    """Test validation of gap recommendation parameters."""
+    # Valid parameters
+    _validate_recommend_gaps_params({"required_skills": MOCK_SKILLS})
+    _validate_recommend_gaps_params(
+        {"required_skills": MOCK_SKILLS, "person_skills": ["Python"], "top_k": 2}
+    )
+
+    # Invalid parameters
+    for params in (
+        {},
+        {"required_skills": "Python"},
+        {"required_skills": MOCK_SKILLS, "person_skills": "Python"},
+        {"required_skills": MOCK_SKILLS, "top_k": 0},
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_recommend_gaps_params(params)
+        assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_validate_batch_search_params() -> None:
+    """Test validation of batch search parameters."""
+    # Valid parameters
+    _validate_batch_search_params({"queries": ["Python", "Neo4j"], "top_k": 3})
+
+    # Invalid parameters
+    for params in (
+        {},
+        {"queries": "Python"},
+        {"queries": ["Python", ""]},
+        {"queries": ["Python"] * 101},
+        {"queries": ["Python"], "top_k": 0},
+        {"queries": ["Python"], "labels": "Job"},
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_batch_search_params(params)
+        assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest_asyncio.fixture
 async def test_dispatch_tool_success(mock_session: AsyncMock) -> None:
     """Test successful tool dispatch."""
@@ -2,6 +2,7 @@
 
 import logging
 
+from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -22,8 +23,10 @@ from skill_sphere_mcp.api.mcp.handlers import explain_match
 from skill_sphere_mcp.api.mcp.handlers import graph_search
 from skill_sphere_mcp.api.mcp.handlers import match_role
 from skill_sphere_mcp.cv.generator import generate_cv
+from skill_sphere_mcp.graph.skill_matching import GapRecommendation
 from skill_sphere_mcp.graph.skill_matching import MatchResult
 from skill_sphere_mcp.graph.skill_matching import SkillMatch
+from skill_sphere_mcp.tools.handlers import recommend_gaps
 
 
 logger = logging.getLogger(__name__)
@@ -42,10 +45,37 @@ MOCK_EMBEDDING = np.random.default_rng(42).random(128)
 EXPECTED_RESULTS_COUNT = 2
 
 
+class AsyncRecords:
+    """Async iterable over mock Neo4j records."""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = iter(records)
+
+    def __aiter__(self) -> "AsyncRecords":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        try:
+            return next(self._records)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+def _returns(session: AsyncMock, records: list[dict[str, Any]]) -> None:
+    """Make every query on the session return the given records."""
+    session.run.side_effect = lambda *_args, **_kwargs: AsyncRecords(records)
+
+
 @pytest_asyncio.fixture
 async def mock_session() -> AsyncMock:
-    """Create a mock Neo4j session."""
-    return AsyncMock(spec=AsyncSession)
+    """Create a mock Neo4j session running managed transactions on itself."""
+    session = AsyncMock(spec=AsyncSession)
+
+    async def execute(work: Any) -> Any:
+        return await work(session)
+
+    session.execute_read.side_effect = execute
+    return session
 
 
 @pytest_asyncio.fixture
@@ -72,20 +102,17 @@ async def mock_skill_matcher() -> AsyncMock:
 async def test_match_role_success(mock_session: AsyncMock) -> None:
     """Test successful skill matching."""
     # Setup mock session response
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python", "FastAPI"],
-                    "experience": {"Python": 5, "FastAPI": 3},
-                }
+    records = [
+        {
+            "p": {
+                "id": "1",
+                "name": "Test Person",
+                "skills": ["Python", "FastAPI"],
+                "experience": {"Python": 5, "FastAPI": 3},
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
 
     result = await match_role(
         {
@@ -113,23 +140,20 @@ async def test_match_role_no_skills(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_explain_match_success(mock_session: AsyncMock) -> None:
     """Test successful explain match."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(
-        return_value={
-            "s": {"id": "1", "name": "Python"},
-            "projects": [
-                {"id": "p1", "name": "Project A", "description": "Python project"}
-            ],
-            "certifications": [
-                {
-                    "id": "c1",
-                    "name": "Python Cert",
-                    "description": "Python certification",
-                }
-            ],
-        }
-    )
-    mock_session.run.return_value = mock_result
+    record = {
+        "s": {"id": "1", "name": "Python"},
+        "projects": [
+            {"id": "p1", "name": "Project A", "description": "Python project"}
+        ],
+        "certifications": [
+            {
+                "id": "c1",
+                "name": "Python Cert",
+                "description": "Python certification",
+            }
+        ],
+    }
+    _returns(mock_session, [record])
 
     result = await explain_match(
         {
@@ -156,9 +180,7 @@ async def test_explain_match_missing_params(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_explain_match_skill_not_found(mock_session: AsyncMock) -> None:
     """Test explain match with non-existent skill."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(return_value=None)
-    mock_session.run.return_value = mock_result
+    _returns(mock_session, [])
 
     with pytest.raises(HTTPException) as exc_info:
         await explain_match(
@@ -181,7 +203,7 @@ async def test_generate_cv_success(mock_session: AsyncMock) -> None:
         "companies": [],
         "education": [],
     }
-    mock_session.run.return_value.single.return_value = mock_record
+    _returns(mock_session, [mock_record])
     result = await generate_cv(
         {"target_keywords": ["Python"], "format": "markdown"}, mock_session
     )
@@ -209,25 +231,22 @@ async def test_generate_cv_invalid_format(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_graph_search_success(mock_session: AsyncMock) -> None:
     """Test successful graph search."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "n": {
-                    "id": "1",
+    records = [
+        {
+            "n": {
+                "id": "1",
+                "name": "Python",
+                "type": "Skill",
+                "description": "Python programming language",
+                "labels": ["Skill"],
+                "properties": {
                     "name": "Python",
-                    "type": "Skill",
                     "description": "Python programming language",
-                    "labels": ["Skill"],
-                    "properties": {
-                        "name": "Python",
-                        "description": "Python programming language",
-                    },
-                }
+                },
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
 
     result = await graph_search(
         {
@@ -326,11 +345,9 @@ async def test_match_role_invalid_experience_value(mock_session: AsyncMock) -> N
 async def test_match_role_partial_match(mock_session: AsyncMock) -> None:
     """Test role matching with partial skill matches."""
     # Mock the session to return a profile with only some required skills
-    mock_result = AsyncMock()
     # The handler expects all required skills to be present in the profile for a match
     # So, if only one skill is present, match_score should be 0.0
-    mock_result.all = AsyncMock(return_value=[])  # No full matches
-    mock_session.run.return_value = mock_result
+    _returns(mock_session, [])  # No full matches
 
     result = await match_role(
         {
@@ -348,15 +365,12 @@ async def test_match_role_partial_match(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_explain_match_empty_evidence(mock_session: AsyncMock) -> None:
     """Test explain match with no projects or certifications."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(
-        return_value={
-            "s": {"id": "1", "name": "Python"},
-            "projects": [],
-            "certifications": [],
-        }
-    )
-    mock_session.run.return_value = mock_result
+    record = {
+        "s": {"id": "1", "name": "Python"},
+        "projects": [],
+        "certifications": [],
+    }
+    _returns(mock_session, [record])
 
     result = await explain_match(
         {"skill_id": "1", "role_requirement": "Python Developer"},
@@ -372,22 +386,19 @@ async def test_explain_match_empty_evidence(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_explain_match_multiple_evidence(mock_session: AsyncMock) -> None:
     """Test explain match with multiple pieces of evidence."""
-    mock_result = AsyncMock()
-    mock_result.single = AsyncMock(
-        return_value={
-            "s": {"id": "1", "name": "Python"},
-            "projects": [
-                {"id": "p1", "name": "Project A"},
-                {"id": "p2", "name": "Project B"},
-                {"id": "p3", "name": "Project C"},
-            ],
-            "certifications": [
-                {"id": "c1", "name": "Cert A"},
-                {"id": "c2", "name": "Cert B"},
-            ],
-        }
-    )
-    mock_session.run.return_value = mock_result
+    record = {
+        "s": {"id": "1", "name": "Python"},
+        "projects": [
+            {"id": "p1", "name": "Project A"},
+            {"id": "p2", "name": "Project B"},
+            {"id": "p3", "name": "Project C"},
+        ],
+        "certifications": [
+            {"id": "c1", "name": "Cert A"},
+            {"id": "c2", "name": "Cert B"},
+        ],
+    }
+    _returns(mock_session, [record])
 
     result = await explain_match(
         {"skill_id": "1", "role_requirement": "Python Developer"},
@@ -413,9 +424,7 @@ async def test_explain_match_invalid_skill_id(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_graph_search_empty_results(mock_session: AsyncMock) -> None:
     """Test graph search with no matching results."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(return_value=[])
-    mock_session.run.return_value = mock_result
+    _returns(mock_session, [])
 
     result = await graph_search({"query": "nonexistent", "top_k": 5}, mock_session)
     assert "results" in result
@@ -425,13 +434,10 @@ async def test_graph_search_empty_results(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_graph_search_special_characters(mock_session: AsyncMock) -> None:
     """Test graph search with special characters in query."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {"n": {"id": "1", "name": "C++", "description": "Programming language"}}
-        ]
-    )
-    mock_session.run.return_value = mock_result
+    records = [
+        {"n": {"id": "1", "name": "C++", "description": "Programming language"}}
+    ]
+    _returns(mock_session, records)
 
     result = await graph_search({"query": "C++", "top_k": 5}, mock_session)
     assert "results" in result
@@ -442,11 +448,8 @@ async def test_graph_search_special_characters(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_graph_search_large_top_k(mock_session: AsyncMock) -> None:
     """Test graph search with a large top_k value."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[{"n": {"id": str(i), "name": f"Node {i}"}} for i in range(100)]
-    )
-    mock_session.run.return_value = mock_result
+    records = [{"n": {"id": str(i), "name": f"Node {i}"}} for i in range(100)]
+    _returns(mock_session, records)
 
     result = await graph_search({"query": "Node", "top_k": 100}, mock_session)
     assert "results" in result
@@ -456,19 +459,16 @@ async def test_graph_search_large_top_k(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_match_role_empty_experience(mock_session: AsyncMock) -> None:
     """Test match role with empty years_experience."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "name": "Test Person",
-                    "skills": ["Python", "FastAPI"],
-                    "experience": {},
-                }
+    records = [
+        {
+            "p": {
+                "name": "Test Person",
+                "skills": ["Python", "FastAPI"],
+                "experience": {},
             }
-        ]
-    )
-    mock_session.run.return_value = mock_result
+        }
+    ]
+    _returns(mock_session, records)
 
     result = await match_role(
         {
@@ -486,9 +486,7 @@ async def test_match_role_empty_experience(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_match_role_nonexistent_skills(mock_session: AsyncMock) -> None:
     """Test match role with non-existent skills."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(return_value=[])
-    mock_session.run.return_value = mock_result
+    _returns(mock_session, [])
 
     result = await match_role(
         {
@@ -505,26 +503,23 @@ async def test_match_role_nonexistent_skills(mock_session: AsyncMock) -> None:
 @pytest.mark.asyncio
 async def test_match_role_multiple_profiles(mock_session: AsyncMock) -> None:
     """Test match role with multiple matching profiles."""
-    mock_result = AsyncMock()
-    mock_result.all = AsyncMock(
-        return_value=[
-            {
-                "p": {
-                    "name": "Person 1",
-                    "skills": ["Python"],
-                    "experience": {"Python": 5},
-                }
-            },
-            {
-                "p": {
-                    "name": "Person 2",
-                    "skills": ["Python"],
-                    "experience": {"Python": 3},
-                }
-            },
-        ]
-    )
-    mock_session.run.return_value = mock_result
+    records = [
+        {
+            "p": {
+                "name": "Person 1",
+                "skills": ["Python"],
+                "experience": {"Python": 5},
+            }
+        },
+        {
+            "p": {
+                "name": "Person 2",
+                "skills": ["Python"],
+                "experience": {"Python": 3},
+            }
+        },
+    ]
+    _returns(mock_session, records)
 
     result = await match_role(
         {
@@ -545,3 +540,76 @@ async def test_match_role_empty_skills(mock_session: AsyncMock) -> None:
     with pytest.raises(HTTPException) as exc_info:
         await match_role({"required_skills": [], "years_experience": {}}, mock_session)
     assert exc_info.value.status_code == 422
+
+
+def _recommendation(name: str) -> GapRecommendation:
+    return GapRecommendation(
+        skill_name=name,
+        nearest_skills=[{"name": "Python", "similarity": 0.6}],
+        bridge_from="Python",
+        bridge=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_recommend_gaps_with_given_skills(mock_session: AsyncMock) -> None:
+    """Test gaps are the required skills not held, recommended as dicts."""
+    matcher = MagicMock(recommend_for_gaps=AsyncMock(return_value=[_recommendation("Rust")]))
+    with patch("skill_sphere_mcp.tools.handlers.skill_matching", matcher):
+        result = await recommend_gaps(
+            {"required_skills": ["Python", "Rust"], "person_skills": ["Python"], "top_k": 2},
+            mock_session,
+        )
+
+    matcher.recommend_for_gaps.assert_awaited_once_with(mock_session, ["Rust"], ["Python"], 2)
+    assert result["skill_gaps"] == ["Rust"]
+    assert result["recommendations"][0]["skill_name"] == "Rust"
+    assert result["recommendations"][0]["bridge_from"] == "Python"
+    mock_session.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_recommend_gaps_uses_best_matching_person(mock_session: AsyncMock) -> None:
+    """Test held skills default to the person covering most requirements."""
+    index = MagicMock()
+    index.best_match.return_value = ("p1", ["Python"], ["Rust"])
+    index.skills_of.return_value = ["Python", "Django"]
+    matcher = MagicMock(recommend_for_gaps=AsyncMock(return_value=[]))
+    with patch(
+        "skill_sphere_mcp.tools.handlers.person_skills",
+        MagicMock(ensure_fresh=AsyncMock(return_value=index)),
+    ), patch("skill_sphere_mcp.tools.handlers.skill_matching", matcher):
+        result = await recommend_gaps({"required_skills": ["Python", "Rust"]}, mock_session)
+
+    index.skills_of.assert_called_once_with("p1")
+    matcher.recommend_for_gaps.assert_awaited_once_with(
+        mock_session, ["Rust"], ["Python", "Django"], 3
+    )
+    assert result == {"skill_gaps": ["Rust"], "recommendations": []}
+
+
+@pytest.mark.asyncio
+async def test_recommend_gaps_queries_held_skills_without_index(
+    mock_session: AsyncMock,
+) -> None:
+    """Test held skills are queried from Neo4j when the bitset index is missing."""
+    session = mock_session
+    _returns(session, [{"name": "Python"}])
+    matcher = MagicMock(recommend_for_gaps=AsyncMock(return_value=[]))
+    with patch(
+        "skill_sphere_mcp.tools.handlers.person_skills",
+        MagicMock(ensure_fresh=AsyncMock(return_value=None)),
+    ), patch("skill_sphere_mcp.tools.handlers.skill_matching", matcher):
+        result = await recommend_gaps({"required_skills": ["Python", "Go"]}, session)
+
+    assert "HAS_SKILL" in session.run.call_args.args[0]
+    matcher.recommend_for_gaps.assert_awaited_once_with(session, ["Go"], ["Python"], 3)
+    assert result["skill_gaps"] == ["Go"]
+
+
+@pytest.mark.asyncio
+async def test_recommend_gaps_missing_skills(mock_session: AsyncMock) -> None:
+    """Test recommend_gaps rejects a call without required skills."""
+    with pytest.raises(HTTPException) as exc_info:
+        await recommend_gaps({}, mock_session)
+    assert exc_info.value.status_code == HTTP_BAD_REQUEST
@@ -0,0 +1,126 @@
+"""Tests for single-flight deduplication of tool calls."""
+
+import asyncio
+
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from prometheus_client import REGISTRY
+
+from skill_sphere_mcp.graph.generation import graph_generation
+from skill_sphere_mcp.tools.dispatcher import dispatch_tool
+from skill_sphere_mcp.tools.single_flight import SingleFlight
+
+
+class SlowCall:
+    """Counts calls and finishes each when released."""
+
+    def __init__(self, result: object = None, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self._result = result
+        self._error = error
+
+    async def __call__(self) -> object:
+        self.calls += 1
+        await self.release.wait()
+        if self._error is not None:
+            raise self._error
+        return {"result": self._result}
+
+
+def _coalesced(tool: str) -> float:
+    return REGISTRY.get_sample_value("single_flight_coalesced_total", {"tool": tool}) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_execution() -> None:
+    """Test concurrent identical calls run once and get separate copies."""
+    flights = SingleFlight()
+    call = SlowCall(result=[1])
+    before = _coalesced("test.tool")
+
+    tasks = [
+        asyncio.create_task(flights.do("test.tool", {"a": 1, "b": 2}, call)),
+        asyncio.create_task(flights.do("test.tool", {"b": 2, "a": 1}, call)),
+        asyncio.create_task(flights.do("test.tool", {"a": 1, "b": 2}, call)),
+    ]
+    other = asyncio.create_task(flights.do("test.tool", {"a": 2}, call))
+    await asyncio.sleep(0)
+    call.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert await other == {"result": [1]}
+    assert call.calls == 2
+    assert results == [{"result": [1]}] * 3
+    assert results[0] is not results[1]
+    assert _coalesced("test.tool") == before + 2
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared() -> None:
+    """Test calls that joined a failing flight see its exception."""
+    flights = SingleFlight()
+    call = SlowCall(error=ValueError("bad query"))
+    tasks = [asyncio.create_task(flights.do("test.tool", {}, call)) for _ in range(2)]
+    await asyncio.sleep(0)
+    call.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert call.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_calls_after_a_write_do_not_join() -> None:
+    """Test a graph write separates calls made before and after it."""
+    flights = SingleFlight()
+    call = SlowCall()
+    first = asyncio.create_task(flights.do("test.tool", {}, call))
+    await asyncio.sleep(0)
+    graph_generation.bump()
+    second = asyncio.create_task(flights.do("test.tool", {}, call))
+    await asyncio.sleep(0)
+    call.release.set()
+    await asyncio.gather(first, second)
+    assert call.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers() -> None:
+    """Test a follower runs the call itself if the leading call is cancelled."""
+    flights = SingleFlight()
+    call = SlowCall(result="ok")
+    leader = asyncio.create_task(flights.do("test.tool", {}, call))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("test.tool", {}, call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    call.release.set()
+
+    assert await follower == {"result": "ok"}
+    assert leader.cancelled()
+    assert call.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_coalesces_concurrent_calls() -> None:
+    """Test identical concurrent dispatches reach the handler once."""
+
+    async def search(_parameters: dict, _session: AsyncMock) -> dict:
+        await asyncio.sleep(0.01)
+        return {"results": []}
+
+    handler = AsyncMock(side_effect=search)
+    with mock.patch("skill_sphere_mcp.tools.dispatcher.graph_search", handler):
+        results = await asyncio.gather(
+            *(
+                dispatch_tool("graph.search", {"query": "Python"}, AsyncMock())
+                for _ in range(3)
+            )
+        )
+    assert results == [{"results": []}] * 3
+    assert handler.await_count == 1
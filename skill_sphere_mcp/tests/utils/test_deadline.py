@@ -0,0 +1,169 @@
+"""Tests for per-request deadlines."""
+
+# pylint: disable=redefined-outer-name
+
+import asyncio
+
+from collections.abc import Generator
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fastapi import FastAPI
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from skill_sphere_mcp.api.jsonrpc import ERROR_DEADLINE_EXCEEDED
+from skill_sphere_mcp.api.jsonrpc import ERROR_INVALID_PARAMS
+from skill_sphere_mcp.api.jsonrpc import JSONRPCRequest
+from skill_sphere_mcp.api.mcp.handlers import handle_get_entity
+from skill_sphere_mcp.api.mcp.rpc import handle_rpc_request
+from skill_sphere_mcp.tools.dispatcher import dispatch_tool
+from skill_sphere_mcp.utils.deadline import DeadlineExceeded
+from skill_sphere_mcp.utils.deadline import DeadlineMiddleware
+from skill_sphere_mcp.utils.deadline import current_deadline
+from skill_sphere_mcp.utils.deadline import deadline_scope
+from skill_sphere_mcp.utils.deadline import run_with_deadline
+from skill_sphere_mcp.utils.deadline import transaction_timeout
+
+
+@pytest.fixture
+def timeouts() -> Generator[mock.Mock, None, None]:
+    """Use small request and tool timeouts."""
+    settings = mock.Mock(
+        request_timeout=5.0,
+        max_request_timeout=10.0,
+        tool_timeouts={"graph.search": 0.05, "skill.match_role": 2.0},
+    )
+    with mock.patch("skill_sphere_mcp.utils.deadline.get_settings", return_value=settings):
+        yield settings
+
+
+class SlowCall:
+    """Sleeps, recording whether it was cancelled."""
+
+    def __init__(self, seconds: float = 1.0) -> None:
+        self.seconds = seconds
+        self.cancelled = False
+
+    async def run(self, *_args: object) -> dict:
+        try:
+            await asyncio.sleep(self.seconds)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"done": True}
+
+
+async def sessions():
+    """Yield a mock session, standing in for a session factory."""
+    yield AsyncMock()
+
+
+@pytest.mark.usefixtures("timeouts")
+def test_scopes_prefer_requested_timeouts() -> None:
+    """Test tool defaults replace the request default but not a client timeout."""
+    assert current_deadline() is None
+    with deadline_scope() as request:
+        assert request.timeout == 5.0 and not request.requested
+        with deadline_scope("skill.match_role") as tool:
+            assert tool.timeout == 2.0
+            assert tool.started == request.started
+        with deadline_scope("unknown.tool") as tool:
+            assert tool.timeout == 5.0
+    assert current_deadline() is None
+
+    with deadline_scope(requested=8.0) as request:
+        with deadline_scope("skill.match_role") as tool:
+            assert tool is request
+            assert transaction_timeout(30.0) <= 8.0
+            assert transaction_timeout(1.0) == 1.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("timeouts")
+async def test_run_with_deadline_cancels_the_call() -> None:
+    """Test a call still running at the deadline is cancelled and reported."""
+    call = SlowCall()
+    with deadline_scope("graph.search"):
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            await run_with_deadline(call.run)
+        assert exc_info.value.status_code == 504
+        assert call.cancelled
+        # No transaction may start once the deadline has passed
+        with pytest.raises(DeadlineExceeded):
+            transaction_timeout(30.0)
+
+    assert await run_with_deadline(SlowCall(0).run) == {"done": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("timeouts")
+async def test_handler_reads_end_by_the_deadline() -> None:
+    """Test a handler's Neo4j read gets the remaining time as its transaction timeout."""
+    session = AsyncMock()
+    session.execute_read.return_value = []
+    with deadline_scope("skill.match_role"):
+        with pytest.raises(HTTPException) as exc_info:
+            await handle_get_entity(session, "missing")
+    assert exc_info.value.status_code == 404
+    work = session.execute_read.call_args.args[0]
+    assert 0 < work.timeout <= 2.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("timeouts")
+async def test_dispatcher_applies_tool_timeout() -> None:
+    """Test a tool call is cut off at its tool's default timeout."""
+    call = SlowCall()
+    handler = AsyncMock(side_effect=call.run)
+    with mock.patch("skill_sphere_mcp.tools.dispatcher.graph_search", handler):
+        with pytest.raises(HTTPException) as exc_info:
+            await dispatch_tool("graph.search", {"query": "slow"}, AsyncMock())
+    assert exc_info.value.status_code == 504
+    assert call.cancelled
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("timeouts")
+async def test_rpc_timeout_param() -> None:
+    """Test a JSON-RPC call's timeout param sets its deadline."""
+    call = SlowCall()
+    with mock.patch("skill_sphere_mcp.api.mcp.rpc.match_role", AsyncMock(side_effect=call.run)):
+        response = await handle_rpc_request(
+            JSONRPCRequest(
+                method="mcp.tool",
+                params={"name": "match_role", "parameters": {}, "timeout": 0.01},
+                id=1,
+            ),
+            sessions,
+        )
+    assert response.error == ERROR_DEADLINE_EXCEEDED
+    assert call.cancelled
+
+    response = await handle_rpc_request(
+        JSONRPCRequest(method="mcp.resources.list", params={"timeout": "soon"}, id=2)
+    )
+    assert response.error["code"] == ERROR_INVALID_PARAMS["code"]
+
+
+@pytest.mark.usefixtures("timeouts")
+def test_middleware_reads_timeout_header() -> None:
+    """Test the header sets the deadline, capped at the maximum."""
+    test_app = FastAPI()
+    test_app.add_middleware(DeadlineMiddleware)
+
+    @test_app.get("/deadline")
+    async def deadline() -> dict:
+        current = current_deadline()
+        return {"timeout": current.timeout, "requested": current.requested}
+
+    client = TestClient(test_app)
+    assert client.get("/deadline").json() == {"timeout": 5.0, "requested": False}
+    response = client.get("/deadline", headers={"X-Request-Timeout": "2.5"})
+    assert response.json() == {"timeout": 2.5, "requested": True}
+    response = client.get("/deadline", headers={"X-Request-Timeout": "600"})
+    assert response.json() == {"timeout": 10.0, "requested": True}
+    response = client.get("/deadline", headers={"X-Request-Timeout": "-1"})
+    assert response.json() == {"timeout": 5.0, "requested": False}